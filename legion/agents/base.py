@@ -1,22 +1,27 @@
-import asyncio
 import json
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import BaseModel
-from rich import print as rprint
-from rich.console import Console
 
+from ..console import rprint
+from ..errors import VersionConflictError
 from ..interface.base import LLMInterface
-from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, SystemPrompt
-from ..interface.tools import BaseTool
+from ..interface.batch import DEFAULT_BATCH_CONCURRENCY, BatchResult, iter_batch, run_batch
+from ..interface.cache import ResponseCache
+from ..interface.portal import run_sync
+from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, StreamChunk, SystemPrompt
+from ..interface.tokens import TokenCounter
+from ..interface.tools import BaseTool, dispatch_tool_calls
 from ..memory.base import MemoryProvider
+from ..memory.context import ContextStrategy, KeepRecentStrategy
 from ..memory.providers.memory import ConversationMemory
 from ..providers import get_provider
 
-# Set up rich console and logging
-console = Console()
+# Set up logging
 log = logging.getLogger("legion")
 
 # Role mapping for convenience
@@ -32,6 +37,25 @@ ROLE_MAPPING = {
     "TOOL": Role.TOOL
 }
 
+# Per-request memories keyed by agent while inside ``isolated_memory``
+_request_memories: ContextVar[Optional[Dict["Agent", ConversationMemory]]] = ContextVar(
+    "legion_request_memories", default=None
+)
+
+@contextmanager
+def isolated_memory() -> Iterator[None]:
+    """Give each agent used in this context a fresh memory holding only its system prompt
+
+    The system prompt message is shared with the agent's own memory rather
+    than copied. Concurrent tasks each entering this context don't see each
+    other's messages, so one agent can serve many requests at once.
+    """
+    token = _request_memories.set({})
+    try:
+        yield
+    finally:
+        _request_memories.reset(token)
+
 class Agent:
     """Base agent class with LLM capabilities"""
 
@@ -43,9 +67,27 @@ class Agent:
         max_tokens: Optional[int] = None,
         system_prompt: Optional[Union[str, SystemPrompt]] = None,
         debug: bool = False,
+        max_tool_concurrency: Optional[int] = None,
+        context_budget: Optional[int] = None,
+        context_strategy: Optional[ContextStrategy] = None,
+        token_counter: Optional[TokenCounter] = None,
+        response_cache: Optional[Union[ResponseCache, bool]] = None,
         **kwargs
     ):
-        """Initialize agent with configuration"""
+        """Initialize agent with configuration
+
+        Args:
+        ----
+            context_budget: Maximum tokens of conversation history sent per
+                request; the full history is sent when not set
+            context_strategy: How history is trimmed to the budget, keeping the
+                most recent messages by default
+            token_counter: Counts tokens against the budget, the provider's
+                counter by default
+            response_cache: Cache for this agent's completions, or False to
+                opt out of the process-wide default cache
+
+        """
         self.name = name
         # Handle provider prefix in model name
         if ":" in model:
@@ -59,6 +101,15 @@ class Agent:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.debug = debug
+        self.max_tool_concurrency = max_tool_concurrency
+        self.context_budget = context_budget
+        self.context_strategy = context_strategy or KeepRecentStrategy()
+        self._token_counter = token_counter
+        if max_tool_concurrency is not None:
+            # Providers running their own tool loops read the limit from their config
+            kwargs["max_tool_concurrency"] = max_tool_concurrency
+        if response_cache is not None:
+            kwargs["response_cache"] = response_cache
 
         # Handle system prompt
         if isinstance(system_prompt, SystemPrompt):
@@ -70,7 +121,11 @@ class Agent:
         self._tools = []
         self._memory = ConversationMemory()
         self._memory_provider = None
+        self._current_thread: Optional[str] = None
         self._kwargs = kwargs
+        self._prompt_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
+        # Thread, state version, memory object and message count last synced with the memory provider
+        self._synced: Optional[Tuple[str, int, ConversationMemory, int]] = None
 
         # Initialize LLM provider
         self.llm = self._setup_provider(self._provider_name)
@@ -96,6 +151,8 @@ class Agent:
     def tools(self, value: Sequence[BaseTool]):
         """Set agent's tools"""
         self._tools = list(value)
+        # Formatted tool lists for the old tools won't be asked for again
+        self.llm.clear_tool_cache()
 
     def _setup_provider(self, provider: Union[str, LLMInterface], api_key: Optional[str] = None) -> LLMInterface:
         """Set up the LLM provider"""
@@ -111,8 +168,31 @@ class Agent:
         )
         return get_provider(provider, provider_config)
 
+    def _prompt_cache_key(self, dynamic_values: Optional[Dict[str, str]] = None) -> Optional[Tuple[Any, ...]]:
+        """Get the cache key for a rendered prompt, or None if it must be re-rendered"""
+        sections = self.system_prompt.sections
+        # Callable sections may render differently on every call
+        if any(callable(section.content) or callable(section.default_value) for section in sections):
+            return None
+
+        try:
+            values = frozenset((dynamic_values or {}).items())
+        except TypeError:
+            return None
+
+        return (
+            self.system_prompt.static_prompt,
+            tuple((section.content, section.is_dynamic, section.section_id, section.default_value) for section in sections),
+            values,
+            tuple((tool.name, tool.description) for tool in self._tools)
+        )
+
     def _build_enhanced_prompt(self, dynamic_values: Optional[Dict[str, str]] = None) -> str:
         """Build enhanced system prompt with tools"""
+        key = self._prompt_cache_key(dynamic_values)
+        if key is not None and self._prompt_cache is not None and self._prompt_cache[0] == key:
+            return self._prompt_cache[1]
+
         # Get base prompt with dynamic values
         base_prompt = self.system_prompt.render(dynamic_values)
 
@@ -126,7 +206,23 @@ class Agent:
 
             base_prompt += "\n\nAvailable Tools:\n" + "\n".join(tools_text)
 
+        if key is not None:
+            self._prompt_cache = (key, base_prompt)
         return base_prompt
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Token counter used for the context budget"""
+        if self._token_counter is None:
+            self._token_counter = self.llm.get_token_counter(self.model)
+        return self._token_counter
+
+    async def _context_messages(self) -> List[Message]:
+        """Get the conversation history to send, trimmed to the context budget"""
+        if self.context_budget is None:
+            return self.memory.messages
+        return await self.context_strategy.select(self.memory.messages, self.context_budget, self.token_counter)
+
     def _create_message(self, message: Union[str, Dict[str, Any], Message]) -> Message:
         """Convert various message formats to Message object"""
         if isinstance(message, Message):
@@ -178,6 +274,41 @@ class Agent:
                     self._log_message(f"Result: {tool_call['result']}", verbose)
                 self._log_message("---", verbose)
 
+    def _refresh_system_prompt(self, memory: ConversationMemory, dynamic_values: Optional[Dict[str, str]] = None) -> str:
+        """Render the system prompt into a memory's leading system message"""
+        enhanced_prompt = self._build_enhanced_prompt(dynamic_values)
+        if memory.messages and memory.messages[0].role == Role.SYSTEM:
+            # Only reassign on change so the message keeps its serialized form
+            if memory.messages[0].content != enhanced_prompt:
+                if memory is self._memory:
+                    memory.messages[0].content = enhanced_prompt
+                else:
+                    # Isolated memories share the system message; don't change it under other requests
+                    memory.messages[0] = Message(role=Role.SYSTEM, content=enhanced_prompt)
+        else:
+            # Insert system prompt at the beginning if not present
+            memory.messages.insert(0, Message(
+                role=Role.SYSTEM,
+                content=enhanced_prompt
+            ))
+        return enhanced_prompt
+
+    def _prepare_turn(
+        self,
+        message: Union[str, Dict[str, Any], Message],
+        dynamic_values: Optional[Dict[str, str]] = None
+    ) -> Tuple[Message, str]:
+        """Refresh the system prompt and add the incoming message to memory"""
+        # Convert message to proper format
+        message_obj = self._create_message(message)
+
+        # Update system prompt with current dynamic values and tools
+        enhanced_prompt = self._refresh_system_prompt(self.memory, dynamic_values)
+
+        # Add user message to memory
+        self.memory.add_message(message_obj)
+        return message_obj, enhanced_prompt
+
     async def _aprocess(
         self,
         message: Union[str, Dict[str, Any], Message],
@@ -201,22 +332,7 @@ class Agent:
         if injected_parameters:
             self._log_message(f"Injected Parameters: {injected_parameters}", verbose)
 
-        # Convert message to proper format
-        message_obj = self._create_message(message)
-
-        # Update system prompt with current dynamic values and tools
-        enhanced_prompt = self._build_enhanced_prompt(dynamic_values)
-        if self._memory.messages and self._memory.messages[0].role == Role.SYSTEM:
-            self._memory.messages[0].content = enhanced_prompt
-        else:
-            # Insert system prompt at the beginning if not present
-            self._memory.messages.insert(0, Message(
-                role=Role.SYSTEM,
-                content=enhanced_prompt
-            ))
-
-        # Add user message to memory
-        self.memory.add_message(message_obj)
+        message_obj, enhanced_prompt = self._prepare_turn(message, dynamic_values)
 
         self._log_message("\n📨 System Prompt:", verbose, "bold blue")
         self._log_message(enhanced_prompt, verbose)
@@ -228,7 +344,7 @@ class Agent:
             self._log_message("\n🔄 Getting response from provider...", verbose, "bold yellow")
 
             response = await self.llm.acomplete(
-                messages=self.memory.messages,  # Use full conversation history
+                messages=await self._context_messages(),
                 model=self.model,
                 tools=self._tools,
                 temperature=self.temperature,
@@ -246,35 +362,36 @@ class Agent:
 
             # Handle tool calls if any
             if response.tool_calls:
-                tool_results = []
-                for tool_call in response.tool_calls:
-                    tool = next(
-                        (t for t in self._tools if t.name == tool_call["function"]["name"]),
-                        None
-                    )
-                    if tool:
-                        try:
-                            args = json.loads(tool_call["function"]["arguments"])
-                            # Add injected parameters to tool call
-                            if injected_parameters:
-                                args["__injected_parameters__"] = injected_parameters
-                            result = await tool(**args)
-                            # Convert result to string if it's a dict
-                            if isinstance(result, dict):
-                                result = json.dumps(result, indent=2)
-
-                            # Add tool result to memory
-                            self.memory.add_message(Message(
-                                role=Role.TOOL,
-                                content=str(result),
-                                name=tool_call["function"]["name"],
-                                tool_call_id=tool_call["id"]
-                            ))
-
-                            tool_results.append(str(result))
-                        except Exception as e:
-                            self._log_message(f"\n❌ Tool execution failed: {str(e)}", verbose, "bold red")
-                            raise
+                async def execute(tool: BaseTool, tool_call: Dict[str, Any]) -> str:
+                    try:
+                        args = json.loads(tool_call["function"]["arguments"])
+                        # Add injected parameters to tool call
+                        if injected_parameters:
+                            args["__injected_parameters__"] = injected_parameters
+                        result = await tool(**args)
+                    except Exception as e:
+                        self._log_message(f"\n❌ Tool execution failed: {str(e)}", verbose, "bold red")
+                        raise
+                    # Convert result to string if it's a dict
+                    if isinstance(result, dict):
+                        result = json.dumps(result, indent=2)
+                    return str(result)
+
+                # Run the tool calls concurrently; results are added to memory
+                # in the order the model made the calls
+                executed = await dispatch_tool_calls(
+                    response.tool_calls,
+                    self._tools,
+                    execute,
+                    self.max_tool_concurrency or self.llm.max_tool_concurrency
+                )
+                for tool_call, _, result in executed:
+                    self.memory.add_message(Message(
+                        role=Role.TOOL,
+                        content=result,
+                        name=tool_call["function"]["name"],
+                        tool_call_id=tool_call["id"]
+                    ))
 
                 # Combine tool results into final response
                 combined_content = response.content
@@ -307,7 +424,7 @@ class Agent:
         verbose: bool = False
     ) -> ModelResponse:
         """Process a message and return a response (sync version)"""
-        return asyncio.run(self.aprocess(
+        return run_sync(self.aprocess(
             message,
             response_schema=response_schema,
             thread_id=thread_id,
@@ -345,7 +462,8 @@ class Agent:
             verbose: Whether to print verbose output
 
         """
-        if self.memory_provider:
+        persist = self._persists_memory()
+        if persist:
             # If no thread specified but we have a memory provider,
             # get or create a default thread
             if thread_id is None:
@@ -366,12 +484,160 @@ class Agent:
             )
 
             # Save state if using memory
-            if self.memory_provider:
+            if persist:
                 await self._save_thread_state()
 
             return response
         finally:
-            self._current_thread = None
+            if persist:
+                self._current_thread = None
+
+    async def aprocess_stream(
+        self,
+        message: Union[str, Dict[str, Any], Message],
+        thread_id: Optional[str] = None,
+        dynamic_values: Optional[Dict[str, str]] = None,
+        verbose: bool = False
+    ) -> AsyncIterator[StreamChunk]:
+        """Process a message, yielding response chunks as they are generated
+
+        The assembled response is added to memory once the stream completes,
+        and is also available as ``response`` on the final chunk.
+
+        Args:
+        ----
+            message: The message to process
+            thread_id: Optional thread ID for memory persistence
+            dynamic_values: Optional dynamic values for system prompt
+            verbose: Whether to print verbose output
+
+        """
+        persist = self._persists_memory()
+        if persist:
+            if thread_id is None:
+                thread_id = await self.memory_provider.get_or_create_thread(self.name)
+
+            self._current_thread = thread_id
+            await self._load_thread_state(thread_id)
+
+        try:
+            self._log_message(f"\n🤖 Agent {self.name} streaming:", verbose, "bold blue")
+            self._prepare_turn(message, dynamic_values)
+
+            response = None
+            async for chunk in self.llm.astream(
+                messages=await self._context_messages(),
+                model=self.model,
+                tools=self._tools,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
+            ):
+                if chunk.response is not None:
+                    response = chunk.response
+                yield chunk
+
+            if response is None:
+                return
+
+            self._log_response(response, verbose)
+
+            # Add the assembled response and the results of tools it used to memory
+            self.memory.add_message(Message(
+                role=Role.ASSISTANT,
+                content=response.content,
+                tool_calls=response.tool_calls
+            ))
+            for tool_call in response.tool_calls or []:
+                if "result" in tool_call:
+                    self.memory.add_message(Message(
+                        role=Role.TOOL,
+                        content=tool_call["result"],
+                        name=tool_call["function"]["name"],
+                        tool_call_id=tool_call["id"]
+                    ))
+
+            if persist:
+                await self._save_thread_state()
+        except Exception as e:
+            self._log_message(f"\n❌ Error in agent streaming: {str(e)}", verbose, "bold red")
+            raise
+        finally:
+            if persist:
+                self._current_thread = None
+
+    async def _abatch_one(
+        self,
+        message: Union[str, Dict[str, Any], Message],
+        response_schema: Optional[Type[BaseModel]],
+        dynamic_values: Optional[Dict[str, str]],
+        injected_parameters: Optional[List[Dict[str, Any]]]
+    ) -> ModelResponse:
+        with isolated_memory():
+            return await self._aprocess(
+                message,
+                response_schema=response_schema,
+                dynamic_values=dynamic_values,
+                injected_parameters=injected_parameters
+            )
+
+    def _batch_func(
+        self,
+        response_schema: Optional[Type[BaseModel]],
+        dynamic_values: Optional[Dict[str, str]],
+        injected_parameters: Optional[List[Dict[str, Any]]]
+    ) -> Callable[[Union[str, Dict[str, Any], Message]], Awaitable[ModelResponse]]:
+        """Get the callable processing one batch input"""
+        # Render the shared system prompt once, so requests find it up to date
+        self._refresh_system_prompt(self._memory, dynamic_values)
+        return lambda message: self._abatch_one(message, response_schema, dynamic_values, injected_parameters)
+
+    async def abatch(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], Message]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        response_schema: Optional[Type[BaseModel]] = None,
+        dynamic_values: Optional[Dict[str, str]] = None,
+        injected_parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> List[BatchResult[ModelResponse]]:
+        """Process many independent messages concurrently
+
+        Each message is processed in its own memory holding only the system
+        prompt, so requests don't see each other and the agent's own memory
+        is left untouched. Batch requests are not saved to the memory provider.
+
+        Args:
+        ----
+            inputs: Messages to process
+            concurrency: Maximum number of requests in flight
+            response_schema: Optional schema for every response
+            dynamic_values: Optional dynamic values for the system prompt
+            injected_parameters: Optional parameter injections for tools
+
+        Returns:
+        -------
+            One result per input in input order; failed inputs carry their ``error``
+
+        """
+        return await run_batch(
+            self._batch_func(response_schema, dynamic_values, injected_parameters), inputs, concurrency
+        )
+
+    async def abatch_stream(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], Message]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        response_schema: Optional[Type[BaseModel]] = None,
+        dynamic_values: Optional[Dict[str, str]] = None,
+        injected_parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[BatchResult[ModelResponse]]:
+        """Process many independent messages concurrently, yielding results as they complete
+
+        Takes the same arguments as ``abatch``; each result's ``index`` is the
+        position of its input.
+        """
+        func = self._batch_func(response_schema, dynamic_values, injected_parameters)
+        async for result in iter_batch(func, inputs, concurrency):
+            yield result
 
     # Just here for backward compatibility
     def generate(self, *args, **kwargs) -> ModelResponse:
@@ -437,17 +703,52 @@ class Agent:
         provider, model = model_str.split(":", 1)
         return provider.lower(), model
 
+    def _persists_memory(self) -> bool:
+        """Whether this request loads and saves memory provider state
+
+        Requests inside ``isolated_memory`` keep their memory to themselves,
+        so they neither read nor write the agent's stored thread.
+        """
+        return self.memory_provider is not None and _request_memories.get() is None
+
+    def _synced_version(self, thread_id: str, exact: bool = True) -> Optional[int]:
+        """Get the stored version memory is in sync with, or None if it may differ
+
+        Memory counts as in sync while it is the same object, holds the synced
+        messages (exactly, or as a prefix when ``exact`` is False) and the
+        thread is the one last loaded or saved.
+        """
+        if self._synced is None:
+            return None
+
+        synced_thread, version, memory, count = self._synced
+        if synced_thread != thread_id or memory is not self._memory:
+            return None
+        if len(memory.messages) < count or (exact and len(memory.messages) != count):
+            return None
+        return version
+
+    def _mark_synced(self, thread_id: str, version: Optional[int]) -> None:
+        """Record that memory matches the stored state at ``version``"""
+        self._synced = None if version is None else (thread_id, version, self._memory, len(self._memory.messages))
+
     async def _load_thread_state(self, thread_id: str) -> None:
-        """Load state for current thread"""
+        """Load state for current thread, keeping memory if the thread is unchanged"""
         if not self.memory_provider:
             return
 
+        loaded = await self.memory_provider.load_state_versioned(
+            self.name, thread_id, self._synced_version(thread_id)
+        )
+        if not loaded.changed:
+            return
+
         # First, wipe current memory but preserve system prompt
         system_messages = [msg for msg in self.memory.messages if msg.role == Role.SYSTEM]
         self.memory.messages = system_messages.copy()
 
         # Then load state
-        state = await self.memory_provider.load_state(self.name, thread_id)
+        state = loaded.state
         if state and "messages" in state:
             # Convert dict messages back to Message objects and append to existing system messages
             loaded_messages = [Message(**msg) for msg in state["messages"]]
@@ -455,13 +756,36 @@ class Agent:
             loaded_messages = [msg for msg in loaded_messages if msg.role != Role.SYSTEM]
             self.memory.messages.extend(loaded_messages)
 
+        self._mark_synced(thread_id, loaded.version)
+
     async def _save_thread_state(self) -> None:
-        """Save current state to thread"""
+        """Save current state to thread, appending only messages added since the last sync"""
         if not self.memory_provider or not self._current_thread:
             return
 
+        thread_id = self._current_thread
+        version = self._synced_version(thread_id, exact=False)
+        if version is not None:
+            new_messages = [msg.model_dump() for msg in self.memory.messages[self._synced[3]:]]
+            try:
+                version = await self.memory_provider.append_messages(
+                    self.name, thread_id, new_messages, since_version=version,
+                    updates={"last_updated": datetime.now().isoformat()}
+                )
+            except VersionConflictError:
+                # Another writer got in first; fall back to saving everything
+                version = None
+            if version is not None:
+                self._mark_synced(thread_id, version)
+                return
+
+        await self._save_full_state({})
+
+    async def _save_full_state(self, extra: Dict[str, Any]) -> None:
+        """Save every message in memory, plus ``extra`` state, to the current thread"""
         state = {
-            "messages": [msg.dict() for msg in self.memory.messages],
+            "messages": [msg.model_dump() for msg in self.memory.messages],
+            **extra,
             "last_updated": datetime.now().isoformat()
         }
         await self.memory_provider.save_state(
@@ -469,6 +793,10 @@ class Agent:
             self._current_thread,
             state
         )
+        self._mark_synced(
+            self._current_thread,
+            await self.memory_provider.get_state_version(self.name, self._current_thread)
+        )
 
     async def add_thread_metadata(self, key: str, value: Any) -> None:
         """Add metadata to current thread"""
@@ -482,21 +810,34 @@ class Agent:
         thread.metadata[key] = value
 
         # Save updated state
-        state = {
-            "messages": [msg.dict() for msg in self.memory.messages],
-            "metadata": thread.metadata,
-            "last_updated": datetime.now().isoformat()
-        }
-        await self.memory_provider.save_state(
-            self.name,
-            self._current_thread,
-            state
-        )
+        await self._save_full_state({"metadata": thread.metadata})
+
+    async def aclose(self) -> None:
+        """Release the provider clients held by this agent"""
+        await self.llm.aclose()
 
     @property
     def memory(self) -> ConversationMemory:
-        """Get agent's memory"""
-        return self._memory
+        """Get agent's memory, or its memory for the current request inside ``isolated_memory``"""
+        scope = _request_memories.get()
+        if scope is None:
+            return self._memory
+
+        memory = scope.get(self)
+        if memory is None:
+            messages = self._memory.messages
+            system = messages[:1] if messages and messages[0].role == Role.SYSTEM else []
+            memory = scope[self] = ConversationMemory(messages=system)
+        return memory
+
+    @memory.setter
+    def memory(self, value: ConversationMemory) -> None:
+        """Replace agent's memory, or its memory for the current request inside ``isolated_memory``"""
+        scope = _request_memories.get()
+        if scope is None:
+            self._memory = value
+        else:
+            scope[self] = value
 
     @property
     def memory_provider(self) -> Optional[MemoryProvider]:
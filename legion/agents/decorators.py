@@ -2,15 +2,12 @@ import inspect
 import logging
 from typing import List, Optional, Type
 
-from rich import print as rprint
-from rich.console import Console
-
 from legion.agents.base import Agent
+from legion.console import rprint
 from legion.interface.schemas import SystemPrompt, SystemPromptSection
 from legion.interface.tools import BaseTool
 
-# Set up rich console and logging
-console = Console()
+# Set up logging
 logger = logging.getLogger(__name__)
 
 def agent(
@@ -1,15 +1,15 @@
-import asyncio
+import importlib
 import inspect
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable, List, Optional, Type, get_args, get_origin
 
 from pydantic import BaseModel
-from rich import print as rprint
-from rich.console import Console
 
-# Set up rich console and logging
-console = Console()
+from ..console import rprint
+from ..interface.executors import ExecutorKind, executor_registry
+
+# Set up logging
 logger = logging.getLogger("legion")
 
 @dataclass
@@ -36,6 +36,34 @@ class ValidationError(BlockError):
         self.schema = schema
         super().__init__(message)
 
+def _call_block_function(module_name: str, qualname: str, input_data: Any) -> Any:
+    """Run a block's function in a worker process
+
+    The function is looked up by module and name because the module attribute
+    holds the decorated block rather than the function itself.
+    """
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    if isinstance(target, FunctionalBlock):
+        target = target.func
+    return target(input_data)
+
+def _check_process_safe(func: Callable) -> None:
+    """Ensure a block function can be run in a worker process
+
+    Raises
+    ------
+        BlockError: If the function cannot be looked up from another process
+
+    """
+    if inspect.iscoroutinefunction(func):
+        raise BlockError(f"Block {func.__name__} is async and cannot run in a process pool")
+    if func.__name__ == "<lambda>" or "." in func.__qualname__:
+        raise BlockError(
+            f"Block {func.__qualname__} must be a module-level function to run in a process pool"
+        )
+
 class FunctionalBlock:
     """A discrete processing unit that can be used in chains"""
 
@@ -43,12 +71,18 @@ class FunctionalBlock:
         self,
         func: Callable,
         metadata: BlockMetadata,
-        validate: bool = True
+        validate: bool = True,
+        executor: Optional[str] = None,
+        process: bool = False
     ):
         self.func = func
         self.metadata = metadata
         self.validate = validate
         self.is_async = inspect.iscoroutinefunction(func)
+        self.executor = executor or f"block.{metadata.name}"
+        self.process = process
+        if process:
+            _check_process_safe(func)
 
         # Store original function signature
         self.signature = inspect.signature(func)
@@ -162,13 +196,14 @@ class FunctionalBlock:
                 # Execute function based on type
                 if self.is_async:
                     result = await self.func(validated_input)
-                else:
-                    # Run sync function in thread pool
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda: self.func(validated_input)
+                elif self.process:
+                    # Run CPU-heavy function in a worker process
+                    result = await executor_registry.get(self.executor, ExecutorKind.PROCESS).run(
+                        _call_block_function, self.func.__module__, self.func.__qualname__, validated_input
                     )
+                else:
+                    # Run sync function in the block's thread pool
+                    result = await executor_registry.get(self.executor).run(self.func, validated_input)
 
                 # Validate output
                 validated_output = self._validate_output(result)
@@ -196,7 +231,8 @@ class FunctionalBlock:
         bound_block = FunctionalBlock(
             func=self.func.__get__(obj, objtype),
             metadata=self.metadata,
-            validate=self.validate
+            validate=self.validate,
+            executor=self.executor
         )
 
         return bound_block
@@ -3,13 +3,11 @@ import logging
 from typing import List, Optional, Type
 
 from pydantic import BaseModel
-from rich import print as rprint
-from rich.console import Console
 
+from ..console import rprint
 from .base import BlockMetadata, FunctionalBlock
 
-# Set up rich console and logging
-console = Console()
+# Set up logging
 logger = logging.getLogger(__name__)
 
 def block(
@@ -20,7 +18,9 @@ def block(
     version: str = "1.0",
     tags: Optional[List[str]] = None,
     validate: bool = True,
-    debug: Optional[bool] = False
+    debug: Optional[bool] = False,
+    executor: Optional[str] = None,
+    process: bool = False
 ):
     """Decorator to create a functional block
 
@@ -34,6 +34,11 @@ def block(
     async def process_data(data: InputModel) -> OutputModel:
         ...
 
+    Synchronous blocks run in a thread pool named by ``executor`` (one per
+    block by default). With ``process=True`` they run in a process pool
+    instead, which requires a module-level function with picklable input
+    and output.
+
     """
 
     def _log_message(message: str, color: str = None) -> None:
@@ -76,7 +81,9 @@ def block(
         return FunctionalBlock(
             func=func,
             metadata=metadata,
-            validate=validate
+            validate=validate,
+            executor=executor,
+            process=process
         )
 
     return decorator
@@ -0,0 +1,13 @@
+"""Lazily loaded rich console output
+
+Importing rich is deferred until something is actually printed, so
+``import legion`` stays cheap for processes that never run verbose.
+"""
+
+from typing import Any
+
+
+def rprint(*objects: Any, **kwargs: Any) -> None:
+    """Print with rich markup, as ``rich.print`` does"""
+    from rich import print as rich_print
+    rich_print(*objects, **kwargs)
@@ -2,6 +2,7 @@
 """Custom exceptions for legion"""
 
 from .exceptions import AgentError, LegionError, ProviderError
+from .exceptions import VersionConflictError as VersionConflictError
 
 
 class LegionError(Exception):
@@ -30,3 +30,8 @@ class AgentError(LegionError):
     """Error in agent operations"""
 
     pass
+
+class VersionConflictError(LegionError):
+    """Stored state changed since the version a write was based on"""
+
+    pass
@@ -1,10 +1,16 @@
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Set,
@@ -17,6 +23,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .metadata import MetadataClock
+
 T = TypeVar("T")
 
 class ChannelMetadata(BaseModel):
@@ -33,6 +41,64 @@ class ChannelMetadata(BaseModel):
         }
     )
 
+class SequenceView(Sequence, Generic[T]):
+    """Read-only view of a channel's values
+
+    Channels hand out views instead of copies and copy their own storage
+    before the next write while a view is still alive, so a view never
+    changes after it is returned. Views compare equal to lists and tuples
+    with the same items.
+    """
+
+    __slots__ = ("_items", "__weakref__")
+
+    def __init__(self, items: Sequence):
+        self._items = items
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            items = self._items if isinstance(self._items, list) else list(self._items)
+            return items[index]
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        # A generator keeps the view referenced while iteration is in progress,
+        # so writes to the channel during the loop copy storage first
+        yield from self._items
+
+    def __reversed__(self) -> Iterator[T]:
+        yield from reversed(self._items)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._items
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SequenceView):
+            other = other._items
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self._items) == len(other) and all(a == b for a, b in zip(self._items, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SequenceView({list(self._items)!r})"
+
+    def copy(self) -> List[T]:
+        """Get the values as a new list"""
+        return list(self._items)
+
+def _view_of(channel: Any, items: Sequence) -> SequenceView:
+    """Get a view of a channel's storage, reusing the one readers already hold"""
+    view = channel._view() if channel._view is not None else None
+    if view is None:
+        view = SequenceView(items)
+        channel._view = weakref.ref(view)
+    return view
+
 class Channel(Generic[T], ABC):
     """Base class for all channels"""
 
@@ -47,9 +113,9 @@ class Channel(Generic[T], ABC):
         """
         self._type_hint = type_hint
         self._validate_type = validate_type
-        self._metadata = ChannelMetadata(
-            type_hint=type_hint.__name__ if type_hint else None
-        )
+        # Writes only touch the clock; the pydantic model is built when inspected
+        self._clock = MetadataClock()
+        self._metadata: Optional[ChannelMetadata] = None
         self._id = str(uuid4())
 
     @property
@@ -60,7 +126,11 @@ class Channel(Generic[T], ABC):
     @property
     def metadata(self) -> ChannelMetadata:
         """Get channel metadata"""
-        return self._metadata
+        if self._metadata is None:
+            self._metadata = ChannelMetadata(
+                type_hint=self._type_hint.__name__ if self._type_hint else None
+            )
+        return self._clock.stamp(self._metadata)
 
     def _validate_value_type(self, value: Any) -> None:
         """Validate value type"""
@@ -106,8 +176,12 @@ class Channel(Generic[T], ABC):
 
     def _update_metadata(self) -> None:
         """Update metadata after value change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
+
+    def _restore_metadata(self, data: Dict[str, Any]) -> None:
+        """Restore metadata from a checkpoint"""
+        self._metadata = ChannelMetadata(**data)
+        self._clock = MetadataClock.from_model(self._metadata)
 
     @abstractmethod
     def get(self) -> T:
@@ -154,13 +228,13 @@ class LastValue(Channel[T]):
     def checkpoint(self) -> Dict[str, Any]:
         """Create checkpoint"""
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "value": self._value
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
         """Restore from checkpoint"""
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
         self._value = checkpoint["value"]
 
 class ValueSequence(Channel[T]):
@@ -168,40 +242,56 @@ class ValueSequence(Channel[T]):
 
     def __init__(self, type_hint: Optional[Type[T]] = None, max_size: Optional[int] = None):
         super().__init__(type_hint)
-        self._values: List[T] = []
         self._max_size = max_size
-
-    def get(self) -> List[T]:
-        return self._values.copy()
-
-    def get_all(self) -> List[T]:
+        # Bounded sequences drop their oldest value on append
+        self._values: Deque[T] = deque(maxlen=max_size or None)
+        # Last view handed out, while a reader still holds it
+        self._view: Optional["weakref.ref[SequenceView[T]]"] = None
+
+    def _own(self) -> None:
+        """Copy the values before modifying them if a reader holds a view of them"""
+        if self._view is not None:
+            if self._view() is not None:
+                self._values = self._values.copy()
+            self._view = None
+
+    def get(self) -> SequenceView[T]:
+        """Get a read-only view of the values"""
+        return _view_of(self, self._values)
+
+    def get_all(self) -> SequenceView[T]:
         """Get all values in sequence"""
-        return self._values.copy()
+        return self.get()
+
+    def get_mut(self) -> List[T]:
+        """Get a copy of the values owned by the caller"""
+        return list(self._values)
 
     def append(self, value: T) -> None:
         self._validate_value_type(value)
+        self._own()
         self._values.append(value)
-        if self._max_size and len(self._values) > self._max_size:
-            self._values.pop(0)
         self._update_metadata()
 
     def set(self, values: List[T]) -> None:
         for value in values:
             self._validate_value_type(value)
-        self._values = values[-self._max_size:] if self._max_size else values.copy()
+        self._values = deque(values, maxlen=self._max_size or None)
+        self._view = None
         self._update_metadata()
 
     def checkpoint(self) -> Dict[str, Any]:
         return {
-            "metadata": self._metadata.model_dump(),
-            "values": self._values,
+            "metadata": self.metadata.model_dump(),
+            "values": list(self._values),
             "max_size": self._max_size
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
-        self._values = checkpoint["values"]
+        self._restore_metadata(checkpoint["metadata"])
         self._max_size = checkpoint["max_size"]
+        self._values = deque(checkpoint["values"], maxlen=self._max_size or None)
+        self._view = None
 
 class SharedState(Channel[Dict[str, Any]]):
     """Channel that maintains a shared dictionary state"""
@@ -209,40 +299,76 @@ class SharedState(Channel[Dict[str, Any]]):
     def __init__(self, type_hint: Optional[Type[Dict[str, Any]]] = None):
         super().__init__(dict)  # Use dict instead of Dict
         self._state: Dict[str, Any] = {}
+        # Whether a view or checkpoint references the current dict
+        self._shared = False
 
-    def get(self) -> Dict[str, Any]:
-        return self._state.copy()
+    def get(self) -> Mapping[str, Any]:
+        """Get a read-only view of the state"""
+        self._shared = True
+        return MappingProxyType(self._state)
+
+    def get_key(self, key: str, default: Any = None) -> Any:
+        """Get one value from the state without copying it"""
+        return self._state.get(key, default)
+
+    def get_mut(self) -> Dict[str, Any]:
+        """Get a copy of the state owned by the caller"""
+        return dict(self._state)
 
     def set(self, state: Dict[str, Any]) -> None:
+        # Accept views returned by get()
+        if isinstance(state, Mapping) and not isinstance(state, dict):
+            state = dict(state)
         self._validate_value_type(state)
         self._state = state.copy()
+        self._shared = False
         self._update_metadata()
 
     def update(self, updates: Dict[str, Any]) -> None:
-        self._state.update(updates)
+        if self._shared:
+            self._state = {**self._state, **updates}
+            self._shared = False
+        else:
+            self._state.update(updates)
         self._update_metadata()
 
     def checkpoint(self) -> Dict[str, Any]:
+        self._shared = True
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "state": self._state
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
         self._state = checkpoint["state"]
+        # The dict still belongs to the checkpoint
+        self._shared = True
 
 class MessageChannel(Channel[T]):
     """FIFO message queue channel with capacity management and batch operations"""
 
     def __init__(self, type_hint: Optional[Type[T]] = None, capacity: Optional[int] = None):
         super().__init__(type_hint)
-        self._messages: List[T] = []
+        self._messages: Deque[T] = deque()
         self._capacity = capacity
+        # Last view handed out, while a reader still holds it
+        self._view: Optional["weakref.ref[SequenceView[T]]"] = None
+
+    def _own(self) -> None:
+        """Copy the messages before modifying them if a reader holds a view of them"""
+        if self._view is not None:
+            if self._view() is not None:
+                self._messages = self._messages.copy()
+            self._view = None
 
-    def get(self) -> List[T]:
-        """Get all messages without removing them"""
-        return self._messages.copy()
+    def get(self) -> SequenceView[T]:
+        """Get a read-only view of all messages without removing them"""
+        return _view_of(self, self._messages)
+
+    def get_mut(self) -> List[T]:
+        """Get a copy of all messages owned by the caller"""
+        return list(self._messages)
 
     def set(self, messages: List[T]) -> None:
         """Replace all messages with new ones"""
@@ -252,7 +378,8 @@ class MessageChannel(Channel[T]):
         if self._capacity and len(messages) > self._capacity:
             raise ValueError(f"Message count {len(messages)} exceeds channel capacity {self._capacity}")
 
-        self._messages = messages.copy()
+        self._messages = deque(messages)
+        self._view = None
         self._update_metadata()
 
     def push(self, message: T) -> bool:
@@ -262,18 +389,22 @@ class MessageChannel(Channel[T]):
         if self._capacity and len(self._messages) >= self._capacity:
             return False
 
+        self._own()
         self._messages.append(message)
         self._update_metadata()
         return True
 
     def push_batch(self, messages: List[T]) -> int:
         """Push multiple messages. Returns number of messages successfully pushed."""
-        remaining_capacity = float("inf") if self._capacity is None else self._capacity - len(self._messages)
-        messages_to_add = messages[:remaining_capacity]
+        if self._capacity is None:
+            messages_to_add = messages
+        else:
+            messages_to_add = messages[:max(0, self._capacity - len(self._messages))]
 
         for message in messages_to_add:
             self._validate_value_type(message)
 
+        self._own()
         self._messages.extend(messages_to_add)
         self._update_metadata()
         return len(messages_to_add)
@@ -282,7 +413,8 @@ class MessageChannel(Channel[T]):
         """Remove and return the oldest message"""
         if not self._messages:
             return None
-        message = self._messages.pop(0)
+        self._own()
+        message = self._messages.popleft()
         self._update_metadata()
         return message
 
@@ -292,14 +424,16 @@ class MessageChannel(Channel[T]):
             return []
 
         count = min(max_count or len(self._messages), len(self._messages))
-        messages = self._messages[:count]
-        self._messages = self._messages[count:]
+        self._own()
+        popleft = self._messages.popleft
+        messages = [popleft() for _ in range(count)]
         self._update_metadata()
         return messages
 
     def clear(self) -> None:
         """Remove all messages"""
-        self._messages.clear()
+        self._messages = deque()
+        self._view = None
         self._update_metadata()
 
     @property
@@ -316,15 +450,16 @@ class MessageChannel(Channel[T]):
 
     def checkpoint(self) -> Dict[str, Any]:
         return {
-            "metadata": self._metadata.model_dump(),
-            "messages": self._messages,
+            "metadata": self.metadata.model_dump(),
+            "messages": list(self._messages),
             "capacity": self._capacity
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
-        self._messages = checkpoint["messages"]
+        self._restore_metadata(checkpoint["metadata"])
+        self._messages = deque(checkpoint["messages"])
         self._capacity = checkpoint["capacity"]
+        self._view = None
 
 class BarrierChannel(Channel[bool]):
     """Channel that acts as a synchronization barrier for multiple contributors"""
@@ -402,7 +537,7 @@ class BarrierChannel(Channel[bool]):
 
     def checkpoint(self) -> Dict[str, Any]:
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "contributor_count": self._contributor_count,
             "timeout": self._timeout,
             "current_contributors": list(self._current_contributors),
@@ -411,7 +546,7 @@ class BarrierChannel(Channel[bool]):
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
         self._contributor_count = checkpoint["contributor_count"]
         self._timeout = checkpoint["timeout"]
         self._current_contributors = set(checkpoint["current_contributors"])
@@ -432,7 +567,7 @@ class BroadcastChannel(Channel[T]):
         """
         super().__init__(type_hint)
         self._subscribers: Set[str] = set()
-        self._history: List[T] = []
+        self._history: Deque[T] = deque(maxlen=history_size)
         self._history_size = history_size
         self._current_value: Optional[T] = None
 
@@ -450,13 +585,7 @@ class BroadcastChannel(Channel[T]):
         """Broadcast a value to all subscribers"""
         self._validate_value_type(value)
         self._current_value = value
-
-        if self._history_size is not None:
-            self._history.append(value)
-            if len(self._history) > self._history_size:
-                self._history.pop(0)
-        else:
-            self._history.append(value)
+        self._history.append(value)
 
         self._update_metadata()
 
@@ -471,7 +600,7 @@ class BroadcastChannel(Channel[T]):
     @property
     def history(self) -> List[T]:
         """Get message history"""
-        return self._history.copy()
+        return list(self._history)
 
     @property
     def subscribers(self) -> Set[str]:
@@ -490,18 +619,18 @@ class BroadcastChannel(Channel[T]):
 
     def checkpoint(self) -> Dict[str, Any]:
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "subscribers": list(self._subscribers),
-            "history": self._history,
+            "history": list(self._history),
             "history_size": self._history_size,
             "current_value": self._current_value
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
         self._subscribers = set(checkpoint["subscribers"])
-        self._history = checkpoint["history"]
         self._history_size = checkpoint["history_size"]
+        self._history = deque(checkpoint["history"], maxlen=self._history_size)
         self._current_value = checkpoint["current_value"]
 
 class AggregatorChannel(Channel[T]):
@@ -523,7 +652,8 @@ class AggregatorChannel(Channel[T]):
 
         """
         super().__init__(type_hint)
-        self._values: List[T] = []
+        # The window drops its oldest value once full
+        self._values: Deque[T] = deque(maxlen=window_size)
         self._window_size = window_size
         self._reducer = reducer or (lambda x: x[-1] if x else None)  # Default to last value
         self._current_result: Optional[T] = None
@@ -531,11 +661,6 @@ class AggregatorChannel(Channel[T]):
     def contribute(self, value: T) -> None:
         """Add a value to be aggregated"""
         self._validate_value_type(value)
-
-        if self._window_size is not None:
-            if len(self._values) >= self._window_size:
-                self._values.pop(0)
-
         self._values.append(value)
         self._update_result()
         self._update_metadata()
@@ -547,7 +672,7 @@ class AggregatorChannel(Channel[T]):
             return
 
         try:
-            result = self._reducer(self._values.copy())
+            result = self._reducer(list(self._values))
             if result is not None:  # Allow reducer to return None
                 self._validate_value_type(result)
             self._current_result = result
@@ -562,7 +687,7 @@ class AggregatorChannel(Channel[T]):
     def set(self, value: T) -> None:
         """Set a single value (clears window and sets as only value)"""
         self._validate_value_type(value)
-        self._values = [value]
+        self._values = deque([value], maxlen=self._window_size)
         self._update_result()
         self._update_metadata()
 
@@ -575,7 +700,7 @@ class AggregatorChannel(Channel[T]):
     @property
     def window(self) -> List[T]:
         """Get current window of values"""
-        return self._values.copy()
+        return list(self._values)
 
     @property
     def window_size(self) -> Optional[int]:
@@ -584,16 +709,16 @@ class AggregatorChannel(Channel[T]):
 
     def checkpoint(self) -> Dict[str, Any]:
         return {
-            "metadata": self._metadata.model_dump(),
-            "values": self._values,
+            "metadata": self.metadata.model_dump(),
+            "values": list(self._values),
             "window_size": self._window_size,
             "current_result": self._current_result
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
-        self._metadata = ChannelMetadata(**checkpoint["metadata"])
-        self._values = checkpoint["values"]
+        self._restore_metadata(checkpoint["metadata"])
         self._window_size = checkpoint["window_size"]
+        self._values = deque(checkpoint["values"], maxlen=self._window_size)
         self._current_result = checkpoint["current_result"]
         # Note: reducer is not serialized/restored as it's a function
 
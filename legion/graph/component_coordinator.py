@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 from uuid import uuid4
 
 from .channels import Channel, MessageChannel, SharedMemory
@@ -158,7 +158,7 @@ class ComponentCoordinator:
                     del self._state_scopes[child_scope]
             del self._scope_hierarchy[scope]
 
-    def get_state(self, component_id: str) -> Optional[Dict]:
+    def get_state(self, component_id: str) -> Optional[Mapping]:
         """Get component state
 
         Args:
@@ -167,7 +167,7 @@ class ComponentCoordinator:
 
         Returns:
         -------
-            Component state if found
+            Read-only view of the component state if found
 
         """
         if component_id not in self._components:
@@ -191,7 +191,7 @@ class ComponentCoordinator:
         metadata = self._components[component_id]
         self._state_scopes[metadata.state_scope].set(state)
 
-    def get_parent_state(self, component_id: str) -> Optional[Dict]:
+    def get_parent_state(self, component_id: str) -> Optional[Mapping]:
         """Get parent component state
 
         Args:
@@ -294,11 +294,11 @@ class ComponentCoordinator:
         self._event_channel.push(f"component_error:{component_id}")
 
     @property
-    def errors(self) -> List[Exception]:
-        """Get all reported errors"""
+    def errors(self) -> Sequence[Exception]:
+        """Get all reported errors, as a read-only view"""
         return self._error_channel.get()
 
     @property
-    def events(self) -> List[str]:
-        """Get all component events"""
+    def events(self) -> Sequence[str]:
+        """Get all component events, as a read-only view"""
         return self._event_channel.get()
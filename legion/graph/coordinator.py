@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -170,8 +170,8 @@ class BSPCoordinator:
         self._step_metadata = None
 
     @property
-    def errors(self) -> List[Exception]:
-        """Get errors from current step"""
+    def errors(self) -> Sequence[Exception]:
+        """Get errors from current step, as a read-only view"""
         return self._error_channel.get()
 
     @property
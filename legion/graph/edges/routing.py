@@ -101,8 +101,7 @@ class StateCondition(RoutingCondition):
 
     async def evaluate(self, source_node: NodeBase, **kwargs) -> bool:
         """Evaluate state condition"""
-        state_data = self._graph_state.get_global_state()
-        state_value = state_data.get(self._state_key)
+        state_value = self._graph_state.get_key(self._state_key)
         return self._predicate(state_value)
 
     def checkpoint(self) -> Dict[str, Any]:
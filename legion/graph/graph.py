@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from .edges.base import EdgeBase
 from .edges.registry import EdgeRegistry
 from .edges.validator import EdgeValidator
+from .metadata import MetadataClock
 from .nodes.base import NodeBase
 from .nodes.execution import ExecutionMode
 from .nodes.registry import NodeRegistry
@@ -105,6 +106,7 @@ class Graph:
         config: Optional[GraphConfig] = None
     ):
         self._metadata = GraphMetadata(name=name, description=description)
+        self._clock = MetadataClock.from_model(self._metadata)
         self._config = config or GraphConfig()
         self._state = GraphState()
         self._node_registry = NodeRegistry(self._state)
@@ -336,7 +338,7 @@ class Graph:
     @property
     def metadata(self) -> GraphMetadata:
         """Get graph metadata"""
-        return self._metadata
+        return self._clock.stamp(self._metadata)
 
     @property
     def state(self) -> GraphState:
@@ -355,5 +357,4 @@ class Graph:
 
     def _update_metadata(self) -> None:
         """Update metadata after graph change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
@@ -0,0 +1,84 @@
+"""Version and timestamp tracking for frequently mutated graph objects
+
+Channels, state, nodes and registries bump their version on every write.
+Doing that on a pydantic model costs a ``datetime.now()`` call and a model
+``__setattr__`` per write, so the counters live in a ``MetadataClock``
+instead and are copied onto the pydantic metadata model only when it is
+read or checkpointed.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Optional, TypeVar, Union
+
+M = TypeVar("M")
+
+class MetadataClock:
+    """Creation time, last update time and version of an object
+
+    Timestamps are kept as ``time.time()`` floats and converted to
+    ``datetime`` only when read.
+    """
+
+    __slots__ = ("version", "_created", "_updated")
+
+    def __init__(
+        self,
+        version: int = 0,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ):
+        """Initialize the clock
+
+        Args:
+        ----
+            version: Starting version
+            created_at: Creation time, defaults to now
+            updated_at: Last update time, defaults to the creation time
+
+        """
+        now = time.time()
+        self.version = version
+        self._created: Union[float, datetime] = created_at if created_at is not None else now
+        self._updated: Union[float, datetime] = updated_at if updated_at is not None else self._created
+
+    @classmethod
+    def from_model(cls, model: Any) -> "MetadataClock":
+        """Create a clock from a metadata model's version and timestamps"""
+        return cls(model.version, model.created_at, model.updated_at)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time"""
+        return _as_datetime(self._created)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Time of the last update"""
+        return _as_datetime(self._updated)
+
+    def touch(self) -> None:
+        """Record an update"""
+        self.version += 1
+        self._updated = time.time()
+
+    def stamp(self, model: M) -> M:
+        """Copy the version and timestamps onto a metadata model
+
+        Args:
+        ----
+            model: Pydantic model with ``created_at``, ``updated_at`` and ``version`` fields
+
+        Returns:
+        -------
+            The same model
+
+        """
+        model.created_at = self.created_at
+        model.updated_at = self.updated_at
+        model.version = self.version
+        return model
+
+def _as_datetime(value: Union[float, datetime]) -> datetime:
+    """Convert a ``time.time()`` value to a local datetime"""
+    return value if isinstance(value, datetime) else datetime.fromtimestamp(value)
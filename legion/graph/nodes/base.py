@@ -7,6 +7,7 @@ from uuid import uuid4
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..channels import Channel
+from ..metadata import MetadataClock
 from ..state import GraphState
 
 T = TypeVar("T")
@@ -61,6 +62,7 @@ class NodeBase(ABC):
         self._metadata = NodeMetadata(
             node_type=self.__class__.__name__
         )
+        self._clock = MetadataClock.from_model(self._metadata)
         self._graph_state = graph_state
         self._input_channels: Dict[str, Channel] = {}
         self._output_channels: Dict[str, Channel] = {}
@@ -69,7 +71,7 @@ class NodeBase(ABC):
     @property
     def metadata(self) -> NodeMetadata:
         """Get node metadata"""
-        return self._metadata
+        return self._clock.stamp(self._metadata)
 
     @property
     def node_id(self) -> str:
@@ -83,8 +85,12 @@ class NodeBase(ABC):
 
     def _update_metadata(self) -> None:
         """Update metadata after state change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
+
+    def _restore_metadata(self, data: Dict[str, Any]) -> None:
+        """Restore metadata from a checkpoint"""
+        self._metadata = type(self._metadata)(**data)
+        self._clock = MetadataClock.from_model(self._metadata)
 
     def _update_status(self, status: NodeStatus, error: Optional[str] = None) -> None:
         """Update node status"""
@@ -179,7 +185,7 @@ class NodeBase(ABC):
     def checkpoint(self) -> Dict[str, Any]:
         """Create a checkpoint of current state"""
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "execution_history": [
                 context.model_dump()
                 for context in self._execution_history
@@ -196,7 +202,7 @@ class NodeBase(ABC):
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
         """Restore from checkpoint"""
-        self._metadata = NodeMetadata(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
 
         self._execution_history = [
             ExecutionContext(**context)
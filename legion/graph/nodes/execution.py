@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
@@ -6,6 +8,7 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...exceptions import StateError
+from ..metadata import MetadataClock
 from ..retry import RetryHandler, RetryPolicy
 from ..state import GraphState
 from .base import NodeBase, NodeStatus
@@ -18,6 +21,12 @@ class ExecutionMode(str, Enum):
     SEQUENTIAL = "sequential"  # Execute nodes one at a time
     PARALLEL = "parallel"      # Execute independent nodes in parallel
 
+class ErrorPolicy(str, Enum):
+    """How parallel execution reacts to a failed node"""
+
+    FAIL_FAST = "fail_fast"    # Cancel in-flight nodes and raise the first error
+    CONTINUE = "continue"      # Keep running nodes that do not depend on the failure
+
 class ExecutionHook:
     """Hook for node execution events"""
 
@@ -38,8 +47,13 @@ class ExecutionMetadata(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     version: int = 0
     mode: ExecutionMode = Field(default=ExecutionMode.SEQUENTIAL)
+    error_policy: ErrorPolicy = Field(default=ErrorPolicy.FAIL_FAST)
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
     is_running: bool = False
     current_node: Optional[str] = None
+    running_nodes: List[str] = Field(default_factory=list)
+    failed_nodes: List[str] = Field(default_factory=list)
+    skipped_nodes: List[str] = Field(default_factory=list)
     error: Optional[str] = None
 
     model_config = ConfigDict(
@@ -58,9 +72,16 @@ class ExecutionManager:
         mode: ExecutionMode = ExecutionMode.SEQUENTIAL,
         node_retry_policy: Optional[RetryPolicy] = None,
         state_retry_policy: Optional[RetryPolicy] = None,
-        resource_retry_policy: Optional[RetryPolicy] = None
+        resource_retry_policy: Optional[RetryPolicy] = None,
+        max_concurrency: Optional[int] = None,
+        error_policy: ErrorPolicy = ErrorPolicy.FAIL_FAST
     ):
-        self._metadata = ExecutionMetadata(mode=mode)
+        self._metadata = ExecutionMetadata(
+            mode=mode,
+            max_concurrency=max_concurrency,
+            error_policy=error_policy
+        )
+        self._clock = MetadataClock.from_model(self._metadata)
         self._graph_state = graph_state
         self._registry = registry
         self._hooks: List[ExecutionHook] = []
@@ -74,12 +95,11 @@ class ExecutionManager:
     @property
     def metadata(self) -> ExecutionMetadata:
         """Get execution metadata"""
-        return self._metadata
+        return self._clock.stamp(self._metadata)
 
     def _update_metadata(self) -> None:
         """Update metadata after execution change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
 
     def add_hook(self, hook: ExecutionHook) -> None:
         """Add execution hook"""
@@ -94,6 +114,7 @@ class ExecutionManager:
     async def _execute_node(self, node: NodeBase, **kwargs) -> None:
         """Execute a single node with hooks and retry logic"""
         self._metadata.current_node = node.node_id
+        self._metadata.running_nodes.append(node.node_id)
         self._update_metadata()
 
         async def execute_with_hooks():
@@ -129,7 +150,10 @@ class ExecutionManager:
             )
 
         finally:
-            self._metadata.current_node = None
+            self._metadata.running_nodes.remove(node.node_id)
+            self._metadata.current_node = (
+                self._metadata.running_nodes[-1] if self._metadata.running_nodes else None
+            )
             self._update_metadata()
 
     async def execute_node(self, node_id: str, **kwargs) -> None:
@@ -178,13 +202,94 @@ class ExecutionManager:
                     if node:
                         await self._execute_node(node, **kwargs)
             else:
-                # Execute nodes in parallel (TODO: implement parallel execution)
-                raise NotImplementedError("Parallel execution not yet implemented")
+                await self._execute_parallel(order, **kwargs)
 
         finally:
             self._metadata.is_running = False
             self._update_metadata()
 
+    async def _execute_parallel(self, order: List[str], **kwargs) -> None:
+        """Execute nodes concurrently as soon as their dependencies complete
+
+        Nodes are scheduled from a ready queue (Kahn's algorithm): a node is
+        launched once every dependency has completed, bounded by
+        ``max_concurrency``. Each node runs through ``_execute_node`` and so
+        keeps its hooks and retry policy.
+
+        Args:
+        ----
+            order: Topologically sorted node IDs to execute
+            **kwargs: Execution inputs passed to every node
+
+        """
+        self._metadata.failed_nodes = []
+        self._metadata.skipped_nodes = []
+        self._metadata.error = None
+        self._update_metadata()
+
+        scheduled = set(order)
+        unmet: Dict[str, int] = {
+            node_id: len(self._registry.get_dependencies(node_id) & scheduled)
+            for node_id in order
+        }
+        ready = deque(node_id for node_id in order if unmet[node_id] == 0)
+        limit = self._metadata.max_concurrency or max(len(order), 1)
+        running: Dict[asyncio.Task, str] = {}
+        finished: Set[str] = set()
+
+        def release(node_id: str) -> None:
+            finished.add(node_id)
+            for dependent in sorted(self._registry.get_dependents(node_id) & scheduled):
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0:
+                    ready.append(dependent)
+
+        try:
+            while ready or running:
+                while ready and len(running) < limit:
+                    node_id = ready.popleft()
+                    node = self._registry.get_node(node_id)
+                    if not node:
+                        release(node_id)
+                        continue
+                    task = asyncio.create_task(self._execute_node(node, **kwargs))
+                    running[task] = node_id
+
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                first_error: Optional[BaseException] = None
+                for task in done:
+                    node_id = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        release(node_id)
+                        continue
+
+                    finished.add(node_id)
+                    self._metadata.failed_nodes.append(node_id)
+                    if first_error is None:
+                        first_error = error
+                        self._metadata.error = str(error)
+                    self._update_metadata()
+
+                # Release every node that completed alongside a failure before failing fast
+                if first_error is not None and self._metadata.error_policy == ErrorPolicy.FAIL_FAST:
+                    raise first_error
+
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+            # Nodes cancelled or never reached because of a failure
+            self._metadata.skipped_nodes = [
+                node_id for node_id in order if node_id not in finished
+            ]
+            self._update_metadata()
+
     async def get_ready_nodes(self) -> Set[str]:
         """Get nodes ready for execution with retry logic"""
         async def get_ready():
@@ -215,9 +320,10 @@ class ExecutionManager:
     def checkpoint(self) -> Dict[str, Any]:
         """Create a checkpoint of current state"""
         return {
-            "metadata": self._metadata.model_dump()
+            "metadata": self.metadata.model_dump()
         }
 
     def restore(self, checkpoint: Dict[str, Any]) -> None:
         """Restore from checkpoint"""
         self._metadata = ExecutionMetadata(**checkpoint["metadata"])
+        self._clock = MetadataClock.from_model(self._metadata)
@@ -235,7 +235,7 @@ class GraphNodeAdapter(NodeBase):
             "graph_state": self._graph_state.checkpoint(),
             "execution_stats": deepcopy(self._execution_stats),
             "status": self._subgraph_status,
-            "metadata": self._metadata.model_dump()
+            "metadata": self.metadata.model_dump()
         }
 
     def restore_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
@@ -249,7 +249,7 @@ class GraphNodeAdapter(NodeBase):
         self._graph_state.restore(checkpoint["graph_state"])
         self._execution_stats = deepcopy(checkpoint["execution_stats"])
         self._subgraph_status = checkpoint["status"]
-        self._metadata = type(self._metadata)(**checkpoint["metadata"])
+        self._restore_metadata(checkpoint["metadata"])
 
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics.
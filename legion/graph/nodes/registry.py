@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Set, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..metadata import MetadataClock
 from ..state import GraphState
 from .base import NodeBase, NodeStatus
 
@@ -26,6 +27,7 @@ class NodeRegistry:
 
     def __init__(self, graph_state: GraphState):
         self._metadata = NodeRegistryMetadata()
+        self._clock = MetadataClock.from_model(self._metadata)
         self._graph_state = graph_state
         self._nodes: Dict[str, NodeBase] = {}
         self._node_types: Dict[str, Type[NodeBase]] = {}
@@ -35,12 +37,11 @@ class NodeRegistry:
     @property
     def metadata(self) -> NodeRegistryMetadata:
         """Get registry metadata"""
-        return self._metadata
+        return self._clock.stamp(self._metadata)
 
     def _update_metadata(self) -> None:
         """Update metadata after registry change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
 
     def register_node_type(self, name: str, node_type: Type[NodeBase]) -> None:
         """Register a node type"""
@@ -184,6 +185,7 @@ class NodeRegistry:
         self._dependencies.clear()
         self._reverse_dependencies.clear()
         self._metadata = NodeRegistryMetadata()
+        self._clock = MetadataClock.from_model(self._metadata)
 
     def _would_create_cycle(self, from_node: str, to_node: str) -> bool:
         """Check if adding a dependency would create a cycle"""
@@ -215,7 +217,7 @@ class NodeRegistry:
     def checkpoint(self) -> Dict[str, Any]:
         """Create a checkpoint of current state"""
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "nodes": {
                 node_id: node.checkpoint()
                 for node_id, node in self._nodes.items()
@@ -233,6 +235,7 @@ class NodeRegistry:
     def restore(self, checkpoint: Dict[str, Any]) -> None:
         """Restore from checkpoint"""
         self._metadata = NodeRegistryMetadata(**checkpoint["metadata"])
+        self._clock = MetadataClock.from_model(self._metadata)
 
         # Clear current state
         self._nodes.clear()
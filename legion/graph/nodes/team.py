@@ -212,7 +212,7 @@ class TeamNode(NodeBase):
         for name, channel in self._output_channels.items():
             if channel is not None:
                 if isinstance(channel, ValueSequence):
-                    channel_values[f"out_{name}"] = channel.get_all()
+                    channel_values[f"out_{name}"] = channel.get_mut()
                 else:
                     channel_values[f"out_{name}"] = channel.get()
 
@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Mapping, Optional, Type, TypeVar
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from .channels import Channel, ChannelMetadata, LastValue, SharedState, ValueSequence
+from .metadata import MetadataClock
 
 T = TypeVar("T")
 
@@ -27,13 +28,14 @@ class GraphState:
 
     def __init__(self):
         self._metadata = GraphStateMetadata()
+        self._clock = MetadataClock.from_model(self._metadata)
         self._channels: Dict[str, Channel] = {}
         self._global_state = SharedState()
 
     @property
     def metadata(self) -> GraphStateMetadata:
         """Get graph state metadata"""
-        return self._metadata
+        return self._clock.stamp(self._metadata)
 
     @property
     def graph_id(self) -> str:
@@ -42,8 +44,7 @@ class GraphState:
 
     def _update_metadata(self) -> None:
         """Update metadata after state change"""
-        self._metadata.updated_at = datetime.now()
-        self._metadata.version += 1
+        self._clock.touch()
 
     def create_channel(
         self,
@@ -75,10 +76,18 @@ class GraphState:
         """List all channel names"""
         return list(self._channels.keys())
 
-    def get_global_state(self) -> Dict[str, Any]:
-        """Get global state"""
+    def get_global_state(self) -> Mapping[str, Any]:
+        """Get a read-only view of the global state"""
         return self._global_state.get()
 
+    def get_global_state_mut(self) -> Dict[str, Any]:
+        """Get a copy of the global state owned by the caller"""
+        return self._global_state.get_mut()
+
+    def get_key(self, key: str, default: Any = None) -> Any:
+        """Get one value from the global state without copying it"""
+        return self._global_state.get_key(key, default)
+
     def update_global_state(self, updates: Dict[str, Any]) -> None:
         """Update global state"""
         self._global_state.update(updates)
@@ -97,7 +106,7 @@ class GraphState:
         }
 
         return {
-            "metadata": self._metadata.model_dump(),
+            "metadata": self.metadata.model_dump(),
             "channels": channels_checkpoint,
             "global_state": self._global_state.checkpoint()
         }
@@ -105,6 +114,7 @@ class GraphState:
     def restore(self, checkpoint: Dict[str, Any]) -> None:
         """Restore from checkpoint"""
         self._metadata = GraphStateMetadata(**checkpoint["metadata"])
+        self._clock = MetadataClock.from_model(self._metadata)
 
         # Restore channels
         self._channels.clear()
@@ -129,6 +139,7 @@ class GraphState:
         self._channels.clear()
         self._global_state = SharedState()
         self._metadata = GraphStateMetadata()
+        self._clock = MetadataClock.from_model(self._metadata)
 
     def merge(self, other: "GraphState") -> None:
         """Merge another graph state into this one"""
@@ -2,9 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
-from rich import print as rprint
 
 from ..agents.base import Agent
+from ..console import rprint
 from ..errors import LegionError
 from ..interface.schemas import Message, ModelResponse
 from ..memory.base import MemoryProvider
@@ -1,11 +1,12 @@
 import time
 import traceback
 from asyncio.log import logger
-from typing import Any, Dict, List, Optional, OrderedDict, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, OrderedDict, Type, Union
 
 from pydantic import BaseModel
-from rich import print as rprint
 
+from legion.console import rprint
+from legion.interface.batch import DEFAULT_BATCH_CONCURRENCY, BatchResult, iter_batch, run_batch
 from legion.interface.schemas import Message, ModelResponse, Role, SystemPrompt, SystemPromptSection
 from legion.monitoring.events.base import EventEmitter
 from legion.monitoring.events.chain import (
@@ -18,7 +19,7 @@ from legion.monitoring.events.chain import (
     ChainTransformEvent,
 )
 
-from ..agents.base import Agent
+from ..agents.base import Agent, isolated_memory
 from ..blocks.base import FunctionalBlock
 from .base import BaseGroup, GroupMetadata
 
@@ -508,6 +509,56 @@ class Chain(BaseGroup, EventEmitter):
             role=current_message.role
         )
 
+    async def _abatch_one(
+        self,
+        message: Union[str, Message],
+        response_schema: Optional[Type[BaseModel]]
+    ) -> ModelResponse:
+        with isolated_memory():
+            return await self.aprocess(message, response_schema=response_schema)
+
+    async def abatch(
+        self,
+        inputs: Iterable[Union[str, Message]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        response_schema: Optional[Type[BaseModel]] = None
+    ) -> List[BatchResult[ModelResponse]]:
+        """Run many independent inputs through the chain concurrently
+
+        Each input runs with fresh memories for the chain's agents, so inputs
+        don't see each other and the agents' own memories are left untouched.
+
+        Args:
+        ----
+            inputs: Messages to process
+            concurrency: Maximum number of inputs in the chain at once
+            response_schema: Optional schema for the final member's responses
+
+        Returns:
+        -------
+            One result per input in input order; failed inputs carry their ``error``
+
+        """
+        return await run_batch(
+            lambda message: self._abatch_one(message, response_schema), inputs, concurrency
+        )
+
+    async def abatch_stream(
+        self,
+        inputs: Iterable[Union[str, Message]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        response_schema: Optional[Type[BaseModel]] = None
+    ) -> AsyncIterator[BatchResult[ModelResponse]]:
+        """Run many independent inputs through the chain, yielding results as they complete
+
+        Takes the same arguments as ``abatch``; each result's ``index`` is the
+        position of its input.
+        """
+        async for result in iter_batch(
+            lambda message: self._abatch_one(message, response_schema), inputs, concurrency
+        ):
+            yield result
+
     def print_hierarchy(self, indent: str = "") -> None:
         """Print chain in hierarchy"""
         rprint(f"{indent}[cyan]└──[/cyan] [bold]{self.name}[/bold] ([blue]Chain[/blue])")
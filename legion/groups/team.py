@@ -1,8 +1,7 @@
 from typing import Any, Dict, List, Union
 
-from rich import print as rprint
-
 from legion.agents.base import Agent
+from legion.console import rprint
 from legion.interface.schemas import Message, ModelResponse, Role, SystemPromptSection
 from legion.memory.providers.memory import InMemoryProvider
 
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
-from rich import print as rprint
 
 from ..agents.base import Agent
+from ..console import rprint
+from ..interface.portal import run_sync
 from ..interface.tools import BaseTool
 
 if TYPE_CHECKING:
@@ -109,6 +110,10 @@ class DelegationTool(BaseTool):
         })
 
     def run(self, member: str, task: str, context: Optional[Dict] = None) -> str:
+        """Execute delegation with context (sync version)"""
+        return run_sync(self.arun(member, task, context))
+
+    async def arun(self, member: str, task: str, context: Optional[Dict] = None) -> str:
         """Execute delegation with context"""
         if member not in self.members:
             raise ValueError(f"Unknown team member: {member}")
@@ -133,7 +138,7 @@ class DelegationTool(BaseTool):
 
         # Process the task
         try:
-            result = target.process(formatted_task)
+            result = await target.aprocess(formatted_task)
 
             # Record the response
             delegation_entry["response"] = result.content
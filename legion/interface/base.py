@@ -2,13 +2,33 @@ import asyncio
 import json
 from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
 
 from ..errors import ProviderError
-from .schemas import Message, ModelResponse, ProviderConfig, Role, TokenUsage
-from .tools import BaseTool
+from .batch_jobs import BatchJobBackend
+from .cache import ResponseCache, get_default_response_cache
+from .clients import ClientKey, client_registry, make_client_key
+from .portal import run_sync
+from .ratelimit import RateLimiter, rate_limiter_registry
+from .schemas import Message, ModelResponse, ProviderConfig, Role, StreamChunk, TokenUsage
+from .tokens import CharTokenEstimator, TokenCounter
+from .tools import DEFAULT_TOOL_CONCURRENCY, BaseTool, dispatch_tool_calls
 
 T = TypeVar("T")
 
@@ -26,9 +46,21 @@ def supports_async(sync_func: Callable[..., T]) -> Callable[..., Union[T, Awaita
         )
     return async_wrapper
 
+def _function_schemas(tools: Sequence[BaseTool]) -> List[Dict[str, Any]]:
+    """Format tools as OpenAI-compatible function schemas"""
+    return [tool.get_schema() for tool in tools]
+
 class LLMInterface(ABC):
     """Abstract base class defining the LLM provider interface"""
 
+    # Providers that implement _astream_turn stream tokens as they arrive;
+    # the rest fall back to a single chunk holding the full completion
+    supports_streaming: bool = False
+
+    # Format of the provider's batch job endpoint, if it has one; see batch_jobs.
+    # Providers that set it also implement _batch_request, _batch_response and _batch_backend
+    batch_format: Optional[str] = None
+
     def __init__(
         self,
         config: ProviderConfig,
@@ -44,8 +76,135 @@ class LLMInterface(ABC):
         """
         self.config = config
         self.debug = debug
+        self._client_keys: Dict[str, ClientKey] = {}
+        self._token_counters: Dict[Optional[str], TokenCounter] = {}
+        # Last formatted tool list per formatter, with the tools it was built from
+        self._tool_formats: Dict[Callable[..., Any], Tuple[Tuple[Any, ...], List[Any]]] = {}
         self._setup_client()
 
+    @property
+    def max_tool_concurrency(self) -> int:
+        """Maximum number of tool calls from one model turn run at once"""
+        return getattr(self.config, "max_tool_concurrency", None) or DEFAULT_TOOL_CONCURRENCY
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Cache for completions: the provider's own, else the process-wide default
+
+        A provider configured with ``response_cache=False`` never caches.
+        """
+        cache = getattr(self.config, "response_cache", None)
+        if isinstance(cache, ResponseCache):
+            return cache
+        return None if cache is False else get_default_response_cache()
+
+    def get_rate_limiter(self, model: str) -> Optional[RateLimiter]:
+        """Get the limiter shared by requests to this provider, endpoint and model
+
+        Limits come from the ``requests_per_minute``, ``tokens_per_minute`` and
+        ``max_in_flight`` config settings; None if none of them is set.
+        """
+        return rate_limiter_registry.get(
+            (type(self).__name__, self.config.base_url, model),
+            getattr(self.config, "requests_per_minute", None),
+            getattr(self.config, "tokens_per_minute", None),
+            getattr(self.config, "max_in_flight", None)
+        )
+
+    def _estimate_tokens(self, messages: List[Message], model: str, max_tokens: Optional[int]) -> int:
+        """Estimate the tokens a request uses, for the tokens-per-minute limit"""
+        counter = self._token_counters.get(model)
+        if counter is None:
+            counter = self._token_counters[model] = self.get_token_counter(model)
+        return counter.count_messages(messages) + (max_tokens or 0)
+
+    def _format_tool_list(
+        self,
+        tools: Sequence[BaseTool],
+        formatter: Optional[Callable[[Sequence[BaseTool]], List[Any]]] = None
+    ) -> List[Any]:
+        """Format tools for the provider's API, reusing the result while the tools are unchanged
+
+        The tool loop sends the same tools on every round, so the formatted list
+        is kept until a tool is added, removed or changed. The returned list is
+        shared and must not be modified.
+
+        Args:
+        ----
+            tools: Tools to format
+            formatter: Builds the provider's tool list; OpenAI function schemas by default
+
+        """
+        formatter = formatter or _function_schemas
+        # Bound methods are recreated on each access; key on the underlying function
+        cache_key = getattr(formatter, "__func__", formatter)
+        key = tuple((id(tool), tool._schema_key()) for tool in tools)
+        cached = self._tool_formats.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        formatted = formatter(tools)
+        self._tool_formats[cache_key] = (key, formatted)
+        return formatted
+
+    def clear_tool_cache(self) -> None:
+        """Forget formatted tool lists, e.g. after the agent's tools are replaced"""
+        self._tool_formats.clear()
+
+    def get_token_counter(self, model: Optional[str] = None) -> TokenCounter:
+        """Get a token counter for a model's context window
+
+        Providers override this to count with their own tokenizer; the default
+        estimates from character count.
+        """
+        return CharTokenEstimator()
+
+    def _shared_client(self, kind: str, factory: Callable[[], Any], *extra: Hashable) -> Any:
+        """Get an SDK client shared by providers with the same connection settings
+
+        Args:
+        ----
+            kind: Client kind, e.g. ``"openai.sync"``; ``*.async`` clients
+                are only shared within the running event loop
+            factory: Builds the client if no matching one exists yet
+            *extra: Additional settings that change how the client is built
+
+        """
+        loop = None
+        if kind.endswith(".async"):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        key = make_client_key(kind, self.config, *extra, loop=loop)
+        client = client_registry.acquire(key, factory, loop)
+
+        # Re-running setup must not leak a reference to the previous client
+        previous = self._client_keys.get(kind)
+        self._client_keys[kind] = key
+        if previous is not None:
+            client_registry.release(previous)
+
+        return client
+
+    def close(self) -> None:
+        """Release shared clients held by this provider"""
+        keys = getattr(self, "_client_keys", {})
+        for key in keys.values():
+            client_registry.release(key)
+        keys.clear()
+
+    async def aclose(self) -> None:
+        """Release shared clients held by this provider asynchronously"""
+        keys = getattr(self, "_client_keys", {})
+        for key in keys.values():
+            await client_registry.arelease(key)
+        keys.clear()
+
+    def _batch_backend(self) -> BatchJobBackend:
+        """Get the transport for the provider's batch job endpoint"""
+        raise ProviderError(f"{type(self).__name__} does not support batch jobs")
+
     @abstractmethod
     def _setup_client(self) -> None:
         """Initialize provider-specific client"""
@@ -203,7 +362,6 @@ class LLMInterface(ABC):
 
         return f"{formatting_instructions}\n\nContent to format:\n{content}"
 
-    @supports_async
     def complete(
         self,
         messages: List[Message],
@@ -213,43 +371,15 @@ class LLMInterface(ABC):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
-        """Get completion from LLM (sync version)"""
-        try:
-            if tools and response_schema:
-                return self._get_tool_completion(
-                    messages=messages,
-                    model=model,
-                    tools=tools,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    format_json=True,
-                    json_schema=response_schema
-                )
-            elif response_schema:
-                return self._get_json_completion(
-                    messages=messages,
-                    model=model,
-                    schema=response_schema,
-                    temperature=0.0,
-                    max_tokens=max_tokens
-                )
-            elif tools:
-                return self._get_tool_completion(
-                    messages=messages,
-                    model=model,
-                    tools=tools,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            else:
-                return self._get_chat_completion(
-                    messages=messages,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-        except Exception as e:
-            raise ProviderError(f"Error during completion: {str(e)}")
+        """Get completion from LLM (sync version), run on the shared background loop"""
+        return run_sync(self.acomplete(
+            messages=messages,
+            model=model,
+            response_schema=response_schema,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens
+        ))
 
     @abstractmethod
     async def _asetup_client(self) -> None:
@@ -302,7 +432,53 @@ class LLMInterface(ABC):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
-        """Get completion from LLM asynchronously"""
+        """Get completion from LLM asynchronously, served from the response cache when enabled"""
+        cache = self.response_cache
+        if cache is not None:
+            # JSON completions always run at temperature 0
+            effective_temperature = 0.0 if response_schema and not tools else temperature
+            key = cache.request_key(
+                self, messages, model, tools, effective_temperature, response_schema, max_tokens
+            )
+            if key is not None:
+                return await cache.get_or_complete(
+                    key,
+                    lambda: self._acomplete(messages, model, response_schema, tools, temperature, max_tokens),
+                    self,
+                    model
+                )
+        return await self._acomplete(messages, model, response_schema, tools, temperature, max_tokens)
+
+    async def _acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        response_schema: Optional[Type[BaseModel]] = None,
+        tools: Optional[Sequence[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """Get completion from the provider, bypassing the response cache"""
+        limiter = self.get_rate_limiter(model)
+        if limiter is None:
+            return await self._acomplete_unlimited(messages, model, response_schema, tools, temperature, max_tokens)
+
+        estimate = self._estimate_tokens(messages, model, max_tokens) if limiter.tokens else 0
+        async with limiter.acquire(estimate) as reservation:
+            response = await self._acomplete_unlimited(messages, model, response_schema, tools, temperature, max_tokens)
+            reservation.record(response.usage)
+        return response
+
+    async def _acomplete_unlimited(
+        self,
+        messages: List[Message],
+        model: str,
+        response_schema: Optional[Type[BaseModel]] = None,
+        tools: Optional[Sequence[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """Dispatch a completion to the provider's chat, tool or JSON implementation"""
         try:
             if tools and response_schema:
                 return await self._aget_tool_completion(
@@ -339,3 +515,145 @@ class LLMInterface(ABC):
                 )
         except Exception as e:
             raise ProviderError(f"Error during async completion: {str(e)}")
+
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn without executing tools
+
+        Yields content deltas, then one chunk with the turn's assembled
+        tool calls, usage and finish reason.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+        yield  # pragma: no cover
+
+    async def _alimited_stream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn through the provider's rate limiter"""
+        limiter = self.get_rate_limiter(model)
+        if limiter is None:
+            async for chunk in self._astream_turn(messages, model, tools, temperature, max_tokens):
+                yield chunk
+            return
+
+        estimate = self._estimate_tokens(messages, model, max_tokens) if limiter.tokens else 0
+        async with limiter.acquire(estimate) as reservation:
+            async for chunk in self._astream_turn(messages, model, tools, temperature, max_tokens):
+                reservation.record(chunk.usage)
+                yield chunk
+
+    async def _arun_stream_tool(self, tool: BaseTool, tool_call: Dict[str, Any]) -> str:
+        """Execute a streamed tool call, returning its result as a string"""
+        args = json.loads(tool_call["function"]["arguments"] or "{}")
+        result = await tool(**args)
+        return json.dumps(result) if isinstance(result, dict) else str(result)
+
+    async def astream(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a completion, running tools between model turns
+
+        Args:
+        ----
+            messages: Conversation messages
+            model: Model to use
+            tools: Available tools
+            temperature: Sampling temperature
+            max_tokens: Max tokens to generate
+
+        Yields:
+        ------
+            Content deltas as they arrive, a chunk with each turn's executed
+            tool calls (including results), and finally a chunk whose
+            ``response`` holds the assembled ``ModelResponse``
+
+        """
+        if not self.supports_streaming:
+            response = await self.acomplete(
+                messages=messages,
+                model=model,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            if response.content:
+                yield StreamChunk(content=response.content)
+            yield StreamChunk(usage=response.usage, finish_reason="stop", response=response)
+            return
+
+        current_messages = list(messages)
+        all_tool_calls: List[Dict[str, Any]] = []
+        usage = None
+
+        try:
+            while True:
+                content_parts = []
+                turn_tool_calls = None
+                finish_reason = None
+
+                async for chunk in self._alimited_stream_turn(
+                    current_messages, model, tools, temperature, max_tokens
+                ):
+                    if chunk.content:
+                        content_parts.append(chunk.content)
+                        yield chunk
+                    if chunk.tool_calls:
+                        turn_tool_calls = chunk.tool_calls
+                    if chunk.usage:
+                        usage = chunk.usage if usage is None else TokenUsage(
+                            prompt_tokens=usage.prompt_tokens + chunk.usage.prompt_tokens,
+                            completion_tokens=usage.completion_tokens + chunk.usage.completion_tokens,
+                            total_tokens=usage.total_tokens + chunk.usage.total_tokens
+                        )
+                    if chunk.finish_reason:
+                        finish_reason = chunk.finish_reason
+
+                content = "".join(content_parts)
+                if not (turn_tool_calls and tools):
+                    response = ModelResponse(
+                        content=content,
+                        tool_calls=all_tool_calls or None,
+                        usage=usage
+                    )
+                    yield StreamChunk(usage=usage, finish_reason=finish_reason, response=response)
+                    return
+
+                current_messages.append(Message(
+                    role=Role.ASSISTANT,
+                    content=content,
+                    tool_calls=[dict(call) for call in turn_tool_calls]
+                ))
+                executed = await dispatch_tool_calls(
+                    turn_tool_calls, tools, self._arun_stream_tool, self.max_tool_concurrency
+                )
+                for tool_call, _, result in executed:
+                    current_messages.append(Message(
+                        role=Role.TOOL,
+                        content=result,
+                        tool_call_id=tool_call["id"],
+                        name=tool_call["function"]["name"]
+                    ))
+                    tool_call["result"] = result
+                    all_tool_calls.append(tool_call)
+
+                yield StreamChunk(tool_calls=turn_tool_calls, finish_reason=finish_reason)
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise ProviderError(f"Error during streaming completion: {str(e)}")
@@ -0,0 +1,116 @@
+"""Run an async callable over many inputs with bounded concurrency
+
+Used by ``Agent.abatch`` and ``Chain.abatch``. Inputs are pulled lazily by a
+fixed pool of workers, so a batch of thousands never holds thousands of
+pending tasks. A failing input is reported in its result instead of
+cancelling the rest of the batch.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Workers per batch unless configured otherwise
+DEFAULT_BATCH_CONCURRENCY = 8
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of one input in a batch"""
+
+    # Position of the input in the batch
+    index: int
+    input: Any
+    output: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the input was processed without error"""
+        return self.error is None
+
+async def iter_batch(
+    func: Callable[[Any], Awaitable[T]],
+    inputs: Iterable[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> AsyncIterator[BatchResult[T]]:
+    """Run ``func`` over inputs, yielding results as they complete
+
+    Args:
+    ----
+        func: Async callable processing one input
+        inputs: Inputs to process, consumed lazily
+        concurrency: Maximum number of inputs processed at once
+
+    Yields:
+    ------
+        BatchResult: One per input, in completion order
+
+    Raises:
+    ------
+        ValueError: If concurrency is less than 1
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    items = enumerate(inputs)
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+    done = object()
+
+    async def worker() -> None:
+        try:
+            # Workers share the iterator; taking the next input never awaits
+            for index, item in items:
+                try:
+                    result = BatchResult(index, item, output=await func(item))
+                except Exception as e:
+                    result = BatchResult(index, item, error=e)
+                queue.put_nowait(result)
+        except Exception as e:
+            # The input iterable itself failed
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(done)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    remaining = len(workers)
+    try:
+        while remaining:
+            result = await queue.get()
+            if result is done:
+                remaining -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        # Stop outstanding work if the caller stops iterating early
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+async def run_batch(
+    func: Callable[[Any], Awaitable[T]],
+    inputs: Iterable[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> List[BatchResult[T]]:
+    """Run ``func`` over inputs, returning results in input order
+
+    Args:
+    ----
+        func: Async callable processing one input
+        inputs: Inputs to process
+        concurrency: Maximum number of inputs processed at once
+
+    Returns:
+    -------
+        One result per input; check ``ok`` or ``error`` for failures
+
+    """
+    results: List[BatchResult[T]] = []
+    async for result in iter_batch(func, inputs, concurrency):
+        results.append(result)
+    results.sort(key=lambda result: result.index)
+    return results
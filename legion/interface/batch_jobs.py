@@ -0,0 +1,391 @@
+"""Provider batch jobs for large offline workloads
+
+Provider batch endpoints (OpenAI Batch API, Anthropic Message Batches) take a
+file of requests, process it within hours at a discount, and return a file of
+results. ``BatchSubmitter`` serializes completion requests into the
+provider's JSONL format, submits and polls the job, and maps the results
+back to ``ModelResponse`` objects in request order.
+
+The transport is a ``BatchJobBackend``. Providers supply one that talks to
+their API; ``FileBatchBackend`` is a local stand-in that stores jobs in a
+directory and answers them itself, so the whole pipeline runs offline.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..errors import ProviderError
+from .batch import BatchResult
+from .schemas import Message, ModelResponse
+
+if TYPE_CHECKING:
+    from .base import LLMInterface
+
+logger = logging.getLogger(__name__)
+
+# Seconds between status checks while waiting for a job
+DEFAULT_POLL_INTERVAL = 30.0
+
+class BatchStatus(str, Enum):
+    """Lifecycle state of a batch job"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job will not change state again"""
+        return self not in (BatchStatus.PENDING, BatchStatus.RUNNING)
+
+@dataclass
+class BatchRequest:
+    """A chat completion to run as part of a batch job"""
+
+    messages: List[Message]
+    # The provider's configured model if not set
+    model: Optional[str] = None
+    temperature: float = 0.7
+    max_tokens: Optional[int] = None
+    # Generated from the request's position if not set
+    custom_id: Optional[str] = None
+
+@dataclass
+class BatchJob:
+    """A submitted batch job"""
+
+    id: str
+    status: BatchStatus
+    # Custom ids of the submitted requests, in submission order
+    request_ids: List[str]
+    raw: Dict[str, Any] = field(default_factory=dict)
+
+class BatchJobBackend(ABC):
+    """Transport for a provider's batch endpoint"""
+
+    @abstractmethod
+    async def submit(self, lines: List[Dict[str, Any]]) -> str:
+        """Submit request lines, returning the job id"""
+        pass
+
+    @abstractmethod
+    async def status(self, job_id: str) -> Tuple[BatchStatus, Dict[str, Any]]:
+        """Get a job's status and the provider's raw job object"""
+        pass
+
+    @abstractmethod
+    async def results(self, job_id: str) -> List[Dict[str, Any]]:
+        """Get the result lines of a finished job"""
+        pass
+
+    @abstractmethod
+    async def cancel(self, job_id: str) -> None:
+        """Ask the provider to cancel a job"""
+        pass
+
+class BatchSubmitter:
+    """Runs completion requests through a provider's batch endpoint"""
+
+    def __init__(
+        self,
+        llm: "LLMInterface",
+        backend: Optional[BatchJobBackend] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL
+    ):
+        """Initialize the submitter
+
+        Args:
+        ----
+            llm: Provider whose batch format is used
+            backend: Transport for jobs, the provider's own API by default
+            poll_interval: Seconds between status checks in ``wait``
+
+        Raises:
+        ------
+            ProviderError: If the provider has no batch job support
+
+        """
+        if llm.batch_format is None:
+            raise ProviderError(f"{type(llm).__name__} does not support batch jobs")
+
+        self.llm = llm
+        self.backend = backend if backend is not None else llm._batch_backend()
+        self.poll_interval = poll_interval
+
+    def _request_lines(self, requests: Sequence[Union[BatchRequest, List[Message]]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Serialize requests to the provider's batch format"""
+        ids, lines = [], []
+        for index, request in enumerate(requests):
+            if not isinstance(request, BatchRequest):
+                request = BatchRequest(messages=list(request))
+            custom_id = request.custom_id or f"request-{index}"
+            if custom_id in ids:
+                raise ValueError(f"Duplicate batch request id: {custom_id}")
+            ids.append(custom_id)
+            lines.append(self.llm._batch_request(custom_id, request))
+        return ids, lines
+
+    async def submit(self, requests: Sequence[Union[BatchRequest, List[Message]]]) -> BatchJob:
+        """Submit requests as one batch job
+
+        Args:
+        ----
+            requests: Batch requests, or plain message lists using the defaults
+
+        Raises:
+        ------
+            ValueError: If there are no requests or custom ids repeat
+
+        """
+        if not requests:
+            raise ValueError("A batch job needs at least one request")
+
+        ids, lines = self._request_lines(requests)
+        job_id = await self.backend.submit(lines)
+        logger.debug(f"Submitted batch job {job_id} with {len(lines)} requests")
+        return BatchJob(id=job_id, status=BatchStatus.PENDING, request_ids=ids)
+
+    async def poll(self, job: BatchJob) -> BatchJob:
+        """Refresh a job's status"""
+        job.status, job.raw = await self.backend.status(job.id)
+        return job
+
+    async def wait(self, job: BatchJob, timeout: Optional[float] = None) -> BatchJob:
+        """Poll a job until it finishes
+
+        Raises
+        ------
+            TimeoutError: If the job is still running after ``timeout`` seconds
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not (await self.poll(job)).status.finished:
+            if deadline is not None and time.monotonic() + self.poll_interval > deadline:
+                raise TimeoutError(f"Batch job {job.id} still {job.status.value} after {timeout}s")
+            await asyncio.sleep(self.poll_interval)
+        return job
+
+    async def collect(self, job: BatchJob) -> List[BatchResult[ModelResponse]]:
+        """Get a finished job's responses in request order
+
+        Requests the provider didn't answer, or answered with an error, are
+        returned with a ``ProviderError``.
+        """
+        parsed: Dict[str, Union[ModelResponse, Exception]] = {}
+        for line in await self.backend.results(job.id):
+            try:
+                custom_id, outcome = self.llm._batch_response(line)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable batch result line: {e}")
+                continue
+            parsed[custom_id] = outcome
+
+        results = []
+        for index, custom_id in enumerate(job.request_ids):
+            outcome = parsed.get(custom_id)
+            if outcome is None:
+                outcome = ProviderError(f"No result for {custom_id} in {job.status.value} batch job {job.id}")
+            if isinstance(outcome, Exception):
+                results.append(BatchResult(index, custom_id, error=outcome))
+            else:
+                results.append(BatchResult(index, custom_id, output=outcome))
+        return results
+
+    async def cancel(self, job: BatchJob) -> BatchJob:
+        """Cancel a job and refresh its status"""
+        await self.backend.cancel(job.id)
+        return await self.poll(job)
+
+    async def run(
+        self,
+        requests: Sequence[Union[BatchRequest, List[Message]]],
+        timeout: Optional[float] = None
+    ) -> List[BatchResult[ModelResponse]]:
+        """Submit requests, wait for the job and collect its responses"""
+        job = await self.submit(requests)
+        await self.wait(job, timeout=timeout)
+        return await self.collect(job)
+
+def _echo(body: Dict[str, Any]) -> str:
+    content = body["messages"][-1]["content"]
+    return f"echo: {content if isinstance(content, str) else json.dumps(content)}"
+
+def _count_words(value: Any) -> int:
+    return len(json.dumps(value).split())
+
+def _openai_result(line: Dict[str, Any], reply: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+    body = line["body"]
+    try:
+        content = reply(body)
+    except Exception as e:
+        return {"id": f"batch_req_{uuid.uuid4().hex}", "custom_id": line["custom_id"], "response": None,
+                "error": {"code": "server_error", "message": str(e)}}
+
+    prompt_tokens, completion_tokens = _count_words(body["messages"]), _count_words(content)
+    return {
+        "id": f"batch_req_{uuid.uuid4().hex}",
+        "custom_id": line["custom_id"],
+        "response": {
+            "status_code": 200,
+            "request_id": uuid.uuid4().hex,
+            "body": {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens
+                }
+            }
+        },
+        "error": None
+    }
+
+def _anthropic_result(line: Dict[str, Any], reply: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+    params = line["params"]
+    try:
+        content = reply(params)
+    except Exception as e:
+        return {"custom_id": line["custom_id"], "result": {
+            "type": "errored", "error": {"type": "error", "error": {"type": "api_error", "message": str(e)}}
+        }}
+
+    return {"custom_id": line["custom_id"], "result": {
+        "type": "succeeded",
+        "message": {
+            "id": f"msg_{uuid.uuid4().hex}",
+            "type": "message",
+            "role": "assistant",
+            "model": params["model"],
+            "content": [{"type": "text", "text": content}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": _count_words(params["messages"]), "output_tokens": _count_words(content)}
+        }
+    }}
+
+def _check_openai_line(line: Dict[str, Any]) -> None:
+    if line.get("method") != "POST" or not line.get("url") or "model" not in line.get("body", {}):
+        raise ValueError(f"Invalid OpenAI batch line: {line}")
+
+def _check_anthropic_line(line: Dict[str, Any]) -> None:
+    params = line.get("params", {})
+    if "model" not in params or "max_tokens" not in params or "messages" not in params:
+        raise ValueError(f"Invalid Anthropic batch line: {line}")
+
+_FORMATS = {
+    "openai": (_check_openai_line, _openai_result),
+    "anthropic": (_check_anthropic_line, _anthropic_result)
+}
+
+class FileBatchBackend(BatchJobBackend):
+    """Local stand-in for a provider batch endpoint
+
+    Each job is a directory holding ``input.jsonl`` and ``job.json``. After
+    the configured number of status checks the job is processed: every
+    request is answered by ``reply`` and written to ``output.jsonl`` in the
+    provider's result format.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        batch_format: str,
+        reply: Callable[[Dict[str, Any]], str] = _echo,
+        polls_until_done: int = 1
+    ):
+        """Initialize the backend
+
+        Args:
+        ----
+            root: Directory jobs are stored in, created if missing
+            batch_format: Format to accept and answer in, a provider's ``batch_format``
+            reply: Produces the reply text for a request body; raising marks the request failed
+            polls_until_done: Status checks that report the job running before it completes
+
+        """
+        if batch_format not in _FORMATS:
+            raise ValueError(f"Unknown batch format: {batch_format}")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.batch_format = batch_format
+        self.reply = reply
+        self.polls_until_done = polls_until_done
+
+    def _job_dir(self, job_id: str) -> Path:
+        path = self.root / job_id
+        if not path.is_dir():
+            raise ProviderError(f"Batch job {job_id} not found")
+        return path
+
+    def _read_job(self, job_id: str) -> Dict[str, Any]:
+        return json.loads((self._job_dir(job_id) / "job.json").read_text())
+
+    def _write_job(self, job: Dict[str, Any]) -> None:
+        (self.root / job["id"] / "job.json").write_text(json.dumps(job))
+
+    async def submit(self, lines: List[Dict[str, Any]]) -> str:
+        check, _ = _FORMATS[self.batch_format]
+        custom_ids = set()
+        for line in lines:
+            check(line)
+            if line.get("custom_id") in custom_ids:
+                raise ValueError(f"Duplicate custom_id: {line.get('custom_id')}")
+            custom_ids.add(line.get("custom_id"))
+
+        job_id = f"batch_{uuid.uuid4().hex}"
+        path = self.root / job_id
+        path.mkdir()
+        (path / "input.jsonl").write_text("".join(json.dumps(line) + "\n" for line in lines))
+        self._write_job({"id": job_id, "status": BatchStatus.PENDING.value, "polls": 0, "request_count": len(lines)})
+        return job_id
+
+    def _process(self, job: Dict[str, Any]) -> None:
+        _, answer = _FORMATS[self.batch_format]
+        path = self.root / job["id"]
+        with open(path / "input.jsonl") as inputs, open(path / "output.jsonl", "w") as outputs:
+            for raw in inputs:
+                outputs.write(json.dumps(answer(json.loads(raw), self.reply)) + "\n")
+
+    async def status(self, job_id: str) -> Tuple[BatchStatus, Dict[str, Any]]:
+        job = self._read_job(job_id)
+        if not BatchStatus(job["status"]).finished:
+            job["polls"] += 1
+            if job["polls"] > self.polls_until_done:
+                self._process(job)
+                job["status"] = BatchStatus.COMPLETED.value
+            else:
+                job["status"] = BatchStatus.RUNNING.value
+            self._write_job(job)
+        return BatchStatus(job["status"]), job
+
+    async def results(self, job_id: str) -> List[Dict[str, Any]]:
+        output = self._job_dir(job_id) / "output.jsonl"
+        if not output.exists():
+            return []
+        return [json.loads(raw) for raw in output.read_text().splitlines() if raw.strip()]
+
+    async def cancel(self, job_id: str) -> None:
+        job = self._read_job(job_id)
+        if not BatchStatus(job["status"]).finished:
+            job["status"] = BatchStatus.CANCELLED.value
+            self._write_job(job)
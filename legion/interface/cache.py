@@ -0,0 +1,449 @@
+"""Exact-match response caching for LLM completions
+
+A ``ResponseCache`` stores completions keyed on a stable hash of everything
+that shapes the response: provider, model, messages, tool schemas,
+temperature, output limit and response schema. Identical requests are
+served from the cache, and concurrent identical requests share a single
+provider call.
+
+Caching is opt-in, per agent (``Agent(response_cache=...)``) or for every
+provider in the process (``set_default_response_cache``). Requests sampled
+above the cache's temperature threshold always go to the provider.
+
+A cached tool completion is replayed as-is: tools the provider would have
+called while producing it are not run again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from ..monitoring.events.base import EventEmitter
+from ..monitoring.events.cache import CacheEvent
+from .executors import ManagedExecutor
+from .schemas import Message, ModelResponse
+
+if TYPE_CHECKING:
+    from .base import LLMInterface
+    from .tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the key layout changes, so old disk entries are never matched
+_KEY_VERSION = 1
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    messages: Sequence[Message],
+    tools: Optional[Sequence["BaseTool"]] = None,
+    temperature: Optional[float] = None,
+    response_schema: Optional[Type[BaseModel]] = None,
+    max_tokens: Optional[int] = None
+) -> str:
+    """Build a stable cache key for a completion request
+
+    Args:
+    ----
+        provider: Provider identifier, including anything that changes where requests go
+        model: Model name
+        messages: Messages sent to the model
+        tools: Tools offered to the model
+        temperature: Sampling temperature actually used for the request
+        response_schema: Schema the response is formatted as
+        max_tokens: Output token limit
+
+    Returns:
+    -------
+        Hex digest identifying the request
+
+    """
+    payload = {
+        "v": _KEY_VERSION,
+        "provider": provider,
+        "model": model,
+        "messages": [message.cached_dump() for message in messages],
+        "tools": [tool.get_schema() for tool in tools or ()],
+        "temperature": temperature,
+        "response_schema": response_schema.model_json_schema() if response_schema else None,
+        "max_tokens": max_tokens
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+class CacheBackend(ABC):
+    """Storage for cached responses"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ModelResponse]:
+        """Get a cached response, or None if missing or expired"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: ModelResponse) -> None:
+        """Store a response"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response"""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored responses, including any not yet expired out"""
+        pass
+
+    async def aget(self, key: str) -> Optional[ModelResponse]:
+        """Get a cached response asynchronously"""
+        return self.get(key)
+
+    async def aset(self, key: str, response: ModelResponse) -> None:
+        """Store a response asynchronously"""
+        self.set(key, response)
+
+    def close(self) -> None:
+        """Release resources held by the backend"""
+        pass
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with an optional time-to-live"""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """Initialize the backend
+
+        Args:
+        ----
+            max_entries: Least recently used responses are evicted beyond this many
+            ttl: Seconds a response stays valid; responses never expire if not set
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, ModelResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ModelResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers may modify the response they get back
+        return response.model_copy(deep=True)
+
+    def set(self, key: str, response: ModelResponse) -> None:
+        response = response.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+"""
+
+class SQLiteCacheBackend(CacheBackend):
+    """Disk cache in SQLite, shared across runs and processes"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = "legion_cache.db",
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        timeout: float = 30.0
+    ):
+        """Open (or create) the cache database
+
+        Args:
+        ----
+            db_path: Path to the SQLite database file, or ``":memory:"``
+            ttl: Seconds a response stays valid; responses never expire if not set
+            max_entries: Least recently used responses are evicted beyond this many
+            timeout: Seconds to wait for locks held by other processes
+
+        """
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # One worker, so async lookups keep the event loop free without contending for the connection
+        self._executor = ManagedExecutor("cache.sqlite", max_workers=1)
+
+    def get(self, key: str) -> Optional[ModelResponse]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            if self.max_entries is not None:
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+        return ModelResponse.model_validate_json(row[0])
+
+    def set(self, key: str, response: ModelResponse) -> None:
+        try:
+            data = response.model_dump_json()
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching response that can't be serialized: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, data, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now, now)
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    async def aget(self, key: str) -> Optional[ModelResponse]:
+        return await self._executor.run(self.get, key)
+
+    async def aset(self, key: str, response: ModelResponse) -> None:
+        await self._executor.run(self.set, key, response)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._conn.close()
+
+class ResponseCache(EventEmitter):
+    """Serves repeated completion requests from a cache backend
+
+    Every lookup emits a ``CacheEvent`` with the running hit and miss
+    counts to registered event handlers.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_temperature: float = 0.0,
+        name: str = "response_cache"
+    ):
+        """Initialize the cache
+
+        Args:
+        ----
+            backend: Where responses are stored, an in-memory LRU by default
+            max_temperature: Requests sampled at a higher temperature bypass the
+                cache; raise it to also reuse sampled responses
+            name: Component id used in emitted events
+
+        """
+        super().__init__()
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.max_temperature = max_temperature
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._in_flight: Dict[str, "asyncio.Future[ModelResponse]"] = {}
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of the cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.backend)
+        }
+
+    def clear(self) -> None:
+        """Remove every cached response; counters are kept"""
+        self.backend.clear()
+
+    def close(self) -> None:
+        """Release the backend"""
+        self.backend.close()
+
+    def _record(self, result: str, key: Optional[str], llm: "LLMInterface", model: str) -> None:
+        """Emit a cache event; skipped entirely when nobody is listening"""
+        if not self._event_handlers:
+            return
+        self.emit_event(CacheEvent(
+            component_id=self.name,
+            result=result,
+            key=key,
+            hits=self.hits,
+            misses=self.misses,
+            provider_name=type(llm).__name__,
+            model_name=model
+        ))
+
+    def request_key(
+        self,
+        llm: "LLMInterface",
+        messages: Sequence[Message],
+        model: str,
+        tools: Optional[Sequence["BaseTool"]],
+        temperature: float,
+        response_schema: Optional[Type[BaseModel]],
+        max_tokens: Optional[int]
+    ) -> Optional[str]:
+        """Get the cache key for a request, or None if it bypasses the cache"""
+        if temperature > self.max_temperature:
+            self.bypassed += 1
+            self._record("bypass", None, llm, model)
+            return None
+
+        provider = f"{type(llm).__module__}.{type(llm).__qualname__}@{llm.config.base_url or ''}"
+        return make_cache_key(provider, model, messages, tools, temperature, response_schema, max_tokens)
+
+    async def _lookup(self, key: str) -> Optional[ModelResponse]:
+        try:
+            return await self.backend.aget(key)
+        except Exception as e:
+            # A broken cache must never fail the request
+            self.errors += 1
+            logger.warning(f"Response cache lookup failed: {e}")
+            return None
+
+    async def _store(self, key: str, response: ModelResponse) -> None:
+        try:
+            await self.backend.aset(key, response)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache store failed: {e}")
+
+    async def get_or_complete(
+        self,
+        key: str,
+        complete: Callable[[], Awaitable[ModelResponse]],
+        llm: "LLMInterface",
+        model: str
+    ) -> ModelResponse:
+        """Get the cached response for a key, calling the provider on a miss
+
+        Concurrent calls with the same key wait for the first one instead of
+        each calling the provider.
+
+        Args:
+        ----
+            key: Cache key from ``request_key``
+            complete: Calls the provider
+            llm: Provider handling the request, for events
+            model: Model name, for events
+
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = self._in_flight.get(key)
+            if pending is None or pending.get_loop() is not loop:
+                break
+            try:
+                response = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The call we were waiting on was cancelled; make the call ourselves
+                if pending.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+            self.coalesced += 1
+            self._record("coalesced", key, llm, model)
+            return response.model_copy(deep=True)
+
+        response = await self._lookup(key)
+        if response is not None:
+            self.hits += 1
+            self._record("hit", key, llm, model)
+            return response
+
+        self.misses += 1
+        self._record("miss", key, llm, model)
+
+        future: "asyncio.Future[ModelResponse]" = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            response = await complete()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when no other call was waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+        await self._store(key, response)
+        return response
+
+_default_cache: Optional[ResponseCache] = None
+
+def set_default_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Set the cache used by providers that aren't configured with their own
+
+    Pass None to turn process-wide caching off again.
+    """
+    global _default_cache
+    _default_cache = cache
+
+def get_default_response_cache() -> Optional[ResponseCache]:
+    """Get the process-wide response cache, if one is set"""
+    return _default_cache
@@ -0,0 +1,214 @@
+"""Process-wide registry of provider SDK clients
+
+Provider SDK clients (``OpenAI``, ``AsyncAnthropic``, ...) each own an HTTP
+connection pool. Agents with identical connection settings share one client
+through this registry so keep-alive connections are reused instead of
+opening a new pool per provider instance.
+
+Async clients are bound to the event loop they first ran on, so they are
+only shared within one loop and are dropped once that loop closes.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import itertools
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .portal import run_sync
+from .schemas import ProviderConfig
+
+logger = logging.getLogger(__name__)
+
+ClientKey = Tuple[Hashable, ...]
+
+# Never-reused tokens identifying event loops in client keys; ``id()`` can
+# be recycled once a loop is garbage collected
+_loop_tokens: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+_loop_counter = itertools.count()
+_loop_tokens_lock = threading.Lock()
+
+def _loop_token(loop: asyncio.AbstractEventLoop) -> int:
+    """Get the token identifying an event loop"""
+    with _loop_tokens_lock:
+        token = _loop_tokens.get(loop)
+        if token is None:
+            token = _loop_tokens[loop] = next(_loop_counter)
+        return token
+
+class _ClientEntry:
+    """Shared client with its reference count and, for async clients, its loop"""
+
+    __slots__ = ("client", "refs", "loop")
+
+    def __init__(self, client: Any, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.client = client
+        self.refs = 0
+        self.loop = weakref.ref(loop) if loop is not None else None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the loop this client is bound to has closed"""
+        if self.loop is None:
+            return False
+        loop = self.loop()
+        return loop is None or loop.is_closed()
+
+def make_client_key(
+    kind: str,
+    config: ProviderConfig,
+    *extra: Hashable,
+    loop: Optional[asyncio.AbstractEventLoop] = None
+) -> ClientKey:
+    """Build a registry key from a client kind and connection settings
+
+    Args:
+    ----
+        kind: Client kind, e.g. ``"openai.async"``
+        config: Provider configuration
+        *extra: Additional settings that change how the client is built
+        loop: Event loop an async client is bound to
+
+    """
+    # Keep the raw API key out of the key so it never shows up in reprs or logs
+    api_key = config.api_key
+    key_digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+    return (
+        kind,
+        config.base_url,
+        key_digest,
+        config.timeout,
+        config.max_retries,
+        config.organization_id,
+        *extra,
+        *((("loop", _loop_token(loop)),) if loop is not None else ())
+    )
+
+def _find_close(client: Any) -> Optional[Callable[[], Any]]:
+    """Find the method that closes a client's connection pool"""
+    for target in (client, getattr(client, "_client", None)):
+        if target is None:
+            continue
+        for name in ("close", "aclose"):
+            method = getattr(target, name, None)
+            if callable(method):
+                return method
+    return None
+
+class ClientRegistry:
+    """Reference-counted registry of SDK clients keyed by connection settings"""
+
+    def __init__(self):
+        self._entries: Dict[ClientKey, _ClientEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of live shared clients"""
+        return len(self._entries)
+
+    def acquire(
+        self,
+        key: ClientKey,
+        factory: Callable[[], Any],
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Any:
+        """Get the client for a key, creating it with ``factory`` on first use
+
+        Args:
+        ----
+            key: Registry key from ``make_client_key``
+            factory: Builds the client if no matching one exists yet
+            loop: Event loop an async client is bound to
+
+        """
+        with self._lock:
+            self._drop_stale()
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _ClientEntry(factory(), loop)
+                self._entries[key] = entry
+                logger.debug(f"Created shared client for {key[0]}")
+            entry.refs += 1
+            return entry.client
+
+    def _drop_stale(self) -> None:
+        """Forget async clients whose event loop has closed; they can no longer be used or closed"""
+        for key in [key for key, entry in self._entries.items() if entry.stale]:
+            del self._entries[key]
+            logger.debug(f"Dropped shared client for {key[0]} after its event loop closed")
+
+    def _drop(self, key: ClientKey) -> Optional[Any]:
+        """Decrement a key's reference count, returning the client if it is now unused"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.refs -= 1
+            if entry.refs > 0:
+                return None
+            del self._entries[key]
+            return entry.client
+
+    def release(self, key: ClientKey) -> None:
+        """Release a reference, closing the client when the last one is dropped"""
+        client = self._drop(key)
+        if client is not None:
+            self._close_sync(client)
+
+    async def arelease(self, key: ClientKey) -> None:
+        """Release a reference asynchronously"""
+        client = self._drop(key)
+        if client is not None:
+            await self._close_async(client)
+
+    async def aclose(self) -> None:
+        """Close every shared client regardless of outstanding references"""
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+
+        for client in clients:
+            await self._close_async(client)
+
+    @staticmethod
+    def _close_sync(client: Any) -> None:
+        """Close a client from synchronous code"""
+        close = _find_close(client)
+        if close is None:
+            return
+        try:
+            if not inspect.iscoroutinefunction(close):
+                close()
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Async clients are used on the portal loop, so close them there
+                run_sync(close())
+            else:
+                loop.create_task(close())
+        except Exception as e:
+            logger.warning(f"Failed to close shared client: {e}")
+
+    @staticmethod
+    async def _close_async(client: Any) -> None:
+        """Close a client from asynchronous code"""
+        close = _find_close(client)
+        if close is None:
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Failed to close shared client: {e}")
+
+# Registry shared by every provider in the process
+client_registry = ClientRegistry()
+
+async def aclose_shared_clients() -> None:
+    """Close all shared provider clients, e.g. at application shutdown"""
+    await client_registry.aclose()
@@ -1,4 +1,3 @@
-import asyncio
 import inspect
 import logging
 from typing import Annotated, Any, Dict, List, Optional, Type, get_type_hints
@@ -38,7 +37,8 @@ class FunctionTool(BaseTool):
         """Clear the registry - used for testing"""
         cls._registry.clear()
 
-    def __init__(self, func, name=None, description=None, param_model=None, inject=None, defaults=None):
+    def __init__(self, func, name=None, description=None, param_model=None, inject=None, defaults=None,
+                 concurrent=True, executor=None):
         logger.debug(f"Initializing FunctionTool for {func.__name__}")
         # Store function reference
         self.func = func
@@ -53,7 +53,9 @@ class FunctionTool(BaseTool):
             description=description,
             parameters=param_model,
             injected_params=set(inject or []),
-            injected_values={}
+            injected_values={},
+            concurrent=concurrent,
+            executor=executor
         )
 
         # Initialize registry entry for this function if needed
@@ -127,13 +129,9 @@ class FunctionTool(BaseTool):
             logger.debug("[TOOL ARUN] Calling async standalone function")
             return await self.func(**all_kwargs)
 
-        # Run sync function in thread pool
-        logger.debug("[TOOL ARUN] Running sync function in thread pool")
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.run(**all_kwargs)  # Pass the merged kwargs
-        )
+        # Run sync function in the tool's executor
+        logger.debug(f"[TOOL ARUN] Running sync function in executor {self.executor}")
+        return await self._run_in_executor(**all_kwargs)  # Pass the merged kwargs
 
     def __get__(self, obj, objtype=None):
         """Support descriptor protocol for instance binding"""
@@ -195,43 +193,15 @@ class FunctionTool(BaseTool):
 
         return bound_tool
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get OpenAI-compatible function schema"""
-        # TODO: Ensure this is compatible with all providers
-        schema = self.parameters.model_json_schema()
-
-        # Filter out injected parameters from schema
-        filtered_properties = {
-            k: v for k, v in schema.get("properties", {}).items()
-            if k not in self.injected_params
-        }
-
-        # Remove injected params from required list
-        required = [
-            param for param in schema.get("required", [])
-            if param not in self.injected_params
-        ]
-
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": filtered_properties,
-                    "required": required
-                }
-            }
-        }
-
 def tool(
     func=None,  # Allow positional function argument for @tool syntax
     *,         # Force remaining arguments to be keyword-only
     inject: Optional[List[str]] = None,
     name: Optional[str] = None,
     description: Optional[str] = None,
-    defaults: Optional[Dict[str, Any]] = None
+    defaults: Optional[Dict[str, Any]] = None,
+    concurrent: bool = True,
+    executor: Optional[str] = None
 ):
     """Decorator to create a tool from a function
 
@@ -244,6 +214,8 @@ def tool(
         name: Override tool name
         description: Override tool description
         defaults: Default values for injectable parameters
+        concurrent: Whether the tool may run alongside other tool calls in the same turn
+        executor: Name of the executor running the function if it is synchronous
 
     """
     # Define the actual decorator function
@@ -296,7 +268,9 @@ def tool(
             description=tool_description,
             param_model=param_model,
             inject=inject,
-            defaults=defaults
+            defaults=defaults,
+            concurrent=concurrent,
+            executor=executor
         )
         return tool_instance
 
@@ -0,0 +1,205 @@
+"""Named, bounded executors for synchronous tools and blocks
+
+Synchronous tools and blocks run off the event loop. Rather than sharing the
+loop's default thread pool, each one submits work to a named executor from
+this registry, so a slow tool only ever queues behind its own calls. Every
+executor tracks queue depth and how long calls wait before they start.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Workers per executor unless configured otherwise
+DEFAULT_MAX_WORKERS = 4
+
+class ExecutorKind(str, Enum):
+    """Kind of pool backing an executor"""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+def _timed_call(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[float, Any]:
+    """Run a call in a worker, returning the wall-clock time it started with its result"""
+    started = time.time()
+    return started, func(*args, **kwargs)
+
+class ManagedExecutor:
+    """Bounded thread or process pool with queue and wait-time metrics"""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        kind: ExecutorKind = ExecutorKind.THREAD
+    ):
+        """Initialize the executor; the pool itself is created on first use
+
+        Args:
+        ----
+            name: Executor name
+            max_workers: Maximum number of calls running at once
+            kind: Whether calls run in threads or worker processes
+
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.kind = ExecutorKind(kind)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._pending = 0
+        self._max_queue_depth = 0
+        self._waits = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+
+    def _get_executor(self) -> Executor:
+        """Create the underlying pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                if self.kind == ExecutorKind.PROCESS:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"legion-{self.name}"
+                    )
+            return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted calls waiting for a free worker"""
+        return max(0, self._pending - self.max_workers)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a synchronous callable in this executor
+
+        In process mode the callable and its arguments must be picklable.
+        """
+        executor = self._get_executor()
+        submitted = time.time()
+        with self._lock:
+            self._submitted += 1
+            self._pending += 1
+            self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+
+        try:
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                executor, _timed_call, func, args, kwargs
+            )
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+                self._failed += 1
+            raise
+
+        wait_ms = max(0.0, started - submitted) * 1000
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._waits += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of this executor's metrics"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "kind": self.kind.value,
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "in_flight": min(self._pending, self.max_workers),
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self._max_queue_depth,
+                "avg_wait_ms": self._total_wait_ms / self._waits if self._waits else 0.0,
+                "max_wait_ms": self._max_wait_ms
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+class ExecutorRegistry:
+    """Registry of named executors shared across the process"""
+
+    def __init__(self):
+        self._executors: Dict[str, ManagedExecutor] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._executors
+
+    def configure(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        kind: ExecutorKind = ExecutorKind.THREAD
+    ) -> ManagedExecutor:
+        """Create or replace the executor with the given name
+
+        Calls already running in a replaced executor are allowed to finish.
+        """
+        executor = ManagedExecutor(name, max_workers=max_workers, kind=kind)
+        with self._lock:
+            previous = self._executors.get(name)
+            self._executors[name] = executor
+        if previous is not None:
+            previous.shutdown(wait=False)
+        return executor
+
+    def get(self, name: str, kind: ExecutorKind = ExecutorKind.THREAD) -> ManagedExecutor:
+        """Get an executor by name, creating it with default settings if needed
+
+        Raises
+        ------
+            ValueError: If the executor exists with a different kind
+
+        """
+        kind = ExecutorKind(kind)
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = ManagedExecutor(name, kind=kind)
+                self._executors[name] = executor
+                logger.debug(f"Created {kind.value} executor {name}")
+        if executor.kind != kind:
+            raise ValueError(
+                f"Executor {name} is a {executor.kind.value} executor, not a {kind.value} executor"
+            )
+        return executor
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every executor, keyed by name"""
+        with self._lock:
+            executors = list(self._executors.values())
+        return {executor.name: executor.stats() for executor in executors}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down and forget every executor"""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+# Registry shared by every tool and block in the process
+executor_registry = ExecutorRegistry()
@@ -0,0 +1,198 @@
+"""Background event loop for running coroutines from synchronous code
+
+Sync entry points such as ``Agent.process`` submit their coroutine to one
+long-lived loop on a daemon thread instead of starting a loop per call, so
+async clients and their connection pools survive between calls. Calling a
+sync entry point from inside a running loop is safe: the calling thread
+waits while the portal runs the coroutine, and calls made on the portal's
+own thread run on a separate loop rather than deadlocking.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+def _run_in_new_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh loop in a helper thread"""
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="legion-portal-nested") as pool:
+        return pool.submit(context.run, asyncio.run, coro).result()
+
+class LoopPortal:
+    """Event loop running on a daemon thread, shared by synchronous callers"""
+
+    def __init__(self, name: str = "legion-portal"):
+        """Initialize the portal; the loop and its thread start on first use
+
+        Args:
+        ----
+            name: Name of the loop thread
+
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The portal's running loop, started on first use"""
+        with self._lock:
+            # A forked worker inherits the loop object but not its thread
+            if self._loop is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._start()
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is running in this process"""
+        return self._thread is not None and self._pid == os.getpid() and self._thread.is_alive()
+
+    def in_portal(self) -> bool:
+        """Whether the caller is running on the portal's thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _start(self) -> None:
+        """Start a new loop on a daemon thread and wait until it runs"""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+            finally:
+                _cancel_pending(loop)
+                loop.close()
+
+        thread = threading.Thread(target=serve, name=self.name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the portal loop
+
+        The coroutine runs in a copy of the caller's context, so context
+        variables set by the caller are visible to it. Cancelling the returned
+        future cancels the task.
+
+        Args:
+        ----
+            coro: Coroutine to run
+
+        Returns:
+        -------
+            Future resolved with the coroutine's result
+
+        """
+        future: "Future[T]" = Future()
+        context = contextvars.copy_context()
+        loop = self.loop
+
+        def start() -> None:
+            if future.cancelled():
+                coro.close()
+                return
+            task = loop.create_task(coro, context=context)
+            task.add_done_callback(lambda done: _copy_outcome(done, future))
+            # The future stays pending until the task finishes, so it can still be cancelled
+            future.add_done_callback(
+                lambda done: done.cancelled() and loop.call_soon_threadsafe(task.cancel)
+            )
+
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the portal loop and wait for its result
+
+        Args:
+        ----
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling it
+
+        Returns:
+        -------
+            The coroutine's result
+
+        Raises:
+        ------
+            TimeoutError: If the coroutine doesn't finish within the timeout
+
+        """
+        if self.in_portal():
+            # Waiting on the portal's own loop from its thread would never return
+            return _run_in_new_loop(coro)
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timed out or interrupted; stop the task rather than leaving it running
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Cancel outstanding work and stop the loop thread"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+def _copy_outcome(task: "asyncio.Task[T]", future: "Future[T]") -> None:
+    """Copy a finished task's result, error or cancellation to a future"""
+    if task.cancelled():
+        future.cancel()
+    elif not future.set_running_or_notify_cancel():
+        return
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel and drain the tasks still pending on a stopped loop"""
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except Exception as e:
+        logger.warning(f"Failed to shut down async generators: {e}")
+
+# Global portal used by the sync APIs
+portal = LoopPortal()
+atexit.register(portal.shutdown)
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine from synchronous code on the global portal
+
+    Args:
+    ----
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling it
+
+    Returns:
+    -------
+        The coroutine's result
+
+    """
+    return portal.run(coro, timeout)
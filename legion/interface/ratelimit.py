@@ -0,0 +1,331 @@
+"""Client-side rate limits per provider and model
+
+Requests to a provider and model pass through a shared ``RateLimiter``
+before they are sent. It bounds requests per minute and tokens per minute
+with token buckets, and the number of requests in flight with a semaphore.
+Token use is estimated up front and corrected with the ``TokenUsage`` the
+provider reports, so the TPM bucket tracks what was actually consumed.
+
+Limits are read from ``ProviderConfig`` (``requests_per_minute``,
+``tokens_per_minute``, ``max_in_flight``). Every provider instance with the
+same provider, endpoint and model shares one limiter, so limits hold across
+all agents in the process. Limiters work from any event loop or thread,
+including the short-lived loops the sync ``process`` APIs run.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, Optional, Tuple
+
+from ..monitoring.events.base import EventEmitter
+from ..monitoring.events.ratelimit import RateLimitEvent
+from .schemas import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+LimiterKey = Tuple[Hashable, ...]
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate
+
+    Callers reserve capacity up front and wait out any shortfall, so waiting
+    callers are served in order without a queue, from any event loop.
+    """
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """Initialize a full bucket
+
+        Args:
+        ----
+            per_minute: Tokens added per minute
+            burst: Bucket capacity, a minute's worth of tokens by default
+
+        """
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+
+        self.per_minute = per_minute
+        self.capacity = burst if burst is not None else per_minute
+        self._rate = per_minute / 60
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available; negative while reservations are outstanding"""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, amount: float) -> float:
+        """Take tokens from the bucket, returning how many seconds to wait before using them"""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self._rate)
+
+    def adjust(self, amount: float) -> None:
+        """Take (or with a negative amount, return) tokens without waiting"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+class _Slots:
+    """Counting semaphore usable from any event loop or thread"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                except ValueError:
+                    # The slot was handed over as we were cancelled
+                    granted = True
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                if loop.is_closed():
+                    continue
+                # The slot passes straight to the waiter, so in_use is unchanged
+                loop.call_soon_threadsafe(_wake, future)
+                return
+            self.in_use -= 1
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+class Reservation:
+    """Capacity held by one request, settled against its actual token use"""
+
+    def __init__(self, limiter: "RateLimiter", tokens: int):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.usage: Optional[TokenUsage] = None
+
+    def record(self, usage: Optional[TokenUsage]) -> None:
+        """Record the token use the provider reported for the request"""
+        if usage is not None:
+            self.usage = usage if self.usage is None else TokenUsage(
+                prompt_tokens=self.usage.prompt_tokens + usage.prompt_tokens,
+                completion_tokens=self.usage.completion_tokens + usage.completion_tokens,
+                total_tokens=self.usage.total_tokens + usage.total_tokens
+            )
+
+class RateLimiter:
+    """Request, token and concurrency limits for one provider and model"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        emitter: Optional[EventEmitter] = None
+    ):
+        """Initialize the limiter; limits left unset are not enforced
+
+        Args:
+        ----
+            name: Limiter name, used in events and stats
+            requests_per_minute: Maximum requests started per minute
+            tokens_per_minute: Maximum tokens used per minute
+            max_in_flight: Maximum requests running at once
+            emitter: Emits a ``RateLimitEvent`` for every request
+
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._slots = _Slots(max_in_flight) if max_in_flight else None
+        self._emitter = emitter
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._waited = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._tokens_used = 0
+
+    @property
+    def limits(self) -> Tuple[Optional[float], Optional[float], Optional[int]]:
+        """Configured (requests_per_minute, tokens_per_minute, max_in_flight)"""
+        return (
+            self.requests.per_minute if self.requests else None,
+            self.tokens.per_minute if self.tokens else None,
+            self._slots.limit if self._slots else None
+        )
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0) -> AsyncIterator[Reservation]:
+        """Wait until a request may be sent, holding its capacity until it finishes
+
+        Args:
+        ----
+            estimated_tokens: Tokens the request is expected to use; corrected
+                with the usage recorded on the reservation
+
+        Yields:
+        ------
+            Reservation: Record the provider's reported usage on it
+
+        """
+        started = time.monotonic()
+        if self._slots is not None:
+            await self._slots.acquire()
+
+        reservation = Reservation(self, estimated_tokens)
+        try:
+            delay = 0.0
+            if self.requests is not None:
+                delay = self.requests.reserve(1)
+            if self.tokens is not None:
+                delay = max(delay, self.tokens.reserve(estimated_tokens))
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    # Give back capacity for a request that was never sent
+                    if self.requests is not None:
+                        self.requests.adjust(-1)
+                    if self.tokens is not None:
+                        self.tokens.adjust(-estimated_tokens)
+                    raise
+
+            wait_ms = (time.monotonic() - started) * 1000
+            self._record_wait(wait_ms)
+            yield reservation
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+        used = reservation.usage.total_tokens if reservation.usage else estimated_tokens
+        if self.tokens is not None and reservation.usage is not None:
+            self.tokens.adjust(used - estimated_tokens)
+        with self._lock:
+            self._tokens_used += used
+
+    def _record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self._requests += 1
+            if wait_ms >= 1:
+                self._waited += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+
+        if self._emitter is not None and self._emitter._event_handlers:
+            self._emitter.emit_event(RateLimitEvent(
+                component_id=self.name,
+                wait_ms=wait_ms,
+                in_flight=self._slots.in_use if self._slots else None,
+                queued=self._slots.waiting if self._slots else 0
+            ))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of this limiter's metrics"""
+        requests_per_minute, tokens_per_minute, max_in_flight = self.limits
+        with self._lock:
+            return {
+                "name": self.name,
+                "requests_per_minute": requests_per_minute,
+                "tokens_per_minute": tokens_per_minute,
+                "max_in_flight": max_in_flight,
+                "requests": self._requests,
+                "waited": self._waited,
+                "avg_wait_ms": self._total_wait_ms / self._requests if self._requests else 0.0,
+                "max_wait_ms": self._max_wait_ms,
+                "tokens_used": self._tokens_used,
+                "in_flight": self._slots.in_use if self._slots else None,
+                "queued": self._slots.waiting if self._slots else 0
+            }
+
+class RateLimiterRegistry(EventEmitter):
+    """Rate limiters shared across the process, keyed by provider and model
+
+    Handlers added to the registry receive a ``RateLimitEvent`` from every
+    limiter it holds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._limiters: Dict[LimiterKey, RateLimiter] = {}
+        self._registry_lock = threading.Lock()
+
+    def get(
+        self,
+        key: LimiterKey,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_in_flight: Optional[int] = None
+    ) -> Optional[RateLimiter]:
+        """Get the limiter for a key, creating or reconfiguring it to match the limits
+
+        Returns None, and drops any existing limiter, when no limit is set.
+        """
+        limits = (requests_per_minute, tokens_per_minute, max_in_flight)
+        with self._registry_lock:
+            limiter = self._limiters.get(key)
+            if limiter is not None and limiter.limits == limits:
+                return limiter
+            if not any(limits):
+                self._limiters.pop(key, None)
+                return None
+
+            name = "/".join(str(part) for part in key if part)
+            if limiter is not None:
+                logger.debug(f"Reconfiguring rate limiter {name} to {limits}")
+            limiter = RateLimiter(name, *limits, emitter=self)
+            self._limiters[key] = limiter
+            return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every limiter, keyed by name"""
+        with self._registry_lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.stats() for limiter in limiters}
+
+    def clear(self) -> None:
+        """Forget every limiter"""
+        with self._registry_lock:
+            self._limiters.clear()
+
+# Registry shared by every provider in the process
+rate_limiter_registry = RateLimiterRegistry()
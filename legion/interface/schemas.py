@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Role(str, Enum):
@@ -37,6 +37,47 @@ class Message(BaseModel):
     tool_calls: Optional[List[Union[ToolCall, Dict[str, Any]]]] = None
     tool_call_id: Optional[str] = None
 
+    # Serialized forms of this message, keyed by format
+    _serialized: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._serialized.clear()
+
+    def __copy__(self) -> "Message":
+        copied = super().__copy__()
+        copied._serialized = {}
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Message":
+        copied = super().__deepcopy__(memo)
+        copied._serialized = {}
+        return copied
+
+    def serialized(self, key: str, formatter: Callable[["Message"], Any]) -> Any:
+        """Get this message in a serialized form, formatting it only once
+
+        The cached form is dropped when a field is reassigned. Mutating a
+        field in place (e.g. appending to ``tool_calls``) is not tracked,
+        and callers must treat the returned value as read-only.
+
+        Args:
+        ----
+            key: Name of the format, e.g. a provider name
+            formatter: Function converting the message to that format
+
+        """
+        try:
+            return self._serialized[key]
+        except KeyError:
+            value = self._serialized[key] = formatter(self)
+            return value
+
+    def cached_dump(self) -> Dict[str, Any]:
+        """Get ``model_dump()`` of this message, cached until it changes"""
+        return self.serialized("model_dump", Message.model_dump)
+
 class ModelResponse(BaseModel):
     """Model response schema"""
 
@@ -46,6 +87,20 @@ class ModelResponse(BaseModel):
     raw_response: Optional[Dict[str, Any]] = None
     usage: Optional[TokenUsage] = None
 
+class StreamChunk(BaseModel):
+    """Incremental piece of a streamed completion
+
+    Content chunks carry a text delta. Once a model turn finishes, a chunk
+    carries the turn's assembled tool calls, and the last chunk of the stream
+    carries the assembled ``response``.
+    """
+
+    content: str = ""
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    usage: Optional[TokenUsage] = None
+    finish_reason: Optional[str] = None
+    response: Optional[ModelResponse] = None
+
 class ProviderConfig(BaseModel):
     """Base provider configuration"""
 
@@ -0,0 +1,94 @@
+"""Helpers for assembling streamed provider responses"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .schemas import StreamChunk, TokenUsage
+
+
+class ToolCallAccumulator:
+    """Assemble tool calls from fragments streamed across chunks
+
+    Providers stream a tool call's id and name once and its JSON arguments
+    in pieces, keyed by the call's position in the turn.
+    """
+
+    def __init__(self):
+        self._calls: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(
+        self,
+        index: int,
+        call_id: Optional[str] = None,
+        name: Optional[str] = None,
+        arguments: Optional[str] = None
+    ) -> None:
+        """Merge a fragment into the call at ``index``"""
+        call = self._calls.setdefault(index, {"id": None, "name": "", "arguments": []})
+        if call_id:
+            call["id"] = call_id
+        if name:
+            call["name"] += name
+        if arguments:
+            call["arguments"].append(arguments)
+
+    def build(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the assembled calls in the format used by ``ModelResponse``"""
+        if not self._calls:
+            return None
+
+        return [
+            {
+                "id": call["id"] or f"call_{index}",
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": "".join(call["arguments"]) or "{}"
+                }
+            }
+            for index, call in sorted(self._calls.items())
+        ]
+
+async def iter_openai_stream(stream: AsyncIterator[Any]) -> AsyncIterator[StreamChunk]:
+    """Convert an OpenAI-compatible chat completion stream into chunks
+
+    Args:
+    ----
+        stream: Async iterator of ``ChatCompletionChunk`` objects
+
+    """
+    tool_calls = ToolCallAccumulator()
+    usage = None
+    finish_reason = None
+
+    async for event in stream:
+        if getattr(event, "usage", None):
+            usage = TokenUsage(
+                prompt_tokens=event.usage.prompt_tokens,
+                completion_tokens=event.usage.completion_tokens,
+                total_tokens=event.usage.total_tokens
+            )
+        if not event.choices:
+            continue
+
+        choice = event.choices[0]
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+        delta = choice.delta
+        if delta is None:
+            continue
+        for call in delta.tool_calls or []:
+            function = call.function
+            tool_calls.add(
+                call.index,
+                call_id=call.id,
+                name=function.name if function else None,
+                arguments=function.arguments if function else None
+            )
+        if delta.content:
+            yield StreamChunk(content=delta.content)
+
+    yield StreamChunk(tool_calls=tool_calls.build(), usage=usage, finish_reason=finish_reason)
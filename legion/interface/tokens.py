@@ -0,0 +1,100 @@
+"""Token counting for context window budgets
+
+Providers expose a ``TokenCounter`` through ``LLMInterface.get_token_counter``.
+Counts are cached on each message, so measuring a conversation only counts
+messages that are new or have changed since the last turn.
+"""
+
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from .schemas import Message
+
+
+class TokenCounter(ABC):
+    """Counts the tokens a message uses in a provider's context window"""
+
+    # Tokens each message costs beyond its text (role, separators)
+    message_overhead: int = 4
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identifier for this counter's tokenization, used as the cache key"""
+        pass
+
+    @abstractmethod
+    def count_text(self, text: str) -> int:
+        """Count the tokens in a piece of text"""
+        pass
+
+    def count_message(self, message: Message) -> int:
+        """Count the tokens in a message, cached on the message until it changes"""
+        return message.serialized(f"tokens.{self.name}", self._count_message)
+
+    def count_messages(self, messages: Iterable[Message]) -> int:
+        """Count the tokens in a sequence of messages"""
+        return sum(self.count_message(message) for message in messages)
+
+    def _count_message(self, message: Message) -> int:
+        tokens = self.message_overhead + self.count_text(message.content or "")
+        if message.name:
+            tokens += self.count_text(message.name)
+        if message.tool_calls:
+            tool_calls = [
+                call if isinstance(call, dict) else call.model_dump()
+                for call in message.tool_calls
+            ]
+            tokens += self.count_text(json.dumps(tool_calls))
+        return tokens
+
+class CharTokenEstimator(TokenCounter):
+    """Estimate tokens from character count
+
+    Roughly four characters per token holds for English text with most
+    provider tokenizers, and needs no tokenizer dependency.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0):
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+
+    @property
+    def name(self) -> str:
+        return f"chars/{self.chars_per_token}"
+
+    def count_text(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+class TiktokenCounter(TokenCounter):
+    """Exact token counts for OpenAI models using ``tiktoken``"""
+
+    message_overhead = 3
+
+    def __init__(self, model: str):
+        """Load the encoding for a model
+
+        Raises
+        ------
+            ImportError: If tiktoken is not installed
+
+        """
+        try:
+            import tiktoken
+        except ImportError as e:
+            raise ImportError("TiktokenCounter requires tiktoken: pip install tiktoken") from e
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding("o200k_base")
+
+    @property
+    def name(self) -> str:
+        return f"tiktoken/{self._encoding.name}"
+
+    def count_text(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
@@ -1,15 +1,41 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Set, Type
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Type
 
 from pydantic import BaseModel
 
 from ..errors import ToolError
+from .executors import executor_registry
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Default number of tool calls from one model turn that may run at once
+DEFAULT_TOOL_CONCURRENCY = 8
+
+@lru_cache(maxsize=1024)
+def _parameters_schema(
+    parameters: Type[BaseModel],
+    injected_params: FrozenSet[str]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Get the properties and required list of a parameters model, without injected parameters"""
+    schema = parameters.model_json_schema()
+
+    # Filter out injected parameters from schema
+    properties = {
+        k: v for k, v in schema.get("properties", {}).items()
+        if k not in injected_params
+    }
+
+    # Remove injected params from required list
+    required = [
+        param for param in schema.get("required", [])
+        if param not in injected_params
+    ]
+    return properties, required
+
 class BaseTool(ABC):
     """Base class for all tools"""
 
@@ -19,46 +45,57 @@ class BaseTool(ABC):
         description: str,
         parameters: Type[BaseModel],
         injected_params: Optional[Set[str]] = None,
-        injected_values: Optional[Dict[str, Any]] = None
+        injected_values: Optional[Dict[str, Any]] = None,
+        concurrent: bool = True,
+        executor: Optional[str] = None
     ):
-        """Initialize tool"""
+        """Initialize tool
+
+        Set ``concurrent`` to False for tools that must not run alongside
+        other tool calls from the same model turn. Synchronous tools run in
+        the executor named ``executor``, by default one per tool name.
+        """
         self.name = name
         self.description = description
         self.parameters = parameters
         self.injected_params = injected_params or set()
+        self.concurrent = concurrent
+        self.executor = executor or f"tool.{name}"
         self._is_async = hasattr(self, "arun")
         self._injected_values = dict(injected_values or {})  # Make a copy
         logger.debug(f"BaseTool initialized with injected_values: {self._injected_values}")
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get OpenAI-compatible function schema"""
-        # TODO: Ensure this is compatible with all providers
-        schema = self.parameters.model_json_schema()
+    def _schema_key(self) -> Tuple[Any, ...]:
+        """Get everything the function schema is derived from"""
+        return (self.parameters, self.name, self.description, frozenset(self.injected_params))
 
-        # Filter out injected parameters from schema
-        filtered_properties = {
-            k: v for k, v in schema.get("properties", {}).items()
-            if k not in self.injected_params
-        }
+    def get_schema(self) -> Dict[str, Any]:
+        """Get OpenAI-compatible function schema
 
-        # Remove injected params from required list
-        required = [
-            param for param in schema.get("required", [])
-            if param not in self.injected_params
-        ]
+        The schema is built once per parameters model, name, description and
+        injected parameters and shared between calls, so it must not be modified.
+        """
+        key = self._schema_key()
+        cached = getattr(self, "_schema_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        return {
+        # TODO: Ensure this is compatible with all providers
+        properties, required = _parameters_schema(self.parameters, key[3])
+        schema = {
             "type": "function",
             "function": {
                 "name": self.name,
                 "description": self.description,
                 "parameters": {
                     "type": "object",
-                    "properties": filtered_properties,
+                    "properties": properties,
                     "required": required,
                 }
             }
         }
+        self._schema_cache = (key, schema)
+        return schema
 
     def inject(self, **kwargs) -> "BaseTool":
         """Inject static parameter values"""
@@ -94,9 +131,7 @@ class BaseTool(ABC):
             if self._is_async:
                 return await self.arun(**validated_dict)
             else:
-                return await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self.run(**validated_dict)
-                )
+                return await self._run_in_executor(**validated_dict)
         except Exception as e:
             if isinstance(e, (ValueError, ToolError)):
                 raise
@@ -110,9 +145,11 @@ class BaseTool(ABC):
     async def arun(self, **kwargs) -> Any:
         """Execute the tool with validated parameters (async)"""
         # Default async implementation calls sync version
-        return await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self.run(**kwargs)
-        )
+        return await self._run_in_executor(**kwargs)
+
+    async def _run_in_executor(self, **kwargs) -> Any:
+        """Run the sync implementation in this tool's executor"""
+        return await executor_registry.get(self.executor).run(self.run, **kwargs)
 
     def model_dump(self) -> Dict[str, Any]:
         """Serialize tool for provider APIs
@@ -132,3 +169,62 @@ class BaseTool(ABC):
         }
         """
         return self.get_schema()
+
+async def dispatch_tool_calls(
+    tool_calls: Sequence[Dict[str, Any]],
+    tools: Sequence[BaseTool],
+    execute: Callable[[BaseTool, Dict[str, Any]], Awaitable[Any]],
+    max_concurrency: Optional[int] = None
+) -> List[Tuple[Dict[str, Any], BaseTool, Any]]:
+    """Run the tool calls of one model turn concurrently
+
+    Calls to concurrent tools run together, at most ``max_concurrency`` at a
+    time. A call to a tool with ``concurrent=False`` waits for the calls
+    before it and runs on its own. Calls naming an unknown tool are skipped.
+
+    Args:
+    ----
+        tool_calls: Tool calls in the order the model returned them
+        tools: Available tools
+        execute: Coroutine function running one call with its tool
+        max_concurrency: Maximum number of calls in flight
+
+    Returns:
+    -------
+        ``(tool_call, tool, result)`` tuples in the original call order
+
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_TOOL_CONCURRENCY)
+    results: List[Tuple[Dict[str, Any], BaseTool, Any]] = []
+    batch: List[Tuple[Dict[str, Any], BaseTool]] = []
+
+    async def run(tool_call: Dict[str, Any], tool: BaseTool) -> Any:
+        async with semaphore:
+            return await execute(tool, tool_call)
+
+    async def flush() -> None:
+        if not batch:
+            return
+        tasks = [asyncio.ensure_future(run(call, tool)) for call, tool in batch]
+        try:
+            outputs = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        results.extend((call, tool, output) for (call, tool), output in zip(batch, outputs))
+        batch.clear()
+
+    for tool_call in tool_calls:
+        tool = next((t for t in tools if t.name == tool_call["function"]["name"]), None)
+        if tool is None:
+            continue
+        if getattr(tool, "concurrent", True):
+            batch.append((tool_call, tool))
+            continue
+
+        await flush()
+        results.append((tool_call, tool, await execute(tool, tool_call)))
+
+    await flush()
+    return results
@@ -56,6 +56,15 @@ class MemoryDump(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+class VersionedState(BaseModel):
+    """State loaded together with its version"""
+
+    # None when the provider does not track versions
+    version: Optional[int] = None
+    # None when unchanged since the caller's version, or when nothing is stored
+    state: Optional[Dict[str, Any]] = None
+    changed: bool = True
+
 class MemoryProvider(ABC):
     """Abstract base class for memory providers"""
 
@@ -87,6 +96,60 @@ class MemoryProvider(ABC):
         """Load state for an entity in a thread"""
         pass
 
+    async def append_messages(
+        self,
+        entity_id: str,
+        thread_id: str,
+        messages: List[Dict[str, Any]],
+        since_version: Optional[int] = None,
+        updates: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Append messages to the state of an entity in a thread
+
+        Providers that track versions override this to write only the new
+        messages. This default rewrites the whole state.
+
+        Args:
+        ----
+            entity_id: Entity the state belongs to
+            thread_id: Thread ID
+            messages: Serialized messages to append
+            since_version: Version the caller last saw; the append fails if
+                the state has changed since
+            updates: Other state keys to set along with the append
+
+        Returns:
+        -------
+            The new version, or None if versions are not tracked
+
+        Raises:
+        ------
+            VersionConflictError: If the state changed after ``since_version``
+
+        """
+        state = await self.load_state(entity_id, thread_id) or {}
+        state.update(updates or {})
+        state["messages"] = state.get("messages", []) + list(messages)
+        await self.save_state(entity_id, thread_id, state)
+        return None
+
+    async def get_state_version(self, entity_id: str, thread_id: str) -> Optional[int]:
+        """Get the current version of an entity's state, or None if untracked"""
+        return None
+
+    async def load_state_versioned(
+        self,
+        entity_id: str,
+        thread_id: str,
+        known_version: Optional[int] = None
+    ) -> VersionedState:
+        """Load state unless it is unchanged since ``known_version``
+
+        Lets callers keep an in-process copy of the state and skip reloading
+        it when nothing else has written to the thread.
+        """
+        return VersionedState(state=await self.load_state(entity_id, thread_id))
+
     @abstractmethod
     async def delete_thread(
         self,
@@ -0,0 +1,217 @@
+"""Token-budgeted context windows over conversation history
+
+A strategy picks which messages of a conversation are sent to the model so
+the request fits a token budget. Leading system messages are always kept,
+and recent messages are added newest first until the budget is spent.
+Token counts are cached on each message, so selecting a window costs
+O(window) rather than re-counting the whole history every turn.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..interface.schemas import Message, Role
+from ..interface.tokens import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY_PROMPT = (
+    "Summarize the conversation below so it can replace the original messages. "
+    "Keep facts, decisions, open questions and tool results that later turns may rely on."
+)
+
+@dataclass
+class ContextWindow:
+    """Messages selected for a request"""
+
+    messages: List[Message]
+    tokens: int
+    # Leading system messages, always at the start of ``messages``
+    prefix_count: int
+    # Messages between the system prefix and the window that were left out
+    evicted_count: int
+
+def _system_prefix_length(messages: Sequence[Message]) -> int:
+    count = 0
+    while count < len(messages) and messages[count].role == Role.SYSTEM:
+        count += 1
+    return count
+
+def _iter_units(messages: Sequence[Message], start: int, atomic_tool_calls: bool) -> Iterator[Tuple[int, int]]:
+    """Yield (begin, end) slices of messages that are kept or dropped together, newest first"""
+    end = len(messages)
+    while end > start:
+        begin = end - 1
+        if atomic_tool_calls and messages[begin].role == Role.TOOL:
+            # Keep tool results with the assistant message that requested them
+            while begin > start and messages[begin - 1].role == Role.TOOL:
+                begin -= 1
+            previous = messages[begin - 1] if begin > start else None
+            if previous is not None and previous.role == Role.ASSISTANT and previous.tool_calls:
+                begin -= 1
+        yield begin, end
+        end = begin
+
+def select_recent(
+    messages: Sequence[Message],
+    budget: int,
+    counter: TokenCounter,
+    atomic_tool_calls: bool = True
+) -> ContextWindow:
+    """Select the system prefix and as many recent messages as fit a budget
+
+    The most recent message (or tool-call group) is always included, even if
+    it does not fit, so a request never loses the turn it is answering.
+
+    Args:
+    ----
+        messages: Conversation history, oldest first
+        budget: Maximum number of tokens for the window
+        counter: Token counter for the target model
+        atomic_tool_calls: Keep tool results together with the call that produced them
+
+    """
+    prefix = _system_prefix_length(messages)
+    tokens = counter.count_messages(messages[:prefix])
+    begin = len(messages)
+
+    for unit_begin, unit_end in _iter_units(messages, prefix, atomic_tool_calls):
+        unit_tokens = counter.count_messages(messages[unit_begin:unit_end])
+        if tokens + unit_tokens > budget and begin < len(messages):
+            break
+        tokens += unit_tokens
+        begin = unit_begin
+
+    if tokens > budget:
+        logger.warning(f"Context window of {tokens} tokens exceeds budget of {budget}")
+
+    return ContextWindow(
+        messages=list(messages[:prefix]) + list(messages[begin:]),
+        tokens=tokens,
+        prefix_count=prefix,
+        evicted_count=begin - prefix
+    )
+
+class ContextStrategy(ABC):
+    """Chooses the messages sent to the model for a turn"""
+
+    @abstractmethod
+    async def select(
+        self,
+        messages: Sequence[Message],
+        budget: int,
+        counter: TokenCounter
+    ) -> List[Message]:
+        """Select messages from the conversation that fit the token budget"""
+        pass
+
+class KeepRecentStrategy(ContextStrategy):
+    """Keep the system prompt and the most recent messages that fit"""
+
+    def __init__(self, atomic_tool_calls: bool = True):
+        self.atomic_tool_calls = atomic_tool_calls
+
+    async def select(
+        self,
+        messages: Sequence[Message],
+        budget: int,
+        counter: TokenCounter
+    ) -> List[Message]:
+        return select_recent(messages, budget, counter, self.atomic_tool_calls).messages
+
+Summarizer = Callable[[List[Message], Optional[str]], Awaitable[str]]
+
+class SummarizeStrategy(ContextStrategy):
+    """Keep recent messages and replace the evicted prefix with a summary
+
+    The summary is appended to the system prompt. It is extended as more
+    messages are evicted, so each message is summarized only once.
+    """
+
+    def __init__(
+        self,
+        summarizer: Union[Summarizer, Any],
+        reserve_tokens: int = 512,
+        atomic_tool_calls: bool = True,
+        prompt: str = DEFAULT_SUMMARY_PROMPT
+    ):
+        """Initialize the strategy
+
+        Args:
+        ----
+            summarizer: An agent, or an async callable taking the evicted
+                messages and the previous summary and returning a new summary
+            reserve_tokens: Part of the budget kept free for the summary
+            atomic_tool_calls: Keep tool results together with the call that produced them
+            prompt: Instructions sent to a summarizer agent
+
+        """
+        if reserve_tokens < 0:
+            raise ValueError("reserve_tokens must not be negative")
+
+        self.summarizer = summarizer
+        self.reserve_tokens = reserve_tokens
+        self.atomic_tool_calls = atomic_tool_calls
+        self.prompt = prompt
+        self._summary: Optional[str] = None
+        # How many messages after the system prefix the summary covers, and the last of them
+        self._summarized = 0
+        self._last_summarized: Optional[Message] = None
+        self._system: Optional[Tuple[Message, str, Message]] = None
+
+    async def _summarize(self, messages: List[Message], previous: Optional[str]) -> str:
+        if not hasattr(self.summarizer, "aprocess"):
+            return await self.summarizer(messages, previous)
+
+        sections = [self.prompt]
+        if previous:
+            sections.append(f"Summary so far:\n{previous}")
+        sections.append("\n".join(f"{msg.role.value}: {msg.content}" for msg in messages))
+        response = await self.summarizer.aprocess("\n\n".join(sections))
+        # Each summary is a fresh request; don't let the summarizer's history grow
+        if hasattr(self.summarizer, "wipe_memory"):
+            self.summarizer.wipe_memory()
+        return response.content
+
+    def _with_summary(self, system: Message) -> Message:
+        """Get the system message with the summary appended, reusing it while unchanged"""
+        if self._system and self._system[0] is system and self._system[1] == system.content:
+            return self._system[2]
+
+        combined = system.model_copy(update={
+            "content": f"{system.content}\n\nSummary of earlier conversation:\n{self._summary}"
+        })
+        self._system = (system, system.content, combined)
+        return combined
+
+    async def select(
+        self,
+        messages: Sequence[Message],
+        budget: int,
+        counter: TokenCounter
+    ) -> List[Message]:
+        window = select_recent(
+            messages, max(0, budget - self.reserve_tokens), counter, self.atomic_tool_calls
+        )
+        if not window.evicted_count:
+            return window.messages
+
+        prefix = window.prefix_count
+        done = self._summarized
+        if done and (done > window.evicted_count or messages[prefix + done - 1] is not self._last_summarized):
+            # History was replaced or the window grew; start the summary over
+            self._summary, done = None, 0
+
+        if window.evicted_count > done:
+            newly_evicted = list(messages[prefix + done:prefix + window.evicted_count])
+            self._summary = await self._summarize(newly_evicted, self._summary)
+            self._summarized = window.evicted_count
+            self._last_summarized = newly_evicted[-1]
+            self._system = None
+
+        if not prefix:
+            return [Message(role=Role.SYSTEM, content=f"Summary of earlier conversation:\n{self._summary}")] + window.messages
+
+        return window.messages[:prefix - 1] + [self._with_summary(window.messages[prefix - 1])] + window.messages[prefix:]
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 from copy import deepcopy
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -6,9 +7,12 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from legion.errors import VersionConflictError
 from legion.interface.schemas import Message
+from legion.interface.tokens import CharTokenEstimator, TokenCounter
 
-from ..base import MemoryDump, MemoryProvider, ThreadState
+from ..base import MemoryDump, MemoryProvider, ThreadState, VersionedState
+from ..context import select_recent
 
 
 class ConversationMemory(BaseModel):
@@ -22,11 +26,29 @@ class ConversationMemory(BaseModel):
         self.messages.append(message)
         self.last_updated = datetime.now()
 
-    def get_context_window(self, max_messages: Optional[int] = None) -> List[Message]:
-        """Get recent message history, optionally limited"""
+    def get_context_window(
+        self,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None
+    ) -> List[Message]:
+        """Get recent message history, optionally limited
+
+        Args:
+        ----
+            max_messages: Maximum number of recent messages to return
+            max_tokens: Token budget; leading system messages are always kept
+                and tool results stay with the call that produced them
+            token_counter: Counter used with ``max_tokens``, estimated from
+                character count by default
+
+        """
+        messages = self.messages
         if max_messages:
-            return self.messages[-max_messages:]
-        return self.messages
+            messages = messages[-max_messages:]
+        if max_tokens is not None:
+            messages = select_recent(messages, max_tokens, token_counter or CharTokenEstimator()).messages
+        return messages
 
 class InMemoryProvider(MemoryProvider):
     """Simple in-memory implementation of MemoryProvider"""
@@ -35,6 +57,9 @@ class InMemoryProvider(MemoryProvider):
         self._store: Dict[tuple[str, str], Dict[str, Any]] = {}
         self._threads: Dict[str, ThreadState] = {}
         self._lock = asyncio.Lock()
+        # Versions come from one counter so they never repeat, even across deletes
+        self._versions: Dict[tuple[str, str], int] = {}
+        self._clock = itertools.count(1)
 
     async def create_thread(
         self,
@@ -80,6 +105,55 @@ class InMemoryProvider(MemoryProvider):
             # Save entity state
             key = (entity_id, thread_id)
             self._store[key] = deepcopy(state)
+            self._versions[key] = next(self._clock)
+
+    async def append_messages(
+        self,
+        entity_id: str,
+        thread_id: str,
+        messages: List[Dict[str, Any]],
+        since_version: Optional[int] = None,
+        updates: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Append messages without copying the stored history"""
+        async with self._lock:
+            if thread_id not in self._threads:
+                raise ValueError(f"Thread {thread_id} does not exist")
+
+            key = (entity_id, thread_id)
+            if since_version is not None and self._versions.get(key) != since_version:
+                raise VersionConflictError(
+                    f"State of {entity_id} in thread {thread_id} changed since version {since_version}"
+                )
+
+            state = self._store.setdefault(key, {})
+            if updates:
+                state.update(deepcopy(updates))
+            state.setdefault("messages", []).extend(deepcopy(messages))
+
+            thread_state = self._threads[thread_id]
+            thread_state.messages = state["messages"]
+            thread_state.updated_at = datetime.now()
+
+            self._versions[key] = next(self._clock)
+            return self._versions[key]
+
+    async def get_state_version(self, entity_id: str, thread_id: str) -> Optional[int]:
+        """Get the current version of an entity's state"""
+        return self._versions.get((entity_id, thread_id))
+
+    async def load_state_versioned(
+        self,
+        entity_id: str,
+        thread_id: str,
+        known_version: Optional[int] = None
+    ) -> VersionedState:
+        """Load state unless it is unchanged since ``known_version``"""
+        key = (entity_id, thread_id)
+        version = self._versions.get(key)
+        if known_version is not None and version == known_version:
+            return VersionedState(version=version, changed=False)
+        return VersionedState(version=version, state=await self.load_state(entity_id, thread_id))
 
     async def load_state(
         self,
@@ -116,6 +190,7 @@ class InMemoryProvider(MemoryProvider):
                     thread_state = self._threads[tid]
                     key = (thread_state.entity_id, tid)
                     self._store.pop(key, None)
+                    self._versions.pop(key, None)
                     del self._threads[tid]
 
     async def list_threads(
@@ -153,6 +228,7 @@ class InMemoryProvider(MemoryProvider):
             # Clear current state
             self._threads.clear()
             self._store.clear()
+            self._versions.clear()
 
             # Restore threads
             for thread_id, thread_state in dump.threads.items():
@@ -162,3 +238,4 @@ class InMemoryProvider(MemoryProvider):
             for key_str, state in dump.store.items():
                 entity_id, thread_id = key_str.split(":", 1)
                 self._store[(entity_id, thread_id)] = state
+                self._versions[(entity_id, thread_id)] = next(self._clock)
@@ -0,0 +1,578 @@
+"""SQLite implementation of MemoryProvider"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, TypeVar, Union
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from legion.errors import VersionConflictError
+from legion.interface.executors import ManagedExecutor
+
+from ..base import MemoryDump, MemoryProvider, ThreadState, VersionedState
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    entity_id TEXT NOT NULL,
+    parent_thread_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    message_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS messages (
+    thread_id TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (thread_id, entity_id, seq)
+);
+CREATE TABLE IF NOT EXISTS states (
+    entity_id TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    has_messages INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity_id, thread_id)
+);
+CREATE INDEX IF NOT EXISTS idx_threads_entity ON threads (entity_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_threads_parent ON threads (parent_thread_id);
+CREATE INDEX IF NOT EXISTS idx_threads_updated ON threads (updated_at);
+"""
+
+_THREAD_COLUMNS = "thread_id, entity_id, parent_thread_id, created_at, updated_at, metadata"
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module doesn't handle natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, sort_keys=True)
+
+def _role(message: Dict[str, Any]) -> Optional[str]:
+    role = message.get("role")
+    return role.value if isinstance(role, Enum) else role
+
+class SQLiteMemoryProvider(MemoryProvider):
+    """Durable MemoryProvider storing threads and messages in SQLite
+
+    Messages are stored one row per message, so saving a thread only writes
+    the messages that changed or were added since the last save. Queries
+    run on a single worker thread to keep the event loop free, and the
+    database can be shared between processes.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = "legion_memory.db", timeout: float = 30.0):
+        """Open (or create) the database
+
+        Args:
+        ----
+            db_path: Path to the SQLite database file, or ``":memory:"``
+            timeout: Seconds to wait for locks held by other processes
+
+        """
+        self.db_path = str(db_path)
+        self._conn = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # One worker, so every query runs on the same connection in order
+        self._executor = ManagedExecutor("memory.sqlite", max_workers=1)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking database call on the worker thread"""
+        return await self._executor.run(func, *args)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._executor.shutdown()
+        self._conn.close()
+
+    # Row conversion
+
+    def _load_messages(self, thread_id: str, entity_id: str) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT data FROM messages WHERE thread_id = ? AND entity_id = ? ORDER BY seq",
+            (thread_id, entity_id)
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def _thread_from_row(self, row: sqlite3.Row) -> ThreadState:
+        return ThreadState(
+            thread_id=row["thread_id"],
+            entity_id=row["entity_id"],
+            parent_thread_id=row["parent_thread_id"],
+            created_at=datetime.fromtimestamp(row["created_at"]),
+            updated_at=datetime.fromtimestamp(row["updated_at"]),
+            metadata=json.loads(row["metadata"]),
+            messages=self._load_messages(row["thread_id"], row["entity_id"])
+        )
+
+    def _query_threads(self, where: str = "", params: Sequence[Any] = (), suffix: str = "") -> List[ThreadState]:
+        sql = f"SELECT {_THREAD_COLUMNS} FROM threads"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" {suffix or 'ORDER BY created_at, rowid'}"
+        return [self._thread_from_row(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    # Writes
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        """Run reads and writes in one transaction holding the write lock from the start
+
+        sqlite3 only begins its implicit transaction at the first write, so
+        version checks made before it could race with other processes.
+        """
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    def _create_thread(self, entity_id: str, parent_thread_id: Optional[str]) -> str:
+        thread_id = str(uuid4())
+        now = datetime.now().timestamp()
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO threads (thread_id, entity_id, parent_thread_id, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (thread_id, entity_id, parent_thread_id, now, now)
+            )
+        return thread_id
+
+    def _write_messages(self, entity_id: str, thread_id: str, messages: List[Dict[str, Any]]) -> None:
+        """Bring the stored messages in line with ``messages``, touching only rows that differ"""
+        stored = [
+            row["digest"] for row in self._conn.execute(
+                "SELECT digest FROM messages WHERE thread_id = ? AND entity_id = ? ORDER BY seq",
+                (thread_id, entity_id)
+            )
+        ]
+        updates, inserts = [], []
+        for seq, message in enumerate(messages):
+            data = _dumps(message)
+            digest = hashlib.sha1(data.encode()).hexdigest()
+            role = _role(message)
+            if seq >= len(stored):
+                inserts.append((thread_id, entity_id, seq, role, digest, data))
+            elif stored[seq] != digest:
+                updates.append((role, digest, data, thread_id, entity_id, seq))
+
+        if len(stored) > len(messages):
+            self._conn.execute(
+                "DELETE FROM messages WHERE thread_id = ? AND entity_id = ? AND seq >= ?",
+                (thread_id, entity_id, len(messages))
+            )
+        self._conn.executemany(
+            "UPDATE messages SET role = ?, digest = ?, data = ? WHERE thread_id = ? AND entity_id = ? AND seq = ?",
+            updates
+        )
+        self._conn.executemany(
+            "INSERT INTO messages (thread_id, entity_id, seq, role, digest, data) VALUES (?, ?, ?, ?, ?, ?)",
+            inserts
+        )
+
+    def _save_state(self, entity_id: str, thread_id: str, state: Dict[str, Any]) -> None:
+        with self._write_transaction():
+            row = self._conn.execute(
+                "SELECT entity_id, metadata FROM threads WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Thread {thread_id} does not exist")
+
+            assignments = ["updated_at = ?"]
+            params: List[Any] = [datetime.now().timestamp()]
+            if "messages" in state:
+                self._write_messages(entity_id, thread_id, state["messages"])
+                if entity_id == row["entity_id"]:
+                    assignments.append("message_count = ?")
+                    params.append(len(state["messages"]))
+            if "metadata" in state:
+                metadata = json.loads(row["metadata"])
+                metadata.update(state["metadata"])
+                assignments.append("metadata = ?")
+                params.append(_dumps(metadata))
+
+            self._conn.execute(
+                f"UPDATE threads SET {', '.join(assignments)} WHERE thread_id = ?",
+                params + [thread_id]
+            )
+            other = {key: value for key, value in state.items() if key != "messages"}
+            self._conn.execute(
+                "INSERT INTO states (entity_id, thread_id, data, has_messages, version) VALUES (?, ?, ?, ?, 1) "
+                "ON CONFLICT (entity_id, thread_id) DO UPDATE SET "
+                "data = excluded.data, has_messages = excluded.has_messages, version = version + 1",
+                (entity_id, thread_id, _dumps(other), "messages" in state)
+            )
+
+    def _state_version(self, entity_id: str, thread_id: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT version FROM states WHERE entity_id = ? AND thread_id = ?", (entity_id, thread_id)
+        ).fetchone()
+        return row["version"] if row else None
+
+    def _append_messages(
+        self,
+        entity_id: str,
+        thread_id: str,
+        messages: List[Dict[str, Any]],
+        since_version: Optional[int],
+        updates: Optional[Dict[str, Any]]
+    ) -> int:
+        with self._write_transaction():
+            thread = self._conn.execute(
+                "SELECT entity_id FROM threads WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+            if thread is None:
+                raise ValueError(f"Thread {thread_id} does not exist")
+
+            version = self._state_version(entity_id, thread_id)
+            if since_version is not None and version != since_version:
+                raise VersionConflictError(
+                    f"State of {entity_id} in thread {thread_id} changed since version {since_version}"
+                )
+
+            start = self._count(
+                "SELECT MAX(seq) + 1 FROM messages WHERE thread_id = ? AND entity_id = ?", (thread_id, entity_id)
+            )
+            rows = []
+            for seq, message in enumerate(messages, start):
+                data = _dumps(message)
+                rows.append((thread_id, entity_id, seq, _role(message), hashlib.sha1(data.encode()).hexdigest(), data))
+            self._conn.executemany(
+                "INSERT INTO messages (thread_id, entity_id, seq, role, digest, data) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+            if updates:
+                # Merge the other state keys into the stored data
+                row = self._conn.execute(
+                    "SELECT data FROM states WHERE entity_id = ? AND thread_id = ?", (entity_id, thread_id)
+                ).fetchone()
+                data = json.loads(row["data"]) if row else {}
+                data.update(updates)
+                self._conn.execute(
+                    "INSERT INTO states (entity_id, thread_id, data, has_messages, version) VALUES (?, ?, ?, 1, 1) "
+                    "ON CONFLICT (entity_id, thread_id) DO UPDATE SET "
+                    "data = excluded.data, has_messages = 1, version = version + 1",
+                    (entity_id, thread_id, _dumps(data))
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO states (entity_id, thread_id, data, has_messages, version) VALUES (?, ?, '{}', 1, 1) "
+                    "ON CONFLICT (entity_id, thread_id) DO UPDATE SET has_messages = 1, version = version + 1",
+                    (entity_id, thread_id)
+                )
+            count_update = ", message_count = ?" if entity_id == thread["entity_id"] else ""
+            params = [datetime.now().timestamp()] + ([start + len(rows)] if count_update else [])
+            self._conn.execute(
+                f"UPDATE threads SET updated_at = ?{count_update} WHERE thread_id = ?",
+                params + [thread_id]
+            )
+            return self._state_version(entity_id, thread_id)
+
+    def _load_state_versioned(self, entity_id: str, thread_id: str, known_version: Optional[int]) -> VersionedState:
+        version = self._state_version(entity_id, thread_id)
+        if known_version is not None and version == known_version:
+            return VersionedState(version=version, changed=False)
+        return VersionedState(version=version, state=self._load_state(entity_id, thread_id))
+
+    def _load_state(self, entity_id: str, thread_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT data, has_messages FROM states WHERE entity_id = ? AND thread_id = ?", (entity_id, thread_id)
+        ).fetchone()
+        if row is None:
+            return None
+
+        state = json.loads(row["data"])
+        if row["has_messages"]:
+            state["messages"] = self._load_messages(thread_id, entity_id)
+        return state
+
+    def _delete_thread(self, thread_id: str, recursive: bool) -> None:
+        if recursive:
+            ids = [
+                row[0] for row in self._conn.execute(
+                    "WITH RECURSIVE tree(id) AS ("
+                    " SELECT ? UNION SELECT t.thread_id FROM threads t JOIN tree ON t.parent_thread_id = tree.id"
+                    ") SELECT id FROM tree",
+                    (thread_id,)
+                )
+            ]
+        else:
+            ids = [thread_id]
+
+        with self._conn:
+            for table in ("messages", "states", "threads"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE thread_id = ?", [(tid,) for tid in ids])
+
+    # MemoryProvider interface
+
+    async def create_thread(
+        self,
+        entity_id: str,
+        parent_thread_id: Optional[str] = None
+    ) -> str:
+        """Create a new thread"""
+        return await self._run(self._create_thread, entity_id, parent_thread_id)
+
+    async def save_state(
+        self,
+        entity_id: str,
+        thread_id: str,
+        state: Dict[str, Any]
+    ) -> None:
+        """Save state, writing only messages that were added or changed"""
+        await self._run(self._save_state, entity_id, thread_id, state)
+
+    async def load_state(
+        self,
+        entity_id: str,
+        thread_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load state for an entity in a thread"""
+        return await self._run(self._load_state, entity_id, thread_id)
+
+    async def append_messages(
+        self,
+        entity_id: str,
+        thread_id: str,
+        messages: List[Dict[str, Any]],
+        since_version: Optional[int] = None,
+        updates: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Append messages as new rows, leaving stored messages untouched"""
+        return await self._run(self._append_messages, entity_id, thread_id, messages, since_version, updates)
+
+    async def get_state_version(self, entity_id: str, thread_id: str) -> Optional[int]:
+        """Get the current version of an entity's state"""
+        return await self._run(self._state_version, entity_id, thread_id)
+
+    async def load_state_versioned(
+        self,
+        entity_id: str,
+        thread_id: str,
+        known_version: Optional[int] = None
+    ) -> VersionedState:
+        """Load state unless it is unchanged since ``known_version``"""
+        return await self._run(self._load_state_versioned, entity_id, thread_id, known_version)
+
+    async def delete_thread(
+        self,
+        thread_id: str,
+        recursive: bool = True
+    ) -> None:
+        """Delete a thread and optionally all of its descendants"""
+        await self._run(self._delete_thread, thread_id, recursive)
+
+    async def list_threads(
+        self,
+        entity_id: Optional[str] = None
+    ) -> List[ThreadState]:
+        """List all threads, optionally filtered by entity"""
+        if entity_id:
+            return await self._run(self._query_threads, "entity_id = ?", (entity_id,))
+        return await self._run(self._query_threads)
+
+    async def _create_memory_dump(self) -> MemoryDump:
+        """Create a dump of the current memory state"""
+        def dump() -> MemoryDump:
+            threads = self._query_threads()
+            store = {}
+            for row in self._conn.execute("SELECT entity_id, thread_id FROM states").fetchall():
+                store[f"{row['entity_id']}:{row['thread_id']}"] = self._load_state(row["entity_id"], row["thread_id"])
+            return MemoryDump(threads={t.thread_id: t for t in threads}, store=store)
+
+        return await self._run(dump)
+
+    async def _restore_memory_dump(self, dump: MemoryDump) -> None:
+        """Restore memory state from a dump"""
+        def restore() -> None:
+            with self._conn:
+                for table in ("messages", "states", "threads"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.executemany(
+                    f"INSERT INTO threads ({_THREAD_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            t.thread_id, t.entity_id, t.parent_thread_id,
+                            t.created_at.timestamp(), t.updated_at.timestamp(), _dumps(t.metadata)
+                        )
+                        for t in dump.threads.values()
+                    ]
+                )
+            for key, state in dump.store.items():
+                entity_id, thread_id = key.split(":", 1)
+                self._save_state(entity_id, thread_id, state)
+            # Saving touched updated_at; put back the dumped values
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE threads SET updated_at = ? WHERE thread_id = ?",
+                    [(t.updated_at.timestamp(), t.thread_id) for t in dump.threads.values()]
+                )
+
+        await self._run(restore)
+
+    # Query helpers, filtered in SQL rather than over list_threads()
+
+    async def get_or_create_thread(self, entity_id: str) -> str:
+        """Get the first thread for an entity or create a new one"""
+        def get_or_create() -> str:
+            row = self._conn.execute(
+                "SELECT thread_id FROM threads WHERE entity_id = ? ORDER BY created_at, rowid LIMIT 1",
+                (entity_id,)
+            ).fetchone()
+            return row["thread_id"] if row else self._create_thread(entity_id, None)
+
+        return await self._run(get_or_create)
+
+    def _count(self, sql: str, params: Sequence[Any] = ()) -> int:
+        return self._conn.execute(sql, params).fetchone()[0] or 0
+
+    async def get_thread_count(self, entity_id: Optional[str] = None) -> int:
+        """Get total number of threads for an entity or all threads"""
+        if entity_id:
+            return await self._run(self._count, "SELECT COUNT(*) FROM threads WHERE entity_id = ?", (entity_id,))
+        return await self._run(self._count, "SELECT COUNT(*) FROM threads")
+
+    async def get_thread(self, thread_id: str) -> Optional[ThreadState]:
+        """Get a specific thread by ID"""
+        threads = await self._run(self._query_threads, "thread_id = ?", (thread_id,))
+        return threads[0] if threads else None
+
+    async def _get_one(self, entity_id: Optional[str], order: str) -> Optional[ThreadState]:
+        where, params = ("entity_id = ?", (entity_id,)) if entity_id else ("", ())
+        threads = await self._run(self._query_threads, where, params, f"ORDER BY {order} LIMIT 1")
+        return threads[0] if threads else None
+
+    async def get_latest_thread(self, entity_id: Optional[str] = None) -> Optional[ThreadState]:
+        """Get the most recently updated thread"""
+        return await self._get_one(entity_id, "updated_at DESC")
+
+    async def get_oldest_thread(self, entity_id: Optional[str] = None) -> Optional[ThreadState]:
+        """Get the oldest thread"""
+        return await self._get_one(entity_id, "created_at")
+
+    async def get_message_count(self, entity_id: Optional[str] = None) -> int:
+        """Get total message count across all threads"""
+        if entity_id:
+            return await self._run(
+                self._count, "SELECT SUM(message_count) FROM threads WHERE entity_id = ?", (entity_id,)
+            )
+        return await self._run(self._count, "SELECT SUM(message_count) FROM threads")
+
+    async def get_last_message(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Get the last message from a specific thread"""
+        def last() -> Optional[Dict[str, Any]]:
+            row = self._conn.execute(
+                "SELECT m.data FROM messages m JOIN threads t "
+                "ON m.thread_id = t.thread_id AND m.entity_id = t.entity_id "
+                "WHERE t.thread_id = ? ORDER BY m.seq DESC LIMIT 1",
+                (thread_id,)
+            ).fetchone()
+            return json.loads(row["data"]) if row else None
+
+        return await self._run(last)
+
+    async def get_entities(self) -> Set[str]:
+        """Get all unique entity IDs"""
+        def entities() -> Set[str]:
+            return {row[0] for row in self._conn.execute("SELECT DISTINCT entity_id FROM threads")}
+
+        return await self._run(entities)
+
+    async def get_entity_stats(self, entity_id: str) -> Dict[str, Any]:
+        """Get statistics for a specific entity"""
+        def stats() -> Dict[str, Any]:
+            row = self._conn.execute(
+                "SELECT COUNT(*), SUM(message_count), MIN(created_at), MAX(created_at), MAX(updated_at) "
+                "FROM threads WHERE entity_id = ?",
+                (entity_id,)
+            ).fetchone()
+            if not row[0]:
+                return {}
+
+            roles = {
+                r[0] for r in self._conn.execute(
+                    "SELECT DISTINCT m.role FROM messages m JOIN threads t "
+                    "ON m.thread_id = t.thread_id AND m.entity_id = t.entity_id "
+                    "WHERE t.entity_id = ? AND m.role IS NOT NULL AND m.role != ''",
+                    (entity_id,)
+                )
+            }
+            return {
+                "thread_count": row[0],
+                "total_messages": row[1] or 0,
+                "oldest_thread": datetime.fromtimestamp(row[2]),
+                "newest_thread": datetime.fromtimestamp(row[3]),
+                "last_updated": datetime.fromtimestamp(row[4]),
+                "unique_roles": roles
+            }
+
+        return await self._run(stats)
+
+    async def find_threads_by_age(
+        self,
+        max_age_seconds: Optional[float] = None,
+        min_age_seconds: Optional[float] = None
+    ) -> List[ThreadState]:
+        """Find threads within a specific age range"""
+        now = datetime.now().timestamp()
+        clauses, params = [], []
+        if max_age_seconds is not None:
+            clauses.append("created_at >= ?")
+            params.append(now - max_age_seconds)
+        if min_age_seconds is not None:
+            clauses.append("created_at <= ?")
+            params.append(now - min_age_seconds)
+        return await self._run(self._query_threads, " AND ".join(clauses), params)
+
+    async def find_threads_by_message_count(
+        self,
+        min_messages: Optional[int] = None,
+        max_messages: Optional[int] = None
+    ) -> List[ThreadState]:
+        """Find threads with message count in range"""
+        clauses, params = [], []
+        if min_messages is not None:
+            clauses.append("message_count >= ?")
+            params.append(min_messages)
+        if max_messages is not None:
+            clauses.append("message_count <= ?")
+            params.append(max_messages)
+        return await self._run(self._query_threads, " AND ".join(clauses), params)
+
+    async def cleanup_old_threads(self, max_age_seconds: float) -> int:
+        """Delete threads older than specified age"""
+        def cleanup() -> int:
+            cutoff = datetime.now().timestamp() - max_age_seconds
+            ids = [row[0] for row in self._conn.execute(
+                "SELECT thread_id FROM threads WHERE created_at <= ?", (cutoff,)
+            )]
+            for thread_id in ids:
+                self._delete_thread(thread_id, recursive=True)
+            return len(ids)
+
+        return await self._run(cleanup)
@@ -12,6 +12,8 @@ from .agent import (
     AgentToolUseEvent,
 )
 from .base import Event, EventCategory, EventEmitter, EventSeverity, EventType
+from .cache import CacheEvent
+from .ratelimit import RateLimitEvent
 from .chain import (
     ChainBottleneckEvent,
     ChainCompletionEvent,
@@ -72,5 +74,11 @@ __all__ = [
     "ChainCompletionEvent",
     "ChainErrorEvent",
     "ChainStateChangeEvent",
-    "ChainBottleneckEvent"
+    "ChainBottleneckEvent",
+
+    # Cache events
+    "CacheEvent",
+
+    # Rate limit events
+    "RateLimitEvent"
 ]
@@ -29,6 +29,7 @@ class EventCategory(str, Enum):
     EXECUTION = "execution"
     MEMORY = "memory"
     COST = "cost"
+    CACHE = "cache"
     ERROR = "error"
 
 
@@ -110,6 +111,7 @@ class EventEmitter:
         """Initialize the event emitter"""
         self._event_handlers = weakref.WeakSet()
         self._monitoring_enabled = True
+        self._system_metrics_enabled = True
         self._current_event: Optional[Event] = None
 
     def add_event_handler(self, handler: Callable[[Event], None]):
@@ -144,7 +146,7 @@ class EventEmitter:
             return
 
         # Collect metrics before emitting
-        with MetricsContext(event):
+        with MetricsContext(event, enrich_system=self._system_metrics_enabled):
             for handler in self._event_handlers:
                 try:
                     handler(event)
@@ -188,7 +190,7 @@ class EventEmitter:
         self._current_event = event
 
         # Use metrics context to track the span
-        with MetricsContext(event):
+        with MetricsContext(event, enrich_system=self._system_metrics_enabled):
             try:
                 yield event
             finally:
@@ -202,3 +204,11 @@ class EventEmitter:
     def disable_monitoring(self):
         """Disable event emission"""
         self._monitoring_enabled = False
+
+    def enable_system_metrics(self):
+        """Enrich emitted events with system, process and host metrics"""
+        self._system_metrics_enabled = True
+
+    def disable_system_metrics(self):
+        """Emit events with timing only, skipping system metric enrichment"""
+        self._system_metrics_enabled = False
@@ -0,0 +1,38 @@
+"""Cache event types for Legion monitoring system"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .base import Event, EventCategory, EventSeverity, EventType
+
+
+@dataclass
+class CacheEvent(Event):
+    """Emitted when a response cache serves, stores or skips a request"""
+
+    def __init__(
+        self,
+        component_id: str,
+        result: str,
+        key: Optional[str] = None,
+        hits: int = 0,
+        misses: int = 0,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+        **kwargs
+    ):
+        super().__init__(
+            event_type=EventType.SYSTEM,
+            component_id=component_id,
+            category=EventCategory.CACHE,
+            severity=EventSeverity.DEBUG,
+            provider_name=provider_name,
+            model_name=model_name,
+            metadata={
+                "result": result,
+                "key": key,
+                "hits": hits,
+                "misses": misses
+            },
+            **kwargs
+        )
@@ -0,0 +1,32 @@
+"""Rate limit event types for Legion monitoring system"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .base import Event, EventCategory, EventSeverity, EventType
+
+
+@dataclass
+class RateLimitEvent(Event):
+    """Emitted when a request is let through a client-side rate limiter"""
+
+    def __init__(
+        self,
+        component_id: str,
+        wait_ms: float,
+        in_flight: Optional[int] = None,
+        queued: int = 0,
+        **kwargs
+    ):
+        super().__init__(
+            event_type=EventType.SYSTEM,
+            component_id=component_id,
+            category=EventCategory.EXECUTION,
+            severity=EventSeverity.DEBUG,
+            metadata={
+                "wait_ms": wait_ms,
+                "in_flight": in_flight,
+                "queued": queued
+            },
+            **kwargs
+        )
@@ -66,6 +66,22 @@ class SystemMetricsCollector:
             "system_network_bytes_received": net_bytes_recv
         }
 
+    def get_io_counters(self) -> Dict[str, int]:
+        """Get current cumulative network and disk IO counters
+
+        Returns
+        -------
+            Dict containing raw byte counters, for computing deltas between samples
+
+        """
+        net_io = psutil.net_io_counters()
+        disk_io = psutil.disk_io_counters()
+        return {
+            "system_disk_usage_bytes": disk_io.read_bytes + disk_io.write_bytes,
+            "system_network_bytes_sent": net_io.bytes_sent,
+            "system_network_bytes_received": net_io.bytes_recv
+        }
+
     def get_process_metrics(self) -> Dict[str, Any]:
         """Get current process metrics
 
@@ -79,24 +95,145 @@ class SystemMetricsCollector:
             "cpu_usage_percent": self._process.cpu_percent()
         }
 
+class MetricsSampler:
+    """Process-wide sampler that refreshes system metrics in a background thread
+
+    Sampling psutil is syscall-heavy, so instead of sampling per event the
+    sampler refreshes a snapshot every ``interval`` seconds. Static execution
+    context (host, pid, Python version) is captured once. Readers get the
+    latest snapshot in O(1) via ``snapshot()``, and the raw IO counters
+    sampled with it via ``io_counters()``.
+    """
+
+    DEFAULT_INTERVAL = 1.0
+
+    _instance: Optional["MetricsSampler"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """Initialize the sampler
+
+        Args:
+        ----
+            interval: Seconds between refreshes
+
+        """
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive")
+
+        self._interval = interval
+        self._collector = SystemMetricsCollector()
+        self._pid = os.getpid()
+        self._static_context = {
+            "process_id": self._pid,
+            "host_name": platform.node(),
+            "python_version": sys.version
+        }
+        self._snapshot: Dict[str, Any] = {}
+        self._io_counters: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Take the first sample synchronously so snapshots are never empty
+        self.refresh()
+
+    @classmethod
+    def get_instance(cls) -> "MetricsSampler":
+        """Get the shared sampler, starting it on first use"""
+        instance = cls._instance
+        if instance is not None and instance._pid == os.getpid():
+            return instance
+
+        with cls._instance_lock:
+            # A forked child inherits the instance but not its thread
+            if cls._instance is None or cls._instance._pid != os.getpid():
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    @classmethod
+    def configure(cls, interval: float) -> "MetricsSampler":
+        """Replace the shared sampler with one using a new interval"""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+            cls._instance = cls(interval=interval)
+            cls._instance.start()
+            return cls._instance
+
+    @property
+    def interval(self) -> float:
+        """Seconds between refreshes"""
+        return self._interval
+
+    def refresh(self) -> None:
+        """Sample system and process metrics now"""
+        snapshot = dict(self._static_context)
+        snapshot["system_cpu_percent"] = psutil.cpu_percent()
+        snapshot["system_memory_percent"] = psutil.virtual_memory().percent
+        snapshot.update(self._collector.get_process_metrics())
+        # Swap in new dicts so readers never see a partial update
+        self._io_counters = self._collector.get_io_counters()
+        self._snapshot = snapshot
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the latest sampled metrics"""
+        return self._snapshot
+
+    def io_counters(self) -> Dict[str, int]:
+        """Get the cumulative IO counters from the latest sample"""
+        return self._io_counters
+
+    def start(self) -> None:
+        """Start the background refresh thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="legion-metrics-sampler",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self._interval + 1)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Refresh the snapshot until stopped"""
+        while not self._stop.wait(self._interval):
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the previous snapshot if sampling fails
+                pass
+
 class MetricsContext:
     """Context manager for collecting metrics during an operation"""
 
-    def __init__(self, event: Optional["Event"] = None):
+    def __init__(self, event: Optional["Event"] = None, enrich_system: bool = True):
         """Initialize metrics context
 
         Args:
         ----
             event: Optional event to enrich with metrics
+            enrich_system: Whether to add system, process and host metrics
 
         """
         self.event = event
-        self.collector = SystemMetricsCollector()
+        self.enrich_system = enrich_system
         self._start_time = None
+        self._start_io: Dict[str, int] = {}
 
     def __enter__(self):
         """Enter the metrics collection context"""
         self._start_time = time.time()
+        if self.event and self.enrich_system:
+            self._start_io = MetricsSampler.get_instance().io_counters()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -108,17 +245,15 @@ class MetricsContext:
         duration_ms = (time.time() - self._start_time) * 1000
         self.event.duration_ms = duration_ms
 
-        # Get metrics
-        execution_context = self.collector.get_execution_context()
-        system_metrics = self.collector.get_system_metrics()
-        process_metrics = self.collector.get_process_metrics()
-
-        # Update event
-        for key, value in execution_context.items():
-            setattr(self.event, key, value)
+        if not self.enrich_system:
+            return
 
-        for key, value in system_metrics.items():
+        # Update event from the latest sample
+        sampler = MetricsSampler.get_instance()
+        self.event.thread_id = threading.get_ident()
+        for key, value in sampler.snapshot().items():
             setattr(self.event, key, value)
 
-        for key, value in process_metrics.items():
-            setattr(self.event, key, value)
+        # IO is reported as the change over the operation
+        for key, value in sampler.io_counters().items():
+            setattr(self.event, key, value - self._start_io.get(key, value))
@@ -54,3 +54,11 @@ class StorageBackend(ABC):
 
         """
         pass
+
+    def flush(self) -> None:
+        """Write any buffered events to storage"""
+        pass
+
+    def close(self) -> None:
+        """Flush buffered events and release backend resources"""
+        self.flush()
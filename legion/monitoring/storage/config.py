@@ -1,6 +1,6 @@
 """Configuration for storage backends"""
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,10 @@ class StorageConfig(BaseModel):
         retention_days: Number of days to retain events for
         cleanup_interval: Number of minutes between cleanup runs
         max_events: Maximum number of events to store (None for unlimited)
+        write_behind: Queue events in memory and write them in batches
+        batch_size: Number of queued events that triggers a flush
+        flush_interval: Maximum number of seconds an event stays queued
+        synchronous: SQLite synchronous pragma controlling write durability
 
     """
 
@@ -33,3 +37,25 @@ class StorageConfig(BaseModel):
         description="Maximum number of events to store (None for unlimited)",
         ge=1
     )
+
+    write_behind: bool = Field(
+        default=False,
+        description="Queue events in memory and write them in batches"
+    )
+
+    batch_size: int = Field(
+        default=100,
+        description="Number of queued events that triggers a flush",
+        ge=1
+    )
+
+    flush_interval: float = Field(
+        default=1.0,
+        description="Maximum number of seconds an event stays queued",
+        gt=0
+    )
+
+    synchronous: Literal["FULL", "NORMAL", "OFF"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous pragma controlling write durability"
+    )
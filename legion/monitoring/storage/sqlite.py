@@ -1,12 +1,14 @@
 """SQLite storage backend implementation"""
 
+import atexit
 import json
 import logging
 import sqlite3
 import threading
+import weakref
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 from ..events.base import Event, EventCategory, EventSeverity, EventType
@@ -15,6 +17,62 @@ from .config import StorageConfig
 
 logger = logging.getLogger(__name__)
 
+# Bumped whenever the events table layout changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Event fields stored as their own columns next to the JSON payload, with types.
+# Columns present in the original layout are not re-added by the migration.
+_BASE_COLUMNS = ("id", "timestamp", "event_type", "component_id", "category")
+_PROMOTED_COLUMNS = {
+    "severity": "TEXT",
+    "duration_ms": "REAL",
+    "tokens_used": "INTEGER",
+    "cost": "REAL",
+    "provider_name": "TEXT",
+    "model_name": "TEXT",
+    "root_event_id": "TEXT"
+}
+_INSERT_COLUMNS = _BASE_COLUMNS + tuple(_PROMOTED_COLUMNS) + ("data",)
+
+# Columns that can be aggregated and grouped on
+_METRIC_COLUMNS = ("duration_ms", "tokens_used", "cost")
+_GROUP_COLUMNS = ("component_id", "event_type", "category", "severity", "provider_name", "model_name")
+
+_INDEXES = {
+    "idx_timestamp": "timestamp",
+    "idx_type": "event_type",
+    "idx_component": "component_id, timestamp",
+    "idx_category": "category",
+    "idx_severity": "severity",
+    "idx_provider": "provider_name",
+    "idx_model": "model_name",
+    "idx_root_event": "root_event_id"
+}
+
+def _as_list(value: Union[Any, Sequence[Any], None]) -> List[Any]:
+    """Normalize a single filter value or a sequence of values to a list"""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    return [value]
+
+def _enum_value(value: Any) -> Any:
+    """Get the stored value of an enum member, passing other values through"""
+    return getattr(value, "value", value)
+
+# Write-behind backends still open, flushed at interpreter exit
+_open_backends: "weakref.WeakSet[SQLiteStorageBackend]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_backends():
+    """Flush queued events of write-behind backends at interpreter exit"""
+    for backend in list(_open_backends):
+        try:
+            backend.close()
+        except Exception as e:
+            logger.error(f"Error closing storage backend at exit: {e}")
+
 def _ensure_timezone(dt: datetime) -> datetime:
     """Ensure a datetime has a timezone
 
@@ -124,7 +182,14 @@ def _deserialize_event(data: dict) -> Event:
     )
 
 class SQLiteStorageBackend(StorageBackend):
-    """SQLite implementation of event storage"""
+    """SQLite implementation of event storage
+
+    A single connection in WAL mode is shared by all threads. With
+    ``write_behind`` enabled, events are queued in memory and written in
+    batches when ``batch_size`` events are pending or ``flush_interval``
+    seconds have passed. Reads flush the queue first so they always see
+    every stored event.
+    """
 
     def __init__(self,
                  db_path: str = "events.db",
@@ -141,6 +206,14 @@ class SQLiteStorageBackend(StorageBackend):
         self._config = config or StorageConfig()
         self._cleanup_thread = None
         self._stop_cleanup = threading.Event()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+        self._row_count = 0
+        self._pending: List[Tuple] = []
+        self._pending_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._writer_thread = None
+        self._closed = False
 
         # Ensure directory exists
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -148,22 +221,59 @@ class SQLiteStorageBackend(StorageBackend):
         # Initialize database
         self._init_db()
         self._start_cleanup_task()
+        if self._config.write_behind:
+            self._start_writer_task()
+            _open_backends.add(self)
 
     def _init_db(self):
-        """Initialize the database schema"""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute("""
+        """Open the shared connection and initialize or migrate the database schema"""
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={self._config.synchronous}")
+        with self._conn_lock:
+            promoted = ",\n".join(
+                f"                    {name} {sql_type}" for name, sql_type in _PROMOTED_COLUMNS.items()
+            )
+            self._conn.execute(f"""
                 CREATE TABLE IF NOT EXISTS events (
                     id TEXT PRIMARY KEY,
                     timestamp DATETIME NOT NULL,
                     event_type TEXT NOT NULL,
                     component_id TEXT NOT NULL,
                     category TEXT NOT NULL,
+{promoted},
                     data TEXT NOT NULL
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON events(timestamp)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_type ON events(event_type)")
+            self._migrate()
+            for name, columns in _INDEXES.items():
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON events({columns})")
+            self._conn.commit()
+
+            # Counted once here, then maintained on every insert and delete
+            self._row_count = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def _migrate(self):
+        """Upgrade an events table written by an older schema version
+
+        Must be called with the connection lock held.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(events)")}
+        missing = [name for name in _PROMOTED_COLUMNS if name not in existing]
+        for name in missing:
+            self._conn.execute(f"ALTER TABLE events ADD COLUMN {name} {_PROMOTED_COLUMNS[name]}")
+
+        if missing:
+            # Backfill the new columns from the JSON payload of existing rows
+            assignments = ", ".join(f"{name} = json_extract(data, '$.{name}')" for name in missing)
+            self._conn.execute(f"UPDATE events SET {assignments}")
+            logger.info(f"Migrated events table to schema version {SCHEMA_VERSION}")
+
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def _start_cleanup_task(self):
         """Start the background cleanup task"""
@@ -179,27 +289,80 @@ class SQLiteStorageBackend(StorageBackend):
                     self.cleanup(self._config.retention_days)
 
                     # Check max events
-                    if self._config.max_events:
-                        with sqlite3.connect(self._db_path) as conn:
-                            # Get total count
-                            count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-                            if count > self._config.max_events:
-                                # Delete oldest events
-                                conn.execute("""
-                                    DELETE FROM events
-                                    WHERE id IN (
-                                        SELECT id FROM events
-                                        ORDER BY timestamp ASC
-                                        LIMIT ?
-                                    )
-                                """, (count - self._config.max_events,))
-                                conn.commit()
+                    with self._conn_lock:
+                        self._enforce_max_events()
+                        self._conn.commit()
                 except Exception as e:
                     logger.error(f"Error in cleanup task: {e}")
 
         self._cleanup_thread = threading.Thread(target=cleanup_loop, daemon=True)
         self._cleanup_thread.start()
 
+    def _start_writer_task(self):
+        """Start the background task that flushes queued events"""
+        def writer_loop():
+            while not self._stop_cleanup.is_set():
+                self._flush_requested.wait(self._config.flush_interval)
+                self._flush_requested.clear()
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Error flushing events: {e}")
+
+        self._writer_thread = threading.Thread(target=writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    _INSERT_SQL = (
+        f"INSERT INTO events ({', '.join(_INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(_INSERT_COLUMNS))})"
+    )
+
+    @staticmethod
+    def _event_row(event: Event) -> Tuple:
+        """Build the database row for an event"""
+        return (
+            str(event.id),
+            _ensure_timezone(event.timestamp).isoformat(),
+            event.event_type.value,
+            event.component_id,
+            event.category.value,
+            event.severity.value,
+            event.duration_ms,
+            event.tokens_used,
+            event.cost,
+            event.provider_name,
+            event.model_name,
+            str(event.root_event_id) if event.root_event_id else None,
+            json.dumps(_serialize_event(event))
+        )
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        """Insert rows in one transaction and trim to the max events limit"""
+        with self._conn_lock:
+            self._conn.executemany(self._INSERT_SQL, rows)
+            self._row_count += len(rows)
+            self._enforce_max_events()
+            self._conn.commit()
+
+    def _enforce_max_events(self) -> None:
+        """Delete the oldest events above the max events limit
+
+        Must be called with the connection lock held.
+        """
+        max_events = self._config.max_events
+        if not max_events or self._row_count <= max_events:
+            return
+
+        cursor = self._conn.execute("""
+            DELETE FROM events
+            WHERE id IN (
+                SELECT id FROM events
+                ORDER BY timestamp ASC
+                LIMIT ?
+            )
+        """, (self._row_count - max_events,))
+        self._row_count -= cursor.rowcount
+
     def store_event(self, event: Event) -> None:
         """Store an event in the database
 
@@ -208,39 +371,92 @@ class SQLiteStorageBackend(StorageBackend):
             event: The event to store
 
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute("""
-                INSERT INTO events (id, timestamp, event_type, component_id, category, data)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                str(event.id),
-                _ensure_timezone(event.timestamp).isoformat(),
-                event.event_type.value,
-                event.component_id,
-                event.category.value,
-                json.dumps(_serialize_event(event))
-            ))
-            conn.commit()
-
-            # Check max events limit
-            if self._config.max_events:
-                count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-                if count > self._config.max_events:
-                    # Delete oldest event
-                    conn.execute("""
-                        DELETE FROM events
-                        WHERE id IN (
-                            SELECT id FROM events
-                            ORDER BY timestamp ASC
-                            LIMIT 1
-                        )
-                    """)
-                    conn.commit()
+        if self._closed:
+            raise RuntimeError("Storage backend is closed")
+
+        row = self._event_row(event)
+        if not self._config.write_behind:
+            self._write_rows([row])
+            return
+
+        with self._pending_lock:
+            self._pending.append(row)
+            pending = len(self._pending)
+        if pending >= self._config.batch_size:
+            self._flush_requested.set()
+
+    def flush(self) -> None:
+        """Write all queued events to the database"""
+        with self._conn_lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if rows and not self._closed:
+                self._write_rows(rows)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued events not yet written"""
+        return len(self._pending)
+
+    @property
+    def row_count(self) -> int:
+        """Number of events stored in the database"""
+        return self._row_count
+
+    @staticmethod
+    def _build_filters(event_types: Optional[List[Event]] = None,
+                       start_time: Optional[datetime] = None,
+                       end_time: Optional[datetime] = None,
+                       component_id: Union[str, Sequence[str], None] = None,
+                       severity: Union[EventSeverity, Sequence[EventSeverity], None] = None,
+                       category: Union[EventCategory, Sequence[EventCategory], None] = None,
+                       provider_name: Optional[str] = None,
+                       model_name: Optional[str] = None,
+                       root_event_id: Optional[UUID] = None) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters for event filters"""
+        clauses = []
+        params: List[Any] = []
+
+        def add_in(column: str, values: List[Any]):
+            if values:
+                placeholders = ",".join("?" * len(values))
+                clauses.append(f"{column} IN ({placeholders})")
+                params.extend(values)
+
+        # Filter by event type value
+        add_in("event_type", [e.event_type.value for e in event_types or []])
+        add_in("component_id", _as_list(component_id))
+        add_in("severity", [_enum_value(v) for v in _as_list(severity)])
+        add_in("category", [_enum_value(v) for v in _as_list(category)])
+        add_in("provider_name", _as_list(provider_name))
+        add_in("model_name", _as_list(model_name))
+        add_in("root_event_id", [str(v) for v in _as_list(root_event_id)])
+
+        if start_time:
+            clauses.append("timestamp >= ?")
+            params.append(_ensure_timezone(start_time).isoformat())
+
+        if end_time:
+            clauses.append("timestamp <= ?")
+            params.append(_ensure_timezone(end_time).isoformat())
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
 
     def get_events(self,
                   event_types: Optional[List[Event]] = None,
                   start_time: Optional[datetime] = None,
-                  end_time: Optional[datetime] = None) -> List[Event]:
+                  end_time: Optional[datetime] = None,
+                  *,
+                  component_id: Union[str, Sequence[str], None] = None,
+                  severity: Union[EventSeverity, Sequence[EventSeverity], None] = None,
+                  category: Union[EventCategory, Sequence[EventCategory], None] = None,
+                  provider_name: Optional[str] = None,
+                  model_name: Optional[str] = None,
+                  root_event_id: Optional[UUID] = None,
+                  limit: Optional[int] = None,
+                  offset: int = 0,
+                  order: str = "asc") -> List[Event]:
         """Get events matching the specified criteria
 
         Args:
@@ -248,40 +464,137 @@ class SQLiteStorageBackend(StorageBackend):
             event_types: Optional list of events to filter by type
             start_time: Optional start time to filter by
             end_time: Optional end time to filter by
+            component_id: Optional component ID or IDs to filter by
+            severity: Optional severity or severities to filter by
+            category: Optional category or categories to filter by
+            provider_name: Optional provider name to filter by
+            model_name: Optional model name to filter by
+            root_event_id: Optional root event ID to filter by
+            limit: Maximum number of events to return
+            offset: Number of matching events to skip
+            order: Timestamp order, ``"asc"`` or ``"desc"``
 
         Returns:
         -------
             List of matching events
 
+        Raises:
+        ------
+            ValueError: If the order, limit or offset is invalid
+
         """
-        query = "SELECT data FROM events WHERE 1=1"
-        params = []
+        direction = order.upper()
+        if direction not in ("ASC", "DESC"):
+            raise ValueError(f"Invalid order: {order}")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        if offset < 0:
+            raise ValueError("offset must be non-negative")
+
+        where, params = self._build_filters(
+            event_types, start_time, end_time,
+            component_id=component_id,
+            severity=severity,
+            category=category,
+            provider_name=provider_name,
+            model_name=model_name,
+            root_event_id=root_event_id
+        )
+        query = f"SELECT data FROM events{where} ORDER BY timestamp {direction}, rowid {direction}"
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+
+        with self._conn_lock:
+            self.flush()
+            rows = self._conn.execute(query, params).fetchall()
 
-        if event_types:
-            # Filter by event type value
-            type_values = [e.event_type.value for e in event_types]
-            placeholders = ",".join("?" * len(type_values))
-            query += f" AND event_type IN ({placeholders})"
-            params.extend(type_values)
+        return [_deserialize_event(json.loads(row[0])) for row in rows]
 
-        if start_time:
-            query += " AND timestamp >= ?"
-            params.append(_ensure_timezone(start_time).isoformat())
+    def get_aggregates(self,
+                       metric: str = "duration_ms",
+                       group_by: str = "component_id",
+                       percentiles: Sequence[float] = (50, 95, 99),
+                       event_types: Optional[List[Event]] = None,
+                       start_time: Optional[datetime] = None,
+                       end_time: Optional[datetime] = None,
+                       **filters) -> Dict[str, Dict[str, Optional[float]]]:
+        """Aggregate a numeric event metric per group in SQL
 
-        if end_time:
-            query += " AND timestamp <= ?"
-            params.append(_ensure_timezone(end_time).isoformat())
+        Percentiles use the nearest-rank method over events where the
+        metric is set.
 
-        with sqlite3.connect(self._db_path) as conn:
-            rows = conn.execute(query, params).fetchall()
+        Args:
+        ----
+            metric: Column to aggregate (``duration_ms``, ``tokens_used`` or ``cost``)
+            group_by: Column to group by, ``component_id`` by default
+            percentiles: Percentiles to compute, each between 0 and 100
+            event_types: Optional list of events to filter by type
+            start_time: Optional start time to filter by
+            end_time: Optional end time to filter by
+            **filters: Additional column filters accepted by ``get_events``
 
-        return [_deserialize_event(json.loads(row[0])) for row in rows]
+        Returns:
+        -------
+            Mapping of group value to ``count``, ``sum``, ``avg``, ``min``,
+            ``max`` and one ``p<N>`` entry per percentile
+
+        Raises:
+        ------
+            ValueError: If the metric, grouping column or a percentile is invalid
+
+        """
+        if metric not in _METRIC_COLUMNS:
+            raise ValueError(f"Unsupported metric: {metric}")
+        if group_by not in _GROUP_COLUMNS:
+            raise ValueError(f"Unsupported group_by column: {group_by}")
+        for p in percentiles:
+            if not 0 < p <= 100:
+                raise ValueError(f"Percentile must be in (0, 100]: {p}")
+
+        where, params = self._build_filters(event_types, start_time, end_time, **filters)
+        where += (" AND " if where else " WHERE ") + f"{metric} IS NOT NULL"
+
+        percentile_columns = []
+        percentile_params: List[Any] = []
+        for p in percentiles:
+            # Nearest rank: ceil(p / 100 * n), computed without SQLite math functions
+            rank = "(? * cnt / 100.0)"
+            percentile_columns.append(
+                f"MAX(CASE WHEN rn = MAX(1, CAST({rank} AS INTEGER) + "
+                f"({rank} > CAST({rank} AS INTEGER))) THEN value END)"
+            )
+            percentile_params.extend([p, p, p])
+
+        select = ", ".join(["grp", "COUNT(value)", "SUM(value)", "AVG(value)", "MIN(value)", "MAX(value)"]
+                           + percentile_columns)
+        query = f"""
+            SELECT {select}
+            FROM (
+                SELECT {group_by} AS grp,
+                       {metric} AS value,
+                       ROW_NUMBER() OVER (PARTITION BY {group_by} ORDER BY {metric}) AS rn,
+                       COUNT(*) OVER (PARTITION BY {group_by}) AS cnt
+                FROM events{where}
+            )
+            GROUP BY grp
+        """
+
+        with self._conn_lock:
+            self.flush()
+            rows = self._conn.execute(query, percentile_params + params).fetchall()
+
+        names = ["count", "sum", "avg", "min", "max"] + [f"p{p:g}" for p in percentiles]
+        return {row[0]: dict(zip(names, row[1:])) for row in rows}
 
     def clear(self) -> None:
         """Clear all events from the database"""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute("DELETE FROM events")
-            conn.commit()
+        with self._conn_lock:
+            with self._pending_lock:
+                self._pending.clear()
+            self._conn.execute("DELETE FROM events")
+            self._conn.commit()
+            self._row_count = 0
 
     def cleanup(self, retention_days: Optional[int] = None) -> None:
         """Remove events older than the retention period
@@ -295,12 +608,33 @@ class SQLiteStorageBackend(StorageBackend):
         retention_days = retention_days or self._config.retention_days
         cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute("DELETE FROM events WHERE timestamp < ?", (cutoff.isoformat(),))
-            conn.commit()
+        with self._conn_lock:
+            self.flush()
+            cursor = self._conn.execute("DELETE FROM events WHERE timestamp < ?", (cutoff.isoformat(),))
+            self._row_count -= cursor.rowcount
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Flush queued events, stop background tasks and close the connection"""
+        if self._closed:
+            return
+
+        self._stop_cleanup.set()
+        self._flush_requested.set()
+        for thread in (self._writer_thread, self._cleanup_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=1)
+
+        with self._conn_lock:
+            self.flush()
+            self._closed = True
+            self._conn.close()
+        _open_backends.discard(self)
 
     def __del__(self):
         """Cleanup when the backend is destroyed"""
-        if self._cleanup_thread:
-            self._stop_cleanup.set()
-            self._cleanup_thread.join(timeout=1)
+        try:
+            if not self._closed and self._conn is not None:
+                self.close()
+        except Exception:
+            pass
@@ -1,26 +1,61 @@
 """Provider registry and factory functions"""
 
-from typing import Dict, List, Optional, Type
+import importlib
+from typing import Dict, Iterator, List, Mapping, Optional, Type, Union
 
 from ..interface.base import LLMInterface
 from ..interface.schemas import ProviderConfig
-from .anthropic import AnthropicFactory
 from .factory import ProviderFactory
-from .gemini import GeminiFactory
-from .groq import GroqFactory
-from .ollama import OllamaFactory
-
-# Import provider implementations
-from .openai import OpenAIFactory
-
-# Registry of provider factories
-PROVIDER_FACTORIES: Dict[str, Type[ProviderFactory]] = {
-    "openai": OpenAIFactory,
-    "anthropic": AnthropicFactory,
-    "groq": GroqFactory,
-    "ollama": OllamaFactory,
-    "gemini": GeminiFactory
-}
+
+
+class LazyFactoryRegistry(Mapping[str, Type[ProviderFactory]]):
+    """Provider factories registered by import path and loaded on first use
+
+    Each provider module imports its SDK, so resolving factories lazily means
+    only the providers actually used are ever imported.
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        self._paths = dict(paths)
+        self._loaded: Dict[str, Type[ProviderFactory]] = {}
+
+    def __getitem__(self, name: str) -> Type[ProviderFactory]:
+        if name not in self._loaded:
+            module_path, _, attr = self._paths[name].rpartition(".")
+            module = importlib.import_module(module_path, package=__name__)
+            self._loaded[name] = getattr(module, attr)
+        return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a provider's module has been imported"""
+        return name in self._loaded
+
+    def register(self, name: str, factory: Union[str, Type[ProviderFactory]]) -> None:
+        """Register a factory class, or the import path of one"""
+        self._loaded.pop(name, None)
+        if isinstance(factory, str):
+            self._paths[name] = factory
+        else:
+            self._paths[name] = f"{factory.__module__}.{factory.__qualname__}"
+            self._loaded[name] = factory
+
+# Registry of provider factories, imported on first lookup
+PROVIDER_FACTORIES = LazyFactoryRegistry({
+    "openai": ".openai.OpenAIFactory",
+    "anthropic": ".anthropic.AnthropicFactory",
+    "groq": ".groq.GroqFactory",
+    "ollama": ".ollama.OllamaFactory",
+    "gemini": ".gemini.GeminiFactory"
+})
 
 def get_provider(
     name: str,
@@ -1,20 +1,24 @@
 import json
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import anthropic
+import httpx
 from pydantic import BaseModel
 
 from ..errors import ProviderError
 from ..interface.base import LLMInterface
+from ..interface.batch_jobs import BatchJobBackend, BatchRequest, BatchStatus
 from ..interface.schemas import (
     ChatParameters,
     Message,
     ModelResponse,
     ProviderConfig,
     Role,
+    StreamChunk,
     TokenUsage,
 )
-from ..interface.tools import BaseTool
+from ..interface.streaming import ToolCallAccumulator
+from ..interface.tools import BaseTool, dispatch_tool_calls
 from .factory import ProviderFactory
 
 
@@ -25,60 +29,181 @@ class AnthropicFactory(ProviderFactory):
         """Create a new Anthropic provider instance"""
         return AnthropicProvider(config=config, **kwargs)
 
+class AnthropicBatchBackend(BatchJobBackend):
+    """Batch jobs through the Anthropic Message Batches API"""
+
+    BATCHES_PATH = "/v1/messages/batches"
+
+    def __init__(self, provider: "AnthropicProvider"):
+        self.provider = provider
+
+    async def _client(self) -> anthropic.AsyncAnthropic:
+        await self.provider._ensure_async_client()
+        return self.provider._async_client
+
+    async def submit(self, lines: List[Dict[str, Any]]) -> str:
+        batch = await (await self._client()).post(self.BATCHES_PATH, body={"requests": lines}, cast_to=object)
+        return batch["id"]
+
+    async def status(self, job_id: str) -> Tuple[BatchStatus, Dict[str, Any]]:
+        batch = await (await self._client()).get(f"{self.BATCHES_PATH}/{job_id}", cast_to=object)
+        if batch["processing_status"] != "ended":
+            return BatchStatus.RUNNING, batch
+        # Requests that were cancelled or expired are reported in the results
+        return BatchStatus.COMPLETED, batch
+
+    async def results(self, job_id: str) -> List[Dict[str, Any]]:
+        response = await (await self._client()).get(f"{self.BATCHES_PATH}/{job_id}/results", cast_to=httpx.Response)
+        return [json.loads(raw) for raw in response.text.splitlines() if raw.strip()]
+
+    async def cancel(self, job_id: str) -> None:
+        await (await self._client()).post(f"{self.BATCHES_PATH}/{job_id}/cancel", cast_to=object)
+
 class AnthropicProvider(LLMInterface):
     """Anthropic-specific implementation of the LLM interface"""
 
     DEFAULT_MAX_TOKENS = 4096
+    supports_streaming = True
+    batch_format = "anthropic"
 
     def __init__(self, config: Optional[ProviderConfig] = None, **kwargs):
         if not config or not config.api_key:
             raise ProviderError("API key is required for Anthropic")
         super().__init__(config=config, **kwargs)
+        self._async_client = None  # Initialize async client lazily
 
     def _setup_client(self) -> None:
         """Initialize Anthropic client"""
         try:
-            self.client = anthropic.Anthropic(
+            self.client = self._shared_client("anthropic.sync", lambda: anthropic.Anthropic(
                 api_key=self.config.api_key,
                 base_url=self.config.base_url,
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize Anthropic client: {str(e)}")
 
+    def _batch_request(self, custom_id: str, request: BatchRequest) -> Dict[str, Any]:
+        """Serialize a request as one entry of a message batch"""
+        model = request.model or self.config.model
+        if not model:
+            raise ValueError("Batch requests need a model")
+
+        params = self._build_chat_request(request.messages, model, request.temperature, request.max_tokens)
+        return {"custom_id": custom_id, "params": params}
+
+    def _batch_response(self, line: Dict[str, Any]) -> Tuple[str, Union[ModelResponse, Exception]]:
+        """Parse one entry of message batch results"""
+        custom_id = line["custom_id"]
+        result = line["result"]
+        if result["type"] != "succeeded":
+            error = (result.get("error") or {}).get("error") or {}
+            message = error.get("message") or result["type"]
+            return custom_id, ProviderError(f"Anthropic batch request {custom_id} failed: {message}")
+
+        response = anthropic.types.Message.model_validate(result["message"])
+        return custom_id, self._build_chat_response(response)
+
+    def _batch_backend(self) -> BatchJobBackend:
+        """Get the Message Batches API transport"""
+        return AnthropicBatchBackend(self)
+
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert messages to Anthropic format"""
-        anthropic_messages = []
+        # System messages handled separately
+        return [
+            msg.serialized("anthropic", self._format_message)
+            for msg in messages
+            if msg.role != Role.SYSTEM
+        ]
+
+    def _format_message(self, msg: Message) -> Dict[str, Any]:
+        """Convert a single non-system message to Anthropic format"""
+        # Initialize message
+        formatted_msg = {"role": "user" if msg.role in [Role.USER, Role.TOOL] else "assistant"}
+
+        # Handle different message types
+        if msg.tool_calls:
+            formatted_msg["content"] = [{
+                "type": "tool_use",
+                "id": tool_call["id"],
+                "name": tool_call["function"]["name"],
+                "input": json.loads(tool_call["function"]["arguments"])
+            } for tool_call in msg.tool_calls]
+        elif msg.role == Role.TOOL and msg.tool_call_id:
+            formatted_msg["content"] = [{
+                "type": "tool_result",
+                "tool_use_id": msg.tool_call_id,
+                "content": msg.content
+            }]
+        else:
+            # For basic messages, use string content
+            formatted_msg["content"] = msg.content
+
+        return formatted_msg
+
+    def _build_chat_request(
+        self,
+        messages: List[Message],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build request parameters for a basic chat completion"""
+        # Extract system message if present
+        system_message = next(
+            (msg.content for msg in messages if msg.role == Role.SYSTEM),
+            None
+        )
 
-        for msg in messages:
-            if msg.role == Role.SYSTEM:
-                continue  # System messages handled separately
-
-            # Initialize message
-            formatted_msg = {"role": "user" if msg.role in [Role.USER, Role.TOOL] else "assistant"}
-
-            # Handle different message types
-            if msg.tool_calls:
-                formatted_msg["content"] = [{
-                    "type": "tool_use",
-                    "id": tool_call["id"],
-                    "name": tool_call["function"]["name"],
-                    "input": json.loads(tool_call["function"]["arguments"])
-                } for tool_call in msg.tool_calls]
-            elif msg.role == Role.TOOL and msg.tool_call_id:
-                formatted_msg["content"] = [{
-                    "type": "tool_result",
-                    "tool_use_id": msg.tool_call_id,
-                    "content": msg.content
-                }]
-            else:
-                # For basic messages, use string content
-                formatted_msg["content"] = msg.content
-
-            anthropic_messages.append(formatted_msg)
-
-        return anthropic_messages
+        # Debug: Print formatted messages
+        if self.debug:
+            print("\nSending to Anthropic API:")
+            print(f"Model: {model}")
+            print(f"Messages: {self._format_messages(messages)}")
+            print(f"System: {system_message}")
+            print(f"Temperature: {temperature}")
+            print(f"Max Tokens: {max_tokens or self.DEFAULT_MAX_TOKENS}")
+
+        # Create request parameters
+        request_params = {
+            "model": model,
+            "messages": self._format_messages(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS
+        }
+
+        # Only add system if it's not None
+        if system_message is not None:
+            request_params["system"] = system_message
+
+        return request_params
+
+    def _build_chat_response(self, response: Any) -> ModelResponse:
+        """Convert a basic chat completion into a ModelResponse"""
+        # Debug: Print raw response
+        if self.debug:
+            print("\nReceived from Anthropic API:")
+            print(f"Response Type: {type(response)}")
+            print(f"Response Content: {response.content}")
+            print(f"Response Model Dump: {response.model_dump()}")
+
+        model_response = ModelResponse(
+            content=self._extract_content(response),
+            raw_response=response.model_dump(),
+            usage=self._extract_usage(response),
+            tool_calls=None
+        )
+
+        # Debug: Print final model response
+        if self.debug:
+            print("\nFinal ModelResponse:")
+            print(f"Content: {model_response.content}")
+            print(f"Raw Response: {model_response.raw_response}")
+            print(f"Usage: {model_response.usage}")
+
+        return model_response
 
     def _get_chat_completion(
         self,
@@ -88,59 +213,134 @@ class AnthropicProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a basic chat completion"""
         try:
-            # Extract system message if present
-            system_message = next(
-                (msg.content for msg in messages if msg.role == Role.SYSTEM),
-                None
+            request_params = self._build_chat_request(
+                messages, model, params.temperature, params.max_tokens
             )
+            response = self.client.messages.create(**request_params)
+            return self._build_chat_response(response)
+        except Exception as e:
+            raise ProviderError(f"Anthropic completion failed: {str(e)}")
 
-            # Debug: Print formatted messages
-            if self.debug:
-                print("\nSending to Anthropic API:")
-                print(f"Model: {model}")
-                print(f"Messages: {self._format_messages(messages)}")
-                print(f"System: {system_message}")
-                print(f"Temperature: {params.temperature}")
-                print(f"Max Tokens: {params.max_tokens or self.DEFAULT_MAX_TOKENS}")
-
-            # Create request parameters
-            request_params = {
-                "model": model,
-                "messages": self._format_messages(messages),
-                "temperature": params.temperature,
-                "max_tokens": params.max_tokens or self.DEFAULT_MAX_TOKENS
-            }
-
-            # Only add system if it's not None
-            if system_message is not None:
-                request_params["system"] = system_message
+    def _build_tool_system_message(
+        self,
+        messages: List[Message],
+        format_json: bool = False,
+        json_schema: Optional[Type[BaseModel]] = None
+    ) -> str:
+        """Build the system message used for tool completions"""
+        # Extract system message if present
+        system_message = next(
+            (msg.content for msg in messages if msg.role == Role.SYSTEM),
+            None
+        )
 
-            response = self.client.messages.create(**request_params)
+        # Add tool use instructions to system message
+        tool_instructions = (
+            "If you need to use tools, do not include any text before making tool calls. "
+            "Simply make sequential tool calls until you have all the information needed, "
+            "then provide your final response."
+        )
 
-            # Debug: Print raw response
-            if self.debug:
-                print("\nReceived from Anthropic API:")
-                print(f"Response Type: {type(response)}")
-                print(f"Response Content: {response.content}")
-                print(f"Response Model Dump: {response.model_dump()}")
-
-            model_response = ModelResponse(
-                content=self._extract_content(response),
-                raw_response=response.model_dump(),
-                usage=self._extract_usage(response),
-                tool_calls=None
+        # If JSON formatting is requested, add JSON instructions
+        if format_json and json_schema:
+            schema_json = json_schema.model_json_schema()
+            json_instructions = (
+                "\n\nAfter using tools, format your final response as JSON matching this schema:\n"
+                f"{json.dumps(schema_json, indent=2)}\n\n"
+                "Respond ONLY with valid JSON matching this schema. No other text."
             )
+            tool_instructions = tool_instructions + json_instructions
+
+        if system_message:
+            return f"{system_message}\n\n{tool_instructions}"
+        return tool_instructions
+
+    def _format_tools(self, tools: Sequence[BaseTool]) -> List[Dict[str, Any]]:
+        """Convert tools to Anthropic format"""
+        anthropic_tools = []
+        for tool in tools:
+            schema = tool.parameters.model_json_schema()
+            anthropic_tools.append({
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": {
+                    "type": "object",
+                    "properties": schema.get("properties", {}),
+                    "required": schema.get("required", [])
+                }
+            })
+        return anthropic_tools
 
-            # Debug: Print final model response
-            if self.debug:
-                print("\nFinal ModelResponse:")
-                print(f"Content: {model_response.content}")
-                print(f"Raw Response: {model_response.raw_response}")
-                print(f"Usage: {model_response.usage}")
+    def _build_tool_request(
+        self,
+        messages: List[Message],
+        model: str,
+        anthropic_tools: List[Dict[str, Any]],
+        system_message: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build request parameters for one round of the tool loop"""
+        # Format current messages
+        formatted_messages = []
+        current_interaction = []
 
-            return model_response
-        except Exception as e:
-            raise ProviderError(f"Anthropic completion failed: {str(e)}")
+        for msg in messages:
+            if msg.role == Role.SYSTEM:
+                continue
+
+            if msg.role == Role.USER and current_interaction:
+                formatted_messages.extend(self._format_messages(current_interaction))
+                current_interaction = []
+
+            current_interaction.append(msg)
+
+        if current_interaction:
+            formatted_messages.extend(self._format_messages(current_interaction))
+
+        if self.debug:
+            print("\nSending messages to Anthropic:")
+            for msg in formatted_messages:
+                print(f"Role: {msg['role']}")
+                print(f"Content: {msg['content']}\n")
+
+        return {
+            "model": model,
+            "messages": formatted_messages,
+            "tools": anthropic_tools,
+            "temperature": temperature,
+            "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
+            "system": system_message,
+            "tool_choice": {"type": "auto", "disable_parallel_tool_use": True}
+        }
+
+    def _build_tool_response(
+        self,
+        final_response: Any,
+        final_tool_calls: List[Dict[str, Any]],
+        format_json: bool = False,
+        json_schema: Optional[Type[BaseModel]] = None
+    ) -> ModelResponse:
+        """Convert the final round of the tool loop into a ModelResponse"""
+        content = self._extract_content(final_response)
+
+        if self.debug and final_tool_calls:
+            print("\nTool calls triggered:")
+            for call in final_tool_calls:
+                print(f"- {call['function']['name']}: {call['function']['arguments']}")
+            if content:
+                print(f"\nAssistant message: {content}")
+
+        # If JSON formatting was requested, validate the response
+        if format_json and json_schema:
+            self._validate_json(content, json_schema)
+
+        return ModelResponse(
+            content=content,
+            raw_response=final_response.model_dump(),
+            usage=self._extract_usage(final_response),
+            tool_calls=final_tool_calls if final_tool_calls else None
+        )
 
     def _get_tool_completion(
         self,
@@ -154,157 +354,99 @@ class AnthropicProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a chat completion with tool use"""
         try:
-            # Extract system message if present
-            system_message = next(
-                (msg.content for msg in messages if msg.role == Role.SYSTEM),
-                None
-            )
+            system_message = self._build_tool_system_message(messages, format_json, json_schema)
+            anthropic_tools = self._format_tool_list(tools, self._format_tools)
 
-            # Add tool use instructions to system message
-            tool_instructions = (
-                "If you need to use tools, do not include any text before making tool calls. "
-                "Simply make sequential tool calls until you have all the information needed, "
-                "then provide your final response."
-            )
-
-            # If JSON formatting is requested, add JSON instructions
-            if format_json and json_schema:
-                schema_json = json_schema.model_json_schema()
-                json_instructions = (
-                    "\n\nAfter using tools, format your final response as JSON matching this schema:\n"
-                    f"{json.dumps(schema_json, indent=2)}\n\n"
-                    "Respond ONLY with valid JSON matching this schema. No other text."
-                )
-                tool_instructions = tool_instructions + json_instructions
-
-            if system_message:
-                system_message = f"{system_message}\n\n{tool_instructions}"
-            else:
-                system_message = tool_instructions
-
-            # Format tools for Anthropic
-            anthropic_tools = []
-            for tool in tools:
-                schema = tool.parameters.model_json_schema()
-                anthropic_tools.append({
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": {
-                        "type": "object",
-                        "properties": schema.get("properties", {}),
-                        "required": schema.get("required", [])
-                    }
-                })
-
-            # Initialize conversation history
-            conversation = []
             current_messages = messages.copy()
-            final_response = None
             final_tool_calls = []
 
             while True:
-                # Format current messages
-                formatted_messages = []
-                current_interaction = []
-
-                for msg in current_messages:
-                    if msg.role == Role.SYSTEM:
-                        continue
-
-                    if msg.role == Role.USER and current_interaction:
-                        formatted_messages.extend(self._format_messages(current_interaction))
-                        current_interaction = []
-
-                    current_interaction.append(msg)
-
-                if current_interaction:
-                    formatted_messages.extend(self._format_messages(current_interaction))
-
-                # Create request
-                request_kwargs = {
-                    "model": model,
-                    "messages": formatted_messages,
-                    "tools": anthropic_tools,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
-                    "system": system_message,
-                    "tool_choice": {"type": "auto", "disable_parallel_tool_use": True}
-                }
-
-                if self.debug:
-                    print("\nSending messages to Anthropic:")
-                    for msg in formatted_messages:
-                        print(f"Role: {msg['role']}")
-                        print(f"Content: {msg['content']}\n")
-
+                request_kwargs = self._build_tool_request(
+                    current_messages, model, anthropic_tools, system_message,
+                    temperature, max_tokens
+                )
                 response = self.client.messages.create(**request_kwargs)
 
                 content = self._extract_content(response)
                 tool_calls = self._extract_tool_calls(response)
 
                 # Add assistant's response to conversation
-                assistant_msg = Message(
+                current_messages.append(Message(
                     role=Role.ASSISTANT,
                     content=content,
                     tool_calls=tool_calls
-                )
-                conversation.append(assistant_msg)
-                current_messages.append(assistant_msg)
-
-                if tool_calls:
-                    final_tool_calls.extend(tool_calls)
-                    # Process tool calls
-                    for tool_call in tool_calls:
-                        tool = next(
-                            (t for t in tools if t.name == tool_call["function"]["name"]),
-                            None
-                        )
-                        if tool:
-                            try:
-                                args = json.loads(tool_call["function"]["arguments"])
-                                result = tool(**args)
-
-                                # Add tool response to conversation
-                                tool_msg = Message(
-                                    role=Role.TOOL,
-                                    content=str(result),
-                                    tool_call_id=tool_call["id"],
-                                    name=tool_call["function"]["name"]
-                                )
-                                conversation.append(tool_msg)
-                                current_messages.append(tool_msg)
-                            except Exception as e:
-                                raise ProviderError(f"Error executing {tool.name}: {str(e)}")
-                else:
+                ))
+
+                if not tool_calls:
                     # No more tool calls, this is our final response
-                    final_response = response
                     break
 
-            if self.debug and final_tool_calls:
-                print("\nTool calls triggered:")
-                for call in final_tool_calls:
-                    print(f"- {call['function']['name']}: {call['function']['arguments']}")
-                if content:
-                    print(f"\nAssistant message: {content}")
-
-            # If JSON formatting was requested, validate the response
-            content = self._extract_content(final_response)
-            if format_json and json_schema:
-                try:
-                    data = json.loads(content)
-                    json_schema.model_validate(data)
-                except Exception as e:
-                    raise ProviderError(f"Invalid JSON response: {str(e)}")
-
-            return ModelResponse(
-                content=content,
-                raw_response=final_response.model_dump(),
-                usage=self._extract_usage(final_response),
-                tool_calls=final_tool_calls if final_tool_calls else None
-            )
+                final_tool_calls.extend(tool_calls)
+                # Process tool calls
+                for tool_call in tool_calls:
+                    tool = next(
+                        (t for t in tools if t.name == tool_call["function"]["name"]),
+                        None
+                    )
+                    if tool:
+                        try:
+                            args = json.loads(tool_call["function"]["arguments"])
+                            result = tool.run(**args)
+                        except Exception as e:
+                            raise ProviderError(f"Error executing {tool.name}: {str(e)}")
+
+                        # Add tool response to conversation
+                        current_messages.append(Message(
+                            role=Role.TOOL,
+                            content=str(result),
+                            tool_call_id=tool_call["id"],
+                            name=tool_call["function"]["name"]
+                        ))
+
+            return self._build_tool_response(response, final_tool_calls, format_json, json_schema)
         except Exception as e:
             raise ProviderError(f"Anthropic tool completion failed: {str(e)}")
 
+    def _build_json_request(
+        self,
+        messages: List[Message],
+        model: str,
+        schema: Type[BaseModel],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build request parameters for a JSON completion"""
+        # Get generic JSON formatting prompt, used as the system message
+        formatting_prompt = self._get_json_formatting_prompt(schema, messages[-1].content)
+
+        return {
+            "model": model,
+            "messages": self._format_messages(messages),
+            "system": formatting_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS
+        }
+
+    def _validate_json(self, content: str, schema: Type[BaseModel]) -> None:
+        """Validate response content against a schema"""
+        try:
+            data = json.loads(content)
+            schema.model_validate(data)
+        except Exception as e:
+            raise ProviderError(f"Invalid JSON response: {str(e)}")
+
+    def _build_json_response(self, response: Any, schema: Type[BaseModel]) -> ModelResponse:
+        """Validate a JSON completion and convert it into a ModelResponse"""
+        content = self._extract_content(response)
+        self._validate_json(content, schema)
+
+        return ModelResponse(
+            content=content,
+            raw_response=response.model_dump(),
+            usage=self._extract_usage(response),
+            tool_calls=None
+        )
+
     def _get_json_completion(
         self,
         messages: List[Message],
@@ -315,34 +457,10 @@ class AnthropicProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a chat completion formatted as JSON"""
         try:
-            # Get generic JSON formatting prompt
-            formatting_prompt = self._get_json_formatting_prompt(schema, messages[-1].content)
-
-            # Create system message with JSON instructions
-            system_message = formatting_prompt
-
             response = self.client.messages.create(
-                model=model,
-                messages=self._format_messages(messages),
-                system=system_message,
-                temperature=temperature,
-                max_tokens=max_tokens or self.DEFAULT_MAX_TOKENS
-            )
-
-            # Validate response against schema
-            content = self._extract_content(response)
-            try:
-                data = json.loads(content)
-                schema.model_validate(data)
-            except Exception as e:
-                raise ProviderError(f"Invalid JSON response: {str(e)}")
-
-            return ModelResponse(
-                content=content,
-                raw_response=response.model_dump(),
-                usage=self._extract_usage(response),
-                tool_calls=None
+                **self._build_json_request(messages, model, schema, temperature, max_tokens)
             )
+            return self._build_json_response(response, schema)
         except Exception as e:
             raise ProviderError(f"Anthropic JSON completion failed: {str(e)}")
 
@@ -399,8 +517,21 @@ class AnthropicProvider(LLMInterface):
         )
 
     async def _asetup_client(self) -> None:
-        """Initialize Anthropic client asynchronously"""
-        await self._setup_client()
+        """Initialize async Anthropic client"""
+        try:
+            self._async_client = self._shared_client("anthropic.async", lambda: anthropic.AsyncAnthropic(
+                api_key=self.config.api_key,
+                base_url=self.config.base_url,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries
+            ))
+        except Exception as e:
+            raise ProviderError(f"Failed to initialize async Anthropic client: {str(e)}")
+
+    async def _ensure_async_client(self) -> None:
+        """Ensure async client is initialized"""
+        if self._async_client is None:
+            await self._asetup_client()
 
     async def _aget_chat_completion(
         self,
@@ -410,11 +541,76 @@ class AnthropicProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a basic chat completion asynchronously"""
-        params = ChatParameters(
-            temperature=temperature,
-            max_tokens=max_tokens
+        try:
+            await self._ensure_async_client()
+            request_params = self._build_chat_request(messages, model, temperature, max_tokens)
+            response = await self._async_client.messages.create(**request_params)
+            return self._build_chat_response(response)
+        except Exception as e:
+            raise ProviderError(f"Anthropic async completion failed: {str(e)}")
+
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn"""
+        await self._ensure_async_client()
+        if tools:
+            request_params = self._build_tool_request(
+                messages, model, self._format_tool_list(tools, self._format_tools),
+                self._build_tool_system_message(messages),
+                temperature, max_tokens
+            )
+        else:
+            request_params = self._build_chat_request(messages, model, temperature, max_tokens)
+
+        tool_calls = ToolCallAccumulator()
+        input_tokens = 0
+        output_tokens = 0
+        stop_reason = None
+
+        try:
+            stream = await self._async_client.messages.create(**request_params, stream=True)
+            async for event in stream:
+                if event.type == "message_start":
+                    input_tokens = event.message.usage.input_tokens
+                elif event.type == "content_block_start":
+                    block = event.content_block
+                    if block.type == "tool_use":
+                        tool_calls.add(event.index, call_id=block.id, name=block.name)
+                elif event.type == "content_block_delta":
+                    delta = event.delta
+                    if delta.type == "text_delta" and delta.text:
+                        yield StreamChunk(content=delta.text)
+                    elif delta.type == "input_json_delta":
+                        tool_calls.add(event.index, arguments=delta.partial_json)
+                elif event.type == "message_delta":
+                    stop_reason = event.delta.stop_reason
+                    output_tokens = event.usage.output_tokens
+        except Exception as e:
+            raise ProviderError(f"Anthropic streaming completion failed: {str(e)}")
+
+        yield StreamChunk(
+            tool_calls=tool_calls.build(),
+            usage=TokenUsage(
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens
+            ),
+            finish_reason=stop_reason
         )
-        return self._get_chat_completion(messages, model, params)
+
+    async def _arun_tool(self, tool: BaseTool, tool_call: Dict[str, Any]) -> Any:
+        """Execute one tool call from the async tool loop"""
+        try:
+            args = json.loads(tool_call["function"]["arguments"])
+            return await tool(**args)
+        except Exception as e:
+            raise ProviderError(f"Error executing {tool.name}: {str(e)}")
 
     async def _aget_tool_completion(
         self,
@@ -427,15 +623,52 @@ class AnthropicProvider(LLMInterface):
         json_schema: Optional[Type[BaseModel]] = None
     ) -> ModelResponse:
         """Get a chat completion with tool use asynchronously"""
-        return self._get_tool_completion(
-            messages=messages,
-            model=model,
-            tools=tools,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            format_json=format_json,
-            json_schema=json_schema
-        )
+        try:
+            await self._ensure_async_client()
+            system_message = self._build_tool_system_message(messages, format_json, json_schema)
+            anthropic_tools = self._format_tool_list(tools, self._format_tools)
+
+            current_messages = list(messages)
+            final_tool_calls = []
+
+            while True:
+                request_kwargs = self._build_tool_request(
+                    current_messages, model, anthropic_tools, system_message,
+                    temperature, max_tokens
+                )
+                response = await self._async_client.messages.create(**request_kwargs)
+
+                content = self._extract_content(response)
+                tool_calls = self._extract_tool_calls(response)
+
+                # Add assistant's response to conversation
+                current_messages.append(Message(
+                    role=Role.ASSISTANT,
+                    content=content,
+                    tool_calls=tool_calls
+                ))
+
+                if not tool_calls:
+                    # No more tool calls, this is our final response
+                    break
+
+                final_tool_calls.extend(tool_calls)
+                # Run the tool calls concurrently, keeping the model's order
+                executed = await dispatch_tool_calls(
+                    tool_calls, tools, self._arun_tool, self.max_tool_concurrency
+                )
+                for tool_call, _, result in executed:
+                    # Add tool response to conversation
+                    current_messages.append(Message(
+                        role=Role.TOOL,
+                        content=str(result),
+                        tool_call_id=tool_call["id"],
+                        name=tool_call["function"]["name"]
+                    ))
+
+            return self._build_tool_response(response, final_tool_calls, format_json, json_schema)
+        except Exception as e:
+            raise ProviderError(f"Anthropic async tool completion failed: {str(e)}")
 
     async def _aget_json_completion(
         self,
@@ -446,4 +679,11 @@ class AnthropicProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a chat completion formatted as JSON asynchronously"""
-        return self._get_json_completion(messages, model, schema, temperature, max_tokens)
+        try:
+            await self._ensure_async_client()
+            response = await self._async_client.messages.create(
+                **self._build_json_request(messages, model, schema, temperature, max_tokens)
+            )
+            return self._build_json_response(response, schema)
+        except Exception as e:
+            raise ProviderError(f"Anthropic async JSON completion failed: {str(e)}")
@@ -1,5 +1,10 @@
+import asyncio
 import json
-from typing import Any, Dict, List, Optional, Sequence, Type, Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Tuple, TypeVar
 
 import boto3
 from pydantic import BaseModel
@@ -16,6 +21,7 @@ from ..interface.schemas import (
 from ..interface.tools import BaseTool
 from .factory import ProviderFactory
 
+T = TypeVar("T")
 
 class BedrockFactory(ProviderFactory):
     """Factory for creating AWS Bedrock providers"""
@@ -26,31 +32,126 @@ class BedrockFactory(ProviderFactory):
 
 
 class BedrockProvider(LLMInterface):
-    """AWS Bedrock-specific implementation of the LLM interface"""
+    """AWS Bedrock-specific implementation of the LLM interface
+
+    boto3 has no async client, so async methods run the sync implementation
+    in a dedicated, size-bounded thread pool. Each worker borrows a client
+    from a pool of reusable boto3 clients. Pool size and the number of
+    in-flight async requests are configured through ``ProviderConfig``
+    extras ``max_workers`` and ``max_concurrency``.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
 
     def __init__(self, config: ProviderConfig, debug: bool = False):
         """Initialize provider with boto3 client"""
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         super().__init__(config, debug)
-        self._session = None
-        self._client = None
-        self._setup_client()
+
+    @property
+    def max_workers(self) -> int:
+        """Size of the thread pool and the boto3 client pool"""
+        return getattr(self.config, "max_workers", None) or self.DEFAULT_MAX_WORKERS
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of async requests in flight"""
+        return getattr(self.config, "max_concurrency", None) or self.max_workers
+
+    def _create_client(self) -> Tuple[Any, Any]:
+        """Create a boto3 client from its own session (sessions are not thread-safe)"""
+        session = boto3.Session(
+            aws_access_key_id=self.config.api_key,
+            aws_secret_access_key=self.config.api_secret,
+            region_name=self.config.region or "us-east-1"
+        )
+        return session, session.client(service_name='bedrock-runtime')
 
     def _setup_client(self) -> None:
         """Initialize AWS Bedrock client"""
         try:
-            self._session = boto3.Session(
-                aws_access_key_id=self.config.api_key,
-                aws_secret_access_key=self.config.api_secret,
-                region_name=self.config.region or "us-east-1"
-            )
-            self._client = self._session.client(service_name='bedrock-runtime')
+            self._session, self._client = self._create_client()
         except Exception as e:
             raise ProviderError(f"Failed to initialize AWS Bedrock client: {str(e)}")
 
+        self._client_pool: queue.Queue = queue.Queue()
+        self._client_pool.put(self._client)
+        self._client_count = 1
+        self._client_lock = threading.Lock()
+
     async def _asetup_client(self) -> None:
         """Initialize AWS Bedrock client asynchronously"""
-        # AWS Bedrock doesn't have an async client, so we'll use the sync one
-        self._setup_client()
+        # AWS Bedrock doesn't have an async client; async calls go through the thread pool.
+        # The client pool is built once, so clients already borrowed stay accounted for
+        if getattr(self, "_client", None) is None:
+            await self._run_in_pool(self._setup_client)
+
+    def _acquire_client(self) -> Any:
+        """Borrow a client from the pool, creating one if the pool is not full"""
+        try:
+            return self._client_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._client_lock:
+            if self._client_count < self.max_workers:
+                self._client_count += 1
+                try:
+                    return self._create_client()[1]
+                except Exception:
+                    self._client_count -= 1
+                    raise
+
+        return self._client_pool.get()
+
+    def _release_client(self, client: Any) -> None:
+        """Return a borrowed client to the pool"""
+        self._client_pool.put(client)
+
+    def _converse(self, **request: Any) -> Dict[str, Any]:
+        """Call the Bedrock Converse API with a pooled client"""
+        client = self._acquire_client()
+        try:
+            return client.converse(**request)
+        finally:
+            self._release_client(client)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the dedicated thread pool, creating it on first use"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="legion-bedrock"
+                    )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_in_pool(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call in the thread pool without blocking the event loop"""
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), partial(func, *args, **kwargs)
+            )
+
+    def close(self) -> None:
+        """Shut down the thread pool"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        super().close()
 
     def _format_messages(self, messages: List[Message]) -> Tuple[List[Dict[str, Any]], Optional[List[Dict[str, str]]]]:
         """Format messages for the API request, separating system messages"""
@@ -181,7 +282,7 @@ class BedrockProvider(LLMInterface):
             if system:
                 request_body["system"] = system
 
-            response = self._client.converse(
+            response = self._converse(
                 modelId=model or "us.amazon.nova-lite-v1:0",
                 **request_body
             )
@@ -203,8 +304,9 @@ class BedrockProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a basic chat completion asynchronously"""
-        # AWS Bedrock doesn't have async support, so we'll use the sync version
-        return self._get_chat_completion(messages, model, temperature, max_tokens)
+        return await self._run_in_pool(
+            self._get_chat_completion, messages, model, temperature, max_tokens
+        )
 
     def _get_tool_completion(
         self,
@@ -232,7 +334,7 @@ class BedrockProvider(LLMInterface):
             else:
                 system = [tool_instructions]
 
-            tool_list = self._format_tools(tools)
+            tool_list = self._format_tool_list(tools, self._format_tools)
 
             request_body = {
                 "messages": chat_messages,
@@ -253,7 +355,7 @@ class BedrockProvider(LLMInterface):
             if system:
                 request_body["system"] = system
 
-            response = self._client.converse(
+            response = self._converse(
                 modelId=model or "us.amazon.nova-lite-v1:0",
                 **request_body
             )
@@ -282,8 +384,14 @@ class BedrockProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a tool-enabled chat completion asynchronously"""
         if format_json and json_schema:
-            return self._get_tool_and_json_completion(messages, model, tools, json_schema, temperature, max_tokens)
-        return self._get_tool_completion(messages, model, tools, temperature, max_tokens, format_json, json_schema)
+            return await self._run_in_pool(
+                self._get_tool_and_json_completion,
+                messages, model, tools, json_schema, temperature, max_tokens
+            )
+        return await self._run_in_pool(
+            self._get_tool_completion,
+            messages, model, tools, temperature, max_tokens, format_json, json_schema
+        )
 
     def _get_json_completion(
         self,
@@ -344,7 +452,7 @@ class BedrockProvider(LLMInterface):
             if system:
                 request_body["system"] = system
 
-            response = self._client.converse(
+            response = self._converse(
                 modelId=model or "us.amazon.nova-lite-v1:0",
                 **request_body
             )
@@ -444,5 +552,7 @@ class BedrockProvider(LLMInterface):
         preserve_tool_calls: Optional[List[Dict[str, Any]]] = None
     ) -> ModelResponse:
         """Get a JSON-formatted chat completion asynchronously"""
-        # AWS Bedrock doesn't have async support, so we'll use the sync version
-        return self._get_json_completion(messages, model, schema, temperature, max_tokens, preserve_tool_calls) 
\ No newline at end of file
+        return await self._run_in_pool(
+            self._get_json_completion,
+            messages, model, schema, temperature, max_tokens, preserve_tool_calls
+        )
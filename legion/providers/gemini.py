@@ -1,16 +1,17 @@
 """Google's Gemini-specific implementation of the LLM interface"""
 
-import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type
 from unittest.mock import MagicMock
 
 from pydantic import BaseModel
 
 from ..errors import ProviderError
 from ..interface.base import LLMInterface
-from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, TokenUsage
+from ..interface.portal import run_sync
+from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, StreamChunk, TokenUsage
+from ..interface.streaming import iter_openai_stream
 from ..interface.tools import BaseTool
 from . import ProviderFactory
 
@@ -38,6 +39,8 @@ class GeminiFactory(ProviderFactory):
 class GeminiProvider(LLMInterface):
     """Google's Gemini-specific provider implementation"""
 
+    supports_streaming = True
+
     DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
     SUPPORTED_MODELS = {
         "gemini-1.5-flash-latest": "gemini-1.5-flash",
@@ -59,7 +62,7 @@ class GeminiProvider(LLMInterface):
         from openai import AsyncOpenAI
         self.client = AsyncOpenAI(
             api_key=api_key,
-            base_url=self.DEFAULT_BASE_URL,
+            base_url=self.config.base_url or self.DEFAULT_BASE_URL,
             timeout=60,
             max_retries=3
         )
@@ -70,37 +73,37 @@ class GeminiProvider(LLMInterface):
 
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Format messages for Gemini API."""
-        formatted_messages = []
-        for message in messages:
-            formatted = {"role": message.role.value}
-
-            # Ensure content is never None/empty for Gemini
-            formatted["content"] = message.content if message.content else " "  # Use space instead of empty string
-
-            if message.tool_calls:
-                formatted["tool_calls"] = []
-                for tool_call in message.tool_calls:
-                    if isinstance(tool_call, dict):
-                        formatted["tool_calls"].append(tool_call)
-                    else:
-                        formatted["tool_calls"].append({
-                            "id": tool_call.id,
-                            "type": "function",
-                            "function": {
-                                "name": tool_call.name,
-                                "arguments": tool_call.arguments
-                            }
-                        })
+        return [message.serialized("gemini", self._format_message) for message in messages]
 
-            if message.role == Role.TOOL:
-                if message.name:
-                    formatted["name"] = message.name
-                if message.tool_call_id:
-                    formatted["tool_call_id"] = message.tool_call_id
+    def _format_message(self, message: Message) -> Dict[str, Any]:
+        """Format a single message for Gemini API."""
+        formatted = {"role": message.role.value}
 
-            formatted_messages.append(formatted)
+        # Ensure content is never None/empty for Gemini
+        formatted["content"] = message.content if message.content else " "  # Use space instead of empty string
 
-        return formatted_messages
+        if message.tool_calls:
+            formatted["tool_calls"] = []
+            for tool_call in message.tool_calls:
+                if isinstance(tool_call, dict):
+                    formatted["tool_calls"].append(tool_call)
+                else:
+                    formatted["tool_calls"].append({
+                        "id": tool_call.id,
+                        "type": "function",
+                        "function": {
+                            "name": tool_call.name,
+                            "arguments": tool_call.arguments
+                        }
+                    })
+
+        if message.role == Role.TOOL:
+            if message.name:
+                formatted["name"] = message.name
+            if message.tool_call_id:
+                formatted["tool_call_id"] = message.tool_call_id
+
+        return formatted
 
     def _extract_content(self, response: Any) -> str:
         """Extract content from response."""
@@ -224,7 +227,7 @@ class GeminiProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a basic chat completion"""
-        return asyncio.get_event_loop().run_until_complete(
+        return run_sync(
             self._aget_chat_completion(
                 messages=messages,
                 model=model,
@@ -269,6 +272,35 @@ class GeminiProvider(LLMInterface):
         except Exception as e:
             raise ProviderError(f"Gemini completion failed: {str(e)}")
 
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn"""
+        try:
+            params = self._validate_request({
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            })
+            if tools:
+                params["tools"] = self._format_tool_list(tools)
+                params["tool_choice"] = "auto"
+
+            stream = await self.client.chat.completions.create(
+                model=self.SUPPORTED_MODELS.get(model, model),
+                messages=self._format_messages(messages),
+                stream=True,
+                **params
+            )
+            async for chunk in iter_openai_stream(stream):
+                yield chunk
+        except Exception as e:
+            raise ProviderError(f"Gemini streaming completion failed: {str(e)}")
+
     def _get_json_completion(
         self,
         messages: List[Message],
@@ -278,7 +310,7 @@ class GeminiProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a chat completion formatted as JSON"""
-        return asyncio.get_event_loop().run_until_complete(
+        return run_sync(
             self._aget_json_completion(
                 messages=messages,
                 model=model,
@@ -353,7 +385,7 @@ class GeminiProvider(LLMInterface):
         json_schema: Optional[Type[BaseModel]] = None
     ) -> ModelResponse:
         """Get completion with tool usage"""
-        return asyncio.get_event_loop().run_until_complete(
+        return run_sync(
             self._aget_tool_completion(
                 messages=messages,
                 model=model,
@@ -390,7 +422,7 @@ class GeminiProvider(LLMInterface):
             # Format tools for Gemini API
             formatted_tools = None
             if tools:
-                formatted_tools = [tool.get_schema() for tool in tools]
+                formatted_tools = self._format_tool_list(tools)
 
             response = await self.client.chat.completions.create(
                 model=model,
@@ -1,17 +1,19 @@
 """Groq-specific implementation of the LLM interface"""
 
-import asyncio
+import inspect
 import json
 import os
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from pydantic import BaseModel
 
 from ..errors import ProviderError
 from ..interface.base import LLMInterface
-from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, TokenUsage
-from ..interface.tools import BaseTool
+from ..interface.portal import run_sync
+from ..interface.schemas import Message, ModelResponse, ProviderConfig, Role, StreamChunk, TokenUsage
+from ..interface.streaming import iter_openai_stream
+from ..interface.tools import BaseTool, dispatch_tool_calls
 from . import ProviderFactory
 
 
@@ -38,6 +40,8 @@ class GroqFactory(ProviderFactory):
 class GroqProvider(LLMInterface):
     """Groq-specific provider implementation"""
 
+    supports_streaming = True
+
     DEFAULT_BASE_URL = "https://api.groq.com/openai/v1"
     GROQ_SYSTEM_INSTRUCTION = (
         "DO NOT attempt to use tools that you do not have access to. "
@@ -55,52 +59,97 @@ class GroqProvider(LLMInterface):
             raise ProviderError("API key is required for Groq provider. Set GROQ_API_KEY environment variable.")
 
         try:
-            self.client = OpenAI(
+            self.client = self._shared_client("groq.sync", lambda: OpenAI(
                 api_key=self.config.api_key,
                 base_url=self.config.base_url or self.DEFAULT_BASE_URL,
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize Groq client: {str(e)}")
 
+    def __init__(self, config: ProviderConfig, debug: bool = False):
+        """Initialize provider with a lazily created async client"""
+        super().__init__(config, debug)
+        self._async_client = None
+
     async def _asetup_client(self) -> None:
-        """Initialize async Groq client"""
-        # Groq uses OpenAI's client for both sync and async
-        await self._setup_client()
+        """Initialize async Groq client using OpenAI's async client"""
+        try:
+            self._async_client = self._shared_client("groq.async", lambda: AsyncOpenAI(
+                api_key=self.config.api_key,
+                base_url=self.config.base_url or self.DEFAULT_BASE_URL,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries
+            ))
+        except Exception as e:
+            raise ProviderError(f"Failed to initialize async Groq client: {str(e)}")
+
+    async def _ensure_async_client(self) -> None:
+        """Ensure async client is initialized"""
+        if self._async_client is None:
+            await self._asetup_client()
+
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn"""
+        await self._ensure_async_client()
+        kwargs = self._validate_request(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        if tools:
+            kwargs["tools"] = self._format_tool_list([tool for tool in tools if tool.parameters])
+            kwargs["tool_choice"] = "auto"
+
+        try:
+            stream = await self._async_client.chat.completions.create(
+                model=model,
+                messages=self._format_messages(messages),
+                stream=True,
+                **kwargs
+            )
+            async for chunk in iter_openai_stream(stream):
+                yield chunk
+        except Exception as e:
+            raise ProviderError(f"Groq streaming completion failed: {str(e)}")
 
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Format messages for Groq API"""
-        formatted_messages = []
-
-        for msg in messages:
-            if msg.role == Role.SYSTEM:
-                # Add Groq-specific instruction to system message
-                content = f"{msg.content}\n\n{self.GROQ_SYSTEM_INSTRUCTION}" if msg.content else self.GROQ_SYSTEM_INSTRUCTION
-                formatted_messages.append({
-                    "role": "system",
-                    "content": content
-                })
-                continue
-
-            # Only include required fields for Groq
-            message = {
-                "role": msg.role.value,
-                "content": msg.content or ""
+        return [msg.serialized("groq", self._format_message) for msg in messages]
+
+    def _format_message(self, msg: Message) -> Dict[str, Any]:
+        """Format a single message for Groq API"""
+        if msg.role == Role.SYSTEM:
+            # Add Groq-specific instruction to system message
+            content = f"{msg.content}\n\n{self.GROQ_SYSTEM_INSTRUCTION}" if msg.content else self.GROQ_SYSTEM_INSTRUCTION
+            return {
+                "role": "system",
+                "content": content
             }
 
-            # Add tool-specific fields only if present
-            if msg.role == Role.TOOL and msg.tool_call_id:
-                message.update({
-                    "tool_call_id": msg.tool_call_id,
-                    "name": msg.name
-                })
-            elif msg.role == Role.ASSISTANT and msg.tool_calls:
-                message["tool_calls"] = msg.tool_calls
+        # Only include required fields for Groq
+        message = {
+            "role": msg.role.value,
+            "content": msg.content or ""
+        }
 
-            formatted_messages.append(message)
+        # Add tool-specific fields only if present
+        if msg.role == Role.TOOL and msg.tool_call_id:
+            message.update({
+                "tool_call_id": msg.tool_call_id,
+                "name": msg.name
+            })
+        elif msg.role == Role.ASSISTANT and msg.tool_calls:
+            message["tool_calls"] = msg.tool_calls
 
-        return formatted_messages
+        return message
 
     def _extract_tool_calls(self, response: Any) -> Optional[List[Dict[str, Any]]]:
         """Extract tool calls from Groq response"""
@@ -188,6 +237,76 @@ class GroqProvider(LLMInterface):
 
         return kwargs
 
+    def _chat_request(
+        self,
+        messages: List[Message],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the request parameters for a basic chat completion"""
+        return {
+            "model": model,
+            "messages": self._format_messages(messages),
+            **self._validate_request(temperature=temperature, max_tokens=max_tokens)
+        }
+
+    def _chat_response(self, response: Any) -> ModelResponse:
+        """Convert a chat completion to a model response"""
+        return ModelResponse(
+            content=self._extract_content(response),
+            raw_response=self._response_to_dict(response),
+            usage=self._extract_usage(response),
+            tool_calls=None
+        )
+
+    def _json_request(
+        self,
+        messages: List[Message],
+        model: str,
+        schema: Type[BaseModel],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the request parameters for a JSON completion"""
+        # Get generic JSON formatting prompt
+        formatting_prompt = self._get_json_formatting_prompt(schema, messages[-1].content)
+
+        # Create messages for Groq
+        groq_messages = [
+            {"role": "system", "content": formatting_prompt}
+        ]
+
+        # Add remaining messages, skipping system and only including required fields
+        groq_messages.extend([
+            {"role": msg.role.value, "content": msg.content}
+            for msg in messages
+            if msg.role != Role.SYSTEM
+        ])
+
+        return {
+            "model": model,
+            "messages": groq_messages,
+            "response_format": {"type": "json_object"},
+            **self._validate_request(temperature=temperature, max_tokens=max_tokens)
+        }
+
+    def _json_response(self, response: Any, schema: Type[BaseModel]) -> ModelResponse:
+        """Validate a JSON completion against the schema and convert it to a model response"""
+        content = response.choices[0].message.content
+        try:
+            data = json.loads(content)
+            schema.model_validate(data)
+        except Exception as e:
+            raise ProviderError(f"Invalid JSON response: {str(e)}")
+
+        return ModelResponse(
+            content=content,
+            raw_response=self._response_to_dict(response),
+            usage=self._extract_usage(response),
+            tool_calls=None
+        )
+
     def _get_chat_completion(
         self,
         messages: List[Message],
@@ -197,23 +316,10 @@ class GroqProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a basic chat completion"""
         try:
-            kwargs = self._validate_request(
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-
             response = self.client.chat.completions.create(
-                model=model,
-                messages=self._format_messages(messages),
-                **kwargs
-            )
-
-            return ModelResponse(
-                content=self._extract_content(response),
-                raw_response=self._response_to_dict(response),
-                usage=self._extract_usage(response),
-                tool_calls=None
+                **self._chat_request(messages, model, temperature, max_tokens)
             )
+            return self._chat_response(response)
         except Exception as e:
             raise ProviderError(f"Groq completion failed: {str(e)}")
 
@@ -228,7 +334,7 @@ class GroqProvider(LLMInterface):
         json_schema: Optional[Type[BaseModel]] = None
     ) -> ModelResponse:
         """Get completion with tool usage"""
-        return asyncio.get_event_loop().run_until_complete(
+        return run_sync(
             self._aget_tool_completion(
                 messages=messages,
                 model=model,
@@ -251,6 +357,7 @@ class GroqProvider(LLMInterface):
         json_schema: Optional[Type[BaseModel]] = None
     ) -> ModelResponse:
         """Get completion with tool usage asynchronously"""
+        await self._ensure_async_client()
         try:
             # Initialize conversation
             current_messages = messages.copy()
@@ -265,10 +372,10 @@ class GroqProvider(LLMInterface):
                 )
 
                 # Get response with tools
-                response = self.client.chat.completions.create(
+                response = await self._async_client.chat.completions.create(
                     model=model,
                     messages=self._format_messages(current_messages),
-                    tools=[tool.get_schema() for tool in tools if tool.parameters],
+                    tools=self._format_tool_list([tool for tool in tools if tool.parameters]),
                     tool_choice="auto",
                     **kwargs
                 )
@@ -305,34 +412,37 @@ class GroqProvider(LLMInterface):
                         tool_calls=None
                     )
 
-                # Process tool calls
-                for tool_call in tool_calls:
-                    tool = next(
-                        (t for t in tools if t.name == tool_call["function"]["name"]),
-                        None
-                    )
-                    if tool:
-                        try:
-                            args = json.loads(tool_call["function"]["arguments"])
-                            result = await tool(**args) if asyncio.iscoroutinefunction(tool) else tool(**args)
-
-                            if self.debug:
-                                print(f"\nTool {tool.name} returned: {result}")
-
-                            # Add tool response to conversation
-                            tool_msg = Message(
-                                role=Role.TOOL,
-                                content=str(result),
-                                tool_call_id=tool_call["id"],
-                                name=tool_call["function"]["name"]
-                            )
-                            current_messages.append(tool_msg)
-                        except Exception as e:
-                            raise ProviderError(f"Error executing {tool.name}: {str(e)}")
+                # Run the tool calls concurrently, keeping the model's order
+                executed = await dispatch_tool_calls(
+                    tool_calls,
+                    tools,
+                    self._execute_tool_call,
+                    self.max_tool_concurrency
+                )
+                for tool_call, tool, result in executed:
+                    if self.debug:
+                        print(f"\nTool {tool.name} returned: {result}")
+
+                    # Add tool response to conversation
+                    current_messages.append(Message(
+                        role=Role.TOOL,
+                        content=str(result),
+                        tool_call_id=tool_call["id"],
+                        name=tool_call["function"]["name"]
+                    ))
 
         except Exception as e:
             raise ProviderError(f"Groq tool completion failed: {str(e)}")
 
+    async def _execute_tool_call(self, tool: BaseTool, tool_call: Dict[str, Any]) -> Any:
+        """Run one tool call from the model"""
+        try:
+            args = json.loads(tool_call["function"]["arguments"])
+            result = tool(**args)
+            return await result if inspect.isawaitable(result) else result
+        except Exception as e:
+            raise ProviderError(f"Error executing {tool.name}: {str(e)}")
+
     def _get_json_completion(
         self,
         messages: List[Message],
@@ -343,47 +453,10 @@ class GroqProvider(LLMInterface):
     ) -> ModelResponse:
         """Get a chat completion formatted as JSON"""
         try:
-            # Get generic JSON formatting prompt
-            formatting_prompt = self._get_json_formatting_prompt(schema, messages[-1].content)
-
-            # Create messages for Groq
-            groq_messages = [
-                {"role": "system", "content": formatting_prompt}
-            ]
-
-            # Add remaining messages, skipping system and only including required fields
-            groq_messages.extend([
-                {"role": msg.role.value, "content": msg.content}
-                for msg in messages
-                if msg.role != Role.SYSTEM
-            ])
-
-            kwargs = self._validate_request(
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-
             response = self.client.chat.completions.create(
-                model=model,
-                messages=groq_messages,
-                response_format={"type": "json_object"},
-                **kwargs
-            )
-
-            # Validate response against schema
-            content = response.choices[0].message.content
-            try:
-                data = json.loads(content)
-                schema.model_validate(data)
-            except Exception as e:
-                raise ProviderError(f"Invalid JSON response: {str(e)}")
-
-            return ModelResponse(
-                content=content,
-                raw_response=self._response_to_dict(response),
-                usage=self._extract_usage(response),
-                tool_calls=None
+                **self._json_request(messages, model, schema, temperature, max_tokens)
             )
+            return self._json_response(response, schema)
         except Exception as e:
             raise ProviderError(f"Groq JSON completion failed: {str(e)}")
 
@@ -395,13 +468,14 @@ class GroqProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a basic chat completion asynchronously"""
-        # For now, just use sync version since Groq uses OpenAI's client
-        return self._get_chat_completion(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        await self._ensure_async_client()
+        try:
+            response = await self._async_client.chat.completions.create(
+                **self._chat_request(messages, model, temperature, max_tokens)
+            )
+            return self._chat_response(response)
+        except Exception as e:
+            raise ProviderError(f"Groq completion failed: {str(e)}")
 
     async def _aget_json_completion(
         self,
@@ -412,11 +486,11 @@ class GroqProvider(LLMInterface):
         max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a chat completion formatted as JSON asynchronously"""
-        # For now, just use sync version since Groq uses OpenAI's client
-        return self._get_json_completion(
-            messages=messages,
-            model=model,
-            schema=schema,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        await self._ensure_async_client()
+        try:
+            response = await self._async_client.chat.completions.create(
+                **self._json_request(messages, model, schema, temperature, max_tokens)
+            )
+            return self._json_response(response, schema)
+        except Exception as e:
+            raise ProviderError(f"Groq JSON completion failed: {str(e)}")
@@ -38,24 +38,24 @@ class HuggingFaceProvider(LLMInterface):
     def _setup_client(self) -> None:
         """Initialize HuggingFace client"""
         try:
-            self.client = OpenAI(
+            self.client = self._shared_client("huggingface.sync", lambda: OpenAI(
                 api_key=self.config.api_key,
                 base_url="https://api-inference.huggingface.co/v1/",
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize HuggingFace client: {str(e)}")
 
     async def _asetup_client(self) -> None:
         """Initialize async HuggingFace client"""
         try:
-            self._async_client = AsyncOpenAI(
+            self._async_client = self._shared_client("huggingface.async", lambda: AsyncOpenAI(
                 api_key=self.config.api_key,
                 base_url="https://api-inference.huggingface.co/v1/",
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize async HuggingFace client: {str(e)}")
 
@@ -117,7 +117,7 @@ class HuggingFaceProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._format_tool_list(tools)
 
                 try:
                     response = await self._async_client.chat.completions.create(
@@ -493,7 +493,7 @@ class HuggingFaceProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._format_tool_list(tools)
 
                 try:
                     response = self.client.chat.completions.create(
@@ -2,7 +2,7 @@
 
 import ast
 import json
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type
 
 from pydantic import BaseModel
 
@@ -13,9 +13,11 @@ from ..interface.schemas import (
     ModelResponse,
     ProviderConfig,
     Role,
+    StreamChunk,
     TokenUsage,
 )
-from ..interface.tools import BaseTool
+from ..interface.streaming import ToolCallAccumulator
+from ..interface.tools import BaseTool, dispatch_tool_calls
 from . import ProviderFactory
 
 
@@ -29,6 +31,8 @@ class OllamaFactory(ProviderFactory):
 class OllamaProvider(LLMInterface):
     """Ollama-specific provider implementation"""
 
+    supports_streaming = True
+
     def __init__(self, config: ProviderConfig, debug: bool = False):
         """Initialize provider with both sync and async clients"""
         super().__init__(config, debug)
@@ -38,38 +42,39 @@ class OllamaProvider(LLMInterface):
         """Initialize Ollama client"""
         try:
             from ollama import Client
-            self.client = Client(host=self.config.base_url or "http://localhost:11434")
+            self.client = self._shared_client(
+                "ollama.sync",
+                lambda: Client(host=self.config.base_url or "http://localhost:11434")
+            )
         except Exception as e:
             raise ProviderError(f"Failed to initialize Ollama client: {str(e)}")
 
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert messages to Ollama format"""
-        ollama_messages = []
-
-        for msg in messages:
-            if msg.role == Role.SYSTEM:
-                # Ollama handles system messages as special user messages
-                ollama_messages.append({
-                    "role": "system",
-                    "content": msg.content
-                })
-                continue
-
-            if msg.role == Role.TOOL:
-                # Format tool results
-                ollama_messages.append({
-                    "role": "tool",
-                    "content": msg.content,
-                    "name": msg.name
-                })
-            else:
-                # Format regular messages
-                ollama_messages.append({
-                    "role": "user" if msg.role == Role.USER else "assistant",
-                    "content": msg.content
-                })
-
-        return ollama_messages
+        return [msg.serialized("ollama", self._format_message) for msg in messages]
+
+    def _format_message(self, msg: Message) -> Dict[str, Any]:
+        """Convert a single message to Ollama format"""
+        if msg.role == Role.SYSTEM:
+            # Ollama handles system messages as special user messages
+            return {
+                "role": "system",
+                "content": msg.content
+            }
+
+        if msg.role == Role.TOOL:
+            # Format tool results
+            return {
+                "role": "tool",
+                "content": msg.content,
+                "name": msg.name
+            }
+
+        # Format regular messages
+        return {
+            "role": "user" if msg.role == Role.USER else "assistant",
+            "content": msg.content
+        }
 
     def _format_arguments(
             self,
@@ -135,7 +140,7 @@ class OllamaProvider(LLMInterface):
             response = self.client.chat(
                 model=model,
                 messages=self._format_messages(messages),
-                tools=[tool.get_schema() for tool in tools],
+                tools=self._format_tool_list(tools),
                 options=options,
                 stream=False
             )
@@ -264,9 +269,9 @@ class OllamaProvider(LLMInterface):
         """Initialize async Ollama client"""
         from ollama import AsyncClient
         try:
-            self._async_client = AsyncClient(
+            self._async_client = self._shared_client("ollama.async", lambda: AsyncClient(
                 host=self.config.base_url or "http://localhost:11434",
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize async Ollama client: {str(e)}")
 
@@ -294,6 +299,57 @@ class OllamaProvider(LLMInterface):
         except Exception as e:
             raise ProviderError(f"Ollama async completion failed: {str(e)}")
 
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn"""
+        await self._ensure_async_client()
+        request = {
+            "model": model,
+            "messages": self._format_messages(messages),
+            "options": {"temperature": temperature},
+            "stream": True
+        }
+        if tools:
+            request["tools"] = self._format_tool_list(tools)
+
+        tool_calls = ToolCallAccumulator()
+        usage = None
+        finish_reason = None
+
+        try:
+            async for part in await self._async_client.chat(**request):
+                message = part.message
+                # Ollama sends each tool call whole, without an ID
+                for tool_call in message.tool_calls or []:
+                    index = len(tool_calls)
+                    tool_calls.add(
+                        index,
+                        call_id=str(index),
+                        name=tool_call.function.name,
+                        arguments=self._format_arguments(tool_call.function.arguments)
+                    )
+                if message.content:
+                    yield StreamChunk(content=message.content)
+                if part.done:
+                    finish_reason = part.done_reason
+                    prompt_tokens = part.prompt_eval_count or 0
+                    completion_tokens = part.eval_count or 0
+                    usage = TokenUsage(
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=prompt_tokens + completion_tokens
+                    )
+        except Exception as e:
+            raise ProviderError(f"Ollama streaming completion failed: {str(e)}")
+
+        yield StreamChunk(tool_calls=tool_calls.build(), usage=usage, finish_reason=finish_reason)
+
     async def _aget_json_completion(
             self,
             messages,
@@ -370,7 +426,7 @@ class OllamaProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._format_tool_list(tools)
 
                 try:
                     response = await self._async_client.chat(
@@ -408,35 +464,29 @@ class OllamaProvider(LLMInterface):
                         tool_calls=tool_call_data
                     ))
 
-                    # Process each tool call
-                    for id, tool_call in enumerate(response.message.tool_calls):
-                        tool = next(
-                            (t for t in tools if t.name == tool_call.function.name),
-                            None
-                        )
-
-                        if tool:
-                            args = json.loads(self._format_arguments(tool_call.function.arguments))
-                            result = await tool.arun(**args)  # Use async tool call
-
-                            if self.debug:
-                                print(f"Tool {tool.name} returned: {result}")
-
-                            # Add the tool's response
-                            current_messages.append(Message(
-                                role=Role.TOOL,
-                                content=json.dumps(result) if isinstance(result, dict) else str(result),
-                                tool_call_id=str(id),
-                                name=tool_call.function.name
-                            ))
-
-                            # Store tool call for final response
-                            call_data = next(
-                                c for c in tool_call_data
-                                if c["id"] == str(id)
-                            )
-                            call_data["result"] = json.dumps(result) if isinstance(result, dict) else str(result)
-                            all_tool_calls.append(call_data)
+                    # Run the tool calls concurrently, keeping the model's order
+                    executed = await dispatch_tool_calls(
+                        tool_call_data,
+                        tools,
+                        lambda tool, call: tool.arun(**json.loads(call["function"]["arguments"])),
+                        self.max_tool_concurrency
+                    )
+                    for call_data, tool, result in executed:
+                        if self.debug:
+                            print(f"Tool {tool.name} returned: {result}")
+
+                        # Add the tool's response
+                        result_content = json.dumps(result) if isinstance(result, dict) else str(result)
+                        current_messages.append(Message(
+                            role=Role.TOOL,
+                            content=result_content,
+                            tool_call_id=call_data["id"],
+                            name=call_data["function"]["name"]
+                        ))
+
+                        # Store tool call for final response
+                        call_data["result"] = result_content
+                        all_tool_calls.append(call_data)
                     continue
 
                 # No more tool calls - get final response
@@ -1,21 +1,26 @@
 # File: llm_kit/providers/openai.py
 
 import json
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion
 from pydantic import BaseModel
 
 from ..errors import ProviderError
 from ..interface.base import LLMInterface
+from ..interface.batch_jobs import BatchJobBackend, BatchRequest, BatchStatus
 from ..interface.schemas import (
     Message,
     ModelResponse,
     ProviderConfig,
     Role,
+    StreamChunk,
     TokenUsage,
 )
-from ..interface.tools import BaseTool
+from ..interface.streaming import iter_openai_stream
+from ..interface.tokens import TiktokenCounter, TokenCounter
+from ..interface.tools import BaseTool, dispatch_tool_calls
 from .factory import ProviderFactory
 
 
@@ -26,9 +31,64 @@ class OpenAIFactory(ProviderFactory):
         """Create a new OpenAI provider instance"""
         return OpenAIProvider(config=config or ProviderConfig(), **kwargs)
 
+class OpenAIBatchBackend(BatchJobBackend):
+    """Batch jobs through the OpenAI Batch API"""
+
+    _STATUSES = {
+        "validating": BatchStatus.PENDING,
+        "in_progress": BatchStatus.RUNNING,
+        "finalizing": BatchStatus.RUNNING,
+        "cancelling": BatchStatus.RUNNING,
+        "completed": BatchStatus.COMPLETED,
+        "failed": BatchStatus.FAILED,
+        "expired": BatchStatus.EXPIRED,
+        "cancelled": BatchStatus.CANCELLED
+    }
+
+    def __init__(self, provider: "OpenAIProvider", completion_window: str = "24h"):
+        self.provider = provider
+        self.completion_window = completion_window
+
+    async def _client(self) -> AsyncOpenAI:
+        await self.provider._ensure_async_client()
+        return self.provider._async_client
+
+    async def submit(self, lines: List[Dict[str, Any]]) -> str:
+        client = await self._client()
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode()
+        input_file = await client.files.create(file=("batch.jsonl", data), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=OpenAIProvider.BATCH_ENDPOINT,
+            completion_window=self.completion_window
+        )
+        return batch.id
+
+    async def status(self, job_id: str) -> Tuple[BatchStatus, Dict[str, Any]]:
+        batch = await (await self._client()).batches.retrieve(job_id)
+        return self._STATUSES.get(batch.status, BatchStatus.RUNNING), batch.model_dump()
+
+    async def results(self, job_id: str) -> List[Dict[str, Any]]:
+        client = await self._client()
+        batch = await client.batches.retrieve(job_id)
+        lines = []
+        # Successful requests go to the output file, failed ones to the error file
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await client.files.content(file_id)
+                lines.extend(json.loads(raw) for raw in content.text.splitlines() if raw.strip())
+        return lines
+
+    async def cancel(self, job_id: str) -> None:
+        await (await self._client()).batches.cancel(job_id)
+
 class OpenAIProvider(LLMInterface):
     """OpenAI-specific implementation of the LLM interface"""
 
+    supports_streaming = True
+    batch_format = "openai"
+    BATCH_ENDPOINT = "/v1/chat/completions"
+
     def __init__(self, config: ProviderConfig, debug: bool = False):
         """Initialize provider with both sync and async clients"""
         super().__init__(config, debug)
@@ -37,26 +97,26 @@ class OpenAIProvider(LLMInterface):
     def _setup_client(self) -> None:
         """Initialize OpenAI client"""
         try:
-            self.client = OpenAI(
+            self.client = self._shared_client("openai.sync", lambda: OpenAI(
                 api_key=self.config.api_key,
                 base_url=self.config.base_url,
                 organization=self.config.organization_id,
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize OpenAI client: {str(e)}")
 
     async def _asetup_client(self) -> None:
         """Initialize async OpenAI client"""
         try:
-            self._async_client = AsyncOpenAI(
+            self._async_client = self._shared_client("openai.async", lambda: AsyncOpenAI(
                 api_key=self.config.api_key,
                 base_url=self.config.base_url,
                 organization=self.config.organization_id,
                 timeout=self.config.timeout,
                 max_retries=self.config.max_retries
-            )
+            ))
         except Exception as e:
             raise ProviderError(f"Failed to initialize async OpenAI client: {str(e)}")
 
@@ -77,7 +137,7 @@ class OpenAIProvider(LLMInterface):
             await self._ensure_async_client()
             response = await self._async_client.chat.completions.create(
                 model=model,
-                messages=[msg.model_dump() for msg in messages],
+                messages=[msg.cached_dump() for msg in messages],
                 temperature=temperature,
                 max_tokens=max_tokens
             )
@@ -91,6 +151,34 @@ class OpenAIProvider(LLMInterface):
         except Exception as e:
             raise ProviderError(f"OpenAI async completion failed: {str(e)}")
 
+    async def _astream_turn(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Optional[Sequence[BaseTool]],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model turn"""
+        await self._ensure_async_client()
+        request = {
+            "model": model,
+            "messages": self._format_messages(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+        if tools:
+            request["tools"] = self._format_tool_list(tools)
+
+        try:
+            stream = await self._async_client.chat.completions.create(**request)
+            async for chunk in iter_openai_stream(stream):
+                yield chunk
+        except Exception as e:
+            raise ProviderError(f"OpenAI streaming completion failed: {str(e)}")
+
     async def _aget_tool_completion(
         self,
         messages: List[Message],
@@ -116,7 +204,7 @@ class OpenAIProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._format_tool_list(tools)
 
                 try:
                     response = await self._async_client.chat.completions.create(
@@ -156,35 +244,29 @@ class OpenAIProvider(LLMInterface):
                         tool_calls=tool_call_data
                     ))
 
-                    # Process each tool call
-                    for tool_call in choice.message.tool_calls:
-                        tool = next(
-                            (t for t in tools if t.name == tool_call.function.name),
-                            None
-                        )
-
-                        if tool:
-                            args = json.loads(tool_call.function.arguments)
-                            result = await tool.arun(**args)  # Use async tool call
-
-                            if self.debug:
-                                print(f"Tool {tool.name} returned: {result}")
-
-                            # Add the tool's response
-                            current_messages.append(Message(
-                                role=Role.TOOL,
-                                content=json.dumps(result) if isinstance(result, dict) else str(result),
-                                tool_call_id=tool_call.id,
-                                name=tool_call.function.name
-                            ))
-
-                            # Store tool call for final response
-                            call_data = next(
-                                c for c in tool_call_data
-                                if c["id"] == tool_call.id
-                            )
-                            call_data["result"] = json.dumps(result) if isinstance(result, dict) else str(result)
-                            all_tool_calls.append(call_data)
+                    # Run the tool calls concurrently, keeping the model's order
+                    executed = await dispatch_tool_calls(
+                        tool_call_data,
+                        tools,
+                        lambda tool, call: tool.arun(**json.loads(call["function"]["arguments"])),
+                        self.max_tool_concurrency
+                    )
+                    for call_data, tool, result in executed:
+                        if self.debug:
+                            print(f"Tool {tool.name} returned: {result}")
+
+                        # Add the tool's response
+                        result_content = json.dumps(result) if isinstance(result, dict) else str(result)
+                        current_messages.append(Message(
+                            role=Role.TOOL,
+                            content=result_content,
+                            tool_call_id=call_data["id"],
+                            name=call_data["function"]["name"]
+                        ))
+
+                        # Store tool call for final response
+                        call_data["result"] = result_content
+                        all_tool_calls.append(call_data)
                     continue
 
                 # No more tool calls - get final response
@@ -232,7 +314,7 @@ class OpenAIProvider(LLMInterface):
 
             # Add remaining messages, skipping system
             openai_messages.extend([
-                msg.model_dump() for msg in messages
+                msg.cached_dump() for msg in messages
                 if msg.role != Role.SYSTEM
             ])
 
@@ -261,6 +343,49 @@ class OpenAIProvider(LLMInterface):
         except Exception as e:
             raise ProviderError(f"OpenAI async JSON completion failed: {str(e)}")
 
+    def get_token_counter(self, model: Optional[str] = None) -> TokenCounter:
+        """Count tokens with tiktoken when it is installed"""
+        try:
+            return TiktokenCounter(model or self.config.model or "gpt-4o")
+        except ImportError:
+            return super().get_token_counter(model)
+
+    def _batch_request(self, custom_id: str, request: BatchRequest) -> Dict[str, Any]:
+        """Serialize a request as one line of an OpenAI batch input file"""
+        model = request.model or self.config.model
+        if not model:
+            raise ValueError("Batch requests need a model")
+
+        body = {
+            "model": model,
+            "messages": self._format_messages(request.messages),
+            "temperature": request.temperature
+        }
+        if request.max_tokens is not None:
+            body["max_tokens"] = request.max_tokens
+        return {"custom_id": custom_id, "method": "POST", "url": self.BATCH_ENDPOINT, "body": body}
+
+    def _batch_response(self, line: Dict[str, Any]) -> Tuple[str, Union[ModelResponse, Exception]]:
+        """Parse one line of an OpenAI batch output or error file"""
+        custom_id = line["custom_id"]
+        response = line.get("response") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            error = line.get("error") or (response.get("body") or {}).get("error") or {}
+            message = error.get("message") or f"status {response.get('status_code')}"
+            return custom_id, ProviderError(f"OpenAI batch request {custom_id} failed: {message}")
+
+        completion = ChatCompletion.model_validate(response["body"])
+        return custom_id, ModelResponse(
+            content=self._extract_content(completion),
+            raw_response=self._response_to_dict(completion),
+            usage=self._extract_usage(completion),
+            tool_calls=self._extract_tool_calls(completion)
+        )
+
+    def _batch_backend(self) -> BatchJobBackend:
+        """Get the OpenAI Batch API transport"""
+        return OpenAIBatchBackend(self)
+
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert messages to OpenAI format"""
         openai_messages = []
@@ -277,24 +402,28 @@ class OpenAIProvider(LLMInterface):
         # Add remaining messages in order
         for msg in messages:
             if msg.role != Role.SYSTEM:
-                msg_dict = {
-                    "role": msg.role,
-                    "content": msg.content
-                }
+                openai_messages.append(msg.serialized("openai", self._format_message))
+
+        return openai_messages
 
-                # Add tool calls if present
-                if msg.tool_calls:
-                    msg_dict["tool_calls"] = msg.tool_calls
+    def _format_message(self, msg: Message) -> Dict[str, Any]:
+        """Convert a single non-system message to OpenAI format"""
+        msg_dict = {
+            "role": msg.role,
+            "content": msg.content
+        }
 
-                # Add tool call id and name if present
-                if msg.tool_call_id:
-                    msg_dict["tool_call_id"] = msg.tool_call_id
-                if msg.name:
-                    msg_dict["name"] = msg.name
+        # Add tool calls if present
+        if msg.tool_calls:
+            msg_dict["tool_calls"] = msg.tool_calls
 
-                openai_messages.append(msg_dict)
+        # Add tool call id and name if present
+        if msg.tool_call_id:
+            msg_dict["tool_call_id"] = msg.tool_call_id
+        if msg.name:
+            msg_dict["name"] = msg.name
 
-        return openai_messages
+        return msg_dict
 
     def _get_chat_completion(
         self,
@@ -307,7 +436,7 @@ class OpenAIProvider(LLMInterface):
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[msg.model_dump() for msg in messages],
+                messages=[msg.cached_dump() for msg in messages],
                 temperature=temperature,
                 max_tokens=max_tokens
             )
@@ -345,7 +474,7 @@ class OpenAIProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._format_tool_list(tools)
 
                 try:
                     response = self.client.chat.completions.create(
@@ -460,7 +589,7 @@ class OpenAIProvider(LLMInterface):
 
             # Add remaining messages, skipping system
             openai_messages.extend([
-                msg.model_dump() for msg in messages
+                msg.cached_dump() for msg in messages
                 if msg.role != Role.SYSTEM
             ])
 
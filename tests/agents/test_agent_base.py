@@ -1,13 +1,17 @@
+import asyncio
+import json
 import sys
+import time
 
 import pytest
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 
 from legion.agents.base import Agent
-from legion.interface.schemas import Message, ModelResponse, Role, SystemPrompt, SystemPromptSection
-from legion.interface.tools import BaseTool
-from legion.memory.providers.memory import ConversationMemory
+from legion.interface.cache import ResponseCache
+from legion.interface.schemas import Message, ModelResponse, Role, StreamChunk, SystemPrompt, SystemPromptSection
+from legion.interface.tools import BaseTool, _parameters_schema
+from legion.memory.providers.memory import ConversationMemory, InMemoryProvider
 
 # Load environment variables
 load_dotenv()
@@ -137,6 +141,123 @@ def test_enhanced_prompt(agent_with_tools):
     assert "simple_tool" in enhanced
     assert "A simple test tool" in enhanced
 
+def test_enhanced_prompt_is_memoized(agent_with_tools):
+    """Test the prompt is re-rendered only when its inputs change"""
+    agent_with_tools.system_prompt = SystemPrompt(sections=[
+        SystemPromptSection(content="Hello {name}", is_dynamic=True)
+    ])
+    calls = 0
+    render = agent_with_tools.system_prompt.render
+
+    def counting_render(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return render(*args, **kwargs)
+
+    object.__setattr__(agent_with_tools.system_prompt, "render", counting_render)
+
+    first = agent_with_tools._build_enhanced_prompt({"name": "Ada"})
+    assert agent_with_tools._build_enhanced_prompt({"name": "Ada"}) == first
+    assert calls == 1
+
+    assert "Grace" in agent_with_tools._build_enhanced_prompt({"name": "Grace"})
+    agent_with_tools.tools = []
+    assert "simple_tool" not in agent_with_tools._build_enhanced_prompt({"name": "Grace"})
+    assert calls == 3
+
+def test_enhanced_prompt_callable_sections_not_memoized(agent):
+    """Test callable sections are rendered on every call"""
+    counter = iter(range(10))
+    agent.system_prompt = SystemPrompt(sections=[
+        SystemPromptSection(content=lambda: str(next(counter)), is_dynamic=True)
+    ])
+
+    assert agent._build_enhanced_prompt() != agent._build_enhanced_prompt()
+
+@pytest.mark.parametrize("history", [10, 100, 1000])
+def test_turn_overhead_benchmark(agent, history):
+    """Benchmark preparing and formatting a turn against a long history"""
+    for i in range(history):
+        agent.memory.add_message(Message(role=Role.USER if i % 2 else Role.ASSISTANT, content=f"message {i}"))
+
+    formatted = 0
+    format_message = agent.llm._format_message
+
+    def counting_format(msg):
+        nonlocal formatted
+        formatted += 1
+        return format_message(msg)
+
+    agent.llm._format_message = counting_format
+
+    def turn():
+        agent._prepare_turn("next", {"name": "Ada"})
+        return agent.llm._format_messages(agent.memory.messages)
+
+    start = time.perf_counter()
+    turn()
+    cold = time.perf_counter() - start
+    first_pass = formatted
+
+    start = time.perf_counter()
+    turn()
+    warm = time.perf_counter() - start
+
+    print(f"{history} messages: first turn {cold * 1000:.2f}ms, next turn {warm * 1000:.2f}ms")
+    # Only the new user message is formatted on the second turn
+    assert formatted - first_pass == 1
+
+def _tool_set(count):
+    """Build tools with distinct parameter models"""
+    tools = []
+    for i in range(count):
+        params = create_model(f"Tool{i}Params", query=(str, ...), limit=(int, 10), api_key=(str, ""))
+        tool = SimpleTool()
+        tool.name = f"tool_{i}"
+        tool.parameters = params
+        tool.injected_params = {"api_key"}
+        tools.append(tool)
+    return tools
+
+def test_tool_format_cache_benchmark(agent):
+    """Benchmark formatting a 30-tool agent's tools on every round of the tool loop"""
+    agent.tools = _tool_set(30)
+    builds = _parameters_schema.cache_info().misses
+
+    start = time.perf_counter()
+    first = agent.llm._format_tool_list(agent.tools)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        rounds = agent.llm._format_tool_list(agent.tools)
+    warm = (time.perf_counter() - start) / 100
+
+    print(f"30 tools: first round {cold * 1000:.2f}ms, next rounds {warm * 1000:.3f}ms")
+    assert rounds is first
+    assert _parameters_schema.cache_info().misses - builds == 30
+    assert "api_key" not in first[0]["function"]["parameters"]["properties"]
+
+    # Providers with their own format are cached separately
+    names = agent.llm._format_tool_list(agent.tools, lambda tools: [tool.name for tool in tools])
+    assert names == [f"tool_{i}" for i in range(30)]
+    assert agent.llm._format_tool_list(agent.tools) is first
+
+def test_tool_format_cache_invalidation(agent):
+    """Test reassigning, extending or changing tools rebuilds the formatted list"""
+    agent.tools = _tool_set(2)
+    first = agent.llm._format_tool_list(agent.tools)
+
+    agent.tools = agent.tools[:1]
+    assert [t["function"]["name"] for t in agent.llm._format_tool_list(agent.tools)] == ["tool_0"]
+
+    agent.tools.append(SimpleTool())
+    assert len(agent.llm._format_tool_list(agent.tools)) == 2
+
+    agent.tools[0].description = "Changed"
+    assert agent.llm._format_tool_list(agent.tools)[0]["function"]["description"] == "Changed"
+    assert agent.llm._format_tool_list(agent.tools) is not first
+
 def test_basic_completion(agent):
     # Test basic message completion
     response = agent.process("Say 'Hello, World!'")
@@ -235,6 +356,207 @@ async def test_memory_provider_integration(agent):
     assert agent.memory_provider is None
     assert isinstance(agent._memory, ConversationMemory)
 
+@pytest.mark.asyncio
+async def test_aprocess_stream_updates_memory(agent):
+    tool_call = {
+        "id": "call_1",
+        "type": "function",
+        "function": {"name": "simple_tool", "arguments": '{"message": "hi"}'},
+        "result": "Tool response: hi"
+    }
+    final = ModelResponse(content="Hello there", tool_calls=[tool_call])
+    seen = {}
+
+    async def fake_astream(messages, **kwargs):
+        seen["messages"] = list(messages)
+        yield StreamChunk(content="Hello")
+        yield StreamChunk(tool_calls=[tool_call])
+        yield StreamChunk(content=" there")
+        yield StreamChunk(finish_reason="stop", response=final)
+
+    agent.llm.astream = fake_astream
+
+    chunks = [chunk async for chunk in agent.aprocess_stream("Hi")]
+
+    assert "".join(c.content for c in chunks) == "Hello there"
+    assert chunks[-1].response is final
+    # The request included the system prompt and the new user message
+    assert seen["messages"][0].role == Role.SYSTEM
+    assert seen["messages"][-1].content == "Hi"
+
+    assistant, tool = agent.memory.messages[-2:]
+    assert assistant.role == Role.ASSISTANT
+    assert assistant.content == "Hello there"
+    assert tool.role == Role.TOOL
+    assert tool.tool_call_id == "call_1"
+    assert tool.content == "Tool response: hi"
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently(agent):
+    in_flight = 0
+    peak = 0
+
+    class SlowTool(BaseTool):
+        def __init__(self):
+            super().__init__(name="slow_tool", description="A slow tool", parameters=SimpleToolParams)
+
+        def run(self, message: str) -> str:
+            return message
+
+        async def arun(self, message: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later calls finish first
+            await asyncio.sleep(0.05 / (len(message)))
+            in_flight -= 1
+            return message
+
+    agent.tools = [SlowTool()]
+    agent.max_tool_concurrency = 2
+    tool_calls = [
+        {
+            "id": f"call_{i}",
+            "type": "function",
+            "function": {"name": "slow_tool", "arguments": json.dumps({"message": "x" * (i + 1)})}
+        }
+        for i in range(4)
+    ]
+
+    async def fake_acomplete(**kwargs):
+        return ModelResponse(content="Done", tool_calls=tool_calls)
+
+    agent.llm.acomplete = fake_acomplete
+    await agent.aprocess("Use the tool")
+
+    assert peak == 2
+    tool_messages = [m for m in agent.memory.messages if m.role == Role.TOOL]
+    assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2", "call_3"]
+
+@pytest.mark.asyncio
+async def test_context_budget_trims_history(agent):
+    """Test only the recent history within the budget is sent"""
+    agent.context_budget = 40
+    for i in range(50):
+        agent.memory.add_message(Message(role=Role.USER, content=f"earlier message number {i}"))
+
+    sent = []
+
+    async def fake_acomplete(messages, **kwargs):
+        sent.append(messages)
+        return ModelResponse(content="Done")
+
+    agent.llm.acomplete = fake_acomplete
+    await agent.aprocess("latest")
+
+    messages = sent[0]
+    assert messages[0].role == Role.SYSTEM
+    assert messages[-1].content == "latest"
+    assert len(messages) < 10
+    assert agent.token_counter.count_messages(messages) <= 40
+    assert len(agent.memory.messages) == 53
+
+@pytest.mark.asyncio
+async def test_thread_state_persists_only_new_messages(agent):
+    """Test later turns append new messages and keep memory warm"""
+    provider = InMemoryProvider()
+    agent._memory_provider = provider
+    thread_id = await provider.create_thread(agent.name)
+
+    async def fake_acomplete(**kwargs):
+        return ModelResponse(content="Reply")
+
+    agent.llm.acomplete = fake_acomplete
+    loads, appends = [], []
+    load_state, append_messages = provider.load_state, provider.append_messages
+
+    async def spy_load(*args, **kwargs):
+        loads.append(args)
+        return await load_state(*args, **kwargs)
+
+    async def spy_append(entity_id, thread_id, messages, since_version=None, updates=None):
+        appends.append(len(messages))
+        return await append_messages(entity_id, thread_id, messages, since_version, updates)
+
+    provider.load_state = spy_load
+    provider.append_messages = spy_append
+
+    await agent.aprocess("first", thread_id=thread_id)
+    first_saved = (await load_state(agent.name, thread_id))["last_updated"]
+    await asyncio.sleep(0.001)
+    await agent.aprocess("second", thread_id=thread_id)
+    await agent.aprocess("third", thread_id=thread_id)
+
+    # Only the first turn loads; later turns append the user message and reply
+    assert len(loads) == 1
+    assert appends == [2, 2]
+    state = await load_state(agent.name, thread_id)
+    assert state["last_updated"] > first_saved
+    assert [m["content"] for m in state["messages"][1:]] == ["first", "Reply", "second", "Reply", "third", "Reply"]
+
+    # A write from elsewhere forces a full reload
+    await provider.save_state(agent.name, thread_id, {"messages": state["messages"][:3]})
+    await agent.aprocess("fourth", thread_id=thread_id)
+    assert len(loads) == 2
+    assert [m.content for m in agent.memory.messages[1:]] == ["first", "Reply", "fourth", "Reply"]
+
+@pytest.mark.asyncio
+async def test_response_cache_shared_between_agents():
+    """Test an identical request from another agent is served from the shared cache"""
+    cache = ResponseCache()
+    agents = [
+        Agent(name="cached", model="gpt-4o-mini", temperature=0.0, response_cache=cache)
+        for _ in range(2)
+    ]
+    calls = []
+
+    async def fake_acomplete(messages, model, response_schema, tools, temperature, max_tokens):
+        calls.append(model)
+        return ModelResponse(content="Cached reply")
+
+    for cached_agent in agents:
+        assert cached_agent.llm.response_cache is cache
+        cached_agent.llm._acomplete = fake_acomplete
+
+    responses = [await cached_agent.aprocess("Hello") for cached_agent in agents]
+
+    assert [response.content for response in responses] == ["Cached reply", "Cached reply"]
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_abatch_isolates_requests_and_keeps_order(agent):
+    """Test batch requests each see only the system prompt and their own message"""
+    active, peak = 0, 0
+
+    async def fake_acomplete(messages, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if messages[-1].content == "fail":
+            raise ValueError("provider error")
+        return ModelResponse(content=f"{messages[-1].content}:{len(messages)}")
+
+    agent.llm.acomplete = fake_acomplete
+    system = agent.memory.messages[0]
+    inputs = [f"input {i}" for i in range(20)] + ["fail"]
+
+    results = await agent.abatch(inputs, concurrency=5)
+
+    assert [result.output.content for result in results[:-1]] == [f"input {i}:2" for i in range(20)]
+    assert not results[-1].ok
+    assert isinstance(results[-1].error, ValueError)
+    assert peak == 5
+    # The agent's own memory is untouched, and its system message was shared rather than copied
+    assert agent.memory.messages == [system]
+    assert system.content == agent._build_enhanced_prompt()
+
+    streamed = [result async for result in agent.abatch_stream(inputs[:4], concurrency=2)]
+    assert sorted(result.index for result in streamed) == [0, 1, 2, 3]
+    assert all(result.output.content.endswith(":2") for result in streamed)
+
 def test_debug_mode():
     # Test agent with debug mode enabled
     agent = Agent(name="test", model="gpt-4o-mini", debug=True)
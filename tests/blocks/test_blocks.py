@@ -1,4 +1,5 @@
 import asyncio
+import os
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -6,6 +7,7 @@ from pydantic import BaseModel
 
 from legion import block
 from legion.blocks.base import BlockError, BlockMetadata, FunctionalBlock, ValidationError
+from legion.interface.executors import ExecutorKind, executor_registry
 
 
 # Test Models
@@ -43,6 +45,11 @@ def complex_processor(data: ComplexInput) -> Dict[str, Any]:
         "items_count": len(data.numbers)
     }
 
+@block(process=True)
+def process_block(data: SimpleInput) -> Dict[str, str]:
+    """Block run in a worker process"""
+    return {"result": f"{data.value} in {os.getpid()}"}
+
 # Test Fixtures
 @pytest.fixture
 def simple_metadata():
@@ -273,5 +280,37 @@ async def test_block_concurrent_execution():
 
     assert results == delays
 
+@pytest.mark.asyncio
+async def test_block_runs_in_named_executor():
+    """Test sync blocks run in their own named thread pool"""
+    @block(name="pooled_block", executor="test.blocks.pool")
+    def pooled_block(value: str) -> str:
+        return value.upper()
+
+    assert await pooled_block("a") == "A"
+    assert executor_registry.stats()["test.blocks.pool"]["completed"] == 1
+
+@pytest.mark.asyncio
+async def test_process_block_execution():
+    """Test a module-level block can run in a process pool"""
+    result = await process_block(SimpleInput(value="x"))
+
+    assert result["result"].startswith("x in ")
+    assert result["result"] != f"x in {os.getpid()}"
+    assert executor_registry.get("block.process_block", ExecutorKind.PROCESS).stats()["completed"] == 1
+    executor_registry.get("block.process_block", ExecutorKind.PROCESS).shutdown()
+
+def test_process_block_rejects_unpicklable_functions():
+    """Test process mode is rejected for functions other processes cannot import"""
+    with pytest.raises(BlockError):
+        @block(process=True)
+        def local_block(value: str) -> str:
+            return value
+
+    with pytest.raises(BlockError):
+        @block(process=True)
+        async def async_block(value: str) -> str:
+            return value
+
 if __name__ == "__main__":
     pytest.main(["-v"])
@@ -1,11 +1,17 @@
 """Tests for execution manager."""
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from legion.exceptions import FatalError, NodeError
 from legion.graph.nodes.base import NodeBase, NodeStatus
-from legion.graph.nodes.execution import ExecutionHook, ExecutionManager, ExecutionMode
+from legion.graph.nodes.execution import (
+    ErrorPolicy,
+    ExecutionHook,
+    ExecutionManager,
+    ExecutionMode,
+)
 from legion.graph.nodes.registry import NodeRegistry
 from legion.graph.retry import RetryPolicy, RetryStrategy
 from legion.graph.state import GraphState
@@ -185,5 +191,183 @@ async def test_checkpointing(execution_manager):
     assert not execution_manager.metadata.is_running
     assert execution_manager.metadata.current_node is None
 
+def make_parallel_manager(graph_state, **kwargs):
+    """Create a parallel execution manager for testing"""
+    return ExecutionManager(
+        graph_state,
+        NodeRegistry(graph_state),
+        mode=ExecutionMode.PARALLEL,
+        node_retry_policy=RetryPolicy(
+            max_retries=1,
+            strategy=RetryStrategy.IMMEDIATE
+        ),
+        **kwargs
+    )
+
+def make_timed_node(graph_state, node_id, log, delay=0.05):
+    """Create a test node that records its start and end"""
+    node = TestNode(graph_state)
+    node._metadata.node_id = node_id
+
+    async def run(**kwargs):
+        log.append(("start", node_id))
+        await asyncio.sleep(delay)
+        log.append(("end", node_id))
+        return {"result": node_id}
+
+    node.execute_mock.side_effect = run
+    return node
+
+@pytest.mark.asyncio
+async def test_parallel_execution_overlaps_independent_nodes(graph_state):
+    """Test independent nodes run concurrently"""
+    manager = make_parallel_manager(graph_state)
+    log = []
+    nodes = [make_timed_node(graph_state, f"node{i}", log) for i in range(5)]
+    for node in nodes:
+        manager._registry.register_node(node)
+
+    await manager.execute_all()
+
+    # Every node starts before any node finishes
+    assert [event for event, _ in log[:5]] == ["start"] * 5
+    assert all(node.status == NodeStatus.COMPLETED for node in nodes)
+    assert not manager.metadata.is_running
+    assert manager.metadata.running_nodes == []
+
+@pytest.mark.asyncio
+async def test_parallel_execution_respects_dependencies(graph_state):
+    """Test dependents only start after their dependencies complete"""
+    manager = make_parallel_manager(graph_state)
+    log = []
+    for node_id in ["root", "left", "right", "join"]:
+        manager._registry.register_node(make_timed_node(graph_state, node_id, log))
+
+    manager._registry.add_dependency("left", "root")
+    manager._registry.add_dependency("right", "root")
+    manager._registry.add_dependency("join", "left")
+    manager._registry.add_dependency("join", "right")
+
+    await manager.execute_all()
+
+    position = {entry: index for index, entry in enumerate(log)}
+    assert position[("end", "root")] < position[("start", "left")]
+    assert position[("end", "root")] < position[("start", "right")]
+    assert position[("end", "left")] < position[("start", "join")]
+    assert position[("end", "right")] < position[("start", "join")]
+    # Independent branches overlap
+    assert position[("start", "right")] < position[("end", "left")]
+
+@pytest.mark.asyncio
+async def test_parallel_execution_max_concurrency(graph_state):
+    """Test max concurrency bounds in-flight nodes"""
+    manager = make_parallel_manager(graph_state, max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def run(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    for _ in range(6):
+        node = TestNode(graph_state)
+        node.execute_mock.side_effect = run
+        manager._registry.register_node(node)
+
+    await manager.execute_all()
+
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_parallel_execution_retries_nodes(graph_state):
+    """Test parallel nodes use the node retry policy"""
+    manager = make_parallel_manager(graph_state)
+    node = TestNode(graph_state)
+    node.execute_mock.side_effect = [
+        NodeError("Transient", node.node_id),
+        {"result": "success"}
+    ]
+    manager._registry.register_node(node)
+
+    await manager.execute_all()
+
+    assert node.execute_mock.call_count == 2
+    assert node.status == NodeStatus.COMPLETED
+
+@pytest.mark.asyncio
+async def test_parallel_execution_fail_fast(graph_state):
+    """Test fail-fast policy cancels in-flight nodes and raises"""
+    manager = make_parallel_manager(graph_state)
+    log = []
+    failing = TestNode(graph_state)
+    failing._metadata.node_id = "failing"
+    failing.execute_mock.side_effect = NodeError("Boom", "failing")
+    slow = make_timed_node(graph_state, "slow", log, delay=1.0)
+    manager._registry.register_node(failing)
+    manager._registry.register_node(slow)
+
+    with pytest.raises(FatalError):
+        await manager.execute_all()
+
+    assert ("end", "slow") not in log
+    assert manager.metadata.failed_nodes == ["failing"]
+    assert manager.metadata.skipped_nodes == ["slow"]
+    assert not manager.metadata.is_running
+
+@pytest.mark.asyncio
+async def test_parallel_execution_fail_fast_keeps_nodes_finished_alongside(graph_state):
+    """Test nodes completing together with a failure are not reported as skipped"""
+    manager = make_parallel_manager(graph_state)
+    gate = asyncio.Event()
+
+    async def fail(**kwargs):
+        await gate.wait()
+        raise FatalError("Boom")
+
+    async def succeed(**kwargs):
+        await gate.wait()
+        return {"result": "done"}
+
+    failing = TestNode(graph_state)
+    failing._metadata.node_id = "failing"
+    failing.execute_mock.side_effect = fail
+    manager._registry.register_node(failing)
+    for node_id in ["first", "second"]:
+        node = TestNode(graph_state)
+        node._metadata.node_id = node_id
+        node.execute_mock.side_effect = succeed
+        manager._registry.register_node(node)
+
+    asyncio.get_running_loop().call_later(0.01, gate.set)
+    with pytest.raises(FatalError):
+        await manager.execute_all()
+
+    assert manager.metadata.failed_nodes == ["failing"]
+    assert manager.metadata.skipped_nodes == []
+
+@pytest.mark.asyncio
+async def test_parallel_execution_continue_on_error(graph_state):
+    """Test continue policy skips only dependents of failed nodes"""
+    manager = make_parallel_manager(graph_state, error_policy=ErrorPolicy.CONTINUE)
+    log = []
+    failing = TestNode(graph_state)
+    failing._metadata.node_id = "failing"
+    failing.execute_mock.side_effect = NodeError("Boom", "failing")
+    manager._registry.register_node(failing)
+    for node_id in ["child", "independent"]:
+        manager._registry.register_node(make_timed_node(graph_state, node_id, log))
+    manager._registry.add_dependency("child", "failing")
+
+    await manager.execute_all()
+
+    assert ("end", "independent") in log
+    assert ("start", "child") not in log
+    assert manager.metadata.failed_nodes == ["failing"]
+    assert manager.metadata.skipped_nodes == ["child"]
+    assert "Boom" in manager.metadata.error
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 from typing import List
 
@@ -15,6 +16,7 @@ from legion.graph.channels import (
     SharedState,
     ValueSequence,
 )
+from legion.graph.metadata import MetadataClock
 
 
 def test_channel_metadata():
@@ -27,6 +29,27 @@ def test_channel_metadata():
     assert metadata.version == 0
     assert metadata.type_hint == "str"
 
+def test_channel_metadata_tracks_writes_and_checkpoints():
+    """Test metadata reflects writes when read and survives a checkpoint round trip"""
+    channel = LastValue(type_hint=int)
+    created_at = channel.metadata.created_at
+
+    time.sleep(0.001)
+    channel.set(1)
+    channel.set(2)
+    metadata = channel.metadata
+    assert metadata.version == 2
+    assert metadata.created_at == created_at
+    assert metadata.updated_at > created_at
+
+    restored = LastValue(type_hint=int)
+    restored.restore(channel.checkpoint())
+    assert restored.metadata.model_dump() == metadata.model_dump()
+
+    restored.set(3)
+    assert restored.metadata.version == 3
+    assert restored.metadata.created_at == created_at
+
 def test_last_value_channel():
     """Test LastValue channel functionality"""
     channel = LastValue(type_hint=str)
@@ -126,6 +149,53 @@ def test_shared_state_channel():
     new_channel.restore(checkpoint)
     assert new_channel.get() == {"key": "value", "new_key": "new_value"}
 
+def test_reads_are_read_only_snapshots():
+    """Test readers get views that later writes don't change"""
+    sequence = ValueSequence(type_hint=int)
+    sequence.set([1, 2])
+    view = sequence.get_all()
+    sequence.append(3)
+
+    assert view == [1, 2]
+    assert sequence.get() == [1, 2, 3]
+    assert view[-1] == 2 and view[:1] == [1]
+    with pytest.raises(AttributeError):
+        view.append(4)
+
+    state = SharedState()
+    state.set({"key": "value"})
+    view = state.get()
+    state.update({"key": "changed"})
+
+    assert view == {"key": "value"}
+    assert state.get_key("key") == "changed"
+    assert state.get_key("missing", "default") == "default"
+    with pytest.raises(TypeError):
+        view["key"] = "other"
+
+def test_get_mut_and_checkpoints_are_not_aliased():
+    """Test owned copies and checkpoints don't change with the channel"""
+    state = SharedState()
+    state.set({"key": "value"})
+    owned = state.get_mut()
+    owned["key"] = "mine"
+    checkpoint = state.checkpoint()
+    state.update({"key": "changed"})
+
+    assert checkpoint["state"] == {"key": "value"}
+    assert state.get() == {"key": "changed"}
+
+    messages = MessageChannel(type_hint=str)
+    messages.push("a")
+    checkpoint = messages.checkpoint()
+    messages.push("b")
+    assert checkpoint["messages"] == ["a"]
+
+    # Views can be written back
+    copy = SharedState()
+    copy.set(state.get())
+    assert copy.get() == {"key": "changed"}
+
 def test_channel_isolation():
     """Test that channels maintain proper isolation"""
     # Test LastValue isolation
@@ -221,6 +291,44 @@ class TestMessageChannel:
         assert new_channel.get() == [1, 2]
         assert new_channel.available_capacity == 1
 
+    def test_views_survive_pops(self):
+        """Test a held view keeps its messages while the queue is drained"""
+        channel = MessageChannel[int](int)
+        channel.push_batch([1, 2, 3])
+        view = channel.get()
+
+        assert channel.pop() == 1
+        assert channel.pop_batch() == [2, 3]
+        assert view == [1, 2, 3]
+        assert channel.get() == []
+
+    def test_push_while_iterating_read(self):
+        """Test writing while looping over an unbound read doesn't mutate the loop"""
+        channel = MessageChannel[int](int)
+        channel.push_batch([1, 2, 3])
+
+        for message in channel.get():
+            channel.push(message * 10)
+        assert channel.get() == [1, 2, 3, 10, 20, 30]
+
+        for message in reversed(channel.get()):
+            channel.pop()
+        assert channel.get() == []
+
+    def test_checkpoint_format_is_unchanged(self):
+        """Test checkpoints hold plain lists and restore from lists"""
+        channel = MessageChannel[int](int)
+        assert channel.push_batch([1, 2, 3]) == 3
+
+        checkpoint = channel.checkpoint()
+        assert checkpoint["messages"] == [1, 2, 3]
+        assert isinstance(checkpoint["messages"], list)
+
+        sequence = ValueSequence(type_hint=int, max_size=2)
+        sequence.restore({"metadata": sequence.metadata.model_dump(), "values": [1, 2, 3], "max_size": 2})
+        assert sequence.get() == [2, 3]
+        assert isinstance(sequence.checkpoint()["values"], list)
+
 class TestBarrierChannel:
     def test_init(self):
         # Test valid initialization
@@ -734,3 +842,93 @@ class TestSharedMemory:
         # Test invalid checkpoint type
         with pytest.raises(ValueError):
             new_channel.restore({"type": "invalid"})
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+def _time_ops(operation, count: int = 1_000) -> float:
+    """Time one operation repeated count times, in microseconds per operation"""
+    start = time.perf_counter()
+    for i in range(count):
+        operation(i)
+    return (time.perf_counter() - start) / count * 1e6
+
+@pytest.mark.parametrize("size", SIZES)
+def test_message_channel_push_pop_benchmark(size):
+    """Benchmark push and pop on a queue already holding size messages"""
+    channel = MessageChannel[int](int)
+    channel.push_batch(list(range(size)))
+
+    push = _time_ops(channel.push)
+    popped = []
+    pop = _time_ops(lambda _: popped.append(channel.pop()))
+
+    print(f"MessageChannel with {size} messages: push {push:.2f}us, pop {pop:.2f}us")
+    assert popped == list(range(1_000))
+    assert len(channel.get()) == size
+
+@pytest.mark.parametrize("size", SIZES)
+def test_message_channel_batch_benchmark(size):
+    """Benchmark draining a full queue in batches"""
+    channel = MessageChannel[int](int)
+    channel.push_batch(list(range(size)))
+
+    start = time.perf_counter()
+    drained = 0
+    while channel.get():
+        drained += len(channel.pop_batch(1_000))
+    elapsed = time.perf_counter() - start
+
+    print(f"MessageChannel drain of {size} messages: {elapsed * 1000:.2f}ms")
+    assert drained == size
+
+@pytest.mark.parametrize("size", SIZES)
+def test_bounded_sequence_append_benchmark(size):
+    """Benchmark appending to a full bounded sequence, which drops the oldest value"""
+    sequence = ValueSequence(type_hint=int, max_size=size)
+    sequence.set(list(range(size)))
+
+    append = _time_ops(lambda i: sequence.append(size + i))
+
+    print(f"ValueSequence bounded at {size}: append {append:.2f}us")
+    values = sequence.get()
+    assert len(values) == size
+    assert values[0] == 1_000
+    assert values[-1] == size + 999
+
+@pytest.mark.parametrize("size", SIZES)
+def test_aggregator_window_benchmark(size):
+    """Benchmark contributing to a full aggregation window"""
+    channel = AggregatorChannel[int](int, reducer=lambda values: values[-1], window_size=size)
+    for i in range(size):
+        channel._values.append(i)
+
+    contribute = _time_ops(channel.contribute, count=100)
+
+    print(f"AggregatorChannel window of {size}: contribute {contribute:.2f}us")
+    assert len(channel.window) == size
+    assert channel.get() == 99
+
+def test_metadata_update_benchmark():
+    """Benchmark per-write metadata bookkeeping on the pydantic model against the clock"""
+    count = 100_000
+    model = ChannelMetadata()
+
+    def update_model(_):
+        # What every write did before the clock
+        model.updated_at = datetime.now()
+        model.version += 1
+
+    clock = MetadataClock()
+    before = _time_ops(update_model, count)
+    after = _time_ops(lambda _: clock.touch(), count)
+
+    channel = LastValue(type_hint=int)
+    write = _time_ops(channel.set, count)
+
+    print(
+        f"Metadata update per write: pydantic {before:.3f}us, clock {after:.3f}us; "
+        f"LastValue.set {write:.3f}us"
+    )
+    assert model.version == clock.version == count
+    assert channel.metadata.version == count
+    assert channel.metadata.updated_at >= channel.metadata.created_at
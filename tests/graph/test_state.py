@@ -61,6 +61,13 @@ def test_global_state():
     state.update_global_state({"new_key": "new_value"})
     assert state.get_global_state() == {"key": "value", "new_key": "new_value"}
 
+    # Point reads and owned copies
+    assert state.get_key("new_key") == "new_value"
+    assert state.get_key("missing") is None
+    owned = state.get_global_state_mut()
+    owned["key"] = "changed"
+    assert state.get_key("key") == "value"
+
 
 def test_checkpointing():
     """Test state checkpointing and restoration"""
@@ -12,6 +12,7 @@ from legion.agents.base import Agent
 from legion.errors import LegionError
 from legion.groups.chain import Chain
 from legion.interface.schemas import Message, ModelResponse, Role, SystemPrompt
+from legion.memory.providers.memory import InMemoryProvider
 from legion.monitoring.events.chain import (
     ChainBottleneckEvent,
     ChainCompletionEvent,
@@ -399,6 +400,58 @@ def test_chain_state_isolation():
     # Verify results are different
     assert result1.content != result2.content
 
+@pytest.mark.asyncio
+async def test_chain_abatch_isolates_agent_memory():
+    """Test batched inputs each run through the chain with fresh agent memories"""
+    def echo_agent(name: str, prefix: str) -> Agent:
+        member = Agent(name=name, model="gpt-4o-mini")
+
+        async def fake_acomplete(messages, **kwargs):
+            await asyncio.sleep(0.001)
+            if "boom" in messages[-1].content:
+                raise ValueError("step failed")
+            return ModelResponse(content=f"{prefix}({messages[-1].content}|{len(messages)})")
+
+        member.llm.acomplete = fake_acomplete
+        return member
+
+    chain = Chain(name="batch_chain", members=[echo_agent("first", "a"), echo_agent("second", "b")])
+
+    results = await chain.abatch(["x", "boom", "y"], concurrency=3)
+
+    assert results[0].output.content == "b(a(x|2)|2)"
+    assert results[2].output.content == "b(a(y|2)|2)"
+    assert not results[1].ok
+    assert all(len(member.memory.messages) == 1 for member in chain.members.values())
+
+    streamed = [result async for result in chain.abatch_stream(["x", "y"], concurrency=2)]
+    assert {result.output.content for result in streamed} == {"b(a(x|2)|2)", "b(a(y|2)|2)"}
+
+@pytest.mark.asyncio
+async def test_chain_abatch_leaves_memory_provider_thread_untouched():
+    """Test batched inputs neither save to nor desync an agent's stored thread"""
+    member = Agent(name="stored", model="gpt-4o-mini")
+    provider = InMemoryProvider()
+    member._memory_provider = provider
+    thread_id = await provider.create_thread(member.name)
+
+    async def fake_acomplete(messages, **kwargs):
+        await asyncio.sleep(0.001)
+        return ModelResponse(content=f"re:{messages[-1].content}")
+
+    member.llm.acomplete = fake_acomplete
+    follower = Agent(name="follower", model="gpt-4o-mini")
+    follower.llm.acomplete = fake_acomplete
+    chain = Chain(name="stored_chain", members=[member, follower])
+
+    results = await chain.abatch(["x", "y", "z"], concurrency=3)
+    assert all(result.ok for result in results)
+    assert member._current_thread is None
+
+    await member.aprocess("after", thread_id=thread_id)
+    state = await provider.load_state(member.name, thread_id)
+    assert [m["content"] for m in state["messages"][1:]] == ["after", "re:after"]
+
 def test_chain_event_emission():
     """Test chain event emission during processing"""
     chain = Chain(
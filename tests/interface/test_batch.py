@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from legion.interface.batch import iter_batch, run_batch
+
+
+async def _square(value: int) -> int:
+    # Later inputs finish first
+    await asyncio.sleep(0.01 * (5 - value % 5))
+    if value == 3:
+        raise ValueError("bad input")
+    return value * value
+
+@pytest.mark.asyncio
+async def test_run_batch_keeps_input_order_and_reports_failures():
+    """Test results come back in input order with failures attached"""
+    results = await run_batch(_square, range(10), concurrency=4)
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.output for result in results if result.ok] == [v * v for v in range(10) if v != 3]
+    failed = [result for result in results if not result.ok]
+    assert [result.input for result in failed] == [3]
+    assert isinstance(failed[0].error, ValueError)
+
+@pytest.mark.asyncio
+async def test_iter_batch_yields_as_completed_within_concurrency():
+    """Test results stream in completion order and concurrency is bounded"""
+    active, peak = 0, 0
+
+    async def track(value: int) -> int:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02 if value == 0 else 0.001)
+        active -= 1
+        return value
+
+    order = [result.output async for result in iter_batch(track, range(6), concurrency=2)]
+
+    assert sorted(order) == list(range(6))
+    assert order[-1] == 0
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_iter_batch_consumes_inputs_lazily_and_stops_early():
+    """Test breaking out of the stream cancels outstanding work"""
+    pulled = []
+    started = []
+
+    def inputs():
+        for value in range(1000):
+            pulled.append(value)
+            yield value
+
+    async def slow(value: int) -> int:
+        started.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async for _ in iter_batch(slow, inputs(), concurrency=3):
+        break
+
+    await asyncio.sleep(0.03)
+    assert len(pulled) < 10
+    assert len(started) < 10
+
+@pytest.mark.asyncio
+async def test_iter_batch_validates_concurrency_and_input_errors():
+    """Test invalid concurrency and failing input iterables raise"""
+    with pytest.raises(ValueError):
+        await run_batch(_square, range(3), concurrency=0)
+
+    def broken():
+        yield 1
+        raise RuntimeError("inputs failed")
+
+    with pytest.raises(RuntimeError, match="inputs failed"):
+        await run_batch(_square, broken(), concurrency=2)
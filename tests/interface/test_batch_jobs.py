@@ -0,0 +1,167 @@
+import json
+import time
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from legion.errors import ProviderError
+from legion.interface.batch_jobs import BatchRequest, BatchStatus, BatchSubmitter, FileBatchBackend
+from legion.interface.schemas import Message, ProviderConfig, Role
+from legion.providers.anthropic import AnthropicProvider
+from legion.providers.openai import OpenAIProvider
+from tests.utils import CountingLLM
+
+
+def _requests(count: int):
+    return [
+        [Message(role=Role.SYSTEM, content="Be brief"), Message(role=Role.USER, content=f"question {i}")]
+        for i in range(count)
+    ]
+
+def _reply(body):
+    content = body["messages"][-1]["content"]
+    if content == "question 2":
+        raise ValueError("model overloaded")
+    return f"answer to {content}"
+
+@pytest.fixture
+def openai_provider():
+    return OpenAIProvider(ProviderConfig(api_key="test", model="gpt-4o-mini"))
+
+@pytest.fixture
+def anthropic_provider():
+    return AnthropicProvider(ProviderConfig(api_key="test", model="claude-3-haiku-20240307"))
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider_fixture", ["openai_provider", "anthropic_provider"])
+async def test_batch_pipeline_through_file_backend(tmp_path, request, provider_fixture):
+    """Test requests are serialized, answered offline and mapped back in order"""
+    llm = request.getfixturevalue(provider_fixture)
+    backend = FileBatchBackend(tmp_path, llm.batch_format, reply=_reply, polls_until_done=2)
+    submitter = BatchSubmitter(llm, backend=backend, poll_interval=0)
+
+    results = await submitter.run(_requests(5))
+
+    assert [result.input for result in results] == [f"request-{i}" for i in range(5)]
+    assert [result.output.content for result in results if result.ok] == [
+        f"answer to question {i}" for i in (0, 1, 3, 4)
+    ]
+    assert isinstance(results[2].error, ProviderError)
+    assert "model overloaded" in str(results[2].error)
+    assert results[0].output.usage.total_tokens > 0
+
+    # The job's files are in the provider's JSONL format
+    job_dir = next(tmp_path.iterdir())
+    lines = [json.loads(raw) for raw in (job_dir / "input.jsonl").read_text().splitlines()]
+    assert len(lines) == 5
+    assert all(line["custom_id"].startswith("request-") for line in lines)
+
+@pytest.mark.asyncio
+async def test_batch_request_options_are_serialized(tmp_path, openai_provider):
+    """Test per-request model, temperature, token limit and ids reach the batch file"""
+    backend = FileBatchBackend(tmp_path, "openai")
+    submitter = BatchSubmitter(openai_provider, backend=backend, poll_interval=0)
+
+    job = await submitter.submit([BatchRequest(
+        messages=_requests(1)[0], model="gpt-4o", temperature=0.0, max_tokens=50, custom_id="first"
+    )])
+
+    line = json.loads((tmp_path / job.id / "input.jsonl").read_text())
+    assert line["custom_id"] == "first"
+    assert line["url"] == "/v1/chat/completions"
+    assert line["body"]["model"] == "gpt-4o"
+    assert line["body"]["temperature"] == 0.0
+    assert line["body"]["max_tokens"] == 50
+    assert line["body"]["messages"][0] == {"role": "system", "content": "Be brief"}
+
+    results = await submitter.collect(await submitter.wait(job))
+    assert results[0].output.content == "echo: question 0"
+
+@pytest.mark.asyncio
+async def test_batch_submit_validation(tmp_path, anthropic_provider):
+    """Test empty batches, duplicate ids and malformed lines are rejected"""
+    submitter = BatchSubmitter(anthropic_provider, backend=FileBatchBackend(tmp_path, "anthropic"))
+
+    with pytest.raises(ValueError):
+        await submitter.submit([])
+    with pytest.raises(ValueError, match="Duplicate"):
+        await submitter.submit([
+            BatchRequest(messages=_requests(1)[0], custom_id="same"),
+            BatchRequest(messages=_requests(1)[0], custom_id="same")
+        ])
+    with pytest.raises(ValueError, match="Invalid"):
+        await submitter.backend.submit([{"custom_id": "x", "params": {"model": "m"}}])
+    with pytest.raises(ValueError, match="Unknown"):
+        FileBatchBackend(tmp_path, "unknown")
+
+def test_batch_submitter_requires_batch_support(tmp_path):
+    """Test providers without a batch endpoint are rejected up front"""
+    with pytest.raises(ProviderError, match="CountingLLM does not support batch jobs"):
+        BatchSubmitter(CountingLLM())
+    with pytest.raises(ProviderError, match="does not support batch jobs"):
+        BatchSubmitter(CountingLLM(), backend=FileBatchBackend(tmp_path, "openai"))
+
+@pytest.mark.asyncio
+async def test_batch_wait_timeout_and_cancel(tmp_path, openai_provider):
+    """Test waiting gives up after the timeout and cancelled jobs report missing results"""
+    backend = FileBatchBackend(tmp_path, "openai", polls_until_done=100)
+    submitter = BatchSubmitter(openai_provider, backend=backend, poll_interval=0.01)
+
+    job = await submitter.submit(_requests(2))
+    with pytest.raises(TimeoutError):
+        await submitter.wait(job, timeout=0.05)
+
+    job = await submitter.cancel(job)
+    assert job.status == BatchStatus.CANCELLED
+    results = await submitter.collect(job)
+    assert not any(result.ok for result in results)
+    assert "cancelled" in str(results[0].error)
+
+@pytest.mark.asyncio
+async def test_openai_batch_backend_uses_batch_api(tmp_path, openai_provider):
+    """Test the OpenAI transport uploads, creates, polls and downloads through the Batch API"""
+    fake = FileBatchBackend(tmp_path, "openai", polls_until_done=0)
+    jobs = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        now = int(time.time())
+        if request.method == "POST" and path.endswith("/files"):
+            body = request.content.decode(errors="ignore")
+            start = body.index("{")
+            end = body.rindex("}") + 1
+            jobs["lines"] = [json.loads(raw) for raw in body[start:end].splitlines()]
+            return httpx.Response(200, json={
+                "id": "file-in", "object": "file", "bytes": 1, "created_at": now,
+                "filename": "batch.jsonl", "purpose": "batch", "status": "processed"
+            })
+
+        batch = {
+            "id": "batch-1", "object": "batch", "endpoint": "/v1/chat/completions",
+            "input_file_id": "file-in", "completion_window": "24h", "created_at": now
+        }
+        if request.method == "POST" and path.endswith("/batches"):
+            jobs["id"] = await fake.submit(jobs["lines"])
+            return httpx.Response(200, json={**batch, "status": "validating"})
+        if path.endswith("/batches/batch-1"):
+            status, _ = await fake.status(jobs["id"])
+            return httpx.Response(200, json={
+                **batch,
+                "status": "completed" if status == BatchStatus.COMPLETED else "in_progress",
+                "output_file_id": "file-out"
+            })
+        if path.endswith("/files/file-out/content"):
+            lines = await fake.results(jobs["id"])
+            return httpx.Response(200, text="".join(json.dumps(line) + "\n" for line in lines))
+        return httpx.Response(404, json={"error": {"message": path}})
+
+    openai_provider._async_client = AsyncOpenAI(
+        api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    submitter = BatchSubmitter(openai_provider, poll_interval=0)
+
+    results = await submitter.run(_requests(3))
+
+    assert [result.output.content for result in results] == [f"echo: question {i}" for i in range(3)]
+    assert jobs["lines"][0]["body"]["model"] == "gpt-4o-mini"
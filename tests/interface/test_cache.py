@@ -0,0 +1,197 @@
+import asyncio
+import time
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from legion.errors import ProviderError
+from legion.interface.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    make_cache_key,
+    set_default_response_cache,
+)
+from legion.interface.schemas import Message, ModelResponse, Role
+from legion.monitoring.events import CacheEvent
+from tests.utils import CountingLLM
+
+
+class Answer(BaseModel):
+    text: str
+
+def _messages(content: str = "hello") -> List[Message]:
+    return [Message(role=Role.SYSTEM, content="Be brief"), Message(role=Role.USER, content=content)]
+
+def test_cache_key_is_stable_and_sensitive_to_request():
+    """Test equal requests share a key and any change to the request changes it"""
+    key = make_cache_key("openai", "gpt-4o", _messages(), temperature=0.0)
+
+    assert key == make_cache_key("openai", "gpt-4o", _messages(), temperature=0.0)
+    assert key != make_cache_key("openai", "gpt-4o-mini", _messages(), temperature=0.0)
+    assert key != make_cache_key("anthropic", "gpt-4o", _messages(), temperature=0.0)
+    assert key != make_cache_key("openai", "gpt-4o", _messages("bye"), temperature=0.0)
+    assert key != make_cache_key("openai", "gpt-4o", _messages(), temperature=0.2)
+    assert key != make_cache_key("openai", "gpt-4o", _messages(), temperature=0.0, response_schema=Answer)
+    assert key != make_cache_key("openai", "gpt-4o", _messages(), temperature=0.0, max_tokens=10)
+
+def test_memory_backend_evicts_least_recently_used():
+    """Test the LRU keeps recently read entries"""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", ModelResponse(content="a"))
+    backend.set("b", ModelResponse(content="b"))
+    backend.get("a")
+    backend.set("c", ModelResponse(content="c"))
+
+    assert backend.get("b") is None
+    assert backend.get("a").content == "a"
+    assert backend.get("c").content == "c"
+    assert len(backend) == 2
+
+def test_memory_backend_expires_entries_and_returns_copies():
+    """Test entries expire after the TTL and stored responses can't be modified through reads"""
+    backend = MemoryCacheBackend(ttl=0.05)
+    backend.set("a", ModelResponse(content="a"))
+    backend.get("a").content = "changed"
+
+    assert backend.get("a").content == "a"
+    time.sleep(0.1)
+    assert backend.get("a") is None
+
+def test_sqlite_backend_persists_and_bounds_entries(tmp_path):
+    """Test responses survive reopening the database and old entries are evicted"""
+    path = tmp_path / "cache.db"
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    response = ModelResponse(content="a", tool_calls=[{"id": "1", "type": "function"}])
+    backend.set("a", response)
+    backend.close()
+
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    assert backend.get("a") == response
+    backend.set("b", ModelResponse(content="b"))
+    backend.set("c", ModelResponse(content="c"))
+    assert len(backend) == 2
+    assert backend.get("c").content == "c"
+    backend.close()
+
+def test_sqlite_backend_expires_entries(tmp_path):
+    """Test expired entries are not returned"""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db", ttl=0.05)
+    backend.set("a", ModelResponse(content="a"))
+    time.sleep(0.1)
+
+    assert backend.get("a") is None
+    assert len(backend) == 0
+    backend.close()
+
+@pytest.mark.asyncio
+async def test_acomplete_serves_repeated_requests_from_cache():
+    """Test identical requests call the provider once and are counted as hits"""
+    cache = ResponseCache()
+    llm = CountingLLM(response_cache=cache)
+
+    first = await llm.acomplete(_messages(), model="m", temperature=0.0)
+    second = await llm.acomplete(_messages(), model="m", temperature=0.0)
+    other = await llm.acomplete(_messages("bye"), model="m", temperature=0.0)
+
+    assert first.content == second.content == "reply 1 to hello"
+    assert other.content == "reply 2 to bye"
+    assert llm.calls == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["entries"] == 2
+
+@pytest.mark.asyncio
+async def test_acomplete_with_sqlite_backend(tmp_path):
+    """Test the disk backend serves hits through the async path"""
+    cache = ResponseCache(SQLiteCacheBackend(tmp_path / "cache.db"))
+    llm = CountingLLM(response_cache=cache)
+
+    await llm.acomplete(_messages(), model="m", temperature=0.0)
+    response = await llm.acomplete(_messages(), model="m", temperature=0.0)
+
+    assert response.content == "reply 1 to hello"
+    assert llm.calls == 1
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_high_temperature_bypasses_cache():
+    """Test sampled requests above the threshold always reach the provider"""
+    cache = ResponseCache(max_temperature=0.5)
+    llm = CountingLLM(response_cache=cache)
+
+    await llm.acomplete(_messages(), model="m", temperature=0.7)
+    await llm.acomplete(_messages(), model="m", temperature=0.7)
+    # JSON completions run at temperature 0 whatever was requested
+    await llm.acomplete(_messages(), model="m", temperature=0.7, response_schema=Answer)
+    await llm.acomplete(_messages(), model="m", temperature=0.7, response_schema=Answer)
+
+    assert llm.calls == 3
+    assert cache.stats()["bypassed"] == 2
+    assert cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """Test single-flight: concurrent identical requests wait for the first"""
+    cache = ResponseCache()
+    llm = CountingLLM(delay=0.05, response_cache=cache)
+
+    responses = await asyncio.gather(*(
+        llm.acomplete(_messages(), model="m", temperature=0.0) for _ in range(5)
+    ))
+
+    assert llm.calls == 1
+    assert {response.content for response in responses} == {"reply 1 to hello"}
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["coalesced"] == 4
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_cached_and_fails_waiters():
+    """Test a provider error reaches every waiting caller and nothing is stored"""
+    cache = ResponseCache()
+    llm = CountingLLM(delay=0.05, fail=True, response_cache=cache)
+
+    results = await asyncio.gather(*(
+        llm.acomplete(_messages(), model="m", temperature=0.0) for _ in range(3)
+    ), return_exceptions=True)
+
+    assert llm.calls == 1
+    assert all(isinstance(result, ProviderError) for result in results)
+    assert cache.stats()["entries"] == 0
+
+@pytest.mark.asyncio
+async def test_cache_emits_events_with_counters():
+    """Test lookups are reported to monitoring event handlers"""
+    cache = ResponseCache(name="test_cache")
+    events: List[CacheEvent] = []
+    handler = events.append
+    cache.add_event_handler(handler)
+    llm = CountingLLM(response_cache=cache)
+
+    await llm.acomplete(_messages(), model="m", temperature=0.0)
+    await llm.acomplete(_messages(), model="m", temperature=0.0)
+
+    assert [event.metadata["result"] for event in events] == ["miss", "hit"]
+    assert events[-1].metadata["hits"] == 1
+    assert events[-1].metadata["misses"] == 1
+    assert events[-1].component_id == "test_cache"
+    assert events[-1].model_name == "m"
+
+@pytest.mark.asyncio
+async def test_default_cache_applies_unless_provider_opts_out():
+    """Test the process-wide cache is used by providers without their own"""
+    cache = ResponseCache()
+    set_default_response_cache(cache)
+    try:
+        llm = CountingLLM()
+        opted_out = CountingLLM(response_cache=False)
+        for _ in range(2):
+            await llm.acomplete(_messages(), model="m", temperature=0.0)
+            await opted_out.acomplete(_messages(), model="m", temperature=0.0)
+    finally:
+        set_default_response_cache(None)
+
+    assert llm.calls == 1
+    assert opted_out.calls == 2
+    assert CountingLLM().response_cache is None
@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from legion.interface.clients import ClientRegistry, client_registry, make_client_key
+from legion.interface.schemas import Message, ProviderConfig, Role
+from legion.providers.anthropic import AnthropicProvider
+from legion.providers.openai import OpenAIProvider
+from tests.utils import FakeChatServer
+
+
+def test_make_client_key_hides_api_key():
+    """Test the raw API key never appears in the registry key"""
+    key = make_client_key("openai.sync", ProviderConfig(api_key="sk-secret"))
+    assert "sk-secret" not in repr(key)
+    assert key == make_client_key("openai.sync", ProviderConfig(api_key="sk-secret"))
+    assert key != make_client_key("openai.sync", ProviderConfig(api_key="sk-other"))
+
+def test_make_client_key_ignores_model():
+    """Test clients are shared across models with the same connection settings"""
+    first = make_client_key("openai.sync", ProviderConfig(api_key="k", model="gpt-4o"))
+    second = make_client_key("openai.sync", ProviderConfig(api_key="k", model="gpt-4o-mini"))
+    assert first == second
+
+def test_registry_reference_counting():
+    """Test clients are shared and closed when the last reference is released"""
+    registry = ClientRegistry()
+    client = MagicMock()
+    factory = MagicMock(return_value=client)
+    key = ("test", "url")
+
+    assert registry.acquire(key, factory) is client
+    assert registry.acquire(key, factory) is client
+    factory.assert_called_once()
+
+    registry.release(key)
+    client.close.assert_not_called()
+    registry.release(key)
+    client.close.assert_called_once()
+    assert len(registry) == 0
+
+@pytest.mark.asyncio
+async def test_registry_aclose_closes_async_clients():
+    """Test aclose awaits async close methods"""
+    registry = ClientRegistry()
+    client = MagicMock()
+    client.close = AsyncMock()
+    registry.acquire(("test",), lambda: client)
+
+    await registry.aclose()
+
+    client.close.assert_awaited_once()
+    assert len(registry) == 0
+
+def test_providers_share_clients():
+    """Test providers with identical connection settings share SDK clients"""
+    config = ProviderConfig(api_key="sk-shared-test", timeout=30)
+    first = OpenAIProvider(config=config)
+    second = OpenAIProvider(config=ProviderConfig(api_key="sk-shared-test", timeout=30, model="other"))
+    different = OpenAIProvider(config=ProviderConfig(api_key="sk-shared-test", timeout=31))
+
+    assert first.client is second.client
+    assert first.client is not different.client
+
+    for provider in (first, second, different):
+        provider.close()
+
+def test_provider_close_releases_reference():
+    """Test the shared client outlives one provider but not all of them"""
+    config = ProviderConfig(api_key="sk-release-test")
+    first = AnthropicProvider(config=config)
+    second = AnthropicProvider(config=config)
+    live = len(client_registry)
+
+    first.close()
+    assert len(client_registry) == live
+    second.close()
+    assert len(client_registry) == live - 1
+
+def test_repeated_setup_does_not_leak_references():
+    """Test re-running client setup keeps a single reference"""
+    provider = OpenAIProvider(config=ProviderConfig(api_key="sk-setup-test"))
+    provider._setup_client()
+    provider._setup_client()
+    live = len(client_registry)
+
+    provider.close()
+    assert len(client_registry) == live - 1
+
+@pytest.mark.asyncio
+async def test_async_clients_are_shared():
+    """Test lazily created async clients are shared"""
+    config = ProviderConfig(api_key="sk-async-test")
+    first = OpenAIProvider(config=config)
+    second = OpenAIProvider(config=config)
+
+    await first._ensure_async_client()
+    await second._ensure_async_client()
+    assert first._async_client is second._async_client
+
+    await first.aclose()
+    await second.aclose()
+
+def test_async_clients_are_not_shared_across_event_loops():
+    """Test a provider on a new event loop doesn't reuse a client bound to a closed one"""
+    messages = [Message(role=Role.USER, content="hello")]
+
+    with FakeChatServer() as server:
+        config = ProviderConfig(api_key="sk-loop-test", base_url=server.base_url, max_retries=0)
+        first = OpenAIProvider(config=config)
+        second = OpenAIProvider(config=config)
+
+        assert asyncio.run(first.acomplete(messages, model="gpt-4o-mini")).content == "reply"
+        assert asyncio.run(second.acomplete(messages, model="gpt-4o-mini")).content == "reply"
+        assert first._async_client is not second._async_client
+
+    first.close()
+    second.close()
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from legion.interface.executors import ExecutorKind, ExecutorRegistry, ManagedExecutor, executor_registry
+from legion.interface.tools import BaseTool
+
+
+class EchoParams(BaseModel):
+    value: str
+
+class ThreadNameTool(BaseTool):
+    """Tool reporting the thread it runs in"""
+
+    def __init__(self, **kwargs):
+        super().__init__(name="thread_name", description="Report thread", parameters=EchoParams, **kwargs)
+
+    def run(self, value: str) -> str:
+        return threading.current_thread().name
+
+@pytest.mark.asyncio
+async def test_executor_runs_calls_and_records_stats():
+    """Test completed calls are counted"""
+    executor = ManagedExecutor("test.stats", max_workers=2)
+    results = await asyncio.gather(*(executor.run(pow, i, 2) for i in range(4)))
+
+    assert results == [0, 1, 4, 9]
+    stats = executor.stats()
+    assert stats["submitted"] == 4
+    assert stats["completed"] == 4
+    assert stats["failed"] == 0
+    assert stats["queue_depth"] == 0
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrency_and_tracks_waits():
+    """Test calls beyond max_workers queue and their wait is measured"""
+    executor = ManagedExecutor("test.bounded", max_workers=1)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(3)))
+
+    assert time.perf_counter() - start >= 0.15
+    stats = executor.stats()
+    assert stats["max_queue_depth"] == 2
+    assert stats["max_wait_ms"] >= 50
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_executor_counts_failures():
+    """Test exceptions propagate and are counted"""
+    executor = ManagedExecutor("test.failures")
+
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(lambda: 1 / 0)
+
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+
+def test_executor_rejects_invalid_workers():
+    """Test an executor needs at least one worker"""
+    with pytest.raises(ValueError):
+        ManagedExecutor("test.invalid", max_workers=0)
+
+def test_registry_configure_and_get():
+    """Test executors are created on demand and configured by name"""
+    registry = ExecutorRegistry()
+    default = registry.get("pool")
+    assert registry.get("pool") is default
+    assert "pool" in registry
+
+    configured = registry.configure("pool", max_workers=2)
+    assert registry.get("pool") is configured
+    assert registry.stats()["pool"]["max_workers"] == 2
+
+    with pytest.raises(ValueError):
+        registry.get("pool", ExecutorKind.PROCESS)
+
+    registry.shutdown()
+    assert "pool" not in registry
+
+@pytest.mark.asyncio
+async def test_sync_tool_runs_in_named_executor():
+    """Test a sync tool runs in its own pool rather than the loop default"""
+    tool = ThreadNameTool()
+    assert tool.executor == "tool.thread_name"
+
+    name = await tool(value="x")
+    assert name.startswith("legion-tool.thread_name")
+
+    shared = ThreadNameTool(executor="test.shared")
+    assert (await shared(value="x")).startswith("legion-test.shared")
+    assert executor_registry.stats()["test.shared"]["completed"] == 1
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+
+from legion.agents.base import Agent
+from legion.interface.portal import LoopPortal, portal, run_sync
+from legion.interface.schemas import Message, Role
+from tests.utils import CountingLLM
+
+request_id: ContextVar[str] = ContextVar("request_id", default="none")
+
+async def _loop_and_thread():
+    return asyncio.get_running_loop(), threading.current_thread()
+
+@pytest.fixture
+def local_portal():
+    portal = LoopPortal("test-portal")
+    yield portal
+    portal.shutdown()
+
+def test_calls_share_one_background_loop(local_portal):
+    """Test every sync call runs on the same long-lived loop off the caller's thread"""
+    first_loop, first_thread = local_portal.run(_loop_and_thread())
+    second_loop, second_thread = local_portal.run(_loop_and_thread())
+
+    assert first_loop is second_loop
+    assert first_thread is second_thread is not threading.current_thread()
+    assert first_loop.is_running()
+
+def test_errors_and_context_reach_the_caller(local_portal):
+    """Test exceptions propagate and the caller's context variables are visible"""
+    async def fail():
+        raise ValueError(f"failed {request_id.get()}")
+
+    token = request_id.set("abc")
+    try:
+        with pytest.raises(ValueError, match="failed abc"):
+            local_portal.run(fail())
+    finally:
+        request_id.reset(token)
+
+def test_timeout_cancels_the_task(local_portal):
+    """Test a call that times out doesn't keep running on the portal"""
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        local_portal.run(slow(), timeout=0.05)
+    assert cancelled.wait(1)
+
+def test_nested_call_from_portal_thread(local_portal):
+    """Test a sync call made on the portal's own thread runs instead of deadlocking"""
+    async def inner():
+        return "inner"
+
+    async def outer():
+        # Simulates sync code called directly from a coroutine on the portal
+        return local_portal.run(inner(), timeout=1)
+
+    assert local_portal.run(outer(), timeout=2) == "inner"
+
+def test_restarts_after_shutdown(local_portal):
+    """Test the portal starts a new loop when used after shutdown"""
+    loop, _ = local_portal.run(_loop_and_thread())
+    local_portal.shutdown()
+
+    assert not local_portal.running
+    new_loop, _ = local_portal.run(_loop_and_thread())
+    assert new_loop is not loop
+    assert loop.is_closed()
+
+@pytest.mark.asyncio
+async def test_agent_process_inside_running_loop():
+    """Test the sync agent API works from a coroutine and reuses the portal loop"""
+    agent = Agent(name="test", model="gpt-4o-mini", temperature=0)
+    agent.llm = CountingLLM(delay=0.01)
+
+    first = agent.process("hello")
+    second = agent.process("again")
+
+    assert first.content == "reply 1 to hello"
+    assert second.content == "reply 2 to again"
+    assert run_sync(_loop_and_thread())[0] is portal.loop
+
+def test_provider_complete_is_sync():
+    """Test provider complete returns a response, running acomplete on the portal"""
+    provider = CountingLLM()
+    messages = [Message(role=Role.USER, content="hello")]
+
+    first = provider.complete(messages, model="test")
+    second = provider.complete(messages, model="test")
+
+    assert first.content == "reply 1 to hello"
+    assert second.content == "reply 2 to hello"
+
+def test_sync_calls_from_many_threads(local_portal):
+    """Test concurrent sync callers overlap on the shared loop"""
+    async def wait():
+        await asyncio.sleep(0.1)
+
+    threads = [threading.Thread(target=local_portal.run, args=(wait(),)) for _ in range(10)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - start < 0.5
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from legion.interface.ratelimit import RateLimiter, TokenBucket, rate_limiter_registry
+from legion.interface.schemas import Message, Role, TokenUsage
+from legion.monitoring.events import RateLimitEvent
+from tests.utils import CountingLLM
+
+
+@pytest.fixture(autouse=True)
+def clear_limiters():
+    rate_limiter_registry.clear()
+    yield
+    rate_limiter_registry.clear()
+
+def _messages(content: str = "hello") -> List[Message]:
+    return [Message(role=Role.USER, content=content)]
+
+def test_token_bucket_reserves_and_refills():
+    """Test reservations beyond capacity return the time until they are covered"""
+    bucket = TokenBucket(per_minute=600, burst=2)
+
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(0.1, abs=0.01)
+    time.sleep(0.1)
+    assert bucket.available == pytest.approx(0, abs=0.1)
+
+def test_token_bucket_adjust_is_capped_at_capacity():
+    """Test returned tokens never overfill the bucket"""
+    bucket = TokenBucket(per_minute=60)
+    bucket.adjust(-100)
+
+    assert bucket.available == pytest.approx(60)
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_spaces_requests():
+    """Test requests beyond the burst wait for the bucket to refill"""
+    limiter = RateLimiter("test.rpm", requests_per_minute=600)
+    limiter.requests = TokenBucket(600, burst=1)
+
+    async def request():
+        async with limiter.acquire():
+            return time.monotonic()
+
+    started = time.monotonic()
+    times = await asyncio.gather(*(request() for _ in range(3)))
+
+    assert times[-1] - started >= 0.18
+    stats = limiter.stats()
+    assert stats["requests"] == 3
+    assert stats["waited"] == 2
+    assert stats["max_wait_ms"] >= 180
+
+@pytest.mark.asyncio
+async def test_max_in_flight_bounds_concurrency():
+    """Test no more than max_in_flight requests run at once"""
+    limiter = RateLimiter("test.in_flight", max_in_flight=2)
+    active, peak = 0, 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.acquire():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.stats()["in_flight"] == 0
+    assert limiter.stats()["queued"] == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_slot():
+    """Test cancelling a queued request doesn't leak a slot"""
+    limiter = RateLimiter("test.cancel", max_in_flight=1)
+
+    async def hold(delay):
+        async with limiter.acquire():
+            await asyncio.sleep(delay)
+
+    first = asyncio.create_task(hold(0.05))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(hold(0))
+    await asyncio.sleep(0.01)
+    queued.cancel()
+    await first
+
+    await asyncio.wait_for(hold(0), timeout=1)
+    assert limiter.stats()["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_token_usage_settles_estimate():
+    """Test the TPM bucket is debited with reported usage rather than the estimate"""
+    limiter = RateLimiter("test.tpm", tokens_per_minute=1000)
+
+    async with limiter.acquire(estimated_tokens=200) as reservation:
+        assert limiter.tokens.available == pytest.approx(800, abs=1)
+        reservation.record(TokenUsage(prompt_tokens=40, completion_tokens=10, total_tokens=50))
+
+    assert limiter.tokens.available == pytest.approx(950, abs=1)
+    assert limiter.stats()["tokens_used"] == 50
+
+def test_limiter_works_across_event_loops():
+    """Test one limiter serves the separate loops the sync APIs run"""
+    limiter = RateLimiter("test.loops", max_in_flight=1)
+
+    async def request():
+        async with limiter.acquire():
+            await asyncio.sleep(0.01)
+
+    async def burst():
+        await asyncio.gather(*(request() for _ in range(3)))
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+    assert limiter.stats()["requests"] == 6
+
+@pytest.mark.asyncio
+async def test_providers_share_limits_from_config():
+    """Test provider instances for the same model share one limiter configured from ProviderConfig"""
+    first = CountingLLM(delay=0.02, max_in_flight=1, tokens_per_minute=100_000)
+    second = CountingLLM(delay=0.02, max_in_flight=1, tokens_per_minute=100_000)
+    events: List[RateLimitEvent] = []
+    handler = events.append
+    rate_limiter_registry.add_event_handler(handler)
+    try:
+        await asyncio.gather(*(
+            llm.acomplete(_messages(), model="m", temperature=0.0)
+            for llm in (first, second, first, second)
+        ))
+    finally:
+        rate_limiter_registry.remove_event_handler(handler)
+
+    assert first.get_rate_limiter("m") is second.get_rate_limiter("m")
+    assert first.get_rate_limiter("other") is not first.get_rate_limiter("m")
+    assert first.peak + second.peak == 2
+    assert first.active == second.active == 0
+
+    stats = first.get_rate_limiter("m").stats()
+    assert stats["requests"] == 4
+    assert stats["tokens_used"] == 60
+    assert len(events) == 4
+    assert max(event.metadata["wait_ms"] for event in events) >= 40
+
+@pytest.mark.asyncio
+async def test_no_limiter_without_limits():
+    """Test providers without limits skip the limiter entirely"""
+    llm = CountingLLM()
+
+    await llm.acomplete(_messages(), model="m", temperature=0.0)
+    assert llm.get_rate_limiter("m") is None
+    assert rate_limiter_registry.stats() == {}
@@ -0,0 +1,40 @@
+import copy
+
+from legion.interface.schemas import Message, Role
+
+
+def test_serialized_is_cached():
+    """Test a message is formatted once per format"""
+    message = Message(role=Role.USER, content="hello")
+    calls = []
+
+    def formatter(msg):
+        calls.append(msg)
+        return {"content": msg.content}
+
+    first = message.serialized("test", formatter)
+    assert message.serialized("test", formatter) is first
+    assert len(calls) == 1
+    assert message.cached_dump() is message.cached_dump()
+
+def test_serialized_invalidated_on_assignment():
+    """Test reassigning a field drops the cached forms"""
+    message = Message(role=Role.SYSTEM, content="old")
+    assert message.cached_dump()["content"] == "old"
+
+    message.content = "new"
+    assert message.cached_dump()["content"] == "new"
+    assert message.serialized("test", lambda msg: msg.content) == "new"
+
+def test_copies_do_not_share_cache():
+    """Test copies get their own cache"""
+    message = Message(content="original")
+    message.cached_dump()
+
+    updated = message.model_copy(update={"content": "updated"})
+    assert updated.cached_dump()["content"] == "updated"
+
+    for duplicate in (copy.copy(message), copy.deepcopy(message)):
+        duplicate.content = "changed"
+        assert duplicate.cached_dump()["content"] == "changed"
+    assert message.cached_dump()["content"] == "original"
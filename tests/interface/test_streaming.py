@@ -0,0 +1,151 @@
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import (
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from pydantic import BaseModel
+
+from legion.interface.schemas import Message, ModelResponse, ProviderConfig, Role, TokenUsage
+from legion.interface.streaming import ToolCallAccumulator, iter_openai_stream
+from legion.interface.tools import BaseTool
+from legion.providers.openai import OpenAIProvider
+
+
+class EchoParams(BaseModel):
+    text: str
+
+class EchoTool(BaseTool):
+    def __init__(self):
+        super().__init__(name="echo", description="Echo text", parameters=EchoParams)
+
+    def run(self, text: str) -> str:
+        return f"echo: {text}"
+
+def make_chunk(content=None, tool_calls=None, finish_reason=None, usage=None) -> ChatCompletionChunk:
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        choices.append(Choice(
+            index=0,
+            delta=ChoiceDelta(content=content, tool_calls=tool_calls),
+            finish_reason=finish_reason
+        ))
+    return ChatCompletionChunk(
+        id="chunk",
+        choices=choices,
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion.chunk",
+        usage=usage
+    )
+
+def tool_call_delta(index, call_id=None, name=None, arguments=None) -> ChoiceDeltaToolCall:
+    return ChoiceDeltaToolCall(
+        index=index,
+        id=call_id,
+        type="function" if call_id else None,
+        function=ChoiceDeltaToolCallFunction(name=name, arguments=arguments)
+    )
+
+async def aiter(items):
+    for item in items:
+        yield item
+
+def streaming_provider(*turns: List[ChatCompletionChunk]) -> OpenAIProvider:
+    provider = OpenAIProvider(config=ProviderConfig(api_key="sk-stream-test"))
+    provider._async_client = MagicMock()
+    provider._async_client.chat.completions.create = AsyncMock(
+        side_effect=[aiter(turn) for turn in turns]
+    )
+    return provider
+
+def test_tool_call_accumulator_joins_fragments():
+    """Test tool call fragments are assembled in index order"""
+    calls = ToolCallAccumulator()
+    calls.add(1, call_id="b", name="second", arguments='{"x"')
+    calls.add(0, call_id="a", name="first")
+    calls.add(1, arguments=": 1}")
+
+    assert len(calls) == 2
+    assert calls.build() == [
+        {"id": "a", "type": "function", "function": {"name": "first", "arguments": "{}"}},
+        {"id": "b", "type": "function", "function": {"name": "second", "arguments": '{"x": 1}'}}
+    ]
+    assert ToolCallAccumulator().build() is None
+
+@pytest.mark.asyncio
+async def test_iter_openai_stream():
+    """Test OpenAI-compatible chunks become content deltas and a final summary"""
+    chunks = [
+        make_chunk(content="Hel"),
+        make_chunk(content="lo"),
+        make_chunk(finish_reason="stop"),
+        make_chunk(usage=CompletionUsage(prompt_tokens=3, completion_tokens=2, total_tokens=5))
+    ]
+
+    result = [chunk async for chunk in iter_openai_stream(aiter(chunks))]
+
+    assert [c.content for c in result[:-1]] == ["Hel", "lo"]
+    assert result[-1].finish_reason == "stop"
+    assert result[-1].usage.total_tokens == 5
+    assert result[-1].tool_calls is None
+
+@pytest.mark.asyncio
+async def test_astream_yields_deltas_and_final_response():
+    """Test a plain streamed completion assembles the final response"""
+    provider = streaming_provider([make_chunk(content="Hi"), make_chunk(content=" there", finish_reason="stop")])
+
+    chunks = [c async for c in provider.astream([Message(role=Role.USER, content="Hello")], "gpt-4o-mini")]
+
+    assert [c.content for c in chunks if c.content] == ["Hi", " there"]
+    assert chunks[-1].response.content == "Hi there"
+    request = provider._async_client.chat.completions.create.call_args.kwargs
+    assert request["stream"] is True
+    assert "tools" not in request
+
+@pytest.mark.asyncio
+async def test_astream_runs_tools_between_turns():
+    """Test streamed tool calls are executed and the conversation continues"""
+    provider = streaming_provider(
+        [
+            make_chunk(tool_calls=[tool_call_delta(0, "call_1", "echo", '{"te')]),
+            make_chunk(tool_calls=[tool_call_delta(0, arguments='xt": "hi"}')], finish_reason="tool_calls")
+        ],
+        [make_chunk(content="Done", finish_reason="stop")]
+    )
+
+    chunks = [
+        c async for c in provider.astream(
+            [Message(role=Role.USER, content="Echo hi")], "gpt-4o-mini", tools=[EchoTool()]
+        )
+    ]
+
+    tool_chunk = next(c for c in chunks if c.tool_calls)
+    assert tool_chunk.tool_calls[0]["result"] == "echo: hi"
+    assert chunks[-1].response.content == "Done"
+    assert chunks[-1].response.tool_calls[0]["id"] == "call_1"
+
+    second_request = provider._async_client.chat.completions.create.call_args_list[1].kwargs
+    assert second_request["messages"][-1] == {
+        "role": Role.TOOL, "content": "echo: hi", "tool_call_id": "call_1", "name": "echo"
+    }
+
+@pytest.mark.asyncio
+async def test_astream_falls_back_to_acomplete():
+    """Test providers without streaming support yield the full completion"""
+    provider = OpenAIProvider(config=ProviderConfig(api_key="sk-stream-test"))
+    provider.supports_streaming = False
+    usage = TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+    provider.acomplete = AsyncMock(return_value=ModelResponse(content="Whole", usage=usage))
+
+    chunks = [c async for c in provider.astream([Message(role=Role.USER, content="Hi")], "gpt-4o-mini")]
+
+    assert [c.content for c in chunks] == ["Whole", ""]
+    assert chunks[-1].response.content == "Whole"
+    assert chunks[-1].usage == usage
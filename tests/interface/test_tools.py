@@ -1,11 +1,12 @@
 import asyncio
+import json
 import sys
 from typing import Any, Dict, Optional
 
 import pytest
 from pydantic import BaseModel, Field
 
-from legion.interface.tools import BaseTool
+from legion.interface.tools import BaseTool, dispatch_tool_calls
 
 
 # Test parameter models
@@ -225,6 +226,20 @@ def test_injected_parameter_schema(injectable_tool):
     assert "api_key" not in schema["function"]["parameters"]["required"]
     assert "user_id" not in schema["function"]["parameters"]["required"]
 
+def test_schema_is_cached_until_tool_changes(injectable_tool):
+    """Test the schema is built once and rebuilt when what it's derived from changes"""
+    schema = injectable_tool.get_schema()
+    assert injectable_tool.get_schema() is schema
+
+    injectable_tool.description = "Changed description"
+    schema = injectable_tool.get_schema()
+    assert schema["function"]["description"] == "Changed description"
+
+    injectable_tool.injected_params = {"api_key"}
+    assert "user_id" in injectable_tool.get_schema()["function"]["parameters"]["properties"]
+    injectable_tool.injected_params.add("user_id")
+    assert "user_id" not in injectable_tool.get_schema()["function"]["parameters"]["properties"]
+
 def test_tool_reuse_with_injection(injectable_tool):
     """Test that tool can be reused with different injected values"""
     # First use with injected values
@@ -248,6 +263,87 @@ def test_tool_reuse_with_injection(injectable_tool):
     # Original tool should not be modified
     assert not hasattr(injectable_tool, "_injected_values") or not injectable_tool._injected_values
 
+class SleepParams(BaseModel):
+    delay: float
+
+class SleepTool(BaseTool):
+    """Tool recording how many of its calls overlap"""
+
+    def __init__(self, name: str = "sleep", concurrent: bool = True):
+        super().__init__(
+            name=name,
+            description="Sleep for a while",
+            parameters=SleepParams,
+            concurrent=concurrent
+        )
+        self.in_flight = 0
+        self.peak = 0
+
+    def run(self, delay: float) -> str:
+        return f"slept {delay}"
+
+    async def arun(self, delay: float) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(delay)
+        self.in_flight -= 1
+        return f"slept {delay}"
+
+def make_call(call_id: str, name: str, delay: float) -> Dict[str, Any]:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": f'{{"delay": {delay}}}'}
+    }
+
+async def execute_call(tool: BaseTool, call: Dict[str, Any]) -> Any:
+    return await tool(**json.loads(call["function"]["arguments"]))
+
+@pytest.mark.asyncio
+async def test_dispatch_runs_calls_concurrently_in_order():
+    tool = SleepTool()
+    calls = [make_call(f"call_{i}", "sleep", delay) for i, delay in enumerate([0.05, 0.01, 0.03])]
+
+    results = await dispatch_tool_calls(calls, [tool], execute_call)
+
+    assert tool.peak == 3
+    assert [call["id"] for call, _, _ in results] == ["call_0", "call_1", "call_2"]
+    assert [result for _, _, result in results] == ["slept 0.05", "slept 0.01", "slept 0.03"]
+
+@pytest.mark.asyncio
+async def test_dispatch_respects_concurrency_limit():
+    tool = SleepTool()
+    calls = [make_call(f"call_{i}", "sleep", 0.01) for i in range(6)]
+
+    await dispatch_tool_calls(calls, [tool], execute_call, max_concurrency=2)
+
+    assert tool.peak == 2
+
+@pytest.mark.asyncio
+async def test_dispatch_runs_serial_tools_alone():
+    parallel = SleepTool("parallel")
+    serial = SleepTool("serial", concurrent=False)
+    calls = [
+        make_call("a", "parallel", 0.02),
+        make_call("b", "serial", 0.01),
+        make_call("c", "serial", 0.01),
+        make_call("d", "parallel", 0.01),
+        make_call("e", "unknown", 0.01)
+    ]
+
+    results = await dispatch_tool_calls(calls, [parallel, serial], execute_call)
+
+    assert serial.peak == 1
+    assert [call["id"] for call, _, _ in results] == ["a", "b", "c", "d"]
+
+@pytest.mark.asyncio
+async def test_dispatch_propagates_errors():
+    async def fail(tool, call):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await dispatch_tool_calls([make_call("a", "sleep", 0)], [SleepTool()], fail)
+
 if __name__ == "__main__":
     # Configure pytest arguments
     args = [
@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from legion.interface.schemas import Message, ModelResponse, Role
+from legion.interface.tokens import CharTokenEstimator, TokenCounter
+from legion.memory.context import KeepRecentStrategy, SummarizeStrategy, select_recent
+from legion.memory.providers.memory import ConversationMemory
+
+
+class WordCounter(TokenCounter):
+    """One token per word and no per-message overhead"""
+
+    message_overhead = 0
+
+    def __init__(self):
+        self.counted = 0
+
+    @property
+    def name(self) -> str:
+        return "words"
+
+    def count_text(self, text: str) -> int:
+        self.counted += 1
+        return len(text.split())
+
+def conversation(turns: int):
+    messages = [Message(role=Role.SYSTEM, content="system prompt")]
+    for i in range(turns):
+        messages.append(Message(role=Role.USER, content=f"question {i}"))
+        messages.append(Message(role=Role.ASSISTANT, content=f"answer {i}"))
+    return messages
+
+def tool_turn(call_id: str):
+    return [
+        Message(role=Role.ASSISTANT, content="", tool_calls=[{
+            "id": call_id,
+            "type": "function",
+            "function": {"name": "lookup", "arguments": json.dumps({"q": "x"})}
+        }]),
+        Message(role=Role.TOOL, content="tool result", tool_call_id=call_id, name="lookup")
+    ]
+
+def test_char_estimator():
+    """Test the character estimator rounds up"""
+    counter = CharTokenEstimator()
+    assert counter.count_text("") == 0
+    assert counter.count_text("abcde") == 2
+    assert counter.count_message(Message(content="abcd")) == 1 + counter.message_overhead
+    with pytest.raises(ValueError):
+        CharTokenEstimator(chars_per_token=0)
+
+def test_token_counts_are_cached_per_message():
+    """Test a message is counted once until it changes"""
+    counter = WordCounter()
+    message = Message(content="one two three")
+
+    assert counter.count_message(message) == 3
+    assert counter.count_message(message) == 3
+    assert counter.counted == 1
+
+    message.content = "one"
+    assert counter.count_message(message) == 1
+
+def test_select_recent_keeps_system_and_latest():
+    """Test the window keeps the system prompt and the newest messages"""
+    messages = conversation(5)
+    window = select_recent(messages, budget=6, counter=WordCounter())
+
+    assert window.messages[0] is messages[0]
+    assert [m.content for m in window.messages[1:]] == ["question 4", "answer 4"]
+    assert window.tokens == 6
+    assert window.evicted_count == 8
+
+def test_select_recent_always_keeps_last_message():
+    """Test the newest message is sent even when it exceeds the budget"""
+    messages = conversation(2)
+    window = select_recent(messages, budget=1, counter=WordCounter())
+    assert window.messages == [messages[0], messages[-1]]
+
+def test_select_recent_keeps_tool_pairs_atomic():
+    """Test tool results are never separated from their call"""
+    messages = conversation(0) + tool_turn("call_1") + [Message(role=Role.USER, content="next question")]
+    counter = WordCounter()
+    # Room for the tool result on its own but not for its call
+    budget = 4 + counter.count_message(messages[2])
+
+    window = select_recent(messages, budget=budget, counter=counter)
+    assert [m.role for m in window.messages] == [Role.SYSTEM, Role.USER]
+
+    split = select_recent(messages, budget=budget, counter=counter, atomic_tool_calls=False)
+    assert [m.role for m in split.messages] == [Role.SYSTEM, Role.TOOL, Role.USER]
+
+def test_select_only_counts_window():
+    """Test selection stops counting once the budget is spent"""
+    messages = conversation(500)
+    counter = WordCounter()
+    select_recent(messages, budget=10, counter=counter)
+    assert counter.counted < 10
+
+def test_memory_context_window_by_tokens():
+    """Test ConversationMemory trims by token budget"""
+    memory = ConversationMemory(messages=conversation(3))
+    window = memory.get_context_window(max_tokens=4, token_counter=WordCounter())
+    assert [m.content for m in window] == ["system prompt", "answer 2"]
+    assert memory.get_context_window(max_messages=2) == memory.messages[-2:]
+
+@pytest.mark.asyncio
+async def test_keep_recent_strategy():
+    """Test the default strategy selects the recent window"""
+    messages = conversation(3)
+    selected = await KeepRecentStrategy().select(messages, 6, WordCounter())
+    assert selected == [messages[0]] + messages[-2:]
+
+@pytest.mark.asyncio
+async def test_summarize_strategy_summarizes_evicted_prefix_once():
+    """Test evicted messages are summarized incrementally"""
+    calls = []
+
+    async def summarizer(messages, previous):
+        calls.append([m.content for m in messages])
+        return f"{previous or ''}+{len(messages)}"
+
+    strategy = SummarizeStrategy(summarizer, reserve_tokens=0)
+    messages = conversation(3)
+    counter = WordCounter()
+
+    selected = await strategy.select(messages, 6, counter)
+    assert calls == [["question 0", "answer 0", "question 1", "answer 1"]]
+    assert selected[0].content.endswith("Summary of earlier conversation:\n+4")
+    assert messages[0].content == "system prompt"
+    assert selected[1:] == messages[-2:]
+
+    # Unchanged history reuses the summary
+    assert await strategy.select(messages, 6, counter) == selected
+    assert len(calls) == 1
+
+    messages.extend([Message(role=Role.USER, content="question 3"), Message(role=Role.ASSISTANT, content="answer 3")])
+    selected = await strategy.select(messages, 6, counter)
+    assert calls[-1] == ["question 2", "answer 2"]
+    assert selected[0].content.endswith("+4+2")
+
+@pytest.mark.asyncio
+async def test_summarize_strategy_with_agent():
+    """Test an agent can act as the summarizer"""
+    class FakeSummarizer:
+        def __init__(self):
+            self.prompts = []
+            self.wiped = 0
+
+        async def aprocess(self, prompt):
+            self.prompts.append(prompt)
+            return ModelResponse(content="short summary")
+
+        def wipe_memory(self):
+            self.wiped += 1
+
+    agent = FakeSummarizer()
+    strategy = SummarizeStrategy(agent, reserve_tokens=0)
+    selected = await strategy.select(conversation(2), 4, WordCounter())
+
+    assert "user: question 0" in agent.prompts[0]
+    assert agent.wiped == 1
+    assert selected[0].content.endswith("short summary")
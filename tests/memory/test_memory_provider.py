@@ -0,0 +1,53 @@
+import pytest
+
+from legion.errors import VersionConflictError
+from legion.memory.providers.memory import InMemoryProvider
+
+
+def message(content: str):
+    return {"role": "user", "content": content}
+
+@pytest.mark.asyncio
+async def test_append_messages_bumps_version():
+    """Test appends add to the stored messages and return a new version"""
+    provider = InMemoryProvider()
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {"messages": [message("a")]})
+    version = await provider.get_state_version("agent", thread_id)
+
+    new_version = await provider.append_messages("agent", thread_id, [message("b")], since_version=version)
+
+    assert new_version != version
+    state = await provider.load_state("agent", thread_id)
+    assert [m["content"] for m in state["messages"]] == ["a", "b"]
+    assert (await provider.get_thread(thread_id)).message_count == 2
+
+@pytest.mark.asyncio
+async def test_append_messages_detects_conflicts():
+    """Test an append based on a stale version is rejected"""
+    provider = InMemoryProvider()
+    thread_id = await provider.create_thread("agent")
+    version = await provider.append_messages("agent", thread_id, [message("a")])
+    await provider.append_messages("agent", thread_id, [message("b")])
+
+    with pytest.raises(VersionConflictError):
+        await provider.append_messages("agent", thread_id, [message("c")], since_version=version)
+    with pytest.raises(ValueError):
+        await provider.append_messages("agent", "missing", [message("c")])
+
+@pytest.mark.asyncio
+async def test_load_state_versioned():
+    """Test unchanged state is not reloaded"""
+    provider = InMemoryProvider()
+    thread_id = await provider.create_thread("agent")
+
+    empty = await provider.load_state_versioned("agent", thread_id)
+    assert empty.version is None and empty.state is None and empty.changed
+
+    version = await provider.append_messages("agent", thread_id, [message("a")])
+    unchanged = await provider.load_state_versioned("agent", thread_id, version)
+    assert not unchanged.changed and unchanged.state is None
+
+    await provider.save_state("agent", thread_id, {"messages": []})
+    changed = await provider.load_state_versioned("agent", thread_id, version)
+    assert changed.changed and changed.state == {"messages": []}
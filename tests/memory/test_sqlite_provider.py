@@ -0,0 +1,237 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from legion.errors import VersionConflictError
+from legion.interface.schemas import Message, Role
+from legion.memory.providers.sqlite import SQLiteMemoryProvider
+
+
+@pytest.fixture
+def provider(tmp_path):
+    provider = SQLiteMemoryProvider(tmp_path / "memory.db")
+    yield provider
+    provider.close()
+
+def messages(count: int):
+    return [
+        Message(role=Role.USER if i % 2 == 0 else Role.ASSISTANT, content=f"message {i}").model_dump()
+        for i in range(count)
+    ]
+
+def message_rows(provider):
+    return provider._conn.execute("SELECT seq, data FROM messages ORDER BY seq").fetchall()
+
+@pytest.mark.asyncio
+async def test_save_and_load_state(provider):
+    """Test state round-trips with messages and metadata"""
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {
+        "messages": messages(2),
+        "metadata": {"topic": "tests"},
+        "last_updated": "now"
+    })
+
+    state = await provider.load_state("agent", thread_id)
+    assert state["last_updated"] == "now"
+    assert [m["content"] for m in state["messages"]] == ["message 0", "message 1"]
+    assert state["messages"][0]["role"] == "user"
+    assert await provider.load_state("other", thread_id) is None
+
+    thread = await provider.get_thread(thread_id)
+    assert thread.metadata == {"topic": "tests"}
+    assert thread.message_count == 2
+
+@pytest.mark.asyncio
+async def test_save_state_requires_thread(provider):
+    """Test saving to an unknown thread fails"""
+    with pytest.raises(ValueError):
+        await provider.save_state("agent", "missing", {"messages": []})
+
+@pytest.mark.asyncio
+async def test_save_state_only_writes_changes(provider):
+    """Test saving a grown history appends rather than rewriting"""
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {"messages": messages(3)})
+    before = provider._conn.total_changes
+
+    history = messages(5)
+    history[0]["content"] = "edited"
+    await provider.save_state("agent", thread_id, {"messages": history})
+
+    # One updated row, two inserted rows, plus the thread and state rows
+    assert provider._conn.total_changes - before == 5
+    assert [row["seq"] for row in message_rows(provider)] == [0, 1, 2, 3, 4]
+
+    await provider.save_state("agent", thread_id, {"messages": history[:2]})
+    state = await provider.load_state("agent", thread_id)
+    assert [m["content"] for m in state["messages"]] == ["edited", "message 1"]
+
+@pytest.mark.asyncio
+async def test_persists_across_instances(tmp_path):
+    """Test a second provider on the same file sees saved threads"""
+    first = SQLiteMemoryProvider(tmp_path / "shared.db")
+    thread_id = await first.create_thread("agent")
+    await first.save_state("agent", thread_id, {"messages": messages(1)})
+    first.close()
+
+    second = SQLiteMemoryProvider(tmp_path / "shared.db")
+    try:
+        assert await second.get_or_create_thread("agent") == thread_id
+        state = await second.load_state("agent", thread_id)
+        assert state["messages"][0]["content"] == "message 0"
+    finally:
+        second.close()
+
+@pytest.mark.asyncio
+async def test_query_helpers(provider):
+    """Test the SQL-backed thread queries"""
+    first = await provider.create_thread("agent")
+    await asyncio.sleep(0.01)
+    second = await provider.create_thread("agent", parent_thread_id=first)
+    other = await provider.create_thread("other")
+    await provider.save_state("agent", first, {"messages": messages(3)})
+    await provider.save_state("other", other, {"messages": messages(1)})
+
+    assert await provider.get_thread_count() == 3
+    assert await provider.get_thread_count("agent") == 2
+    assert await provider.get_entities() == {"agent", "other"}
+    assert await provider.get_message_count() == 4
+    assert await provider.get_message_count("agent") == 3
+    assert (await provider.get_last_message(first))["content"] == "message 2"
+    assert await provider.get_last_message(second) is None
+    assert (await provider.get_oldest_thread("agent")).thread_id == first
+    assert (await provider.get_latest_thread()).thread_id == other
+    assert [t.thread_id for t in await provider.list_threads("agent")] == [first, second]
+
+    stats = await provider.get_entity_stats("agent")
+    assert stats["thread_count"] == 2
+    assert stats["total_messages"] == 3
+    assert stats["unique_roles"] == {"user", "assistant"}
+    assert await provider.get_entity_stats("nobody") == {}
+
+    by_count = await provider.find_threads_by_message_count(min_messages=2)
+    assert [t.thread_id for t in by_count] == [first]
+    assert len(await provider.find_threads_by_age(max_age_seconds=60)) == 3
+    assert await provider.find_threads_by_age(min_age_seconds=60) == []
+
+@pytest.mark.asyncio
+async def test_delete_thread_recursive(provider):
+    """Test deleting a thread removes its descendants and their messages"""
+    root = await provider.create_thread("agent")
+    child = await provider.create_thread("agent", parent_thread_id=root)
+    grandchild = await provider.create_thread("agent", parent_thread_id=child)
+    keep = await provider.create_thread("agent")
+    await provider.save_state("agent", grandchild, {"messages": messages(2)})
+
+    await provider.delete_thread(root)
+
+    assert [t.thread_id for t in await provider.list_threads()] == [keep]
+    assert message_rows(provider) == []
+
+    single = await provider.create_thread("agent", parent_thread_id=keep)
+    await provider.delete_thread(keep, recursive=False)
+    assert await provider.get_thread(single) is not None
+
+@pytest.mark.asyncio
+async def test_cleanup_old_threads(provider):
+    """Test old threads are deleted in SQL"""
+    await provider.create_thread("agent")
+    assert await provider.cleanup_old_threads(max_age_seconds=60) == 0
+    assert await provider.cleanup_old_threads(max_age_seconds=0) == 1
+    assert await provider.get_thread_count() == 0
+
+@pytest.mark.asyncio
+async def test_dump_and_restore(provider, tmp_path):
+    """Test memory dumps round-trip through another provider"""
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {"messages": messages(2), "metadata": {"k": "v"}})
+    await provider.dump_memory(tmp_path / "dump.json")
+
+    restored = SQLiteMemoryProvider(":memory:")
+    try:
+        await restored.load_memory(tmp_path / "dump.json")
+        state = await restored.load_state("agent", thread_id)
+        assert len(state["messages"]) == 2
+        thread = await restored.get_thread(thread_id)
+        assert thread.metadata == {"k": "v"}
+        assert thread.updated_at == (await provider.get_thread(thread_id)).updated_at
+    finally:
+        restored.close()
+
+@pytest.mark.asyncio
+async def test_append_messages(provider):
+    """Test appends insert rows without touching stored messages"""
+    thread_id = await provider.create_thread("agent")
+    first = await provider.append_messages("agent", thread_id, messages(2))
+    before = provider._conn.total_changes
+
+    second = await provider.append_messages("agent", thread_id, messages(3)[2:], since_version=first)
+
+    assert second == first + 1
+    # One inserted message plus the state and thread rows
+    assert provider._conn.total_changes - before == 3
+    state = await provider.load_state("agent", thread_id)
+    assert [m["content"] for m in state["messages"]] == ["message 0", "message 1", "message 2"]
+    assert (await provider.get_thread(thread_id)).message_count == 3
+
+    with pytest.raises(VersionConflictError):
+        await provider.append_messages("agent", thread_id, messages(1), since_version=first)
+
+@pytest.mark.asyncio
+async def test_append_holds_write_lock_during_version_check(provider, tmp_path):
+    """Test another writer can't slip in between the version check and the append"""
+    other = SQLiteMemoryProvider(tmp_path / "memory.db", timeout=0.05)
+    thread_id = await provider.create_thread("agent")
+    first = await provider.append_messages("agent", thread_id, messages(1))
+
+    state_version = provider._state_version
+    interleaved = []
+
+    def check_then_interleave(entity_id, thread_id):
+        version = state_version(entity_id, thread_id)
+        if not interleaved:
+            try:
+                other._append_messages("agent", thread_id, messages(2)[1:], None, None)
+                interleaved.append("written")
+            except sqlite3.OperationalError:
+                interleaved.append("locked")
+        return version
+
+    provider._state_version = check_then_interleave
+    try:
+        await provider.append_messages("agent", thread_id, messages(2)[1:], since_version=first)
+    finally:
+        other.close()
+
+    assert interleaved == ["locked"]
+    assert await provider.get_state_version("agent", thread_id) == first + 1
+
+@pytest.mark.asyncio
+async def test_append_messages_with_updates(provider):
+    """Test appends can set other state keys, keeping the ones already stored"""
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {"messages": messages(1), "step": 1, "last_updated": "a"})
+
+    await provider.append_messages("agent", thread_id, messages(2)[1:], updates={"last_updated": "b"})
+
+    state = await provider.load_state("agent", thread_id)
+    assert state["step"] == 1
+    assert state["last_updated"] == "b"
+    assert len(state["messages"]) == 2
+
+@pytest.mark.asyncio
+async def test_load_state_versioned(provider):
+    """Test versioned loads skip unchanged state"""
+    thread_id = await provider.create_thread("agent")
+    await provider.save_state("agent", thread_id, {"messages": messages(1)})
+    version = await provider.get_state_version("agent", thread_id)
+
+    unchanged = await provider.load_state_versioned("agent", thread_id, version)
+    assert not unchanged.changed and unchanged.state is None
+
+    await provider.save_state("agent", thread_id, {"messages": messages(2)})
+    changed = await provider.load_state_versioned("agent", thread_id, version)
+    assert changed.changed and changed.version == version + 1
+    assert len(changed.state["messages"]) == 2
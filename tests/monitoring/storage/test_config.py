@@ -12,6 +12,10 @@ def test_default_config():
     assert config.retention_days == 30
     assert config.cleanup_interval == 60
     assert config.max_events is None
+    assert config.write_behind is False
+    assert config.batch_size == 100
+    assert config.flush_interval == 1.0
+    assert config.synchronous == "NORMAL"
 
 def test_custom_config():
     """Test custom configuration values"""
@@ -47,6 +51,16 @@ def test_validation():
     with pytest.raises(ValidationError):
         StorageConfig(max_events=-1)
 
+    # Test invalid write-behind settings
+    with pytest.raises(ValidationError):
+        StorageConfig(batch_size=0)
+
+    with pytest.raises(ValidationError):
+        StorageConfig(flush_interval=0)
+
+    with pytest.raises(ValidationError):
+        StorageConfig(synchronous="EXTRA")
+
 def test_model_dump():
     """Test configuration serialization"""
     config = StorageConfig(
@@ -59,5 +73,9 @@ def test_model_dump():
     assert data == {
         "retention_days": 7,
         "cleanup_interval": 30,
-        "max_events": 1000
+        "max_events": 1000,
+        "write_behind": False,
+        "batch_size": 100,
+        "flush_interval": 1.0,
+        "synchronous": "NORMAL"
     }
@@ -1,6 +1,8 @@
 """Tests for SQLite storage backend"""
 
+import json
 import shutil
+import sqlite3
 import tempfile
 import threading
 import time
@@ -9,9 +11,9 @@ from pathlib import Path
 
 import pytest
 
-from legion.monitoring.events.base import Event, EventCategory, EventType
+from legion.monitoring.events.base import Event, EventCategory, EventSeverity, EventType
 from legion.monitoring.storage.config import StorageConfig
-from legion.monitoring.storage.sqlite import SQLiteStorageBackend
+from legion.monitoring.storage.sqlite import SCHEMA_VERSION, SQLiteStorageBackend, _serialize_event
 
 
 @pytest.fixture
@@ -218,3 +220,239 @@ def test_concurrent_access(storage):
 
     # 5 threads * 100 events each = 500 total
     assert len(storage.get_events()) == 500
+
+def _make_event(component_id: str = "test") -> Event:
+    return Event(
+        event_type=EventType.AGENT,
+        component_id=component_id,
+        category=EventCategory.EXECUTION
+    )
+
+def test_wal_mode_and_synchronous(temp_dir):
+    """Test the shared connection uses WAL with the configured durability"""
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), StorageConfig(synchronous="OFF"))
+    try:
+        assert storage._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 0 = OFF, 1 = NORMAL, 2 = FULL
+        assert storage._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    finally:
+        storage.close()
+
+def test_write_behind_batches_until_flush(temp_dir):
+    """Test write-behind queues events until a flush"""
+    config = StorageConfig(write_behind=True, batch_size=1000, flush_interval=60)
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), config)
+    try:
+        for i in range(10):
+            storage.store_event(_make_event(f"test_{i}"))
+
+        assert storage.pending_count == 10
+        assert storage.row_count == 0
+
+        storage.flush()
+        assert storage.pending_count == 0
+        assert storage.row_count == 10
+    finally:
+        storage.close()
+
+def test_write_behind_reads_see_queued_events(temp_dir):
+    """Test reads flush queued events first"""
+    config = StorageConfig(write_behind=True, batch_size=1000, flush_interval=60)
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), config)
+    try:
+        event = _make_event()
+        storage.store_event(event)
+        events = storage.get_events()
+        assert len(events) == 1
+        assert events[0].id == event.id
+    finally:
+        storage.close()
+
+def test_write_behind_flushes_on_batch_size(temp_dir):
+    """Test reaching the batch size wakes the writer"""
+    config = StorageConfig(write_behind=True, batch_size=5, flush_interval=60)
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), config)
+    try:
+        for i in range(5):
+            storage.store_event(_make_event(f"test_{i}"))
+
+        deadline = time.monotonic() + 2
+        while storage.row_count < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert storage.row_count == 5
+    finally:
+        storage.close()
+
+def test_write_behind_flushes_on_interval(temp_dir):
+    """Test queued events are written after the flush interval"""
+    config = StorageConfig(write_behind=True, batch_size=1000, flush_interval=0.05)
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), config)
+    try:
+        storage.store_event(_make_event())
+
+        deadline = time.monotonic() + 2
+        while storage.row_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert storage.row_count == 1
+    finally:
+        storage.close()
+
+def test_close_flushes_queued_events(temp_dir):
+    """Test closing the backend persists queued events"""
+    db_path = temp_dir / "test.db"
+    config = StorageConfig(write_behind=True, batch_size=1000, flush_interval=60)
+    storage = SQLiteStorageBackend(str(db_path), config)
+    storage.store_event(_make_event())
+    storage.close()
+
+    with pytest.raises(RuntimeError):
+        storage.store_event(_make_event())
+
+    reopened = SQLiteStorageBackend(str(db_path))
+    try:
+        assert len(reopened.get_events()) == 1
+        assert reopened.row_count == 1
+    finally:
+        reopened.close()
+
+def test_write_behind_max_events(temp_dir):
+    """Test the maintained row counter enforces max events across batches"""
+    config = StorageConfig(write_behind=True, batch_size=1000, flush_interval=60, max_events=10)
+    storage = SQLiteStorageBackend(str(temp_dir / "test.db"), config)
+    try:
+        for i in range(25):
+            storage.store_event(_make_event(f"test_{i}"))
+
+        events = storage.get_events()
+        assert len(events) == 10
+        assert storage.row_count == 10
+        assert events[0].component_id == "test_15"
+        assert events[-1].component_id == "test_24"
+    finally:
+        storage.close()
+
+def test_row_count_tracks_cleanup(storage):
+    """Test the row counter follows retention cleanup and clear"""
+    old_event = _make_event()
+    old_event.timestamp = datetime.now(timezone.utc) - timedelta(days=10)
+    storage.store_event(old_event)
+    storage.store_event(_make_event())
+    assert storage.row_count == 2
+
+    storage.cleanup(retention_days=5)
+    assert storage.row_count == 1
+
+    storage.clear()
+    assert storage.row_count == 0
+
+def test_migrates_json_only_schema(temp_dir):
+    """Test a database from the JSON-only schema gains backfilled columns"""
+    db_path = temp_dir / "legacy.db"
+    event = _make_event("legacy")
+    event.duration_ms = 12.5
+    event.provider_name = "openai"
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE events (
+                id TEXT PRIMARY KEY,
+                timestamp DATETIME NOT NULL,
+                event_type TEXT NOT NULL,
+                component_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                data TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (str(event.id), event.timestamp.isoformat(), event.event_type.value,
+             event.component_id, event.category.value, json.dumps(_serialize_event(event)))
+        )
+
+    storage = SQLiteStorageBackend(str(db_path))
+    try:
+        assert storage._conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        row = storage._conn.execute(
+            "SELECT severity, duration_ms, provider_name, root_event_id FROM events"
+        ).fetchone()
+        assert row == ("info", 12.5, "openai", str(event.id))
+
+        events = storage.get_events(provider_name="openai")
+        assert [e.id for e in events] == [event.id]
+    finally:
+        storage.close()
+
+def test_column_filters(storage):
+    """Test component, severity, category and provider filters run in SQL"""
+    first = _make_event("agent_a")
+    second = _make_event("agent_b")
+    second.severity = EventSeverity.ERROR
+    second.model_name = "gpt-4o"
+    third = _make_event("agent_c")
+    third.category = EventCategory.ERROR
+    for event in (first, second, third):
+        storage.store_event(event)
+
+    assert [e.id for e in storage.get_events(component_id="agent_a")] == [first.id]
+    assert len(storage.get_events(component_id=["agent_a", "agent_b"])) == 2
+    assert [e.id for e in storage.get_events(severity=EventSeverity.ERROR)] == [second.id]
+    assert [e.id for e in storage.get_events(category=EventCategory.ERROR)] == [third.id]
+    assert [e.id for e in storage.get_events(model_name="gpt-4o")] == [second.id]
+    assert [e.id for e in storage.get_events(root_event_id=first.id)] == [first.id]
+
+def test_limit_offset_and_order(storage):
+    """Test pagination and ordering are pushed down into the query"""
+    base = datetime.now(timezone.utc)
+    for i in range(5):
+        event = _make_event(f"test_{i}")
+        event.timestamp = base + timedelta(seconds=i)
+        storage.store_event(event)
+
+    page = storage.get_events(limit=2, offset=1)
+    assert [e.component_id for e in page] == ["test_1", "test_2"]
+
+    newest = storage.get_events(order="desc", limit=2)
+    assert [e.component_id for e in newest] == ["test_4", "test_3"]
+
+    assert len(storage.get_events(offset=3)) == 2
+
+    with pytest.raises(ValueError):
+        storage.get_events(order="sideways")
+
+def test_aggregates_per_component(storage):
+    """Test sums, averages and percentiles are computed per component"""
+    for i in range(1, 101):
+        event = _make_event("agent_a")
+        event.duration_ms = float(i)
+        event.tokens_used = 10
+        storage.store_event(event)
+    for value in (5.0, 15.0):
+        event = _make_event("agent_b")
+        event.duration_ms = value
+        storage.store_event(event)
+    # Events without the metric are ignored
+    storage.store_event(_make_event("agent_c"))
+
+    stats = storage.get_aggregates("duration_ms", percentiles=(50, 95, 99))
+    assert set(stats) == {"agent_a", "agent_b"}
+    assert stats["agent_a"]["count"] == 100
+    assert stats["agent_a"]["sum"] == 5050.0
+    assert stats["agent_a"]["avg"] == 50.5
+    assert stats["agent_a"]["p50"] == 50.0
+    assert stats["agent_a"]["p95"] == 95.0
+    assert stats["agent_a"]["p99"] == 99.0
+    assert stats["agent_b"]["min"] == 5.0
+    assert stats["agent_b"]["max"] == 15.0
+    assert stats["agent_b"]["p50"] == 5.0
+
+    tokens = storage.get_aggregates("tokens_used", component_id="agent_a")
+    assert tokens["agent_a"]["sum"] == 1000
+
+def test_aggregates_reject_unknown_columns(storage):
+    """Test only known columns can be interpolated into aggregate queries"""
+    with pytest.raises(ValueError):
+        storage.get_aggregates(metric="data")
+    with pytest.raises(ValueError):
+        storage.get_aggregates(group_by="id; DROP TABLE events")
+    with pytest.raises(ValueError):
+        storage.get_aggregates(percentiles=(0,))
@@ -8,8 +8,8 @@ import time
 
 import pytest
 
-from legion.monitoring.events.base import Event, EventCategory, EventType
-from legion.monitoring.metrics import MetricsContext, SystemMetricsCollector
+from legion.monitoring.events.base import Event, EventCategory, EventEmitter, EventType
+from legion.monitoring.metrics import MetricsContext, MetricsSampler, SystemMetricsCollector
 
 
 def test_execution_context():
@@ -112,5 +112,105 @@ def test_metrics_context_exception():
     assert event.memory_usage_bytes is not None
     assert event.cpu_usage_percent is not None
 
+def test_sampler_is_shared():
+    """Test the sampler is a process-wide singleton with static context cached"""
+    sampler = MetricsSampler.get_instance()
+    assert MetricsSampler.get_instance() is sampler
+
+    snapshot = sampler.snapshot()
+    assert snapshot["process_id"] == os.getpid()
+    assert snapshot["host_name"] == platform.node()
+    assert snapshot["python_version"] == sys.version
+    assert isinstance(snapshot["memory_usage_bytes"], int)
+
+def test_sampler_refreshes_in_background():
+    """Test the background thread replaces the snapshot on its interval"""
+    sampler = MetricsSampler.configure(interval=0.02)
+    try:
+        first = sampler.snapshot()
+        time.sleep(0.1)
+        assert sampler.snapshot() is not first
+    finally:
+        MetricsSampler.configure(interval=MetricsSampler.DEFAULT_INTERVAL)
+
+def test_sampler_rejects_invalid_interval():
+    """Test the sampling interval must be positive"""
+    with pytest.raises(ValueError):
+        MetricsSampler(interval=0)
+
+def test_metrics_context_reads_cached_snapshot(monkeypatch):
+    """Test metrics context does not sample psutil per event"""
+    MetricsSampler.get_instance()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("psutil sampled on the hot path")
+
+    monkeypatch.setattr(SystemMetricsCollector, "__init__", fail)
+    monkeypatch.setattr(SystemMetricsCollector, "get_system_metrics", fail)
+
+    event = Event(
+        event_type=EventType.AGENT,
+        component_id="test_agent",
+        category=EventCategory.EXECUTION
+    )
+    with MetricsContext(event):
+        pass
+
+    assert event.memory_usage_bytes is not None
+    assert event.thread_id == threading.get_ident()
+
+def test_metrics_context_reports_io_deltas(monkeypatch):
+    """Test IO metrics cover the operation, not the sampler's lifetime"""
+    sampler = MetricsSampler.get_instance()
+    samples = iter([
+        {"system_disk_usage_bytes": 1000, "system_network_bytes_sent": 500, "system_network_bytes_received": 700},
+        {"system_disk_usage_bytes": 1300, "system_network_bytes_sent": 520, "system_network_bytes_received": 760}
+    ])
+    monkeypatch.setattr(sampler, "io_counters", lambda: next(samples))
+
+    event = Event(
+        event_type=EventType.AGENT,
+        component_id="test_agent",
+        category=EventCategory.EXECUTION
+    )
+    with MetricsContext(event):
+        pass
+
+    assert event.system_disk_usage_bytes == 300
+    assert event.system_network_bytes_sent == 20
+    assert event.system_network_bytes_received == 60
+
+def test_metrics_context_without_system_enrichment():
+    """Test system enrichment can be disabled"""
+    event = Event(
+        event_type=EventType.AGENT,
+        component_id="test_agent",
+        category=EventCategory.EXECUTION
+    )
+
+    with MetricsContext(event, enrich_system=False):
+        pass
+
+    assert event.duration_ms is not None
+    assert event.thread_id is None
+    assert event.system_cpu_percent is None
+    assert event.memory_usage_bytes is None
+
+def test_emitter_can_disable_system_metrics():
+    """Test an emitter can skip system enrichment for its events"""
+    emitter = EventEmitter()
+    emitter.disable_system_metrics()
+    received = []
+
+    def handler(event):
+        received.append(event)
+
+    emitter.add_event_handler(handler)
+    with emitter.event_span(EventType.AGENT, "test_agent", EventCategory.EXECUTION):
+        pass
+
+    assert received[0].duration_ms is not None
+    assert received[0].host_name is None
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,10 +1,26 @@
 """Tests for the Anthropic provider implementation"""
 
+import asyncio
 import json
 import os
 from typing import List
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from anthropic.types import Message as AnthropicMessage
+from anthropic.types import (
+    InputJsonDelta,
+    MessageDeltaUsage,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    TextBlock,
+    TextDelta,
+    ToolUseBlock,
+    Usage,
+)
+from anthropic.types.raw_message_delta_event import Delta
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
@@ -81,7 +97,7 @@ async def test_basic_completion(provider):
     messages = [
         Message(role=Role.USER, content="Say 'Hello, World!'")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="claude-3-haiku-20240307",
         temperature=0.7
@@ -99,7 +115,7 @@ async def test_tool_completion(provider):
     messages = [
         Message(role=Role.USER, content="Use the mock tool with input='test'")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="claude-3-haiku-20240307",
         tools=[tool],
@@ -119,7 +135,7 @@ async def test_json_completion(provider):
             content="Generate a test response with message='Hello', score=0.9, tags=['test']"
         )
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="claude-3-haiku-20240307",
         temperature=0.1,
@@ -139,7 +155,7 @@ async def test_tool_and_json_completion(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant that uses tools and returns structured data."),
         Message(role=Role.USER, content="Use the mock tool with input='test', then format the response as a test response")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="claude-3-haiku-20240307",
         tools=[tool],
@@ -179,7 +195,7 @@ async def test_system_message_handling(provider):
         Message(role=Role.SYSTEM, content="You are Claude, a helpful AI assistant created by Anthropic."),
         Message(role=Role.USER, content="Who are you?")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="claude-3-haiku-20240307",
         temperature=0
@@ -192,7 +208,7 @@ async def test_invalid_model(provider):
     """Test error handling for invalid model"""
     messages = [Message(role=Role.USER, content="Test")]
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="invalid-model"
         )
@@ -204,10 +220,202 @@ async def test_invalid_api_key():
     provider = AnthropicProvider(config=config)
     messages = [Message(role=Role.USER, content="Test")]
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="claude-3-haiku-20240307"
         )
 
+def make_anthropic_response(*blocks):
+    """Build an Anthropic SDK response for offline tests"""
+    return AnthropicMessage(
+        id="msg_test",
+        content=list(blocks),
+        model="claude-3-haiku-20240307",
+        role="assistant",
+        stop_reason="end_turn",
+        type="message",
+        usage=Usage(input_tokens=3, output_tokens=5)
+    )
+
+@pytest.fixture
+def offline_provider():
+    provider = AnthropicProvider(config=ProviderConfig(api_key="test-key"))
+    provider.client = MagicMock()
+    return provider
+
+@pytest.mark.asyncio
+async def test_async_client_is_lazy_and_reused(offline_provider):
+    """Test the async client is created once and reused"""
+    assert offline_provider._async_client is None
+    await offline_provider._ensure_async_client()
+    client = offline_provider._async_client
+    assert client is not None
+    await offline_provider._ensure_async_client()
+    assert offline_provider._async_client is client
+
+@pytest.mark.asyncio
+async def test_async_completion_uses_async_client(offline_provider):
+    """Test async completions never touch the sync client"""
+    offline_provider._async_client = MagicMock()
+    offline_provider._async_client.messages.create = AsyncMock(
+        return_value=make_anthropic_response(TextBlock(type="text", text="Hello"))
+    )
+
+    response = await offline_provider.acomplete(
+        messages=[
+            Message(role=Role.SYSTEM, content="Be brief"),
+            Message(role=Role.USER, content="Hi")
+        ],
+        model="claude-3-haiku-20240307"
+    )
+
+    assert response.content == "Hello"
+    assert response.usage.total_tokens == 8
+    request = offline_provider._async_client.messages.create.call_args.kwargs
+    assert request["system"] == "Be brief"
+    offline_provider.client.messages.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_async_tool_loop(offline_provider):
+    """Test the async tool loop runs tools and returns the final response"""
+    offline_provider._async_client = MagicMock()
+    offline_provider._async_client.messages.create = AsyncMock(side_effect=[
+        make_anthropic_response(
+            ToolUseBlock(type="tool_use", id="call_1", name="mock_tool", input={"input": "test"})
+        ),
+        make_anthropic_response(TextBlock(type="text", text="Done"))
+    ])
+
+    response = await offline_provider.acomplete(
+        messages=[Message(role=Role.USER, content="Use the tool")],
+        model="claude-3-haiku-20240307",
+        tools=[MockTool()]
+    )
+
+    assert response.content == "Done"
+    assert response.tool_calls[0]["id"] == "call_1"
+    second_request = offline_provider._async_client.messages.create.call_args_list[1].kwargs
+    tool_result = second_request["messages"][-1]["content"][0]
+    assert tool_result["type"] == "tool_result"
+    assert tool_result["content"] == "Mock tool response: test"
+
+@pytest.mark.asyncio
+async def test_async_json_completion(offline_provider):
+    """Test async JSON completion validates against the schema"""
+    payload = {"message": "Hello", "score": 0.9, "tags": ["test"]}
+    offline_provider._async_client = MagicMock()
+    offline_provider._async_client.messages.create = AsyncMock(
+        return_value=make_anthropic_response(TextBlock(type="text", text=json.dumps(payload)))
+    )
+
+    response = await offline_provider.acomplete(
+        messages=[Message(role=Role.USER, content="Respond")],
+        model="claude-3-haiku-20240307",
+        response_schema=TestResponse
+    )
+
+    assert TestResponse.model_validate_json(response.content).message == "Hello"
+
+@pytest.mark.asyncio
+async def test_async_completions_overlap(offline_provider):
+    """Test concurrent async completions share the event loop"""
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return make_anthropic_response(TextBlock(type="text", text="ok"))
+
+    offline_provider._async_client = MagicMock()
+    offline_provider._async_client.messages.create = create
+
+    await asyncio.gather(*[
+        offline_provider.acomplete(
+            messages=[Message(role=Role.USER, content="Hi")],
+            model="claude-3-haiku-20240307"
+        )
+        for _ in range(10)
+    ])
+
+    assert peak == 10
+
+async def anthropic_stream(*events):
+    for event in events:
+        yield event
+
+def stream_start():
+    return RawMessageStartEvent(type="message_start", message=make_anthropic_response())
+
+def stream_stop(stop_reason, output_tokens):
+    return RawMessageDeltaEvent(
+        type="message_delta",
+        delta=Delta(stop_reason=stop_reason),
+        usage=MessageDeltaUsage(output_tokens=output_tokens)
+    )
+
+@pytest.mark.asyncio
+async def test_async_stream_with_tool_use(offline_provider):
+    """Test streamed text and tool input deltas are assembled across turns"""
+    offline_provider._async_client = MagicMock()
+    offline_provider._async_client.messages.create = AsyncMock(side_effect=[
+        anthropic_stream(
+            stream_start(),
+            RawContentBlockStartEvent(
+                type="content_block_start", index=0,
+                content_block=ToolUseBlock(type="tool_use", id="call_1", name="mock_tool", input={})
+            ),
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0,
+                delta=InputJsonDelta(type="input_json_delta", partial_json='{"input": ')
+            ),
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0,
+                delta=InputJsonDelta(type="input_json_delta", partial_json='"test"}')
+            ),
+            stream_stop("tool_use", 4)
+        ),
+        anthropic_stream(
+            stream_start(),
+            RawContentBlockStartEvent(
+                type="content_block_start", index=0,
+                content_block=TextBlock(type="text", text="")
+            ),
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0,
+                delta=TextDelta(type="text_delta", text="Do")
+            ),
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0,
+                delta=TextDelta(type="text_delta", text="ne")
+            ),
+            stream_stop("end_turn", 2)
+        )
+    ])
+
+    chunks = [
+        chunk async for chunk in offline_provider.astream(
+            messages=[Message(role=Role.USER, content="Use the tool")],
+            model="claude-3-haiku-20240307",
+            tools=[MockTool()]
+        )
+    ]
+
+    assert [c.content for c in chunks if c.content] == ["Do", "ne"]
+    response = chunks[-1].response
+    assert response.content == "Done"
+    assert response.tool_calls[0]["result"] == "Mock tool response: test"
+    assert response.usage.completion_tokens == 6
+    assert chunks[-1].finish_reason == "end_turn"
+
+    first_request = offline_provider._async_client.messages.create.call_args_list[0].kwargs
+    assert first_request["stream"] is True
+    assert first_request["tools"][0]["name"] == "mock_tool"
+    second_request = offline_provider._async_client.messages.create.call_args_list[1].kwargs
+    assert second_request["messages"][-1]["content"][0]["type"] == "tool_result"
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,5 +1,9 @@
+import asyncio
 import os
+import threading
+import time
 from typing import List
+from unittest.mock import MagicMock
 from pydantic import BaseModel
 
 import pytest
@@ -205,7 +209,128 @@ async def test_system_message_handling(provider):
         model="us.amazon.nova-lite-v1:0",
         temperature=0
     )
-    
+
     assert isinstance(response, ModelResponse)
     assert isinstance(response.content, str)
-    assert "Hello" in response.content 
\ No newline at end of file
+    assert "Hello" in response.content
+
+
+class StubBedrockClient:
+    """Stubbed bedrock-runtime client with a blocking converse call"""
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def converse(self, **kwargs):
+        with self.tracker["lock"]:
+            self.tracker["in_flight"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["in_flight"])
+        time.sleep(0.05)
+        with self.tracker["lock"]:
+            self.tracker["in_flight"] -= 1
+        return {
+            "output": {"message": {"role": "assistant", "content": [{"text": "Hello"}]}},
+            "usage": {"inputTokens": 2, "outputTokens": 1, "totalTokens": 3}
+        }
+
+@pytest.fixture
+def stub_tracker(monkeypatch):
+    tracker = {"lock": threading.Lock(), "in_flight": 0, "peak": 0, "clients": 0}
+
+    def make_session(**kwargs):
+        session = MagicMock()
+
+        def make_client(**client_kwargs):
+            tracker["clients"] += 1
+            return StubBedrockClient(tracker)
+
+        session.client.side_effect = make_client
+        return session
+
+    monkeypatch.setattr("legion.providers.bedrock.boto3.Session", make_session)
+    return tracker
+
+def make_stub_provider(**extra):
+    return BedrockProvider(config=ProviderConfig(
+        api_key="key",
+        api_secret="secret",
+        region="us-east-1",
+        **extra
+    ))
+
+@pytest.mark.asyncio
+async def test_async_completions_run_off_loop(stub_tracker):
+    """Test concurrent async completions overlap without blocking the loop"""
+    provider = make_stub_provider(max_workers=4)
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker_task = asyncio.create_task(ticker())
+    responses = await asyncio.gather(*[
+        provider.acomplete(
+            messages=[Message(role=Role.USER, content="Say hello")],
+            model="us.amazon.nova-lite-v1:0"
+        )
+        for _ in range(4)
+    ])
+    done.set()
+    await ticker_task
+    provider.close()
+
+    assert all(response.content == "Hello" for response in responses)
+    assert stub_tracker["peak"] == 4
+    # The event loop kept running while converse blocked in worker threads
+    assert ticks > 3
+
+@pytest.mark.asyncio
+async def test_async_concurrency_limit(stub_tracker):
+    """Test max_concurrency bounds in-flight converse calls"""
+    provider = make_stub_provider(max_workers=8, max_concurrency=2)
+    await asyncio.gather(*[
+        provider.acomplete(
+            messages=[Message(role=Role.USER, content="Say hello")],
+            model="us.amazon.nova-lite-v1:0"
+        )
+        for _ in range(6)
+    ])
+    provider.close()
+
+    assert stub_tracker["peak"] == 2
+
+@pytest.mark.asyncio
+async def test_client_pool_is_bounded_and_reused(stub_tracker):
+    """Test boto3 clients are pooled up to max_workers and reused"""
+    provider = make_stub_provider(max_workers=3)
+    for _ in range(2):
+        await asyncio.gather(*[
+            provider.acomplete(
+                messages=[Message(role=Role.USER, content="Say hello")],
+                model="us.amazon.nova-lite-v1:0"
+            )
+            for _ in range(6)
+        ])
+    provider.close()
+
+    assert stub_tracker["clients"] <= 3
+    assert provider._client_pool.qsize() == stub_tracker["clients"]
+
+@pytest.mark.asyncio
+async def test_async_setup_keeps_client_pool(stub_tracker):
+    """Test async setup reuses the existing client pool and borrowed clients"""
+    provider = make_stub_provider(max_workers=2)
+    pool = provider._client_pool
+    borrowed = provider._acquire_client()
+
+    await provider._asetup_client()
+    provider._release_client(borrowed)
+    provider.close()
+
+    assert provider._client_pool is pool
+    assert provider._client_count == 1
+    assert stub_tracker["clients"] == 1
@@ -189,6 +189,24 @@ class TestGeminiProvider:
         assert json.loads(result.content) == {"name": "test", "value": 42}
         assert result.usage.total_tokens == 30
 
+    @pytest.mark.asyncio
+    async def test_sync_json_completion_inside_running_loop(self, provider):
+        """Test the sync JSON completion can be called from a coroutine"""
+        class TestSchema(BaseModel):
+            name: str
+            value: int
+
+        provider.client.chat.completions.create.return_value = MockResponse('{"name": "test", "value": 42}')
+
+        result = provider._get_json_completion(
+            messages=[Message(role=Role.USER, content="Get JSON")],
+            model="gemini-1.5-pro",
+            schema=TestSchema,
+            temperature=0.7
+        )
+
+        assert json.loads(result.content) == {"name": "test", "value": 42}
+
     def test_validate_request(self, provider):
         """Test request parameter validation"""
         # Test temperature=0 handling
@@ -1,17 +1,21 @@
 """Tests for the Groq provider implementation"""
 
+import asyncio
 import json
 import os
+import time
 from typing import List, Optional
 
 import pytest
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+from legion.agents.base import Agent
 from legion.errors import ProviderError
 from legion.interface.schemas import Message, ProviderConfig, Role
 from legion.interface.tools import BaseTool
 from legion.providers.groq import GroqFactory, GroqProvider
+from tests.utils import FakeChatServer
 
 # Load environment variables
 load_dotenv()
@@ -206,5 +210,55 @@ def test_error_handling(provider):
         )
 
 
+@pytest.mark.asyncio
+async def test_concurrent_agents_overlap(monkeypatch):
+    """Test requests from concurrent Groq agents overlap instead of blocking the event loop"""
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    with FakeChatServer(delay=0.2) as server:
+        agents = [
+            Agent(name=f"agent_{i}", model="groq:llama-3.3-70b-versatile", base_url=server.base_url)
+            for i in range(5)
+        ]
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(agent.aprocess("Hello") for agent in agents))
+        elapsed = time.perf_counter() - start
+
+    assert [response.content for response in responses] == ["reply"] * 5
+    assert server.peak == 5
+    # Serialized requests would take at least 5 x 0.2s
+    assert elapsed < 0.6
+
+@pytest.mark.asyncio
+async def test_async_tool_and_json_completion():
+    """Test the async tool loop runs tools and JSON completions are validated"""
+    def reply(body):
+        if body.get("response_format"):
+            return {"role": "assistant", "content": json.dumps({"message": "done", "score": 0.5, "tags": None})}
+        if body["messages"][-1]["role"] == "tool":
+            return {"role": "assistant", "content": f"Tool said: {body['messages'][-1]['content']}"}
+        return {"role": "assistant", "content": None, "tool_calls": [{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "mock_tool", "arguments": json.dumps({"input": "x"})}
+        }]}
+
+    with FakeChatServer(reply=reply) as server:
+        provider = GroqProvider(ProviderConfig(api_key="test_key", base_url=server.base_url))
+        messages = [Message(role=Role.USER, content="Use the tool")]
+
+        response = await provider._aget_tool_completion(
+            messages=messages, model="llama-3.3-70b-versatile", tools=[MockTool()], temperature=0
+        )
+        json_response = await provider._aget_json_completion(
+            messages=messages, model="llama-3.3-70b-versatile", schema=TestResponse, temperature=0
+        )
+
+    assert response.content == "Tool said: Mock tool response"
+    assert server.requests[0]["tools"][0]["function"]["name"] == "mock_tool"
+    assert json.loads(json_response.content)["message"] == "done"
+    assert json_response.usage.total_tokens == 15
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -67,7 +67,7 @@ async def test_basic_completion(provider):
     messages = [
         Message(role=Role.USER, content="Say 'Hello, World!'")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="google/gemma-2-2b-it",
         temperature=0
@@ -88,7 +88,7 @@ async def test_tool_completion(provider):
     ]
     try:
         response = await asyncio.wait_for(
-            provider.complete(
+            provider.acomplete(
                 messages=messages,
                 model="google/gemma-2-2b-it",
                 tools=[tool],
@@ -119,7 +119,7 @@ async def test_json_completion(provider):
     ]
     try:
         response = await asyncio.wait_for(
-            provider.complete(
+            provider.acomplete(
                 messages=messages,
                 model="google/gemma-2-2b-it",
                 temperature=0,
@@ -150,7 +150,7 @@ async def test_tool_and_json_completion(provider):
     try:
         # Set a 30 second timeout
         response = await asyncio.wait_for(
-            provider.complete(
+            provider.acomplete(
                 messages=messages,
                 model="google/gemma-2-2b-it",
                 tools=[tool],
@@ -192,7 +192,7 @@ async def test_invalid_api_key():
     messages = [Message(role=Role.USER, content="test")]
 
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="google/gemma-2-2b-it"
         )
@@ -202,7 +202,7 @@ async def test_invalid_model(provider):
     messages = [Message(role=Role.USER, content="test")]
 
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="invalid-model"
         )
@@ -213,7 +213,7 @@ async def test_system_message_handling(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant"),
         Message(role=Role.USER, content="Who are you?")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="google/gemma-2-2b-it",
         temperature=0
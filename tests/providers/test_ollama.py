@@ -1,6 +1,9 @@
 from typing import List
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from ollama import ChatResponse
+from ollama import Message as OllamaMessage
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
@@ -61,7 +64,7 @@ async def test_basic_completion(provider):
     messages = [
         Message(role=Role.USER, content="Say 'Hello, World!'")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model=MODEL,
         temperature=0
@@ -79,7 +82,7 @@ async def test_tool_completion(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant that uses tools when appropriate."),
         Message(role=Role.USER, content="Use the simple tool to say hello")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model=MODEL,
         tools=[tool],
@@ -98,7 +101,7 @@ async def test_json_completion(provider):
             content="Give me information about a person named John who is 25 and likes reading and gaming"
         )
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model=MODEL,
         temperature=0,
@@ -117,7 +120,7 @@ async def test_tool_and_json_completion(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant that uses tools and returns structured data."),
         Message(role=Role.USER, content="Use the simple tool to say hello, then format the response as a person's info")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model=MODEL,
         tools=[tool],
@@ -154,7 +157,7 @@ async def test_invalid_model(provider):
     messages = [Message(role=Role.USER, content="test")]
 
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="invalid-model"
         )
@@ -165,7 +168,7 @@ async def test_system_message_handling(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant"),
         Message(role=Role.USER, content="Who are you?")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model=MODEL,
         temperature=0
@@ -174,5 +177,44 @@ async def test_system_message_handling(provider):
     # Check that the response is a proper self-introduction
     assert any(word in response.content.lower() for word in ["assist", "help", "support"])
 
+async def ollama_stream(*parts):
+    for part in parts:
+        yield part
+
+@pytest.mark.asyncio
+async def test_async_stream_with_tool_call(provider):
+    """Test streamed Ollama parts are assembled and tools run between turns"""
+    tool_call = OllamaMessage.ToolCall(
+        function=OllamaMessage.ToolCall.Function(name="simple_tool", arguments={"message": "hi"})
+    )
+    provider._async_client = MagicMock()
+    provider._async_client.chat = AsyncMock(side_effect=[
+        ollama_stream(
+            ChatResponse(message=OllamaMessage(role="assistant", content="", tool_calls=[tool_call])),
+            ChatResponse(message=OllamaMessage(role="assistant", content=""), done=True,
+                         done_reason="stop", prompt_eval_count=4, eval_count=2)
+        ),
+        ollama_stream(
+            ChatResponse(message=OllamaMessage(role="assistant", content="Do")),
+            ChatResponse(message=OllamaMessage(role="assistant", content="ne"), done=True,
+                         done_reason="stop", prompt_eval_count=6, eval_count=1)
+        )
+    ])
+
+    chunks = [
+        chunk async for chunk in provider.astream(
+            messages=[Message(role=Role.USER, content="Use the tool")],
+            model=MODEL,
+            tools=[SimpleTool()]
+        )
+    ]
+
+    assert [c.content for c in chunks if c.content] == ["Do", "ne"]
+    response = chunks[-1].response
+    assert response.content == "Done"
+    assert response.tool_calls[0]["result"] == "Tool response: hi"
+    assert response.usage.total_tokens == 13
+    assert provider._async_client.chat.call_args_list[0].kwargs["stream"] is True
+
 if __name__ == "__main__":
     pytest.main()
@@ -64,7 +64,7 @@ async def test_basic_completion(provider):
     messages = [
         Message(role=Role.USER, content="Say 'Hello, World!'")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="gpt-4o-mini",
         temperature=0
@@ -82,7 +82,7 @@ async def test_tool_completion(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant that uses tools when appropriate."),
         Message(role=Role.USER, content="Use the simple tool to say hello")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="gpt-4o-mini",
         tools=[tool],
@@ -101,7 +101,7 @@ async def test_json_completion(provider):
             content="Give me information about a person named John who is 25 and likes reading and gaming"
         )
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="gpt-4o-mini",
         temperature=0,
@@ -120,7 +120,7 @@ async def test_tool_and_json_completion(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant that uses tools and returns structured data."),
         Message(role=Role.USER, content="Use the simple tool to say hello, then format the response as a person's info")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="gpt-4o-mini",
         tools=[tool],
@@ -159,7 +159,7 @@ async def test_invalid_api_key():
     messages = [Message(role=Role.USER, content="test")]
 
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="gpt-4o-mini"
         )
@@ -169,7 +169,7 @@ async def test_invalid_model(provider):
     messages = [Message(role=Role.USER, content="test")]
 
     with pytest.raises(ProviderError):
-        await provider.complete(
+        await provider.acomplete(
             messages=messages,
             model="invalid-model"
         )
@@ -180,7 +180,7 @@ async def test_system_message_handling(provider):
         Message(role=Role.SYSTEM, content="You are a helpful assistant"),
         Message(role=Role.USER, content="Who are you?")
     ]
-    response = await provider.complete(
+    response = await provider.acomplete(
         messages=messages,
         model="gpt-4o-mini",
         temperature=0
@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from legion.providers import PROVIDER_FACTORIES, LazyFactoryRegistry, available_providers, get_provider
+from legion.providers.factory import ProviderFactory
+from legion.providers.openai import OpenAIFactory
+
+PROVIDER_SDKS = ["openai", "anthropic", "groq", "ollama", "google.generativeai", "boto3", "transformers"]
+
+# Runs in a fresh interpreter so modules imported by other tests don't count
+IMPORT_BENCHMARK = f"""
+import json, sys, time
+start = time.perf_counter()
+import legion
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "imported": [name for name in {PROVIDER_SDKS!r} + ["rich"] if name in sys.modules]
+}}))
+"""
+
+def test_import_legion_does_not_import_provider_sdks():
+    """Test importing legion loads no provider SDK or rich"""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_BENCHMARK],
+        capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    print(f"import legion: {result['seconds'] * 1000:.1f}ms")
+    assert result["imported"] == []
+
+def test_registry_lists_providers_without_importing():
+    """Test listing and membership checks don't resolve factories"""
+    registry = LazyFactoryRegistry({"fake": "legion.providers.missing.FakeFactory"})
+
+    assert "fake" in registry
+    assert list(registry) == ["fake"]
+    assert not registry.is_loaded("fake")
+
+def test_registry_resolves_on_lookup():
+    """Test factories are imported on first lookup"""
+    registry = LazyFactoryRegistry({"openai": ".openai.OpenAIFactory"})
+
+    assert registry["openai"] is OpenAIFactory
+    assert registry.is_loaded("openai")
+    with pytest.raises(KeyError):
+        registry["missing"]
+
+def test_registry_register_class():
+    """Test factories can be registered directly"""
+    class FakeFactory(ProviderFactory):
+        def create_provider(self, config=None, **kwargs):
+            return "provider"
+
+    registry = LazyFactoryRegistry({})
+    registry.register("fake", FakeFactory)
+
+    assert registry["fake"] is FakeFactory
+
+def test_get_provider_unknown_name():
+    """Test unknown providers are rejected with the available names"""
+    assert "openai" in available_providers()
+    assert set(available_providers()) == set(PROVIDER_FACTORIES)
+    with pytest.raises(ValueError):
+        get_provider("not-a-provider")
@@ -1,6 +1,16 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
 from unittest.mock import AsyncMock, MagicMock
 
-from legion.interface.schemas import ModelResponse, Role, TokenUsage
+from pydantic import BaseModel
+
+from legion.interface.base import LLMInterface
+from legion.interface.schemas import Message, ModelResponse, ProviderConfig, Role, TokenUsage
+from legion.interface.tools import BaseTool
 
 
 class MockOpenAIProvider:
@@ -19,3 +29,163 @@ class MockOpenAIProvider:
             raw_response={"content": "Mock response"},
             usage=TokenUsage(prompt_tokens=10, completion_tokens=10, total_tokens=20)
         ))
+
+class CountingLLM(LLMInterface):
+    """Provider that counts completions and can be slowed down or made to fail"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False, **config: Any):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.delay = delay
+        self.fail = fail
+        super().__init__(ProviderConfig(api_key="test", **config))
+
+    def _setup_client(self) -> None:
+        pass
+
+    async def _asetup_client(self) -> None:
+        pass
+
+    def _format_messages(self, messages: List[Message]) -> Any:
+        return messages
+
+    def _extract_tool_calls(self, response: Any) -> Optional[List[Dict[str, Any]]]:
+        return None
+
+    def _extract_content(self, response: Any) -> str:
+        return ""
+
+    def _extract_usage(self, response: Any) -> TokenUsage:
+        return TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+
+    def _get_chat_completion(self, messages, model, temperature, max_tokens=None):
+        raise NotImplementedError
+
+    def _get_tool_completion(self, messages, model, tools, temperature, max_tokens=None,
+                             format_json=False, json_schema=None):
+        raise NotImplementedError
+
+    def _get_json_completion(self, messages, model, schema, temperature, max_tokens=None):
+        raise NotImplementedError
+
+    async def _aget_chat_completion(
+        self,
+        messages: List[Message],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        self.calls += 1
+        call = self.calls
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("provider down")
+        return ModelResponse(
+            content=f"reply {call} to {messages[-1].content}",
+            usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        )
+
+    async def _aget_tool_completion(
+        self,
+        messages: List[Message],
+        model: str,
+        tools: Sequence[BaseTool],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+        format_json: bool = False,
+        json_schema: Optional[Type[BaseModel]] = None
+    ) -> ModelResponse:
+        return await self._aget_chat_completion(messages, model, temperature, max_tokens)
+
+    async def _aget_json_completion(
+        self,
+        messages: List[Message],
+        model: str,
+        schema: Type[BaseModel],
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        return await self._aget_chat_completion(messages, model, temperature, max_tokens)
+
+class FakeChatServer:
+    """Local OpenAI-compatible chat completions server for provider tests
+
+    Each request takes ``delay`` seconds and is answered with the message
+    returned by ``reply`` for the request body. The server records request
+    bodies and the peak number of requests handled at once.
+    """
+
+    def __init__(self, delay: float = 0.0, reply: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        self.delay = delay
+        self.reply = reply or (lambda body: {"role": "assistant", "content": "reply"})
+        self.requests: List[Dict[str, Any]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "FakeChatServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _handle(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.requests.append(body)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            message = self.reply(body)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+        return {
+            "id": f"chatcmpl-{len(self.requests)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if message.get("tool_calls") else "stop"
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        }
+
+    def _handler(self) -> Type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                payload = json.dumps(server._handle(body)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler